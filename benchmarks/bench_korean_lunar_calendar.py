@@ -0,0 +1,187 @@
+"""Benchmark the public entry points of `korean_lunar_calendar` with `timeit`.
+
+Usage:
+	python benchmarks/bench_korean_lunar_calendar.py [--output results.json] [--compare baseline.json]
+
+Each case is timed over early (1000), mid-range (1582) and late (2050) years, as conversion costs used to grow with the year, plus a sweep over the full supported range. The best time per call (over `--repeat` runs) is reported, and saved as JSON to compare versions.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import korean_lunar_calendar
+from korean_lunar_calendar import (
+	KoreanLunarCalendar,
+	LunarDate,
+	SolarDate,
+	from_date,
+	gap_ja_string,
+	parse_lunar_iso,
+	parse_solar_iso,
+	to_lunar,
+	to_solar,
+)
+from korean_lunar_calendar.holidays import holidays, lunar_anniversaries
+from korean_lunar_calendar.solar_terms import four_pillars, month_pillar
+
+# Solar & lunar dates of each year range
+YEARS: dict[str, tuple[tuple[int, int, int], tuple[int, int, int, bool]]] = {
+	"1000": ((1000, 3, 1), (1000, 1, 17, False)),
+	"1582": ((1582, 10, 15), (1582, 9, 19, False)),
+	"2050": ((2050, 12, 31), (2050, 11, 18, False)),
+}
+# Every 97th day of the supported range
+SWEEP_STEP: int = 97
+SWEEP_START: datetime.date = datetime.date(1000, 2, 13)
+SWEEP_DATES: list[datetime.date] = [
+	SWEEP_START + datetime.timedelta(days=offset) for offset in range(0, (datetime.date(2050, 12, 31) - SWEEP_START).days + 1, SWEEP_STEP)
+]
+
+# Every lunar year of the supported range, for the yearly anniversaries
+ANNIVERSARY_YEARS: range = range(1000, 2050)
+# Number of dates or years looped over by each sweep case, its calls being scaled down accordingly
+SWEEP_LENGTHS: dict[str, int] = {
+	"set_solar_date[sweep]": len(SWEEP_DATES),
+	"from_date[sweep]": len(SWEEP_DATES),
+	"lunar_anniversaries[sweep]": len(ANNIVERSARY_YEARS),
+	"to_solar_anniversaries[sweep]": len(ANNIVERSARY_YEARS),
+	"holidays[sweep]": len(ANNIVERSARY_YEARS),
+}
+
+
+def _cases() -> dict[str, Callable[[], Any]]:
+	"""Build the benchmark cases.
+
+	Returns:
+		dict[str, Callable[[], Any]]: Callable timed for each case name
+	"""
+	klc = KoreanLunarCalendar()
+	cases: dict[str, Callable[[], Any]] = {}
+	for name, (solar, lunar) in YEARS.items():
+		def set_lunar_and_format(lunar: tuple[int, int, int, bool] = lunar) -> str:
+			klc.set_lunar_date(*lunar)
+			return klc.lunar_iso_format()
+
+		def set_lunar_and_gap_ja(lunar: tuple[int, int, int, bool] = lunar) -> str:
+			klc.set_lunar_date(*lunar)
+			return klc.get_gap_ja_string()
+
+		def set_lunar_and_chinese_gap_ja(lunar: tuple[int, int, int, bool] = lunar) -> str:
+			klc.set_lunar_date(*lunar)
+			return klc.get_chinese_gap_ja_string()
+
+		solar_date = SolarDate(*solar)
+		lunar_date = LunarDate(*lunar)
+		date = datetime.date(*solar)
+		cases[f"set_solar_date[{name}]"] = partial(klc.set_solar_date, *solar)
+		cases[f"set_lunar_date[{name}]"] = partial(klc.set_lunar_date, *lunar)
+		cases[f"lunar_iso_format[{name}]"] = set_lunar_and_format
+		cases[f"get_gap_ja_string[{name}]"] = set_lunar_and_gap_ja
+		cases[f"get_chinese_gap_ja_string[{name}]"] = set_lunar_and_chinese_gap_ja
+		cases[f"to_lunar[{name}]"] = partial(to_lunar, solar_date)
+		cases[f"to_solar[{name}]"] = partial(to_solar, lunar_date)
+		cases[f"from_date[{name}]"] = partial(from_date, date)
+		cases[f"gap_ja_string[{name}]"] = partial(gap_ja_string, lunar_date)
+		cases[f"month_pillar[{name}]"] = partial(month_pillar, datetime.datetime(*solar, 13, 30))
+		cases[f"four_pillars[{name}]"] = partial(four_pillars, datetime.datetime(*solar, 13, 30))
+		cases[f"parse_solar_iso[{name}]"] = partial(parse_solar_iso, solar_date.iso_format())
+		cases[f"parse_lunar_iso[{name}]"] = partial(parse_lunar_iso, lunar_date.iso_format())
+		# Reference for `parse_solar_iso` & `parse_lunar_iso`
+		cases[f"date.fromisoformat[{name}]"] = partial(datetime.date.fromisoformat, date.isoformat())
+
+	cases["set_solar_date[invalid]"] = partial(klc.set_solar_date, 2025, 2, 29)
+	cases["set_lunar_date[invalid]"] = partial(klc.set_lunar_date, 2025, 5, 1, True)
+	cases["set_solar_date[out_of_range]"] = partial(klc.set_solar_date, 2051, 1, 1)
+
+	def sweep_set_solar_date() -> None:
+		for date in SWEEP_DATES:
+			klc.set_solar_date(date.year, date.month, date.day)
+
+	def sweep_from_date() -> None:
+		for date in SWEEP_DATES:
+			from_date(date)
+
+	def sweep_anniversary_to_solar() -> None:
+		for year in ANNIVERSARY_YEARS:
+			to_solar(LunarDate(year, 3, 10))
+
+	cases["set_solar_date[sweep]"] = sweep_set_solar_date
+	cases["from_date[sweep]"] = sweep_from_date
+	cases["lunar_anniversaries[sweep]"] = partial(lunar_anniversaries, LunarDate(1950, 3, 10), ANNIVERSARY_YEARS)
+	# Reference for `lunar_anniversaries`: one conversion per year
+	cases["to_solar_anniversaries[sweep]"] = sweep_anniversary_to_solar
+	cases["holidays[sweep]"] = partial(holidays, ANNIVERSARY_YEARS)
+	return cases
+
+
+def run(number: int, repeat: int, pattern: str | None = None) -> dict[str, Any]:
+	"""Time every benchmark case.
+
+	Args:
+		number (int): Number of calls per run (divided by the loop length of the sweep cases, see `SWEEP_LENGTHS`)
+		repeat (int): Number of runs (the best one is kept)
+		pattern (str | None, optional): Only run the cases whose name contains **pattern**. Defaults to None.
+
+	Returns:
+		dict[str, Any]: JSON-serializable results
+	"""
+	results: dict[str, dict[str, float | int]] = {}
+	for name, case in _cases().items():
+		if pattern is not None and pattern not in name:
+			continue
+		calls: int = max(1, number // SWEEP_LENGTHS.get(name, 1))
+		best: float = min(timeit.repeat(case, number=calls, repeat=repeat)) / calls
+		results[name] = {"seconds_per_call": best, "calls": calls, "repeat": repeat}
+	return {
+		"version": korean_lunar_calendar.__version__,
+		"python": platform.python_version(),
+		"implementation": platform.python_implementation(),
+		"timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(), # noqa: UP017 (`datetime.UTC` is Python 3.11+)
+		"results": results,
+	}
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""Run the benchmarks, print them, and optionally save/compare them as JSON.
+
+	Args:
+		argv (list[str] | None, optional): Command line arguments. Defaults to None (`sys.argv[1:]`).
+
+	Returns:
+		int: Exit code
+	"""
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--number", type=int, default=2000, help="calls per run (default: %(default)s)")
+	parser.add_argument("--repeat", type=int, default=5, help="runs per case, the best one being kept (default: %(default)s)")
+	parser.add_argument("-k", dest="pattern", default=None, help="only run the cases whose name contains PATTERN")
+	parser.add_argument("--output", default=None, help="save the results as JSON")
+	parser.add_argument("--compare", default=None, help="compare with results previously saved as JSON")
+	args = parser.parse_args(argv)
+
+	report: dict[str, Any] = run(args.number, args.repeat, args.pattern)
+	baseline: dict[str, Any] = {}
+	if args.compare is not None:
+		with open(args.compare, encoding="utf-8") as f:
+			baseline = json.load(f)["results"]
+
+	for name, result in report["results"].items():
+		line: str = f"{name:<40} {result['seconds_per_call'] * 1e6:>12.3f} us"
+		if name in baseline:
+			line += f" {baseline[name]['seconds_per_call'] / result['seconds_per_call']:>8.2f}x"
+		print(line)
+
+	if args.output is not None:
+		with open(args.output, "w", encoding="utf-8") as f:
+			json.dump(report, f, indent=2)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -1,7 +1,37 @@
 """Korean Lunar Calendar."""
 
-from .korean_lunar_calendar import KoreanLunarCalendar
+from .korean_lunar_calendar import (
+	DateCheck,
+	GapJa,
+	GapJaLocale,
+	KoreanLunarCalendar,
+	LunarDate,
+	Pillar,
+	SolarDate,
+	check_lunar_date,
+	check_solar_date,
+	from_date,
+	gap_ja,
+	gap_ja_string,
+	get_gap_ja_locale,
+	iter_days,
+	iter_lunar_months,
+	lunar_to_ordinal,
+	ordinal_to_lunar,
+	ordinal_to_solar,
+	parse_lunar_iso,
+	parse_lunar_iso_many,
+	parse_solar_iso,
+	parse_solar_iso_many,
+	register_gap_ja_locale,
+	solar_to_ordinal,
+	to_date,
+	to_lunar,
+	to_solar,
+	validate_lunar_many,
+	validate_solar_many,
+)
 
 __version__ = '0.3.1'
 
-__all__ = [ 'KoreanLunarCalendar' ]
+__all__ = [ 'DateCheck', 'GapJa', 'GapJaLocale', 'KoreanLunarCalendar', 'LunarDate', 'Pillar', 'SolarDate', 'check_lunar_date', 'check_solar_date', 'from_date', 'gap_ja', 'gap_ja_string', 'get_gap_ja_locale', 'iter_days', 'iter_lunar_months', 'lunar_to_ordinal', 'ordinal_to_lunar', 'ordinal_to_solar', 'parse_lunar_iso', 'parse_lunar_iso_many', 'parse_solar_iso', 'parse_solar_iso_many', 'register_gap_ja_locale', 'solar_to_ordinal', 'to_date', 'to_lunar', 'to_solar', 'validate_lunar_many', 'validate_solar_many' ]
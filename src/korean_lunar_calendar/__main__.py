@@ -0,0 +1,8 @@
+"""Command line bulk converter (see `korean_lunar_calendar.cli`)."""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,177 @@
+"""Asyncio bulk conversion.
+
+The conversions are CPU-bound: converted in one go, a large batch would block the event loop. `aconvert_many` & `aconvert_iter` convert their input in bounded chunks:
+
+* without executor, in the event loop, yielding control back to it between chunks
+* with an executor (e.g. a `ProcessPoolExecutor`), off the event loop, a bounded number of chunks being in flight at once
+
+The results are in the input order, and the input (an iterable or an async iterable) is consumed lazily: `aconvert_iter` only converts ahead of its consumer by the chunks in flight (backpressure).
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
+from concurrent.futures import Executor
+from contextlib import aclosing
+from datetime import date
+
+from .korean_lunar_calendar import LunarDate, SolarDate
+from .parallel import _chunks, _convert_chunk
+
+
+def _check_args(chunksize: int, max_in_flight: int) -> None:
+	"""Check the chunking arguments.
+
+	Args:
+		chunksize (int): Number of dates converted at once
+		max_in_flight (int): Maximum number of chunks submitted to the executor at once
+
+	Raises:
+		ValueError: If **chunksize** or **max_in_flight** is not positive
+	"""
+	if chunksize < 1:
+		raise ValueError(f"chunksize is:{chunksize}\nShould be: a positive integer")
+	if max_in_flight < 1:
+		raise ValueError(f"max_in_flight is:{max_in_flight}\nShould be: a positive integer")
+
+
+async def _achunks(dates: Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date], chunksize: int) -> AsyncGenerator[list[SolarDate | LunarDate | date], None]:
+	"""Split an iterable or an async iterable of dates in lists of **chunksize** dates.
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date]): Dates
+		chunksize (int): Number of dates per chunk
+
+	Yields:
+		list[SolarDate | LunarDate | date]: Chunk of dates
+	"""
+	if not isinstance(dates, AsyncIterable):
+		for chunk in _chunks(dates, chunksize):
+			yield chunk
+		return
+
+	buffer: list[SolarDate | LunarDate | date] = []
+	async for date_ in dates:
+		buffer.append(date_)
+		if len(buffer) == chunksize:
+			yield buffer
+			buffer = []
+	if buffer:
+		yield buffer
+
+
+async def _aconvert_chunks(
+	dates: Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date], chunksize: int, executor: Executor | None, max_in_flight: int,
+) -> AsyncGenerator[list[LunarDate | SolarDate], None]:
+	"""Convert the dates chunk by chunk (see `aconvert_iter`, once its arguments are checked).
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date]): Dates
+		chunksize (int): Number of dates converted at once
+		executor (Executor | None): Executor (`None`: in the event loop)
+		max_in_flight (int): Maximum number of chunks submitted to **executor** at once
+
+	Yields:
+		list[LunarDate | SolarDate]: Converted chunks, in the input order
+	"""
+	if executor is None:
+		async for chunk in _achunks(dates, chunksize):
+			converted: list[LunarDate | SolarDate] = _convert_chunk(chunk)
+			# Yield control to the event loop between chunks
+			await asyncio.sleep(0)
+			yield converted
+		return
+
+	loop = asyncio.get_running_loop()
+	pending: deque[asyncio.Future[list[LunarDate | SolarDate]]] = deque()
+	try:
+		async for chunk in _achunks(dates, chunksize):
+			pending.append(loop.run_in_executor(executor, _convert_chunk, chunk))
+			if len(pending) >= max_in_flight:
+				yield await pending.popleft()
+		while pending:
+			yield await pending.popleft()
+	finally:
+		for future in pending:
+			future.cancel()
+
+
+def aconvert_iter(
+	dates: Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date], chunksize: int = 1024, executor: Executor | None = None, max_in_flight: int = 2,
+) -> AsyncGenerator[LunarDate | SolarDate, None]:
+	"""Convert many dates chunk by chunk without blocking the event loop, yielding the results in the input order.
+
+	Solar dates (`SolarDate` or `datetime.date`) are converted to `LunarDate`, and lunar dates (`LunarDate`) to `SolarDate`.
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date]): Dates, consumed lazily
+		chunksize (int, optional): Number of dates converted at once (without executor, between two yields to the event loop). Defaults to 1024.
+		executor (Executor | None, optional): Executor converting the chunks, e.g. a `ProcessPoolExecutor` (`None`: in the event loop). Defaults to None.
+		max_in_flight (int, optional): Maximum number of chunks submitted to **executor** at once, ahead of the consumer. Defaults to 2.
+
+	Raises:
+		ValueError: If **chunksize** or **max_in_flight** is not positive, or (on iteration) if a date is not valid
+		TypeError: (On iteration) If a date is neither a `SolarDate`, a `LunarDate` nor a `datetime.date`
+
+	Returns:
+		AsyncGenerator[LunarDate | SolarDate, None]: Converted dates
+
+	Examples:
+		```python
+		async for lunar_date in aconvert_iter(solar_dates, executor=executor, max_in_flight=8):
+			...
+		```
+	"""
+	_check_args(chunksize, max_in_flight)
+	return _aconvert_iter(dates, chunksize, executor, max_in_flight)
+
+
+async def _aconvert_iter(
+	dates: Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date], chunksize: int, executor: Executor | None, max_in_flight: int,
+) -> AsyncGenerator[LunarDate | SolarDate, None]:
+	"""Convert many dates chunk by chunk (see `aconvert_iter`, once its arguments are checked).
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date]): Dates
+		chunksize (int): Number of dates converted at once
+		executor (Executor | None): Executor (`None`: in the event loop)
+		max_in_flight (int): Maximum number of chunks submitted to **executor** at once
+
+	Yields:
+		LunarDate | SolarDate: Converted dates
+	"""
+	async with aclosing(_aconvert_chunks(dates, chunksize, executor, max_in_flight)) as chunks:
+		async for converted in chunks:
+			for date_ in converted:
+				yield date_
+
+
+async def aconvert_many(
+	dates: Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date], chunksize: int = 1024, executor: Executor | None = None, max_in_flight: int = 2,
+) -> list[LunarDate | SolarDate]:
+	"""Convert many dates chunk by chunk without blocking the event loop (see `aconvert_iter`).
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date] | AsyncIterable[SolarDate | LunarDate | date]): Dates, consumed lazily
+		chunksize (int, optional): Number of dates converted at once (without executor, between two yields to the event loop). Defaults to 1024.
+		executor (Executor | None, optional): Executor converting the chunks, e.g. a `ProcessPoolExecutor` (`None`: in the event loop). Defaults to None.
+		max_in_flight (int, optional): Maximum number of chunks submitted to **executor** at once. Defaults to 2.
+
+	Raises:
+		ValueError: If **chunksize** or **max_in_flight** is not positive, or if a date is not valid
+		TypeError: If a date is neither a `SolarDate`, a `LunarDate` nor a `datetime.date`
+
+	Returns:
+		list[LunarDate | SolarDate]: Converted dates, in the input order
+
+	Examples:
+		```python
+		lunar_dates = await aconvert_many(solar_dates)
+		```
+	"""
+	_check_args(chunksize, max_in_flight)
+	converted: list[LunarDate | SolarDate] = []
+	async with aclosing(_aconvert_chunks(dates, chunksize, executor, max_in_flight)) as chunks:
+		async for chunk in chunks:
+			converted.extend(chunk)
+	return converted
@@ -0,0 +1,573 @@
+"""Vectorized conversion between Solar and Lunar dates for whole arrays of dates.
+
+Optional module: requires `numpy` (`pip install korean_lunar_calendar[numpy]`).
+
+The look-up tables of `KoreanLunarCalendar` (`SOLAR_YEAR_START_DAYS`, `LUNAR_MONTH_START_DAYS`, ...) are converted once to NumPy arrays at import, and every conversion is a handful of array operations and table gathers, without any Python loop over the dates.
+
+The gapja (sexagenary cycle) of arrays of ordinals are computed the same way, from the cycle indexes of the year & month of each lunar month start.
+
+> Note: `np.searchsorted` over the ~13k month starts costs a binary search per date, which dominates the conversion time of unsorted input. The month starts are thus expanded once (`np.repeat`) to a per-day index of the month (resp. solar year) containing each absolute day.
+"""
+
+from functools import cache
+from typing import Final
+
+try:
+	import numpy as np
+	import numpy.typing as npt
+except ImportError as e: # pragma: no cover
+	raise ImportError("korean_lunar_calendar.batch requires numpy: pip install korean_lunar_calendar[numpy]") from e
+
+from .korean_lunar_calendar import (
+	DateCheck,
+	GapJaLocale,
+	KoreanLunarCalendar,
+	get_gap_ja_locale,
+)
+from .solar_terms import _MONTH_CYCLE_OFFSET, _SOLAR_TERM_MINUTES
+
+# ruff: noqa: PLR2004
+
+
+# Structured dtypes of the conversion results
+LUNAR_DTYPE: Final[np.dtype] = np.dtype([("year", "<i2"), ("month", "u1"), ("day", "u1"), ("is_intercalation", "?")])
+SOLAR_DTYPE: Final[np.dtype] = np.dtype([("year", "<i2"), ("month", "u1"), ("day", "u1")])
+
+_BASE_YEAR: Final[int] = KoreanLunarCalendar.KOREAN_LUNAR_BASE_YEAR
+_LUNAR_DATA: Final[npt.NDArray[np.int64]] = np.array(KoreanLunarCalendar.KOREAN_LUNAR_DATA, dtype=np.int64)
+_YEAR_COUNT: Final[int] = len(KoreanLunarCalendar.KOREAN_LUNAR_DATA)
+
+# `|0X..|....|....|....|....|....|....|....|`: solar intercalation year
+_SOLAR_INTERCALATION: Final[npt.NDArray[np.intp]] = ((_LUNAR_DATA >> 30) & 0x01).astype(np.intp)
+_SOLAR_YEAR_START_DAYS: Final[npt.NDArray[np.int64]] = np.array(KoreanLunarCalendar.SOLAR_YEAR_START_DAYS, dtype=np.int64)
+# [is_solar_intercalation_year, month-1]: duration of the solar month
+_SOLAR_MONTH_DAYS: Final[npt.NDArray[np.int64]] = np.array([
+	KoreanLunarCalendar.SOLAR_DAYS[:12],
+	(KoreanLunarCalendar.SOLAR_DAYS[0], KoreanLunarCalendar.SOLAR_DAYS[12], *KoreanLunarCalendar.SOLAR_DAYS[2:12]),
+], dtype=np.int64)
+# [is_solar_intercalation_year, month]: duration of the solar year before the given month (13 columns, last one being the year duration)
+_SOLAR_DAYS_BEFORE_MONTH: Final[npt.NDArray[np.int64]] = np.concatenate((np.zeros((2, 1), dtype=np.int64), np.cumsum(_SOLAR_MONTH_DAYS, axis=1)), axis=1)
+# [is_solar_intercalation_year, day_of_year]: month-1 of the (1-based) day of the year
+_SOLAR_DAY_OF_YEAR_MONTH: Final[npt.NDArray[np.intp]] = np.array([
+	np.concatenate(([0], np.repeat(np.arange(12), month_days), [11] * (367 - 1 - int(month_days.sum())))) for month_days in _SOLAR_MONTH_DAYS
+], dtype=np.intp)
+
+_MONTH_START_DAYS: Final[npt.NDArray[np.int64]] = np.array(KoreanLunarCalendar.LUNAR_MONTH_START_DAYS, dtype=np.int64)
+# `|YYYY|YYYY|YYYY|MMMM|I|`: key of each lunar month start
+_MONTH_START_KEYS: Final[npt.NDArray[np.int64]] = np.array(KoreanLunarCalendar.LUNAR_MONTH_START_KEYS, dtype=np.int64)
+_MONTH_START_YEARS: Final[npt.NDArray[np.int16]] = (_MONTH_START_KEYS >> 5).astype(np.int16)
+_MONTH_START_MONTHS: Final[npt.NDArray[np.uint8]] = ((_MONTH_START_KEYS >> 1) & 0x0F).astype(np.uint8)
+_MONTH_START_INTERCALATIONS: Final[npt.NDArray[np.bool_]] = (_MONTH_START_KEYS & 0x01).astype(np.bool_)
+# Index in `_MONTH_START_DAYS` of the first month of each lunar year
+_YEAR_FIRST_MONTH_INDEX: Final[npt.NDArray[np.int64]] = np.searchsorted(_MONTH_START_YEARS, np.arange(_BASE_YEAR, _BASE_YEAR + _YEAR_COUNT)).astype(np.int64)
+# [abs_days-1]: index in `_MONTH_START_DAYS` of the lunar month containing the day
+_DAY_MONTH_INDEX: Final[npt.NDArray[np.int16]] = np.repeat(
+	np.arange(len(_MONTH_START_DAYS), dtype=np.int16), np.diff(np.append(_MONTH_START_DAYS, KoreanLunarCalendar.LUNAR_YEAR_START_DAYS[-1] + 1)),
+)
+# [abs_days-1]: index of the solar year (`year-1000`) containing the day
+_DAY_SOLAR_YEAR_INDEX: Final[npt.NDArray[np.int16]] = np.repeat(
+	np.arange(_YEAR_COUNT, dtype=np.int16), np.diff(_SOLAR_YEAR_START_DAYS),
+)[KoreanLunarCalendar.SOLAR_LUNAR_DAY_DIFF:KoreanLunarCalendar.SOLAR_LUNAR_DAY_DIFF + len(_DAY_MONTH_INDEX)]
+
+
+def _solar_checks(year_arr: npt.NDArray[np.int64], month_arr: npt.NDArray[np.int64], day_arr: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+	"""Check arrays of solar dates (as `_check_valid_date`), one mask per check.
+
+	Args:
+		year_arr (npt.NDArray[np.int64]): Solar years
+		month_arr (npt.NDArray[np.int64]): Solar months
+		day_arr (npt.NDArray[np.int64]): Solar days
+
+	Returns:
+		tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: Masks of the dates in range, of valid month & of valid day
+	"""
+	date_value = year_arr * 10000 + month_arr * 100 + day_arr
+	in_range = (date_value >= KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE) & (date_value <= KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE)
+	valid_month = (month_arr > 0) & (month_arr < 13)
+
+	year_inx = np.clip(year_arr - _BASE_YEAR, 0, _YEAR_COUNT - 1)
+	month_inx = np.clip(month_arr - 1, 0, 11)
+	valid_day = (day_arr > 0) & (day_arr <= _SOLAR_MONTH_DAYS[_SOLAR_INTERCALATION[year_inx], month_inx])
+	return in_range, valid_month, valid_day
+
+
+def _lunar_checks(year_arr: npt.NDArray[np.int64], month_arr: npt.NDArray[np.int64], day_arr: npt.NDArray[np.int64], intercalation_arr: npt.NDArray[np.bool_]) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+	"""Check arrays of lunar dates (as `_check_valid_date`), one mask per check.
+
+	Args:
+		year_arr (npt.NDArray[np.int64]): Lunar years
+		month_arr (npt.NDArray[np.int64]): Lunar months
+		day_arr (npt.NDArray[np.int64]): Lunar days
+		intercalation_arr (npt.NDArray[np.bool_]): Whether each date is in the intercalation month
+
+	Returns:
+		tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: Masks of the dates in range, of valid month, of valid intercalation & of valid day
+	"""
+	date_value = year_arr * 10000 + month_arr * 100 + day_arr
+	in_range = (date_value >= KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE) & (date_value <= KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE)
+	valid_month = (month_arr > 0) & (month_arr < 13)
+
+	lunar_data = _LUNAR_DATA[np.clip(year_arr - _BASE_YEAR, 0, _YEAR_COUNT - 1)]
+	month_arr = np.clip(month_arr, 1, 12)
+	# `|0000|0000|0000|0000|XXXX|....|....|....|`
+	intercalation_month = (lunar_data >> 12) & 0x000F
+	valid_intercalation = ~intercalation_arr | (intercalation_month == month_arr)
+	# `|0000|0000|0000|000X|....|....|....|....|` or `|0000|0000|0000|0000|0000|YYYY|YYYY|YYYY|`: one of the Ys
+	big_month = np.where(intercalation_arr, lunar_data >> 16, lunar_data >> (12 - month_arr)) & 0x01
+	valid_day = (day_arr > 0) & (day_arr <= KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY + big_month)
+	return in_range, valid_month, valid_intercalation, valid_day
+
+
+def _valid_solar(year_arr: npt.NDArray[np.int64], month_arr: npt.NDArray[np.int64], day_arr: npt.NDArray[np.int64]) -> npt.NDArray[np.bool_]:
+	"""Check arrays of solar dates (as `_check_valid_date`).
+
+	Args:
+		year_arr (npt.NDArray[np.int64]): Solar years
+		month_arr (npt.NDArray[np.int64]): Solar months
+		day_arr (npt.NDArray[np.int64]): Solar days
+
+	Returns:
+		npt.NDArray[np.bool_]: Validity mask
+	"""
+	in_range, valid_month, valid_day = _solar_checks(year_arr, month_arr, day_arr)
+	return in_range & valid_month & valid_day
+
+
+def _valid_lunar(year_arr: npt.NDArray[np.int64], month_arr: npt.NDArray[np.int64], day_arr: npt.NDArray[np.int64], intercalation_arr: npt.NDArray[np.bool_]) -> npt.NDArray[np.bool_]:
+	"""Check arrays of lunar dates (as `_check_valid_date`).
+
+	Args:
+		year_arr (npt.NDArray[np.int64]): Lunar years
+		month_arr (npt.NDArray[np.int64]): Lunar months
+		day_arr (npt.NDArray[np.int64]): Lunar days
+		intercalation_arr (npt.NDArray[np.bool_]): Whether each date is in the intercalation month
+
+	Returns:
+		npt.NDArray[np.bool_]: Validity mask
+	"""
+	in_range, valid_month, valid_intercalation, valid_day = _lunar_checks(year_arr, month_arr, day_arr, intercalation_arr)
+	return in_range & valid_month & valid_intercalation & valid_day
+
+
+def _solar_arrays(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike) -> tuple[npt.NDArray[np.int64], ...]:
+	"""Broadcast the solar date arguments together.
+
+	Args:
+		years (npt.ArrayLike): Solar years
+		months (npt.ArrayLike): Solar months
+		days (npt.ArrayLike): Solar days
+
+	Returns:
+		tuple[npt.NDArray[np.int64], ...]: Years, months & days
+	"""
+	return tuple(np.broadcast_arrays(*(np.asarray(arg, dtype=np.int64) for arg in (years, months, days))))
+
+
+def _lunar_arrays(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike, is_intercalation: npt.ArrayLike) -> tuple[npt.NDArray, ...]:
+	"""Broadcast the lunar date arguments together.
+
+	Args:
+		years (npt.ArrayLike): Lunar years
+		months (npt.ArrayLike): Lunar months
+		days (npt.ArrayLike): Lunar days
+		is_intercalation (npt.ArrayLike): Whether each date is in the intercalation month
+
+	Returns:
+		tuple[npt.NDArray, ...]: Years, months, days (`np.int64`) & intercalation flags (`np.bool_`)
+	"""
+	return tuple(np.broadcast_arrays(
+		np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64), np.asarray(days, dtype=np.int64), np.asarray(is_intercalation, dtype=np.bool_),
+	))
+
+
+def solar_to_lunar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Convert arrays of solar dates to lunar dates.
+
+	The arguments are broadcast together. Invalid dates (out of range, or not existing) are flagged in the returned validity mask, and their converted date is left zeroed.
+
+	Args:
+		years (npt.ArrayLike): Solar years
+		months (npt.ArrayLike): Solar months
+		days (npt.ArrayLike): Solar days
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Lunar dates (`LUNAR_DTYPE` structured array: `year`, `month`, `day`, `is_intercalation`), and validity mask
+	"""
+	year_arr, month_arr, day_arr = _solar_arrays(years, months, days)
+	valid = _valid_solar(year_arr, month_arr, day_arr)
+
+	year_inx = np.clip(year_arr - _BASE_YEAR, 0, _YEAR_COUNT - 1)
+	month_inx = np.clip(month_arr - 1, 0, 11)
+	solar_intercalation = _SOLAR_INTERCALATION[year_inx]
+	abs_days = _SOLAR_YEAR_START_DAYS[year_inx] + _SOLAR_DAYS_BEFORE_MONTH[solar_intercalation, month_inx] + day_arr - KoreanLunarCalendar.SOLAR_LUNAR_DAY_DIFF
+	abs_days = np.where(valid, abs_days, 1)
+	month_start_inx = _DAY_MONTH_INDEX[abs_days - 1]
+
+	lunar_dates = np.zeros(valid.shape, dtype=LUNAR_DTYPE)
+	lunar_dates["year"] = np.where(valid, _MONTH_START_YEARS[month_start_inx], 0)
+	lunar_dates["month"] = np.where(valid, _MONTH_START_MONTHS[month_start_inx], 0)
+	lunar_dates["day"] = np.where(valid, abs_days - _MONTH_START_DAYS[month_start_inx] + 1, 0)
+	lunar_dates["is_intercalation"] = valid & _MONTH_START_INTERCALATIONS[month_start_inx]
+	return lunar_dates, valid
+
+
+def lunar_to_solar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike, is_intercalation: npt.ArrayLike = False) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Convert arrays of lunar dates to solar dates.
+
+	The arguments are broadcast together. Invalid dates (out of range, not existing, or flagged as intercalation while the month has no intercalation) are flagged in the returned validity mask, and their converted date is left zeroed.
+
+	Args:
+		years (npt.ArrayLike): Lunar years
+		months (npt.ArrayLike): Lunar months
+		days (npt.ArrayLike): Lunar days
+		is_intercalation (npt.ArrayLike, optional): Whether each date is in the intercalation month. Defaults to False.
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Solar dates (`SOLAR_DTYPE` structured array: `year`, `month`, `day`), and validity mask
+	"""
+	year_arr, month_arr, day_arr, intercalation_arr = _lunar_arrays(years, months, days, is_intercalation)
+	valid = _valid_lunar(year_arr, month_arr, day_arr, intercalation_arr)
+
+	year_inx = np.clip(year_arr - _BASE_YEAR, 0, _YEAR_COUNT - 1)
+	month_arr = np.clip(month_arr, 1, 12)
+	# `|0000|0000|0000|0000|XXXX|....|....|....|`
+	intercalation_month = (_LUNAR_DATA[year_inx] >> 12) & 0x000F
+
+	# The intercalation month comes right after its regular month
+	after_intercalation = (intercalation_month > 0) & ((intercalation_month < month_arr) | (intercalation_arr & (intercalation_month == month_arr)))
+	month_start_inx = _YEAR_FIRST_MONTH_INDEX[year_inx] + month_arr - 1 + after_intercalation
+	abs_days = np.where(valid, _MONTH_START_DAYS[month_start_inx] + day_arr - 1, 1)
+
+	# Duration in days between the beginning of the base solar year and the solar date (excluded)
+	solar_days = abs_days + KoreanLunarCalendar.SOLAR_LUNAR_DAY_DIFF - 1
+	solar_year_inx = _DAY_SOLAR_YEAR_INDEX[abs_days - 1]
+	day_of_year = solar_days - _SOLAR_YEAR_START_DAYS[solar_year_inx] + 1
+	solar_intercalation = _SOLAR_INTERCALATION[solar_year_inx]
+	solar_month_inx = _SOLAR_DAY_OF_YEAR_MONTH[solar_intercalation, day_of_year]
+
+	solar_dates = np.zeros(valid.shape, dtype=SOLAR_DTYPE)
+	solar_dates["year"] = np.where(valid, solar_year_inx + _BASE_YEAR, 0)
+	solar_dates["month"] = np.where(valid, solar_month_inx + 1, 0)
+	solar_dates["day"] = np.where(valid, day_of_year - _SOLAR_DAYS_BEFORE_MONTH[solar_intercalation, solar_month_inx], 0)
+	return solar_dates, valid
+
+
+def validate_solar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+	"""Check arrays of solar dates without converting them (see `check_solar` for why a date is rejected).
+
+	Args:
+		years (npt.ArrayLike): Solar years
+		months (npt.ArrayLike): Solar months
+		days (npt.ArrayLike): Solar days
+
+	Returns:
+		npt.NDArray[np.bool_]: Validity mask
+	"""
+	return _valid_solar(*_solar_arrays(years, months, days))
+
+
+def validate_lunar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike, is_intercalation: npt.ArrayLike = False) -> npt.NDArray[np.bool_]:
+	"""Check arrays of lunar dates without converting them (see `check_lunar` for why a date is rejected).
+
+	Args:
+		years (npt.ArrayLike): Lunar years
+		months (npt.ArrayLike): Lunar months
+		days (npt.ArrayLike): Lunar days
+		is_intercalation (npt.ArrayLike, optional): Whether each date is in the intercalation month. Defaults to False.
+
+	Returns:
+		npt.NDArray[np.bool_]: Validity mask
+	"""
+	return _valid_lunar(*_lunar_arrays(years, months, days, is_intercalation))
+
+
+def check_solar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+	"""Check arrays of solar dates without converting them, telling why each one is not valid.
+
+	Args:
+		years (npt.ArrayLike): Solar years
+		months (npt.ArrayLike): Solar months
+		days (npt.ArrayLike): Solar days
+
+	Returns:
+		npt.NDArray[np.uint8]: `DateCheck` of each date (`DateCheck.VALID`, i.e. `0`, if valid)
+	"""
+	in_range, valid_month, valid_day = _solar_checks(*_solar_arrays(years, months, days))
+	return np.select(
+		(~in_range, ~valid_month, ~valid_day), (DateCheck.OUT_OF_RANGE, DateCheck.INVALID_MONTH, DateCheck.INVALID_DAY), DateCheck.VALID,
+	).astype(np.uint8)
+
+
+def check_lunar(years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike, is_intercalation: npt.ArrayLike = False) -> npt.NDArray[np.uint8]:
+	"""Check arrays of lunar dates without converting them, telling why each one is not valid.
+
+	Args:
+		years (npt.ArrayLike): Lunar years
+		months (npt.ArrayLike): Lunar months
+		days (npt.ArrayLike): Lunar days
+		is_intercalation (npt.ArrayLike, optional): Whether each date is in the intercalation month. Defaults to False.
+
+	Returns:
+		npt.NDArray[np.uint8]: `DateCheck` of each date (`DateCheck.VALID`, i.e. `0`, if valid)
+
+	Examples:
+		```python
+		check_lunar([2025, 2025], [5, 6], [1, 1], [True, True]) # => array([3, 0], dtype=uint8)
+		```
+	"""
+	in_range, valid_month, valid_intercalation, valid_day = _lunar_checks(*_lunar_arrays(years, months, days, is_intercalation))
+	return np.select(
+		(~in_range, ~valid_month, ~valid_intercalation, ~valid_day),
+		(DateCheck.OUT_OF_RANGE, DateCheck.INVALID_MONTH, DateCheck.INVALID_INTERCALATION, DateCheck.INVALID_DAY),
+		DateCheck.VALID,
+	).astype(np.uint8)
+
+
+# Supported range of ordinals (`datetime.date.toordinal`): solar 1000/02/13 ~ 2050/12/31
+_MIN_ORDINAL: Final[int] = KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF + 1
+_MAX_ORDINAL: Final[int] = KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF + KoreanLunarCalendar.SOLAR_YEAR_START_DAYS[-1] - KoreanLunarCalendar.SOLAR_LUNAR_DAY_DIFF
+
+# Index in the sexagenary cycle (0: 갑자/甲子, ..., 59: 계해/癸亥) of the year & month of each lunar month start,
+# the cycle index `n` of a (cheongan, ganji) pair being the one for which `n % 10 == cheongan` & `n % 12 == ganji`
+_MONTH_START_YEAR_CYCLE: Final[npt.NDArray[np.uint8]] = ((_MONTH_START_YEARS.astype(np.int64) - _BASE_YEAR + 36) % 60).astype(np.uint8)
+_MONTH_START_MONTH_CYCLE: Final[npt.NDArray[np.uint8]] = ((_MONTH_START_MONTHS + 12 * (_MONTH_START_YEARS.astype(np.int64) - _BASE_YEAR) + 13) % 60).astype(np.uint8)
+# Offset of the cycle index of the days: `(abs_days + 14) % 60`
+_DAY_CYCLE_OFFSET: Final[int] = 14
+
+# Structured dtype of the gapja indexes
+GAP_JA_DTYPE: Final[np.dtype] = np.dtype([
+	("year_cheongan", "u1"), ("year_ganji", "u1"),
+	("month_cheongan", "u1"), ("month_ganji", "u1"),
+	("day_cheongan", "u1"), ("day_ganji", "u1"),
+])
+
+
+def _gap_ja_cycles(ordinals: npt.ArrayLike) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.uint8], npt.NDArray[np.uint8], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+	"""Get the sexagenary cycle indexes of the year, month & day of arrays of ordinals.
+
+	Args:
+		ordinals (npt.ArrayLike): Ordinals aligned with `datetime.date.toordinal`
+
+	Returns:
+		tuple[npt.NDArray[np.intp], npt.NDArray[np.uint8], npt.NDArray[np.uint8], npt.NDArray[np.int64], npt.NDArray[np.bool_]]: Index of the lunar month start, year, month & day cycle indexes, and validity mask
+	"""
+	ordinal_arr = np.asarray(ordinals, dtype=np.int64)
+	valid = (ordinal_arr >= _MIN_ORDINAL) & (ordinal_arr <= _MAX_ORDINAL)
+	abs_days = np.where(valid, ordinal_arr - KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF, 1)
+	month_start_inx = _DAY_MONTH_INDEX[abs_days - 1].astype(np.intp)
+	return month_start_inx, _MONTH_START_YEAR_CYCLE[month_start_inx], _MONTH_START_MONTH_CYCLE[month_start_inx], (abs_days + _DAY_CYCLE_OFFSET) % 60, valid
+
+
+def gap_ja(ordinals: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Get the gapja indexes (cheongan & ganji of the year, month & day) of arrays of ordinals.
+
+	Out of range ordinals are flagged in the returned validity mask, and their indexes are left zeroed.
+
+	> Note: `datetime64[D]` arrays convert to ordinals with `days.astype(np.int64) + 719163` (ordinal of 1970/01/01).
+
+	Args:
+		ordinals (npt.ArrayLike): Ordinals aligned with `datetime.date.toordinal` (solar 1000/02/13 ~ 2050/12/31)
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Gapja indexes (`GAP_JA_DTYPE` structured array: `year_cheongan`, `year_ganji`, `month_cheongan`, ...), and validity mask
+	"""
+	_, year_cycle, month_cycle, day_cycle, valid = _gap_ja_cycles(ordinals)
+	gap_ja_inx = np.zeros(valid.shape, dtype=GAP_JA_DTYPE)
+	for unit, cycle in (("year", year_cycle), ("month", month_cycle), ("day", day_cycle)):
+		gap_ja_inx[f"{unit}_cheongan"] = np.where(valid, cycle % 10, 0)
+		gap_ja_inx[f"{unit}_ganji"] = np.where(valid, cycle % 12, 0)
+	return gap_ja_inx, valid
+
+
+@cache
+def _gap_ja_names(locale: GapJaLocale) -> tuple[npt.NDArray[np.str_], npt.NDArray[np.str_], npt.NDArray[np.str_]]:
+	"""Get the gapja strings of every lunar month start & of the 60 days of the cycle in a language, built on first use.
+
+	Args:
+		locale (GapJaLocale): Gapja names of the language
+
+	Returns:
+		tuple[npt.NDArray[np.str_], npt.NDArray[np.str_], npt.NDArray[np.str_]]: `'CGU CGU '` (year & month) of each lunar month start, `'CGU'` of each day of the cycle & `' (IU)'` (or `''`) of each lunar month start
+	"""
+	month_names = np.array([
+		f"{locale.years[year_cycle]} {locale.months[month_cycle]} " for year_cycle, month_cycle in zip(_MONTH_START_YEAR_CYCLE.tolist(), _MONTH_START_MONTH_CYCLE.tolist())
+	])
+	intercalation_names = np.where(_MONTH_START_INTERCALATIONS, locale.intercalation, "")
+	return month_names, np.array(locale.days), intercalation_names
+
+
+def gap_ja_strings(ordinals: npt.ArrayLike, gapja_type: str = "KR") -> tuple[npt.NDArray[np.str_], npt.NDArray[np.bool_]]:
+	"""Get the gapja strings of arrays of ordinals.
+
+	The strings are assembled from precomputed tables (year & month of each lunar month start, 60 days of the cycle), without formatting any character per date. Out of range ordinals are flagged in the returned validity mask, and their string is left empty.
+
+	Args:
+		ordinals (npt.ArrayLike): Ordinals aligned with `datetime.date.toordinal` (solar 1000/02/13 ~ 2050/12/31)
+		gapja_type (str, optional): ISO 3166 of Korea ('KR') or China ('CN'), or any language registered with `register_gap_ja_locale`. Defaults to "KR".
+
+	Raises:
+		ValueError: If **gapja_type** is not valid
+
+	Returns:
+		tuple[npt.NDArray[np.str_], npt.NDArray[np.bool_]]: Gapja strings (as `get_gap_ja_string`: `CGU CGU CGU` or `CGU CGU CGU (IU)`), and validity mask
+	"""
+	month_names, day_names, intercalation_names = _gap_ja_names(get_gap_ja_locale(gapja_type))
+	month_start_inx, _, _, day_cycle, valid = _gap_ja_cycles(ordinals)
+	gap_ja_str = np.char.add(np.char.add(month_names[month_start_inx], day_names[day_cycle]), intercalation_names[month_start_inx])
+	return np.where(valid, gap_ja_str, ""), valid
+
+
+# Moments of the jeol (month starting solar terms, see `solar_terms`) as `ordinal * 1440 + minute of the day` (KST), in chronological order
+_SOLAR_TERM_MINUTE_ARR: Final[npt.NDArray[np.int64]] = np.array(_SOLAR_TERM_MINUTES, dtype=np.int64)
+# Ordinal (`datetime.date.toordinal`) of 1970/01/01, the epoch of `datetime64`
+_EPOCH_ORDINAL: Final[int] = 719163
+
+# Structured dtype of a pillar (cheongan & ganji indexes)
+PILLAR_DTYPE: Final[np.dtype] = np.dtype([("cheongan", "u1"), ("ganji", "u1")])
+
+
+def _solar_term_indexes(moments: npt.ArrayLike) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+	"""Get the index of the last jeol on or before each of arrays of moments.
+
+	Args:
+		moments (npt.ArrayLike): `datetime64` moments in Korea Standard Time
+
+	Returns:
+		tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]: Ordinals of the days & minutes of the day (out of range moments replaced by the first supported day, at 00:00),
+			jeol indexes (`12 * (year - 1000) + month - 1`), and validity mask
+	"""
+	moment_arr = np.asarray(moments, dtype="datetime64[m]")
+	day_arr = moment_arr.astype("datetime64[D]")
+	ordinal_arr = day_arr.astype(np.int64) + _EPOCH_ORDINAL
+	valid = (ordinal_arr >= _MIN_ORDINAL) & (ordinal_arr <= _MAX_ORDINAL) & ~np.isnat(moment_arr)
+	ordinal_arr = np.where(valid, ordinal_arr, _MIN_ORDINAL)
+	minute_arr = np.where(valid, (moment_arr - day_arr).astype(np.int64), 0)
+	return ordinal_arr, minute_arr, np.searchsorted(_SOLAR_TERM_MINUTE_ARR, ordinal_arr * 1440 + minute_arr, side="right") - 1, valid
+
+
+def month_pillars(moments: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Get the month pillars of arrays of moments, the months being split at the jeol (as `solar_terms.month_pillar`).
+
+	Each moment costs a binary search in the ~12.6k moments of the jeol. Out of range moments (and `NaT`) are flagged in the returned validity mask, and their indexes are left zeroed.
+
+	Args:
+		moments (npt.ArrayLike): `datetime64` moments in Korea Standard Time (solar 1000/02/13 ~ 2050/12/31)
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Month pillars (`PILLAR_DTYPE` structured array: `cheongan`, `ganji`), and validity mask
+	"""
+	_, _, term_inx, valid = _solar_term_indexes(moments)
+	month_cycle = (term_inx + _MONTH_CYCLE_OFFSET) % 60
+	pillars = np.zeros(valid.shape, dtype=PILLAR_DTYPE)
+	pillars["cheongan"] = np.where(valid, month_cycle % 10, 0)
+	pillars["ganji"] = np.where(valid, month_cycle % 12, 0)
+	return pillars, valid
+
+
+# Structured dtype of the four pillars indexes
+FOUR_PILLARS_DTYPE: Final[np.dtype] = np.dtype([
+	("year_cheongan", "u1"), ("year_ganji", "u1"),
+	("month_cheongan", "u1"), ("month_ganji", "u1"),
+	("day_cheongan", "u1"), ("day_ganji", "u1"),
+	("hour_cheongan", "u1"), ("hour_ganji", "u1"),
+])
+
+
+def four_pillars(moments: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Get the four pillars (year, month, day & hour gapja indexes) of arrays of moments (as `solar_terms.four_pillars`).
+
+	The year & month cycle indexes cost a binary search in the moments of the jeol per moment, the day & hour ones are arithmetic on the day count.
+	Out of range moments (and `NaT`) are flagged in the returned validity mask, and their indexes are left zeroed.
+
+	Args:
+		moments (npt.ArrayLike): `datetime64` moments in Korea Standard Time (solar 1000/02/13 ~ 2050/12/31)
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Four pillars indexes (`FOUR_PILLARS_DTYPE` structured array: `year_cheongan`, `year_ganji`, `month_cheongan`, ..., `hour_ganji`), and validity mask
+	"""
+	ordinal_arr, minute_arr, term_inx, valid = _solar_term_indexes(moments)
+	year_cycle = ((term_inx - 1) // 12 + 36) % 60
+	month_cycle = (term_inx + _MONTH_CYCLE_OFFSET) % 60
+	day_cycle = (ordinal_arr - KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF + _DAY_CYCLE_OFFSET) % 60
+	# Double hour from the ja (子) hour starting the day (12: 23:00 ~ 24:00, the one starting the next day), & its cycle index
+	hour_inx = (minute_arr // 60 + 1) // 2
+	hour_cycle = (day_cycle % 5 * 12 + hour_inx) % 60
+	pillars = np.zeros(valid.shape, dtype=FOUR_PILLARS_DTYPE)
+	for unit, cycle in (("year", year_cycle), ("month", month_cycle), ("day", day_cycle), ("hour", hour_cycle)):
+		pillars[f"{unit}_cheongan"] = np.where(valid, cycle % 10, 0)
+		pillars[f"{unit}_ganji"] = np.where(valid, cycle % 12, 0)
+	return pillars, valid
+
+
+# Trailing argument of the iso format of a lunar date in an intercalation month, as code points
+_INTERCALATION_ISO_SUFFIX: Final[npt.NDArray[np.uint32]] = np.array([ord(c) for c in " Intercalation"], dtype=np.uint32)
+# Positions of the digits in `'YYYY-MM-DD'`, and their weights in the year, month & day
+_ISO_DIGIT_POSITIONS: Final[list[int]] = [0, 1, 2, 3, 5, 6, 8, 9]
+_ISO_YEAR_WEIGHTS: Final[npt.NDArray[np.int64]] = np.array([1000, 100, 10, 1], dtype=np.int64)
+
+
+def _parse_iso_fields(texts: npt.ArrayLike) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+	"""Parse the year, month & day of arrays of dates in iso format `'YYYY-MM-DD'`, optionally followed by `' Intercalation'`, without checking the dates.
+
+	The strings are viewed as a 2D array of code points (one row per string), so that each field is parsed column-wise.
+
+	Args:
+		texts (npt.ArrayLike): Dates in iso format
+
+	Returns:
+		tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: Years, months, days, intercalation flags, and lengths mask (`'YYYY-MM-DD'` or `'YYYY-MM-DD Intercalation'`) with well-formed `'YYYY-MM-DD'` prefix
+	"""
+	text_arr = np.asarray(texts, dtype=np.str_)
+	lengths = np.char.str_len(text_arr)
+	# Longer strings are invalid anyway (as told by their length): they are truncated, and shorter ones padded with '\0'
+	width = 10 + len(_INTERCALATION_ISO_SUFFIX)
+	codes = text_arr.astype(f"<U{width}").reshape(-1).view(np.uint32).reshape((*text_arr.shape, width))
+
+	digits = codes[..., _ISO_DIGIT_POSITIONS].astype(np.int64) - ord("0")
+	well_formed = ((digits >= 0) & (digits <= 9)).all(axis=-1) & (codes[..., 4] == ord("-")) & (codes[..., 7] == ord("-"))
+	is_intercalation = (lengths == width) & (codes[..., 10:] == _INTERCALATION_ISO_SUFFIX).all(axis=-1)
+	well_formed &= (lengths == 10) | is_intercalation
+	return digits[..., :4] @ _ISO_YEAR_WEIGHTS, digits[..., 4] * 10 + digits[..., 5], digits[..., 6] * 10 + digits[..., 7], is_intercalation, well_formed
+
+
+def parse_solar_iso(texts: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Parse arrays of solar dates in iso format `'YYYY-MM-DD'` (as `SolarDate.iso_format`).
+
+	Invalid strings (not in iso format, or not a valid date) are flagged in the returned validity mask, and their parsed date is left zeroed.
+
+	Args:
+		texts (npt.ArrayLike): Solar dates in iso format `'YYYY-MM-DD'`
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Solar dates (`SOLAR_DTYPE` structured array: `year`, `month`, `day`), and validity mask
+	"""
+	year_arr, month_arr, day_arr, is_intercalation, valid = _parse_iso_fields(texts)
+	valid &= ~is_intercalation & _valid_solar(year_arr, month_arr, day_arr)
+
+	solar_dates = np.zeros(valid.shape, dtype=SOLAR_DTYPE)
+	solar_dates["year"] = np.where(valid, year_arr, 0)
+	solar_dates["month"] = np.where(valid, month_arr, 0)
+	solar_dates["day"] = np.where(valid, day_arr, 0)
+	return solar_dates, valid
+
+
+def parse_lunar_iso(texts: npt.ArrayLike) -> tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]:
+	"""Parse arrays of lunar dates in iso format `'YYYY-MM-DD'` or `'YYYY-MM-DD Intercalation'` (as `LunarDate.iso_format`).
+
+	Invalid strings (not in iso format, or not a valid date) are flagged in the returned validity mask, and their parsed date is left zeroed.
+
+	Args:
+		texts (npt.ArrayLike): Lunar dates in iso format `'YYYY-MM-DD'`, with trailing argument `' Intercalation'` if in the intercalation month
+
+	Returns:
+		tuple[npt.NDArray[np.void], npt.NDArray[np.bool_]]: Lunar dates (`LUNAR_DTYPE` structured array: `year`, `month`, `day`, `is_intercalation`), and validity mask
+	"""
+	year_arr, month_arr, day_arr, is_intercalation, valid = _parse_iso_fields(texts)
+	valid &= _valid_lunar(year_arr, month_arr, day_arr, is_intercalation)
+
+	lunar_dates = np.zeros(valid.shape, dtype=LUNAR_DTYPE)
+	lunar_dates["year"] = np.where(valid, year_arr, 0)
+	lunar_dates["month"] = np.where(valid, month_arr, 0)
+	lunar_dates["day"] = np.where(valid, day_arr, 0)
+	lunar_dates["is_intercalation"] = valid & is_intercalation
+	return lunar_dates, valid
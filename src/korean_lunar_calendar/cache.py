@@ -0,0 +1,175 @@
+"""Opt-in memoization layer around the conversion functions.
+
+`CachedConverter` keeps the most recently used conversion results (immutable values only, keyed by the input date) in a bounded LRU cache, and counts its hits, misses and evictions.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import date
+from threading import Lock
+from typing import NamedTuple, TypeVar
+
+from .korean_lunar_calendar import (
+	LunarDate,
+	SolarDate,
+	from_date,
+	to_date,
+	to_lunar,
+	to_solar,
+)
+
+_T = TypeVar("_T")
+
+
+class CacheInfo(NamedTuple):
+	"""Statistics of a `CachedConverter`.
+
+	Attributes:
+		hits (int): Number of conversions served from the cache
+		misses (int): Number of conversions computed (invalid inputs included)
+		evictions (int): Number of results evicted from the cache to respect **maxsize**
+		maxsize (int | None): Maximum number of cached results (`None`: unbounded)
+		currsize (int): Current number of cached results
+	"""
+
+	hits: int
+	misses: int
+	evictions: int
+	maxsize: int | None
+	currsize: int
+
+
+class CachedConverter:
+	"""Convert dates with an LRU cache of the results.
+
+	Every conversion method shares the same cache, keyed on the direction of the conversion and the input date. Invalid inputs raise the same `ValueError` as the underlying functions, and are not cached.
+
+	The cache is protected by a lock, so a single instance can be shared by several threads.
+
+	Examples
+	--------
+	```python
+	converter = CachedConverter(maxsize=10_000)
+	converter.to_lunar(SolarDate(2025, 10, 6)) # => LunarDate(year=2025, month=8, day=15, is_intercalation=False)
+	converter.cache_info() # => CacheInfo(hits=0, misses=1, evictions=0, maxsize=10000, currsize=1)
+	```
+	"""
+
+	def __init__(self, maxsize: int | None = 4096) -> None:
+		"""Create an empty cache.
+
+		Args:
+			maxsize (int | None, optional): Maximum number of cached results, the least recently used ones being evicted first (`None`: unbounded, `0`: no caching). Defaults to 4096.
+
+		Raises:
+			ValueError: If **maxsize** is negative
+		"""
+		if maxsize is not None and maxsize < 0:
+			raise ValueError(f"maxsize is:{maxsize}\nShould be: a non-negative integer or None")
+		self.maxsize: int | None = maxsize
+		self.__cache: OrderedDict[Hashable, object] = OrderedDict()
+		self.__lock: Lock = Lock()
+		self.__hits: int = 0
+		self.__misses: int = 0
+		self.__evictions: int = 0
+
+	def __get(self, key: Hashable, convert: Callable[[], _T]) -> _T:
+		"""Get the cached result for **key**, or compute it with **convert** and cache it.
+
+		Args:
+			key (Hashable): Cache key
+			convert (Callable[[], _T]): Computes the result on a cache miss
+
+		Returns:
+			_T: Conversion result
+		"""
+		with self.__lock:
+			if key in self.__cache:
+				self.__hits += 1
+				self.__cache.move_to_end(key)
+				return self.__cache[key] # type: ignore[return-value]
+			self.__misses += 1
+		# Computed outside of the lock: concurrent misses on the same key only compute the same immutable result twice
+		result: _T = convert()
+		if self.maxsize != 0:
+			with self.__lock:
+				self.__cache[key] = result
+				self.__cache.move_to_end(key)
+				if self.maxsize is not None:
+					while len(self.__cache) > self.maxsize:
+						self.__cache.popitem(last=False)
+						self.__evictions += 1
+		return result
+
+	def to_lunar(self, solar_date: SolarDate) -> LunarDate:
+		"""Convert a solar date to a lunar date, through the cache (see `to_lunar`).
+
+		Args:
+			solar_date (SolarDate): Solar date
+
+		Raises:
+			ValueError: If **solar_date** is not valid
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		return self.__get(("to_lunar", *solar_date), lambda: to_lunar(solar_date))
+
+	def to_solar(self, lunar_date: LunarDate) -> SolarDate:
+		"""Convert a lunar date to a solar date, through the cache (see `to_solar`).
+
+		Args:
+			lunar_date (LunarDate): Lunar date
+
+		Raises:
+			ValueError: If **lunar_date** is not valid
+
+		Returns:
+			SolarDate: Solar date
+		"""
+		return self.__get(("to_solar", *lunar_date), lambda: to_solar(lunar_date))
+
+	def from_date(self, solar_date: date) -> LunarDate:
+		"""Convert a `datetime.date` to a lunar date, through the cache (see `from_date`).
+
+		Args:
+			solar_date (date): Solar date
+
+		Raises:
+			ValueError: If **solar_date** is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		return self.__get(("from_date", solar_date), lambda: from_date(solar_date))
+
+	def to_date(self, lunar_date: LunarDate) -> date:
+		"""Convert a lunar date to a `datetime.date`, through the cache (see `to_date`).
+
+		Args:
+			lunar_date (LunarDate): Lunar date
+
+		Raises:
+			ValueError: If **lunar_date** is not valid
+
+		Returns:
+			date: Solar date
+		"""
+		return self.__get(("to_date", *lunar_date), lambda: to_date(lunar_date))
+
+	def cache_info(self) -> CacheInfo:
+		"""Get the statistics of the cache.
+
+		Returns:
+			CacheInfo: Hits, misses, evictions, maximum & current size
+		"""
+		with self.__lock:
+			return CacheInfo(self.__hits, self.__misses, self.__evictions, self.maxsize, len(self.__cache))
+
+	def cache_clear(self) -> None:
+		"""Empty the cache and reset its statistics."""
+		with self.__lock:
+			self.__cache.clear()
+			self.__hits = 0
+			self.__misses = 0
+			self.__evictions = 0
@@ -0,0 +1,323 @@
+"""Command line bulk converter: `python -m korean_lunar_calendar`.
+
+Streams CSV or JSONL records (from files or stdin) in chunks, and appends the lunar date of their solar date column, its intercalation flag and, optionally, its Korean/Chinese gapja strings.
+
+Examples
+--------
+```bash
+# date,name
+# 2025-07-25,foo
+python -m korean_lunar_calendar --gapja dates.csv
+# date,name,lunar_date,is_intercalation,gapja
+# 2025-07-25,foo,2025-06-01,true,을사년 계미월 을미일 (윤월)
+
+zcat export.jsonl.gz | python -m korean_lunar_calendar --format jsonl --date-column birthday > converted.jsonl
+```
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor
+from datetime import date
+from functools import partial
+from typing import IO, Final, NamedTuple
+
+from .korean_lunar_calendar import (
+	_MAX_ORDINAL,
+	_MIN_ORDINAL,
+	_ORDINAL_ABS_DAY_DIFF,
+	_abs_days_to_lunar,
+	_gap_ja_str,
+	_get_gap_ja,
+)
+from .parallel import _check_workers, _chunks, _map_chunks, _pool
+
+# Size of the read/write buffers of the streamed files
+_BUFFER_SIZE: Final[int] = 1 << 20
+# Length of a solar date in iso format `'YYYY-MM-DD'`
+_ISO_DATE_LENGTH: Final[int] = 10
+_ERRORS: Final[tuple[str, ...]] = ("strict", "skip", "blank")
+
+# Converted columns of a record: lunar date, intercalation flag & gapja strings (`None`: invalid date)
+_Converted = tuple[str | bool, ...] | None
+# Error of a converted chunk: index of the first invalid record in the chunk & its description
+_ChunkError = tuple[int, str] | None
+
+
+def convert_values(values: Iterable[str], gapja_types: Sequence[str] = ()) -> list[_Converted]:
+	"""Convert solar dates in iso format `'YYYY-MM-DD'`, as done for each chunk of records.
+
+	Args:
+		values (Iterable[str]): Solar dates in iso format `'YYYY-MM-DD'`
+		gapja_types (Sequence[str], optional): Gapja strings to add, as ISO 3166 of Korea ('KR') or China ('CN'). Defaults to ().
+
+	Returns:
+		list[_Converted]: `(lunar_date, is_intercalation, *gapja_strings)` for each value, `None` if it is not a valid date of the supported range
+	"""
+	converted: list[_Converted] = []
+	append = converted.append
+	for value in values:
+		# Only `'YYYY-MM-DD'` (as `parse_solar_iso`): `date.fromisoformat` also accepts e.g. `'YYYYMMDD'` & `'YYYY-Www-D'` since Python 3.11
+		if not isinstance(value, str) or len(value) != _ISO_DATE_LENGTH or value[4] != "-" or value[7] != "-":
+			append(None)
+			continue
+		try:
+			ordinal: int = date.fromisoformat(value).toordinal()
+		except ValueError:
+			append(None)
+			continue
+		if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+			append(None)
+			continue
+		year, month, day, is_intercalation = _abs_days_to_lunar(ordinal - _ORDINAL_ABS_DAY_DIFF)
+		lunar_date: str = f"{year:04d}-{month:02d}-{day:02d}"
+		if gapja_types:
+			gap_ja_inx = _get_gap_ja(year, month, day, is_intercalation)
+			append((lunar_date, is_intercalation, *(_gap_ja_str(gap_ja_inx, is_intercalation, gapja_type) for gapja_type in gapja_types)))
+		else:
+			append((lunar_date, is_intercalation))
+	return converted
+
+
+class _Options(NamedTuple):
+	"""Conversion options of the records, sent along with each chunk to the worker processes.
+
+	Attributes:
+		date_column (str): Column of the solar dates
+		columns (tuple[str, ...]): Added columns
+		gapja_types (tuple[str, ...]): Gapja strings to add ('KR' and/or 'CN')
+		errors (str): Handling of invalid dates: 'strict', 'skip' or 'blank'
+	"""
+
+	date_column: str
+	columns: tuple[str, ...]
+	gapja_types: tuple[str, ...]
+	errors: str
+
+
+def _invalid_date(options: _Options, value: object) -> str:
+	"""Describe an invalid date.
+
+	Args:
+		options (_Options): Conversion options
+		value (object): Invalid date
+
+	Returns:
+		str: Description of the invalid date
+	"""
+	return f"{options.date_column} is:{value!r}\nShould be: a solar date 'YYYY-MM-DD' between 1000-02-13 and 2050-12-31"
+
+
+def _convert_csv_chunk(options: _Options, date_inx: int, rows: list[list[str]]) -> tuple[list[list[str]], _ChunkError]:
+	"""Convert a chunk of CSV rows.
+
+	Args:
+		options (_Options): Conversion options
+		date_inx (int): Index of the date column
+		rows (list[list[str]]): Rows
+
+	Returns:
+		tuple[list[list[str]], _ChunkError]: Converted rows (up to the first invalid one with `errors='strict'`) & error
+	"""
+	dates: list[str] = [row[date_inx] if date_inx < len(row) else "" for row in rows]
+	blank: list[str] = [""] * len(options.columns)
+	converted_rows: list[list[str]] = []
+	for inx, (row, values) in enumerate(zip(rows, convert_values(dates, options.gapja_types))):
+		if values is not None:
+			converted_rows.append([*row, str(values[0]), "true" if values[1] else "false", *map(str, values[2:])])
+		elif options.errors == "strict":
+			return converted_rows, (inx, _invalid_date(options, dates[inx]))
+		elif options.errors == "blank":
+			converted_rows.append(row + blank)
+	return converted_rows, None
+
+
+def _convert_jsonl_chunk(options: _Options, lines: list[str]) -> tuple[str, _ChunkError]:
+	"""Convert a chunk of JSONL lines.
+
+	Args:
+		options (_Options): Conversion options
+		lines (list[str]): Lines, each one being a JSON object
+
+	Returns:
+		tuple[str, _ChunkError]: Converted lines (up to the first invalid one) & error
+	"""
+	error: _ChunkError = None
+	records: list[dict] = []
+	for inx, line in enumerate(lines):
+		try:
+			record = json.loads(line)
+		except ValueError:
+			record = None
+		if not isinstance(record, dict):
+			error = (inx, f"line is:{line.strip()}\nShould be: a JSON object")
+			break
+		records.append(record)
+
+	# Not checked as strings: anything else is an invalid date
+	dates: list = [record.get(options.date_column) for record in records]
+	converted_lines: list[str] = []
+	blank: tuple[None, ...] = (None,) * len(options.columns)
+	for inx, (record, values) in enumerate(zip(records, convert_values(dates, options.gapja_types))):
+		if values is None:
+			if options.errors == "strict":
+				return "".join(converted_lines), (inx, _invalid_date(options, dates[inx]))
+			if options.errors == "skip":
+				continue
+		record.update(zip(options.columns, values if values is not None else blank))
+		converted_lines.append(json.dumps(record, ensure_ascii=False))
+		converted_lines.append("\n")
+	return "".join(converted_lines), error
+
+
+class _Converter:
+	"""Stream records chunk by chunk through the worker processes (if any)."""
+
+	def __init__(self, args: argparse.Namespace, executor: Executor | None) -> None:
+		columns: list[str] = [args.lunar_column, args.intercalation_column]
+		if args.gapja:
+			columns.append(args.gapja_column)
+		if args.chinese_gapja:
+			columns.append(args.chinese_gapja_column)
+		gapja_types: tuple[str, ...] = (("KR",) if args.gapja else ()) + (("CN",) if args.chinese_gapja else ())
+		self.options: _Options = _Options(args.date_column, tuple(columns), gapja_types, args.errors)
+		self.delimiter: str = args.delimiter
+		self.chunk_size: int = args.chunk_size
+		self.executor: Executor | None = executor
+		self.max_in_flight: int = 2 * args.workers
+		self.record_count: int = 0
+		self.header: list[str] | None = None
+
+	def __check(self, chunk_size: int, error: _ChunkError) -> None:
+		"""Count the records of a converted chunk, and raise its error, if any.
+
+		Args:
+			chunk_size (int): Number of records in the chunk
+			error (_ChunkError): Error of the chunk
+
+		Raises:
+			ValueError: If the chunk has an error
+		"""
+		if error is not None:
+			raise ValueError(f"record {self.record_count + error[0] + 1}: {error[1]}")
+		self.record_count += chunk_size
+
+	def csv(self, input_file: IO[str], output_file: IO[str]) -> None:
+		"""Convert a CSV file, its first row being the header.
+
+		Args:
+			input_file (IO[str]): Input file
+			output_file (IO[str]): Output file
+
+		Raises:
+			ValueError: If the header or a date is not valid
+		"""
+		# Empty lines are skipped (as by `csv.DictReader`, & as the empty lines of JSONL files)
+		reader: Iterator[list[str]] = (row for row in csv.reader(input_file, delimiter=self.delimiter) if row)
+		writer = csv.writer(output_file, delimiter=self.delimiter, lineterminator="\n")
+		header: list[str] | None = next(reader, None)
+		if header is None:
+			return
+		if self.options.date_column not in header:
+			raise ValueError(f"date_column is:{self.options.date_column!r}\nShould be one of: {header}")
+		if self.header is None:
+			self.header = header
+			writer.writerow(header + list(self.options.columns))
+		elif header != self.header:
+			raise ValueError(f"header is:{header}\nShould be (as in the first file): {self.header}")
+		convert = partial(_convert_csv_chunk, self.options, header.index(self.options.date_column))
+		for chunk, (rows, error) in _map_chunks(convert, _chunks(reader, self.chunk_size), self.executor, self.max_in_flight):
+			writer.writerows(rows)
+			self.__check(len(chunk), error)
+
+	def jsonl(self, input_file: IO[str], output_file: IO[str]) -> None:
+		"""Convert a JSONL file, with one JSON object per line.
+
+		Args:
+			input_file (IO[str]): Input file
+			output_file (IO[str]): Output file
+
+		Raises:
+			ValueError: If a line or a date is not valid
+		"""
+		convert = partial(_convert_jsonl_chunk, self.options)
+		lines: Iterator[str] = (line for line in input_file if line.strip())
+		for chunk, (converted_lines, error) in _map_chunks(convert, _chunks(lines, self.chunk_size), self.executor, self.max_in_flight):
+			output_file.write(converted_lines)
+			self.__check(len(chunk), error)
+
+
+def _parser() -> argparse.ArgumentParser:
+	"""Build the command line parser.
+
+	Returns:
+		argparse.ArgumentParser: Command line parser
+	"""
+	parser = argparse.ArgumentParser(
+		prog="python -m korean_lunar_calendar",
+		description="Append the lunar date (and gapja) of a solar date column to CSV or JSONL records.",
+	)
+	parser.add_argument("files", nargs="*", default=["-"], help="input files ('-': stdin, default)")
+	parser.add_argument("-o", "--output", default="-", help="output file ('-': stdout, default)")
+	parser.add_argument("-f", "--format", choices=("csv", "jsonl"), default="csv", help="input & output format (default: %(default)s)")
+	parser.add_argument("-d", "--date-column", default="date", help="column of the solar dates 'YYYY-MM-DD' (default: %(default)s)")
+	parser.add_argument("--delimiter", default=",", help="CSV delimiter (default: %(default)r)")
+	parser.add_argument("--lunar-column", default="lunar_date", help="added lunar date column (default: %(default)s)")
+	parser.add_argument("--intercalation-column", default="is_intercalation", help="added intercalation flag column (default: %(default)s)")
+	parser.add_argument("--gapja", action="store_true", help="add the Korean gapja string")
+	parser.add_argument("--gapja-column", default="gapja", help="added Korean gapja column (default: %(default)s)")
+	parser.add_argument("--chinese-gapja", action="store_true", help="add the Chinese gapja string")
+	parser.add_argument("--chinese-gapja-column", default="chinese_gapja", help="added Chinese gapja column (default: %(default)s)")
+	parser.add_argument("--errors", choices=_ERRORS, default="strict", help="invalid dates: stop with an error, skip the record or leave the added columns blank (default: %(default)s)")
+	parser.add_argument("--chunk-size", type=int, default=10_000, help="number of records converted at once (default: %(default)s)")
+	parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes converting the chunks (0: one per CPU, default: %(default)s)")
+	return parser
+
+
+def _open(path: str, mode: str) -> IO[str]:
+	"""Open a file (or stdin/stdout for `'-'`) in text mode, with a large buffer.
+
+	Args:
+		path (str): File path, or `'-'`
+		mode (str): `'r'` or `'w'`
+
+	Returns:
+		IO[str]: Opened file (stdin/stdout are not closed when it is)
+	"""
+	if path == "-":
+		return open((sys.stdin if mode == "r" else sys.stdout).fileno(), mode, buffering=_BUFFER_SIZE, encoding="utf-8", newline="", closefd=False)
+	return open(path, mode, buffering=_BUFFER_SIZE, encoding="utf-8", newline="")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+	"""Run the command line converter.
+
+	Args:
+		argv (Sequence[str] | None, optional): Command line arguments. Defaults to None (`sys.argv[1:]`).
+
+	Returns:
+		int: Exit code
+	"""
+	parser = _parser()
+	args = parser.parse_args(argv)
+	if args.chunk_size < 1:
+		parser.error(f"chunk_size is:{args.chunk_size}\nShould be: a positive integer")
+	if args.workers < 0:
+		parser.error(f"workers is:{args.workers}\nShould be: a positive integer, or 0")
+	args.workers = _check_workers(args.workers or None)
+	if args.output == "-":
+		sys.stdout.flush()
+	try:
+		with _pool(args.workers) as executor, _open(args.output, "w") as output_file:
+			converter = _Converter(args, executor)
+			convert = converter.csv if args.format == "csv" else converter.jsonl
+			for path in args.files:
+				with _open(path, "r") as input_file:
+					convert(input_file, output_file)
+	except (OSError, ValueError) as e:
+		print(f"{parser.prog}: error: {e}", file=sys.stderr)
+		return 1
+	return 0
@@ -0,0 +1,184 @@
+"""Dense look-up table of the lunar date of every supported solar day.
+
+`DenseTable` precomputes the lunar date of each of the 383,827 solar days between 1000-02-13 and 2050-12-31 into a packed `array('I')` (~1.5 MB), so that every solar to lunar conversion is a single index operation.
+
+The table can be saved to a file, and memory-mapped back (`mmap`), so that worker processes share the same pages instead of building their own copy.
+
+Each lunar date is packed in 32 bits (see `korean_lunar_calendar.packing`).
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from datetime import date
+from os import PathLike
+from types import TracebackType
+from typing import Final, final
+
+from .korean_lunar_calendar import KoreanLunarCalendar, LunarDate, SolarDate
+from .packing import _pack, _unpack
+
+# File header: magic number & format version, followed by the table as little-endian unsigned 32-bit integers
+_FILE_MAGIC: Final[bytes] = b"KLCD\x00\x00\x00\x01"
+
+_MIN_ORDINAL: Final[int] = KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF + 1
+# Number of solar days between 1000-02-13 and 2050-12-31 (included)
+DAY_COUNT: Final[int] = date(2050, 12, 31).toordinal() - KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF
+
+
+@final
+class DenseTable:
+	"""Lunar date of every supported solar day, indexed by ordinal (`datetime.date.toordinal`).
+
+	Examples
+	--------
+	```python
+	DenseTable.build().save("lunar.bin")
+
+	# In every worker process: the pages of the file are shared
+	with DenseTable.load("lunar.bin") as table:
+		table.from_date(datetime.date(2025, 7, 25)) # => LunarDate(year=2025, month=6, day=1, is_intercalation=True)
+	```
+	"""
+
+	def __init__(self, table: "array[int] | memoryview", mmap_: mmap.mmap | None = None) -> None:
+		"""Wrap a packed table (see `build` & `load`).
+
+		Args:
+			table (array[int] | memoryview): Packed lunar date of every supported solar day
+			mmap_ (mmap.mmap | None, optional): Memory map backing **table**, closed by `close`. Defaults to None.
+
+		Raises:
+			ValueError: If **table** does not have `DAY_COUNT` elements
+		"""
+		if len(table) != DAY_COUNT:
+			raise ValueError(f"table length is:{len(table)}\nShould be: {DAY_COUNT}")
+		self.__table: array[int] | memoryview = table
+		self.__mmap: mmap.mmap | None = mmap_
+
+	@classmethod
+	def build(cls) -> "DenseTable":
+		"""Build the table from `KoreanLunarCalendar.LUNAR_MONTH_STARTS`.
+
+		Returns:
+			DenseTable: Table held in memory
+		"""
+		table: array[int] = array("I")
+		month_starts = KoreanLunarCalendar.LUNAR_MONTH_STARTS
+		for month_start, next_month_start in zip(month_starts, month_starts[1:] + (None,)):
+			month_days: int = (next_month_start.abs_days if next_month_start is not None else DAY_COUNT + 1) - month_start.abs_days
+			table.extend(_pack(month_start.year, month_start.month, day, month_start.is_intercalation) for day in range(1, month_days + 1))
+		del table[DAY_COUNT:]
+		return cls(table)
+
+	@classmethod
+	def load(cls, path: str | PathLike[str], use_mmap: bool = True) -> "DenseTable":
+		"""Load a table saved by `save`.
+
+		Args:
+			path (str | PathLike[str]): File path
+			use_mmap (bool, optional): Memory-map the file (shared between processes) rather than reading it. Defaults to True.
+
+		Raises:
+			ValueError: If the file is not a valid table
+
+		Returns:
+			DenseTable: Loaded table
+		"""
+		with open(path, "rb") as f:
+			# Checked before casting the data, which a truncated file would not fill
+			if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC or os.fstat(f.fileno()).st_size - len(_FILE_MAGIC) != DAY_COUNT * 4:
+				raise ValueError(f"path is:{path}\nShould be: a file saved by DenseTable.save")
+			if use_mmap and sys.byteorder == "little":
+				mmap_: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+				try:
+					if mmap_.size() - len(_FILE_MAGIC) != DAY_COUNT * 4:
+						raise ValueError(f"path is:{path}\nShould be: a file saved by DenseTable.save")
+					return cls(memoryview(mmap_)[len(_FILE_MAGIC):].cast("I"), mmap_)
+				except BaseException:
+					mmap_.close()
+					raise
+			packed: array[int] = array("I")
+			packed.frombytes(f.read())
+		if sys.byteorder != "little":
+			packed.byteswap()
+		return cls(packed)
+
+	def save(self, path: str | PathLike[str]) -> None:
+		"""Save the table to a file, to be loaded (and memory-mapped) by `load`.
+
+		Args:
+			path (str | PathLike[str]): File path
+		"""
+		packed: array[int] = array("I", self.__table)
+		if sys.byteorder != "little":
+			packed.byteswap()
+		with open(path, "wb") as f:
+			f.write(_FILE_MAGIC)
+			packed.tofile(f)
+
+	def close(self) -> None:
+		"""Release the memory map backing the table, if any."""
+		if self.__mmap is not None:
+			if isinstance(self.__table, memoryview):
+				self.__table.release()
+			self.__mmap.close()
+			self.__mmap = None
+
+	def __enter__(self) -> "DenseTable":
+		"""Use the table as a context manager, closing it on exit."""
+		return self
+
+	def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+		"""Close the table (see `close`)."""
+		self.close()
+
+	def __len__(self) -> int:
+		"""Get the number of days in the table: `DAY_COUNT`."""
+		return len(self.__table)
+
+	def from_ordinal(self, ordinal: int) -> LunarDate:
+		"""Get the lunar date of an ordinal aligned with `datetime.date.toordinal`.
+
+		Args:
+			ordinal (int): Ordinal of the day
+
+		Raises:
+			ValueError: If **ordinal** is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		inx: int = ordinal - _MIN_ORDINAL
+		if not 0 <= inx < DAY_COUNT:
+			raise ValueError(f"ordinal is:{ordinal}\nShould be between: {_MIN_ORDINAL} and {_MIN_ORDINAL + DAY_COUNT - 1}")
+		return _unpack(self.__table[inx])
+
+	def from_date(self, solar_date: date) -> LunarDate:
+		"""Convert a `datetime.date` to a lunar date.
+
+		Args:
+			solar_date (date): Solar date
+
+		Raises:
+			ValueError: If **solar_date** is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		return self.from_ordinal(solar_date.toordinal())
+
+	def to_lunar(self, solar_date: SolarDate) -> LunarDate:
+		"""Convert a solar date to a lunar date.
+
+		Args:
+			solar_date (SolarDate): Solar date
+
+		Raises:
+			ValueError: If **solar_date** is not valid
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		return self.from_ordinal(date(*solar_date).toordinal())
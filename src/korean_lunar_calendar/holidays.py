@@ -0,0 +1,160 @@
+"""Korean lunar holidays and yearly lunar anniversaries.
+
+Lunar holidays (Seollal, Buddha's Birthday, Chuseok) and anniversaries (birthdays, memorial rites, i.e. jesa) fall on the same lunar month & day every year.
+Each year is resolved from its own bit fields in `KOREAN_LUNAR_DATA` and from the precomputed month starts, in O(1), without any full conversion.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Final, NamedTuple
+
+from .korean_lunar_calendar import (
+	_BASE_YEAR,
+	_LUNAR_DATA,
+	_LUNAR_MONTH_START_DAYS,
+	_LUNAR_YEAR_FIRST_MONTH_INDEX,
+	_MAX_ORDINAL,
+	_ORDINAL_ABS_DAY_DIFF,
+	DayOverflowPolicy,
+	IntercalationPolicy,
+	KoreanLunarCalendar,
+	LunarDate,
+	SolarDate,
+	_abs_days_to_solar,
+	_check_policies,
+	_check_valid_date,
+	_lunar_abs_days,
+	_resolve_lunar_date,
+)
+
+# Duration in days between base lunar date (1000/01/01) and the last supported date (included)
+_MAX_ABS_DAYS: Final[int] = _MAX_ORDINAL - _ORDINAL_ABS_DAY_DIFF
+
+
+class Holiday(NamedTuple):
+	"""Lunar holiday of a given year.
+
+	Attributes:
+		name (str): Name of the holiday
+		lunar_date (LunarDate): Lunar date
+		solar_date (SolarDate): Solar date
+	"""
+
+	name: str
+	lunar_date: LunarDate
+	solar_date: SolarDate
+
+
+# Name, lunar month & lunar day of the main day of each Korean lunar holiday, in calendar order
+# (Seollal & Chuseok are observed from the day before to the day after, see `LunarDate.add_days`)
+LUNAR_HOLIDAYS: Final[tuple[tuple[str, int, int], ...]] = (
+	("Seollal", 1, 1),
+	("Buddha's Birthday", 4, 8),
+	("Chuseok", 8, 15),
+)
+
+
+def holidays(years: Iterable[int], lunar_holidays: Iterable[tuple[str, int, int]] = LUNAR_HOLIDAYS) -> list[Holiday]:
+	"""Get the lunar holidays of the given lunar years.
+
+	Args:
+		years (Iterable[int]): Lunar years, e.g. `range(2025, 2031)`
+		lunar_holidays (Iterable[tuple[str, int, int]], optional): Name, lunar month & lunar day of each holiday, in calendar order. Defaults to `LUNAR_HOLIDAYS`.
+
+	Raises:
+		ValueError: If a holiday is out of the supported range, or its month or day is not valid
+
+	Returns:
+		list[Holiday]: Holidays, year by year
+
+	Examples:
+		```python
+		holidays(range(2025, 2026)) # => [Holiday(name='Seollal', lunar_date=LunarDate(year=2025, month=1, day=1, is_intercalation=False), solar_date=SolarDate(year=2025, month=1, day=29)), ...]
+		```
+	"""
+	years = tuple(years)
+	lunar_holidays = tuple(lunar_holidays)
+	for _, month, day in lunar_holidays:
+		if not 1 <= month <= 12 or not 1 <= day <= KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY: # noqa: PLR2004
+			raise ValueError(f"month/day is:{month}/{day}\nShould be: a lunar month & day existing every year (day up to {KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY})")
+	# One pass over the years per holiday
+	holiday_abs_days: list[list[int]] = [list(_anniversary_abs_days(month, day, False, years, intercalation="raise", overflow="raise")) for _, month, day in lunar_holidays]
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	new = tuple.__new__
+	return [
+		new(Holiday, (name, new(LunarDate, (year, month, day, False)), _abs_days_to_solar(abs_days[year_inx])))
+		for year_inx, year in enumerate(years)
+		for (name, month, day), abs_days in zip(lunar_holidays, holiday_abs_days)
+	]
+
+
+def lunar_anniversaries(
+	lunar_date: LunarDate, years: Iterable[int], intercalation: IntercalationPolicy = "regular", overflow: DayOverflowPolicy = "clip",
+) -> list[SolarDate]:
+	"""Get the solar dates of the yearly anniversary of a lunar date (birthday, memorial rite, ...) in the given lunar years, in one pass.
+
+	Args:
+		lunar_date (LunarDate): Original lunar date
+		years (Iterable[int]): Lunar years, e.g. `range(2025, 2031)`
+		intercalation (IntercalationPolicy, optional): Policy when the intercalation month of **lunar_date** is missing from a year (`"regular"`: the regular month is used). Defaults to "regular".
+		overflow (DayOverflowPolicy, optional): Policy when the day of **lunar_date** is missing from the month of a year (`"clip"`: day 29 is used instead of day 30). Defaults to "clip".
+
+	Raises:
+		ValueError: If **lunar_date** or a policy is not valid, if a `"raise"` policy applies, or if an anniversary is out of the supported range
+
+	Returns:
+		list[SolarDate]: Solar date of the anniversary in each year of **years**
+
+	Examples:
+		```python
+		# Memorial rite of a death on the 29th day of the 6th intercalation month
+		lunar_anniversaries(LunarDate(2025, 6, 29, True), range(2026, 2028)) # => [SolarDate(year=2026, month=8, day=11), SolarDate(year=2027, month=8, day=1)]
+		```
+	"""
+	_check_policies(intercalation, overflow)
+	_, month, day, is_intercalation = lunar_date
+	if not _check_valid_date(True, is_intercalation, *lunar_date[:3]):
+		raise ValueError(f"lunar_date is:{lunar_date}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	return [_abs_days_to_solar(abs_days) for abs_days in _anniversary_abs_days(month, day, is_intercalation, years, intercalation=intercalation, overflow=overflow)]
+
+
+def _anniversary_abs_days(month:int, day:int, is_intercalation:bool, years: Iterable[int], *, intercalation:str, overflow:str) -> Iterator[int]: # noqa: PLR0913
+	"""Get the duration in days from base lunar date (1000/01/01) of a lunar month & day in each of the given years (see `lunar_anniversaries`, once its arguments are checked).
+
+	The month of each year is read from its bit fields (as `__get_lunar_intercalation_month` & `__get_lunar_days_`) and its start from `_LUNAR_MONTH_START_DAYS`.
+	The rare cases needing a policy other than `"regular"` & `"clip"`, or out of the supported range, are left to `_resolve_lunar_date`.
+
+	Args:
+		month (int): Month
+		day (int): Day
+		is_intercalation (bool): Intercalation month
+		years (Iterable[int]): Lunar years
+		intercalation (str): Policy for an intercalation month missing from a year
+		overflow (str): Policy for a day missing from a month
+
+	Raises:
+		ValueError: If a `"raise"` policy applies, or if an anniversary is out of the supported range
+
+	Yields:
+		int: Duration in days (base lunar date included) of the anniversary in each year
+	"""
+	year_count: int = len(_LUNAR_DATA)
+	for year in years:
+		year_inx: int = year - _BASE_YEAR
+		if 0 <= year_inx < year_count:
+			lunar_data: int = _LUNAR_DATA[year_inx]
+			# `|0000|0000|0000|0000|XXXX|....|....|....|`
+			intercalation_month: int = (lunar_data >> 12) & 0x000F
+			in_intercalation: bool = is_intercalation and intercalation_month == month
+			if in_intercalation or not is_intercalation or intercalation == "regular":
+				# `|0000|0000|0000|000X|....|....|....|....|` or `|0000|0000|0000|0000|0000|YYYY|YYYY|YYYY|`: one of the Ys
+				month_days: int = KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY + ((lunar_data >> (16 if in_intercalation else 12 - month)) & 0x01)
+				if day <= month_days or overflow == "clip":
+					month_inx: int = _LUNAR_YEAR_FIRST_MONTH_INDEX[year_inx] + month - 1
+					# The intercalation month comes right after its regular month
+					if intercalation_month > 0 and (intercalation_month < month or in_intercalation):
+						month_inx += 1
+					abs_days: int = _LUNAR_MONTH_START_DAYS[month_inx] + min(day, month_days) - 1
+					if abs_days <= _MAX_ABS_DAYS:
+						yield abs_days
+						continue
+		yield _lunar_abs_days(*_resolve_lunar_date(year, month, day, is_intercalation, intercalation=intercalation, overflow=overflow))
@@ -0,0 +1,153 @@
+"""Opt-in instrumentation of the entry points (conversions, validation, parsing & gapja formatting).
+
+Each instrumented entry point starts with a check of a single module global, `None` while instrumentation is disabled: the hooks stay in place on the hot path at (almost) no cost.
+Once enabled (`set_profiler`, `enable_counters`), every call to an entry point is timed, and reported to the profiler and/or counted:
+
+* call count, invalid input count (a `ValueError` or `TypeError` raised, or `False` returned by a setter) & cumulative time, per entry point
+* the profiler is called with the event name (the name of the entry point) & the duration in nanoseconds
+
+Only the outermost entry point of a call is reported: e.g. `KoreanLunarCalendar.set_date` is reported once, not along with the conversions it may use.
+Instrumentation is process-wide (all threads are reported): worker processes started by `korean_lunar_calendar.parallel` are only instrumented if forked after it was enabled.
+"""
+
+import threading
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any, NamedTuple, TypeVar
+
+from . import korean_lunar_calendar
+
+_R = TypeVar("_R")
+
+# Profiler: called with the event name & the duration in nanoseconds of each call to an entry point
+Profiler = Callable[[str, int], None]
+
+
+class EntryPointStats(NamedTuple):
+	"""Counters of an entry point.
+
+	Attributes:
+		calls (int): Number of calls
+		invalid (int): Number of calls with an invalid input
+		total_ns (int): Cumulative duration of the calls, in nanoseconds
+	"""
+
+	calls: int
+	invalid: int
+	total_ns: int
+
+
+class _Instrumentation(threading.local):
+	"""Hook installed in `korean_lunar_calendar.korean_lunar_calendar._instrumentation` while instrumentation is enabled.
+
+	As a `threading.local`, **active** (whether a call to an entry point is being reported) is specific to each thread, whereas the profiler & counters are shared.
+	"""
+
+	active: bool = False
+
+	def __init__(self, profiler: Profiler | None, counters: dict[str, list[int]] | None) -> None:
+		"""Initialize the hook (once per thread, with the same arguments).
+
+		Args:
+			profiler (Profiler | None): Profiler (`None`: no profiler)
+			counters (dict[str, list[int]] | None): `[calls, invalid, total_ns]` per entry point (`None`: no counters)
+		"""
+		self.profiler = profiler
+		self.counters = counters
+
+	def call(self, event: str, func: Callable[..., _R], *args: Any) -> _R:
+		"""Call an entry point, & report it.
+
+		Args:
+			event (str): Event name (name of the entry point)
+			func (Callable[..., _R]): Entry point, not reported again as **active** is set while it runs
+			*args (Any): Arguments of **func**
+
+		Returns:
+			_R: Result of **func**
+		"""
+		self.active = True
+		is_invalid: bool = True
+		start: int = perf_counter_ns()
+		try:
+			result: _R = func(*args)
+			is_invalid = result is False
+			return result
+		finally:
+			duration: int = perf_counter_ns() - start
+			# Still active while reporting, so that the entry points used by the profiler are not reported (nor recursively profiled)
+			try:
+				if self.counters is not None:
+					with _COUNTERS_LOCK:
+						stats: list[int] = self.counters.setdefault(event, [0, 0, 0])
+						stats[0] += 1
+						stats[1] += is_invalid
+						stats[2] += duration
+				if self.profiler is not None:
+					self.profiler(event, duration)
+			finally:
+				self.active = False
+
+
+# `[calls, invalid, total_ns]` per entry point, kept while the counters are disabled
+_COUNTERS: dict[str, list[int]] = {}
+_COUNTERS_LOCK: threading.Lock = threading.Lock()
+_profiler: Profiler | None = None
+_counting: bool = False
+
+
+def _install() -> None:
+	"""Install the hook in `korean_lunar_calendar.korean_lunar_calendar` (or remove it if neither the profiler nor the counters are enabled)."""
+	korean_lunar_calendar._instrumentation = _Instrumentation(_profiler, _COUNTERS if _counting else None) if _profiler is not None or _counting else None
+
+
+def set_profiler(profiler: Profiler | None) -> None:
+	"""Set (or unset) the profiler, called with the event name & duration in nanoseconds of each call to an entry point.
+
+	Args:
+		profiler (Profiler | None): Profiler (`None`: disabled)
+
+	Examples:
+		```python
+		set_profiler(lambda event, duration_ns: histograms[event].observe(duration_ns))
+		```
+	"""
+	global _profiler # noqa: PLW0603
+	_profiler = profiler
+	_install()
+
+
+def enable_counters(enabled: bool = True) -> None:
+	"""Enable (or disable) the counters of the entry points (see `get_counters`).
+
+	The counters are kept while disabled, until `reset_counters`.
+
+	Args:
+		enabled (bool, optional): Whether the calls are counted. Defaults to True.
+	"""
+	global _counting # noqa: PLW0603
+	_counting = enabled
+	_install()
+
+
+def get_counters() -> dict[str, EntryPointStats]:
+	"""Get the counters of the entry points called while the counters were enabled (since the last reset).
+
+	Returns:
+		dict[str, EntryPointStats]: Counters per entry point
+
+	Examples:
+		```python
+		enable_counters()
+		to_lunar(SolarDate(2025, 7, 25))
+		get_counters() # => {'to_lunar': EntryPointStats(calls=1, invalid=0, total_ns=...)}
+		```
+	"""
+	with _COUNTERS_LOCK:
+		return {event: EntryPointStats(*stats) for event, stats in _COUNTERS.items()}
+
+
+def reset_counters() -> None:
+	"""Reset the counters of the entry points."""
+	with _COUNTERS_LOCK:
+		_COUNTERS.clear()
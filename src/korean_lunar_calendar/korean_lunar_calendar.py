@@ -14,14 +14,373 @@ To Gregorian proleptic calendar.
 
 By:
 @author : https://github.com/RR5555
+
+---
+
+The module-level functions (`to_lunar`, `to_solar`, `from_date`, `to_date`, `lunar_to_ordinal`, `gap_ja`, ...) only read the constant look-up tables of `KoreanLunarCalendar` and return immutable values: unlike the setters of a shared `KoreanLunarCalendar` instance, they can be called concurrently from any number of threads without locks.
 """
 
-from typing import Final
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date
+from enum import IntEnum
+from itertools import accumulate, islice
+from typing import TYPE_CHECKING, Final, Generic, Literal, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+	from .instrumentation import _Instrumentation
 
 
 # ruff: noqa: PLR2004
 
 
+_T = TypeVar("_T")
+
+# Policy for an intercalation month missing from the target year (see `LunarDate.add_lunar_months`):
+# `"regular"` falls back to the regular month, `"raise"` raises a `ValueError`
+IntercalationPolicy = Literal["regular", "raise"]
+# Policy for a day missing from the target month, e.g. day 30 in a 29-day month (see `LunarDate.add_lunar_months`):
+# `"clip"` falls back to the last day of the month, `"next"` rolls over to the following month, `"raise"` raises a `ValueError`
+DayOverflowPolicy = Literal["clip", "next", "raise"]
+
+# Instrumentation of the entry points, installed by `korean_lunar_calendar.instrumentation`:
+# while `None` (disabled), an entry point only pays for this global lookup
+_instrumentation: "_Instrumentation | None" = None
+
+
+def _build_lunar_year_start_days(lunar_data_table: Sequence[int]) -> tuple[int, ...]:
+	"""Build the prefix sums of the lunar year durations.
+
+	Element `i` is the number of days between the beginning of the base lunar year (1000) and the beginning of lunar year `1000+i`, the last element being the total number of lunar days covered by **lunar_data_table**.
+
+	Args:
+		lunar_data_table (Sequence[int]): Lunar data of every year, starting from the base year
+
+	Returns:
+		tuple[int, ...]: Duration in days before each lunar year (`len(lunar_data_table)+1` elements)
+	"""
+	# `|0000|00XX|XXXX|XXX.|....|....|....|....|`: up to 511 days
+	return tuple(accumulate(((lunar_data >> 17) & 0x01FF for lunar_data in lunar_data_table), initial=0))
+
+
+def _build_solar_year_start_days(lunar_data_table: Sequence[int]) -> tuple[int, ...]:
+	"""Build the prefix sums of the solar year durations.
+
+	Element `i` is the number of days between the beginning of the base solar year (1000) and the beginning of solar year `1000+i`, the last element being the total number of solar days covered by **lunar_data_table**.
+
+	Args:
+		lunar_data_table (Sequence[int]): Lunar data of every year, starting from the base year
+
+	Returns:
+		tuple[int, ...]: Duration in days before each solar year (`len(lunar_data_table)+1` elements)
+	"""
+	# `|0X..|....|....|....|....|....|....|....|`: solar intercalation year (366 days) or not (365 days)
+	return tuple(accumulate((366 if ((lunar_data >> 30) & 0x01) > 0 else 365 for lunar_data in lunar_data_table), initial=0))
+
+
+class LunarMonthStart(NamedTuple):
+	"""First day of a lunar month.
+
+	Attributes:
+		abs_days (int): Duration in days between lunar base date (1000/01/01) and the first day of the month (included)
+		year (int): Lunar year
+		month (int): Lunar month
+		is_intercalation (bool): Whether it is the intercalation month following the regular **month**
+	"""
+
+	abs_days: int
+	year: int
+	month: int
+	is_intercalation: bool
+
+
+class SolarDate(NamedTuple):
+	"""Immutable solar date (Gregorian proleptic calendar).
+
+	Attributes:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+	"""
+
+	year: int
+	month: int
+	day: int
+
+	def iso_format(self) -> str:
+		"""Get solar date as a string in iso format `'YYYY-MM-DD'`.
+
+		Returns:
+			str: Solar date in iso format `'YYYY-MM-DD'`
+		"""
+		return "%04d-%02d-%02d" % (self.year, self.month, self.day)
+
+
+class LunarDate(NamedTuple):
+	"""Immutable lunar date.
+
+	Attributes:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+		is_intercalation (bool): Whether the day is in the intercalation month following the regular **month**. Defaults to False.
+	"""
+
+	year: int
+	month: int
+	day: int
+	is_intercalation: bool = False
+
+	def iso_format(self) -> str:
+		"""Get lunar date as a string in iso format `'YYYY-MM-DD'` with optional trailing argument `'YYYY-MM-DD Intercalation'` if `self.is_intercalation`.
+
+		Returns:
+			str: Lunar date in iso format `'YYYY-MM-DD'` with optional trailing argument `'YYYY-MM-DD Intercalation'` if `self.is_intercalation`
+		"""
+		date_str:str = "%04d-%02d-%02d" % (self.year, self.month, self.day)
+		if self.is_intercalation :
+			date_str += " Intercalation"
+		return date_str
+
+	def add_days(self, days: int) -> "LunarDate":
+		"""Get the lunar date **days** days after this one (before if negative).
+
+		Args:
+			days (int): Number of days
+
+		Raises:
+			ValueError: If this lunar date is not valid, or if the result is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+
+		Examples:
+			```python
+			LunarDate(2025, 6, 30).add_days(1) # => LunarDate(year=2025, month=6, day=1, is_intercalation=True)
+			```
+		"""
+		abs_days: int = lunar_to_ordinal(self) - _ORDINAL_ABS_DAY_DIFF + days
+		if not _MIN_ORDINAL <= abs_days + _ORDINAL_ABS_DAY_DIFF <= _MAX_ORDINAL:
+			raise ValueError(f"days is:{days}\nShould keep the lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+		return _abs_days_to_lunar(abs_days)
+
+	def add_lunar_months(
+		self, months: int, count_intercalation: bool = False, intercalation: IntercalationPolicy = "regular", overflow: DayOverflowPolicy = "clip",
+	) -> "LunarDate":
+		"""Get the lunar date with the same day **months** lunar months after this one (before if negative).
+
+		By default, months are counted by number (intercalation months are skipped, as `add_lunar_years(1)` is `add_lunar_months(12)`):
+		a date in an intercalation month lands in the intercalation month of the target month if the target year has one, else **intercalation** applies.
+		With **count_intercalation**, every lunar month counts, intercalation months included.
+
+		Args:
+			months (int): Number of lunar months
+			count_intercalation (bool, optional): Whether intercalation months are counted as months. Defaults to False.
+			intercalation (IntercalationPolicy, optional): Policy for an intercalation month missing from the target year. Defaults to "regular".
+			overflow (DayOverflowPolicy, optional): Policy for a day missing from the target month (day 30 in a 29-day month). Defaults to "clip".
+
+		Raises:
+			ValueError: If this lunar date or a policy is not valid, if a `"raise"` policy applies, or if the result is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+
+		Examples:
+			```python
+			LunarDate(2025, 3, 30).add_lunar_months(1) # => LunarDate(year=2025, month=4, day=29, is_intercalation=False)
+			LunarDate(2025, 6, 10).add_lunar_months(1, count_intercalation=True) # => LunarDate(year=2025, month=6, day=10, is_intercalation=True)
+			```
+		"""
+		_check_policies(intercalation, overflow)
+		year, month, day, is_intercalation = self
+		if not _check_valid_date(True, is_intercalation, year, month, day):
+			raise ValueError(f"lunar_date is:{self}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+		if count_intercalation:
+			month_inx: int = bisect_right(_LUNAR_MONTH_START_DAYS, _lunar_abs_days(year, month, day, is_intercalation)) - 1 + months
+			if not 0 <= month_inx < len(_LUNAR_MONTH_START_KEYS):
+				raise ValueError(f"months is:{months}\nShould keep the lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+			# `|YYYY|YYYY|YYYY|MMMM|I|`
+			month_key: int = _LUNAR_MONTH_START_KEYS[month_inx]
+			return _resolve_lunar_date(month_key >> 5, (month_key >> 1) & 0x0F, day, (month_key & 0x01) > 0, intercalation=intercalation, overflow=overflow)
+		month_count: int = year * 12 + month - 1 + months
+		return _resolve_lunar_date(month_count // 12, month_count % 12 + 1, day, is_intercalation, intercalation=intercalation, overflow=overflow)
+
+	def add_lunar_years(self, years: int, intercalation: IntercalationPolicy = "regular", overflow: DayOverflowPolicy = "clip") -> "LunarDate":
+		"""Get the lunar date with the same month & day **years** lunar years after this one (before if negative), e.g. a lunar birthday.
+
+		Args:
+			years (int): Number of lunar years
+			intercalation (IntercalationPolicy, optional): Policy for an intercalation month missing from the target year. Defaults to "regular".
+			overflow (DayOverflowPolicy, optional): Policy for a day missing from the target month (day 30 in a 29-day month). Defaults to "clip".
+
+		Raises:
+			ValueError: If this lunar date or a policy is not valid, if a `"raise"` policy applies, or if the result is out of the supported range
+
+		Returns:
+			LunarDate: Lunar date
+
+		Examples:
+			```python
+			LunarDate(2025, 6, 15, True).add_lunar_years(1) # => LunarDate(year=2026, month=6, day=15, is_intercalation=False)
+			```
+		"""
+		_check_policies(intercalation, overflow)
+		year, month, day, is_intercalation = self
+		if not _check_valid_date(True, is_intercalation, year, month, day):
+			raise ValueError(f"lunar_date is:{self}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+		return _resolve_lunar_date(year + years, month, day, is_intercalation, intercalation=intercalation, overflow=overflow)
+
+
+class Pillar(NamedTuple):
+	"""Gapja (sexagenary cycle) indexes of a year, a month or a day.
+
+	Attributes:
+		cheongan (int): Cheongan (stem, sky): index in the 10 cycle [0-9]
+		ganji (int): Ganji (branch, earth): index in the 12 cycle [0-11]
+	"""
+
+	cheongan: int
+	ganji: int
+
+
+class GapJa(NamedTuple):
+	"""Gapja (sexagenary cycle) indexes of a lunar date.
+
+	Attributes:
+		year (Pillar): Year gapja indexes
+		month (Pillar): Month gapja indexes (lunar intercalation months are ignored)
+		day (Pillar): Day gapja indexes
+	"""
+
+	year: Pillar
+	month: Pillar
+	day: Pillar
+
+
+class GapJaLocale(NamedTuple):
+	"""Gapja names of a language, indexed by position in the sexagenary cycle (0: 갑자/甲子, ..., 59: 계해/癸亥).
+
+	The position `n` of a `Pillar` in the cycle is the one for which `n % 10 == cheongan` and `n % 12 == ganji`: `(6 * cheongan - 5 * ganji) % 60`.
+
+	Attributes:
+		years (tuple[str, ...]): Names of the 60 years
+		months (tuple[str, ...]): Names of the 60 months
+		days (tuple[str, ...]): Names of the 60 days
+		intercalation (str): Appended to the gapja string of the dates of an intercalation month
+	"""
+
+	years: tuple[str, ...]
+	months: tuple[str, ...]
+	days: tuple[str, ...]
+	intercalation: str
+
+	@classmethod
+	def from_characters(cls, cheongan: Sequence[str], ganji: Sequence[str], units: Sequence[str], intercalation: str) -> "GapJaLocale":
+		"""Build the names `CGU` of a language from its cheongan `C`, ganji `G` and unit `U` names.
+
+		Args:
+			cheongan (Sequence[str]): Names of the 10 cheongan
+			ganji (Sequence[str]): Names of the 12 ganji
+			units (Sequence[str]): Names of the year, month and day units
+			intercalation (str): Appended to the gapja string of the dates of an intercalation month
+
+		Returns:
+			GapJaLocale: Gapja names
+		"""
+		years, months, days = (tuple(cheongan[n % 10] + ganji[n % 12] + unit for n in range(60)) for unit in units)
+		return cls(years, months, days, intercalation)
+
+
+class DateCheck(IntEnum):
+	"""Outcome of the check of a date: valid, or why it is not (see `check_lunar_date` & `check_solar_date`).
+
+	When several checks fail, the first one in the order below is reported.
+
+	Attributes:
+		VALID (int): Valid date
+		OUT_OF_RANGE (int): Out of the supported range (`KOREAN_LUNAR_MIN_VALUE` ~ `KOREAN_LUNAR_MAX_VALUE`, resp. `KOREAN_SOLAR_MIN_VALUE` ~ `KOREAN_SOLAR_MAX_VALUE`)
+		INVALID_MONTH (int): Month not in [1-12]
+		INVALID_INTERCALATION (int): Intercalation month while the lunar year has none for this month
+		INVALID_DAY (int): Day not in the month (e.g. 30th day of a lunar month of 29 days)
+	"""
+
+	VALID = 0
+	OUT_OF_RANGE = 1
+	INVALID_MONTH = 2
+	INVALID_INTERCALATION = 3
+	INVALID_DAY = 4
+
+
+def _build_lunar_month_start_columns(lunar_data_table: Sequence[int], base_year: int) -> tuple[tuple[int, ...], memoryview]:
+	"""Build the columns of the chronologically sorted list of every lunar month start (regular and intercalation months).
+
+	The months are keyed by a single int `|YYYY|YYYY|YYYY|MMMM|I|` (`year << 5 | month << 1 | is_intercalation`), cheaper to build & to read than a `LunarMonthStart`, and packed in a read-only `memoryview` of 4 byte items.
+	The days stay in a tuple, which `bisect` searches faster than an `array`.
+
+	Args:
+		lunar_data_table (Sequence[int]): Lunar data of every year, starting from the base year
+		base_year (int): Year of the first element of **lunar_data_table**
+
+	Returns:
+		tuple[tuple[int, ...], memoryview]: Duration in days between lunar base date (1000/01/01) and the first day of each month (included), and key of each month
+	"""
+	month_keys: list[int] = []
+	month_days: list[int] = []
+	for year, lunar_data in enumerate(lunar_data_table, base_year):
+		# `|0000|0000|0000|0000|XXXX|....|....|....|`
+		intercalation_month: int = (lunar_data >> 12) & 0x000F
+		year_key: int = year << 5
+		for month in range(1, 13):
+			month_keys.append(year_key | month << 1)
+			# `|0000|0000|0000|0000|0000|YYYY|YYYY|YYYY|`: one of the Ys
+			month_days.append(29 + ((lunar_data >> (12 - month)) & 0x01))
+			if month == intercalation_month:
+				month_keys.append(year_key | month << 1 | 1)
+				# `|0000|0000|0000|000X|....|....|....|....|`
+				month_days.append(29 + ((lunar_data >> 16) & 0x01))
+	return tuple(accumulate(month_days[:-1], initial=1)), memoryview(array("I", month_keys).tobytes()).cast("I")
+
+
+def _build_lunar_month_starts(calendar: type["KoreanLunarCalendar"]) -> tuple[LunarMonthStart, ...]:
+	"""Build the chronologically sorted list of every lunar month start (regular and intercalation months).
+
+	Args:
+		calendar (type[KoreanLunarCalendar]): Class holding the columns of the month starts (`LUNAR_MONTH_START_DAYS` & `LUNAR_MONTH_START_KEYS`)
+
+	Returns:
+		tuple[LunarMonthStart, ...]: Every lunar month start, sorted by **abs_days**
+	"""
+	return tuple(
+		LunarMonthStart(abs_days, key >> 5, (key >> 1) & 0x0F, (key & 0x01) > 0) for abs_days, key in zip(calendar.LUNAR_MONTH_START_DAYS, calendar.LUNAR_MONTH_START_KEYS)
+	)
+
+
+class _LazyClassAttribute(Generic[_T]):
+	"""Class attribute built on first access, then stored on the class in place of this descriptor (so that later accesses cost nothing).
+
+	Concurrent first accesses may each build the value: all of them being equal, the last one stored wins.
+	"""
+
+	def __init__(self, build: Callable[[type], _T]) -> None:
+		"""Wrap the builder of the attribute.
+
+		Args:
+			build (Callable[[type], _T]): Build the attribute from the class holding it
+		"""
+		self.__build: Callable[[type], _T] = build
+		self.__name: str = ""
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.__name = name
+
+	def __get__(self, instance: object, owner: type) -> _T:
+		value: _T = self.__build(owner)
+		setattr(owner, self.__name, value)
+		return value
+
+
 class KoreanLunarCalendar:
 	r"""Handle lunar calendar from 1000-02-13 (solar calendar) to 2050-12-31 (solar calendar) by fetching data from look-up tables.
 
@@ -102,6 +461,8 @@ class KoreanLunarCalendar:
 
 	KOREAN_LUNAR_BASE_YEAR: Final[int] = 1000
 	SOLAR_LUNAR_DAY_DIFF: Final[int] = 43
+	# Solar: 1000/02/13 (1st absolute day) -> `datetime.date(1000, 2, 13).toordinal()`: 364921 => 364920 days diff.
+	ORDINAL_ABS_DAY_DIFF: Final[int] = 364920
 
 	# Lunar month duration is between 29 & 30 days
 	LUNAR_SMALL_MONTH_DAY: Final[int] = 29
@@ -123,8 +484,9 @@ class KoreanLunarCalendar:
 
 	INTERCALATION_STR: Final[tuple[int, ...]] = (0xc724, 0x958f) # 2 ('윤', '閏'): Leap, resp. in korean, and in chinese
 
-	# 8 figure hexadecimal -> 32bits; len: 1051;
-	KOREAN_LUNAR_DATA: Final[tuple[int, ...]] = (
+	# 8 figure hexadecimal -> 32bits; len: 1051; packed in a read-only `memoryview` of 4 byte items (4 bytes per year, instead of a tuple of int objects),
+	# backed by `bytes` so that it cannot be modified (the conversions read their own copy, `_LUNAR_DATA`)
+	KOREAN_LUNAR_DATA: Final[memoryview] = memoryview(array("I", (
 			0x82c60a57, 0x82fec52b, 0x82c40d2a, 0x82c60d55, 0xc30095ad, 0x82c4056a, 0x82c6096d, 0x830054dd, 0xc2c404ad, 0x82c40a4d,
 			0x83002e4d, 0x82c40b26, 0xc300ab56, 0x82c60ad5, 0x82c4035a, 0x8300697a, 0xc2c6095b, 0x82c4049b, 0x83004a9b, 0x82c40a4b,
 			0xc301caa5, 0x82c406aa, 0x82c60ad5, 0x830092dd, 0xc2c402b5, 0x82c60957, 0x82fe54ae, 0x82c60c97, 0xc2c4064b, 0x82ff254a,
@@ -230,7 +592,20 @@ class KoreanLunarCalendar:
 			0xc3004b95, 0x82c406aa, 0x82c60ad5, 0x830026b5, 0xc2c404b6, 0x83006a6e, 0x82c60a57, 0x82c40527, 0xc2fe56a6, 0x82c60d93,
 			0x82c405aa, 0x83003b6a, 0xc2c6096d, 0x8300b4af, 0x82c404ae, 0x82c40a4d, 0xc3016d0d, 0x82c40d25, 0x82c40d52, 0x83005dd4,
 			0xc2c60b6a, 0x82c6096d, 0x8300255b, 0x82c4049b, 0xc3007a57, 0x82c40a4b, 0x82c40b25, 0x83015b25, 0xc2c406d4, 0x82c60ada,
-			0x830138b6)
+			0x830138b6)).tobytes()).cast("I")
+
+	# Prefix sums built once at class load: element `i` is the number of days before year `1000+i`; len: 1052;
+	# the derived tables below are built at import on purpose (~5 ms in all): every conversion reads them as plain module globals, which a lazy lookup would slow down
+	LUNAR_YEAR_START_DAYS: Final[tuple[int, ...]] = _build_lunar_year_start_days(KOREAN_LUNAR_DATA)
+	SOLAR_YEAR_START_DAYS: Final[tuple[int, ...]] = _build_solar_year_start_days(KOREAN_LUNAR_DATA)
+
+	# Columns of every lunar month start (regular & intercalation) sorted by absolute day; len: 12999;
+	# `abs_days` column, to be searched with `bisect`, and `|YYYY|YYYY|YYYY|MMMM|I|` key of each month (see `_build_lunar_month_start_columns`), both read-only
+	LUNAR_MONTH_START_DAYS: tuple[int, ...]
+	LUNAR_MONTH_START_KEYS: memoryview
+	LUNAR_MONTH_START_DAYS, LUNAR_MONTH_START_KEYS = _build_lunar_month_start_columns(KOREAN_LUNAR_DATA, KOREAN_LUNAR_BASE_YEAR)
+	# Every lunar month start as `LunarMonthStart`, built on first access (the conversions only read the columns above)
+	LUNAR_MONTH_STARTS: Final[_LazyClassAttribute[tuple[LunarMonthStart, ...]]] = _LazyClassAttribute(_build_lunar_month_starts)
 
 	def __init__(self) -> None:
 		self.lunar_year: int = 0
@@ -266,6 +641,22 @@ class KoreanLunarCalendar:
 		"""
 		return "%04d-%02d-%02d" % (self.solar_year, self.solar_month, self.solar_day)
 
+	def get_lunar_date(self) -> LunarDate:
+		"""Get the stored lunar date as an immutable value.
+
+		Returns:
+			LunarDate: Lunar date
+		"""
+		return LunarDate(self.lunar_year, self.lunar_month, self.lunar_day, self.is_intercalation)
+
+	def get_solar_date(self) -> SolarDate:
+		"""Get the stored solar date as an immutable value.
+
+		Returns:
+			SolarDate: Solar date
+		"""
+		return SolarDate(self.solar_year, self.solar_month, self.solar_day)
+
 	def __get_lunar_data(self, year: int) -> int:
 		"""Fetch `year-self.KOREAN_LUNAR_BASE_YEAR` (`year-1000`)  element in `self.KOREAN_LUNAR_DATA`.
 
@@ -358,16 +749,17 @@ class KoreanLunarCalendar:
 	def __get_lunar_days_before_base_year(self, year: int) -> int:
 		"""Get duration in days from korean lunar base year to given **year**.
 
+		Reads the precomputed prefix sums `self.LUNAR_YEAR_START_DAYS`, so the cost does not depend on **year**.
+
 		Args:
 			year (int): Year
 
 		Returns:
 			int: Duration in days
 		"""
-		days: int = 0
-		for base_year in range(self.KOREAN_LUNAR_BASE_YEAR, year + 1):
-			days += self.__get_lunar_days(base_year)
-		return days
+		if year < self.KOREAN_LUNAR_BASE_YEAR:
+			return 0
+		return self.LUNAR_YEAR_START_DAYS[year + 1 - self.KOREAN_LUNAR_BASE_YEAR]
 
 	def __get_lunar_days_before_base_month(self, year:int, month:int, is_intercalation:bool) -> int:
 		"""Get number of lunar days from the first day of the year to the end of the given **month** for the given **year**.
@@ -466,16 +858,17 @@ class KoreanLunarCalendar:
 	def __get_solar_days_before_base_year(self, year: int) -> int:
 		"""Get duration, in days, between the beginning of the base year (1000) and the end of the given year **year**.
 
+		Reads the precomputed prefix sums `self.SOLAR_YEAR_START_DAYS`, so the cost does not depend on **year**.
+
 		Args:
 			year (int): Year
 
 		Returns:
 			int: Duration in days
 		"""
-		days: int = 0
-		for base_year in range(self.KOREAN_LUNAR_BASE_YEAR, year + 1):
-			days += self.__get_solar_days(base_year)
-		return days
+		if year < self.KOREAN_LUNAR_BASE_YEAR:
+			return 0
+		return self.SOLAR_YEAR_START_DAYS[year + 1 - self.KOREAN_LUNAR_BASE_YEAR]
 
 	def __get_solar_days_before_base_month(self, year: int, month: int) -> int:
 		"""Get duration, in days, between the beginning of the year and the end of the given month for year **year**.
@@ -487,15 +880,12 @@ class KoreanLunarCalendar:
 		Returns:
 			int: Duration in days
 		"""
-		days: int = 0
-		for base_month in range(1, month + 1):
-			days += self.__get_solar_days(year, base_month)
-		return days
+		return _SOLAR_DAYS_BEFORE_MONTH[self.__is_solar_intercalation_year(self.__get_lunar_data(year))][month]
 
 	def __get_solar_abs_days(self, year: int, month: int, day: int) -> int:
 		"""Get duration in days between base lunar date (from `self.KOREAN_LUNAR_MIN_VALUE`: 1000/01/01) - or equivalently, base solar date (from `self.KOREAN_SOLAR_MIN_VALUE`: 1000/02/13) -, and the given solar date (included).
 
-		Basically, get the duration in days from the beginning of the base solar year (1000) to the given solar date. Then, subtract the `self.SOLAR_LUNAR_DAY_DIFF`: 43 days, to get the difference to the beginning of the base lunar year.
+		Basically, get the ordinal (`datetime.date.toordinal`) of the given solar date, and subtract `self.ORDINAL_ABS_DAY_DIFF`: 364920 days, the ordinal of the day before the base solar date.
 
 		Args:
 			year (int): Year
@@ -505,9 +895,7 @@ class KoreanLunarCalendar:
 		Returns:
 			int: Duration in days
 		"""
-		days:int = self.__get_solar_days_before_base_year(year-1) + self.__get_solar_days_before_base_month(year, month-1) + day
-		days -= self.SOLAR_LUNAR_DAY_DIFF
-		return days
+		return _solar_abs_days(year, month, day)
 
 	def __set_solar_date_by_lunar_date(self, lunar_year:int, lunar_month:int, lunar_day:int, is_intercalation:bool) -> None:
 		"""Set solar date class instance properties to given lunar date converted in solar date.
@@ -518,23 +906,7 @@ class KoreanLunarCalendar:
 			lunar_day (int): Day
 			is_intercalation (bool): Whether the day is in the regular or intercalation month (only applied if **lunar_month** has an intercalation month)
 		"""
-		abs_days = self.__get_lunar_abs_days(lunar_year, lunar_month, lunar_day, is_intercalation)
-		solar_year:int = 0
-		solar_month:int = 0
-		solar_day:int = 0
-
-		solar_year = lunar_year if (abs_days < self.__get_solar_abs_days(lunar_year+1, 1, 1)) else lunar_year+1
-
-		for month in range(12, 0, -1) :
-			abs_days_by_month:int = self.__get_solar_abs_days(solar_year, month, 1)
-			if (abs_days >= abs_days_by_month) :
-				solar_month = month
-				solar_day = abs_days - abs_days_by_month + 1
-				break
-
-		self.solar_year = solar_year
-		self.solar_month = solar_month
-		self.solar_day = solar_day
+		self.solar_year, self.solar_month, self.solar_day = _abs_days_to_solar(_lunar_abs_days(lunar_year, lunar_month, lunar_day, is_intercalation))
 
 	def __set_lunar_date_by_solar_date(self, solar_year:int, solar_month:int, solar_day:int) -> None:
 		"""Set solar date class instance properties to given solar date converted in lunar date.
@@ -544,26 +916,7 @@ class KoreanLunarCalendar:
 			solar_month (int): Month
 			solar_day (int): Day
 		"""
-		abs_days:int = self.__get_solar_abs_days(solar_year, solar_month, solar_day)
-		lunar_year:int = solar_year if (abs_days >= self.__get_lunar_abs_days(solar_year, 1, 1, False)) else solar_year-1
-		lunar_month:int = 0
-		lunar_day:int = 0
-		is_intercalation:bool = False
-
-		for month in range(12, 0, -1) :
-			abs_days_by_month = self.__get_lunar_abs_days(lunar_year, month, 1, False)
-			if abs_days >= abs_days_by_month:
-				lunar_month = month
-				if self.__get_lunar_intercalation_month(self.__get_lunar_data(lunar_year)) == month :
-					is_intercalation = abs_days >= self.__get_lunar_abs_days(lunar_year, month, 1, True)
-
-				lunar_day = abs_days - self.__get_lunar_abs_days(lunar_year, lunar_month, 1, is_intercalation) + 1
-				break
-
-		self.lunar_year = lunar_year
-		self.lunar_month = lunar_month
-		self.lunar_day = lunar_day
-		self.is_intercalation = is_intercalation
+		self.lunar_year, self.lunar_month, self.lunar_day, self.is_intercalation = _abs_days_to_lunar(_solar_abs_days(solar_year, solar_month, solar_day))
 
 	def __check_valid_date(self, is_lunar:bool, is_intercalation:bool, year:int, month:int, day:int) -> bool:
 		"""Check if the given date is valid.
@@ -578,29 +931,7 @@ class KoreanLunarCalendar:
 		Returns:
 			bool: Indicates if given date is valid
 		"""
-		is_valid:bool = False
-		date_value:int = year*10000 + month*100 + day
-		#1582. 10. 5 ~ 1582. 10. 14 is not valid when strictly considering Julian/Gregorian: But is valid in Gregorian Proleptic
-		min_value:int = self.KOREAN_LUNAR_MIN_VALUE if is_lunar else self.KOREAN_SOLAR_MIN_VALUE
-		max_value:int = self.KOREAN_LUNAR_MAX_VALUE if is_lunar else self.KOREAN_SOLAR_MAX_VALUE
-
-		if min_value <= date_value and max_value >= date_value : # noqa: SIM102
-			if month > 0 and month < 13 and day > 0 :
-				day_limit = self.__get_lunar_days(year, month, is_intercalation) if is_lunar else self.__get_solar_days(year, month)
-				# if not is_lunar and year == 1582 and month == 10 :
-				# 	if day > 4 and day < 15 :
-				# 		return is_valid
-				# 	else:
-				# 		day_limit += 10
-
-				if day <= day_limit:
-					is_valid = True
-
-				# Check whether intercalation is correct for lunar date
-				if is_lunar and is_intercalation and self.__get_lunar_intercalation_month(self.__get_lunar_data(year)) != month:
-					is_valid = False
-
-		return is_valid
+		return _check_valid_date(is_lunar, is_intercalation, year, month, day)
 
 	def set_lunar_date(self, lunar_year:int, lunar_month:int, lunar_day:int, is_intercalation:bool) -> bool:
 		"""Check if given lunar date is valid & subsequently set the internal dates (lunar & solar) to the one given, if it is valid.
@@ -614,6 +945,8 @@ class KoreanLunarCalendar:
 		Returns:
 			bool: Indicates if given lunar date is valid
 		"""
+		if _instrumentation is not None and not _instrumentation.active:
+			return _instrumentation.call("KoreanLunarCalendar.set_lunar_date", self.set_lunar_date, lunar_year, lunar_month, lunar_day, is_intercalation)
 		is_valid:bool = False
 		if self.__check_valid_date(True, is_intercalation, lunar_year, lunar_month, lunar_day):
 			self.lunar_year = lunar_year
@@ -637,6 +970,8 @@ class KoreanLunarCalendar:
 		Returns:
 			bool: Indicates if given solar date is valid
 		"""
+		if _instrumentation is not None and not _instrumentation.active:
+			return _instrumentation.call("KoreanLunarCalendar.set_solar_date", self.set_solar_date, solar_year, solar_month, solar_day)
 		is_valid: bool = False
 		if self.__check_valid_date(False, False, solar_year, solar_month, solar_day):
 			self.solar_year = solar_year
@@ -646,6 +981,37 @@ class KoreanLunarCalendar:
 			is_valid = True
 		return is_valid
 
+	def set_date(self, solar_date: date) -> bool:
+		"""Check if given `datetime.date` is in the supported range & subsequently set the internal dates (lunar & solar) to the one given, if it is.
+
+		As a `datetime.date` is always a valid date, only its range is checked.
+
+		Args:
+			solar_date (date): Solar date
+
+		Returns:
+			bool: Indicates if given solar date is in the supported range
+		"""
+		if _instrumentation is not None and not _instrumentation.active:
+			return _instrumentation.call("KoreanLunarCalendar.set_date", self.set_date, solar_date)
+		is_valid: bool = False
+		ordinal: int = solar_date.toordinal()
+		if _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+			self.solar_year = solar_date.year
+			self.solar_month = solar_date.month
+			self.solar_day = solar_date.day
+			self.lunar_year, self.lunar_month, self.lunar_day, self.is_intercalation = _abs_days_to_lunar(ordinal - self.ORDINAL_ABS_DAY_DIFF)
+			is_valid = True
+		return is_valid
+
+	def to_date(self) -> date:
+		"""Get the stored solar date as a `datetime.date`.
+
+		Returns:
+			date: Solar date
+		"""
+		return date(self.solar_year, self.solar_month, self.solar_day)
+
 	def __get_gap_ja(self) -> None:
 		"""Set the gapja indexes for the stored lunar date (`self.lunar_year`, `self.lunar_month`, `self.lunar_day`, `self.is_intercalation`).
 
@@ -700,27 +1066,8 @@ class KoreanLunarCalendar:
 				* `U`: Unit character
 				* `I`: Intercalation/Leap character
 		"""
-		_kr = ("KR",)
-		_cn = ("CN",)
-		if gapja_type in _kr:
-			cheongan: tuple[int, ...] = self.KOREAN_CHEONGAN
-			ganji: tuple[int, ...] = self.KOREAN_GANJI
-			gapja_unit: tuple[int, ...] = self.KOREAN_GAPJA_UNIT
-			intercalation_str: int = self.INTERCALATION_STR[0]
-		elif gapja_type in _cn:
-			cheongan = self.CHINESE_CHEONGAN
-			ganji = self.CHINESE_GANJI
-			gapja_unit = self.CHINESE_GAPJA_UNIT
-			intercalation_str = self.INTERCALATION_STR[1]
-		else:
-			raise ValueError(f"gapja_type is:{gapja_type}\nShould be:\nKorean: {_kr} OR Chinese: {_cn}")
-		gapja_str:str = "%c%c%c %c%c%c %c%c%c" % (chr(cheongan[self.__gapjaYearInx[0]]), chr(ganji[self.__gapjaYearInx[1]]), chr(gapja_unit[self.__gapjaYearInx[2]]),
-		chr(cheongan[self.__gapjaMonthInx[0]]), chr(ganji[self.__gapjaMonthInx[1]]), chr(gapja_unit[self.__gapjaMonthInx[2]]),
-		chr(cheongan[self.__gapjaDayInx[0]]), chr(ganji[self.__gapjaDayInx[1]]), chr(gapja_unit[self.__gapjaDayInx[2]]))
-
-		if self.is_intercalation:
-			gapja_str += " (%c%c)" % (chr(intercalation_str), chr(gapja_unit[1]))
-		return gapja_str
+		gap_ja_inx: GapJa = GapJa(Pillar(*self.__gapjaYearInx[:2]), Pillar(*self.__gapjaMonthInx[:2]), Pillar(*self.__gapjaDayInx[:2]))
+		return _gap_ja_str(gap_ja_inx, self.is_intercalation, gapja_type)
 
 	def get_gap_ja_string(self) -> str:
 		"""Get Korean gapja string for stored lunar date.
@@ -732,6 +1079,8 @@ class KoreanLunarCalendar:
 				* `U`: Unit character
 				* `I`: Intercalation/Leap character
 		"""
+		if _instrumentation is not None and not _instrumentation.active:
+			return _instrumentation.call("KoreanLunarCalendar.get_gap_ja_string", self.get_gap_ja_string)
 		self.__get_gap_ja()
 		gapja_str: str = self._get_gap_ja_str(gapja_type="KR")
 		return gapja_str
@@ -746,7 +1095,872 @@ class KoreanLunarCalendar:
 				* `U`: Unit character
 				* `I`: Intercalation/Leap character
 		"""
+		if _instrumentation is not None and not _instrumentation.active:
+			return _instrumentation.call("KoreanLunarCalendar.get_chinese_gap_ja_string", self.get_chinese_gap_ja_string)
 		self.__get_gap_ja()
 		gapja_str: str = self._get_gap_ja_str(gapja_type="CN")
 
 		return gapja_str
+
+
+_BASE_YEAR: Final[int] = KoreanLunarCalendar.KOREAN_LUNAR_BASE_YEAR
+# Private copy of the lunar data read by the conversions
+_LUNAR_DATA: Final["array[int]"] = array("I", KoreanLunarCalendar.KOREAN_LUNAR_DATA)
+_LUNAR_MONTH_START_DAYS: Final[tuple[int, ...]] = KoreanLunarCalendar.LUNAR_MONTH_START_DAYS
+# Private copy of the month keys read by the conversions
+_LUNAR_MONTH_START_KEYS: Final["array[int]"] = array("I", KoreanLunarCalendar.LUNAR_MONTH_START_KEYS)
+_ORDINAL_ABS_DAY_DIFF: Final[int] = KoreanLunarCalendar.ORDINAL_ABS_DAY_DIFF
+# Index in `_LUNAR_MONTH_START_DAYS` of the first month of each lunar year
+_LUNAR_YEAR_FIRST_MONTH_INDEX: Final[tuple[int, ...]] = tuple(
+	bisect_right(_LUNAR_MONTH_START_DAYS, days) for days in KoreanLunarCalendar.LUNAR_YEAR_START_DAYS[:-1]
+)
+# [is_solar_intercalation_year][month-1]: duration of the solar year before the given month (13 elements, last one being the year duration)
+_SOLAR_DAYS_BEFORE_MONTH: Final[tuple[tuple[int, ...], ...]] = (
+	tuple(accumulate(KoreanLunarCalendar.SOLAR_DAYS[:12], initial=0)),
+	tuple(accumulate((KoreanLunarCalendar.SOLAR_DAYS[0], KoreanLunarCalendar.SOLAR_DAYS[12], *KoreanLunarCalendar.SOLAR_DAYS[2:12]), initial=0)),
+)
+
+# Supported range of ordinals: solar 1000/02/13 ~ 2050/12/31
+_MIN_ORDINAL: Final[int] = date(1000, 2, 13).toordinal()
+_MAX_ORDINAL: Final[int] = date(2050, 12, 31).toordinal()
+
+
+def _check_valid_date(is_lunar:bool, is_intercalation:bool, year:int, month:int, day:int) -> bool:
+	"""Check if the given date is valid.
+
+	Args:
+		is_lunar (bool): Lunar or solar date
+		is_intercalation (bool): Intercalation (has to exist if lunar date) or regular month
+		year (int): Year
+		month (int): Month
+		day (int): Day
+
+	Returns:
+		bool: Indicates if given date is valid
+	"""
+	is_valid:bool = False
+	date_value:int = year*10000 + month*100 + day
+	#1582. 10. 5 ~ 1582. 10. 14 is not valid when strictly considering Julian/Gregorian: But is valid in Gregorian Proleptic
+	min_value:int = KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE if is_lunar else KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE
+	max_value:int = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE if is_lunar else KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE
+
+	if min_value <= date_value and max_value >= date_value : # noqa: SIM102
+		if month > 0 and month < 13 and day > 0 :
+			lunar_data:int = _LUNAR_DATA[year - _BASE_YEAR]
+			if is_lunar:
+				# `|0000|0000|0000|0000|XXXX|....|....|....|`
+				intercalation_month:int = (lunar_data >> 12) & 0x000F
+				# `|0000|0000|0000|000X|....|....|....|....|` or `|0000|0000|0000|0000|0000|YYYY|YYYY|YYYY|`: one of the Ys
+				big_month:int = (lunar_data >> 16) if is_intercalation and intercalation_month == month else (lunar_data >> (12 - month))
+				is_valid = day <= (KoreanLunarCalendar.LUNAR_BIG_MONTH_DAY if (big_month & 0x01) > 0 else KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY)
+				# Check whether intercalation is correct for lunar date
+				if is_intercalation and intercalation_month != month:
+					is_valid = False
+			else:
+				# `|0X..|....|....|....|....|....|....|....|`
+				before_month: tuple[int, ...] = _SOLAR_DAYS_BEFORE_MONTH[(lunar_data >> 30) & 0x01]
+				is_valid = day <= before_month[month] - before_month[month - 1]
+
+	return is_valid
+
+
+def _solar_abs_days(year:int, month:int, day:int) -> int:
+	"""Get duration in days between base lunar date (1000/01/01) - or equivalently, base solar date (1000/02/13) -, and the given (valid) solar date (included).
+
+	Args:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+
+	Returns:
+		int: Duration in days
+	"""
+	return date(year, month, day).toordinal() - _ORDINAL_ABS_DAY_DIFF
+
+
+def _lunar_abs_days(year:int, month:int, day:int, is_intercalation:bool) -> int:
+	"""Get duration in days between base lunar date (1000/01/01) and the given (valid) lunar date (included).
+
+	Args:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+		is_intercalation (bool): Whether the day is in the regular or intercalation month (only applied if **month** has an intercalation month)
+
+	Returns:
+		int: Duration in days
+	"""
+	year_inx:int = year - _BASE_YEAR
+	# `|0000|0000|0000|0000|XXXX|....|....|....|`
+	intercalation_month:int = (_LUNAR_DATA[year_inx] >> 12) & 0x000F
+	month_inx:int = _LUNAR_YEAR_FIRST_MONTH_INDEX[year_inx] + month - 1
+	# The intercalation month comes right after its regular month
+	if intercalation_month > 0 and (intercalation_month < month or (is_intercalation and intercalation_month == month)):
+		month_inx += 1
+	return _LUNAR_MONTH_START_DAYS[month_inx] + day - 1
+
+
+def _abs_days_to_lunar(abs_days:int) -> LunarDate:
+	"""Get the lunar date at the given duration in days from base lunar date (1000/01/01).
+
+	Args:
+		abs_days (int): Duration in days (base lunar date included)
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	# Last lunar month starting on or before `abs_days`
+	month_inx: int = bisect_right(_LUNAR_MONTH_START_DAYS, abs_days) - 1
+	# `|YYYY|YYYY|YYYY|MMMM|I|`
+	month_key: int = _LUNAR_MONTH_START_KEYS[month_inx]
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	return tuple.__new__(LunarDate, (month_key >> 5, (month_key >> 1) & 0x0F, abs_days - _LUNAR_MONTH_START_DAYS[month_inx] + 1, (month_key & 0x01) > 0))
+
+
+def _abs_days_to_solar(abs_days:int) -> SolarDate:
+	"""Get the solar date at the given duration in days from base solar date (1000/02/13).
+
+	Args:
+		abs_days (int): Duration in days (base solar date included)
+
+	Returns:
+		SolarDate: Solar date
+	"""
+	solar_date: date = date.fromordinal(abs_days + _ORDINAL_ABS_DAY_DIFF)
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	return tuple.__new__(SolarDate, (solar_date.year, solar_date.month, solar_date.day))
+
+
+def to_lunar(solar_date: SolarDate) -> LunarDate:
+	"""Convert a solar date to a lunar date.
+
+	Args:
+		solar_date (SolarDate): Solar date
+
+	Raises:
+		ValueError: If **solar_date** is not valid
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("to_lunar", to_lunar, solar_date)
+	year, month, day = solar_date
+	if not _check_valid_date(False, False, year, month, day):
+		raise ValueError(f"solar_date is:{solar_date}\nShould be a valid solar date between: {KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE}")
+	return _abs_days_to_lunar(_solar_abs_days(year, month, day))
+
+
+def to_solar(lunar_date: LunarDate) -> SolarDate:
+	"""Convert a lunar date to a solar date.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Raises:
+		ValueError: If **lunar_date** is not valid
+
+	Returns:
+		SolarDate: Solar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("to_solar", to_solar, lunar_date)
+	year, month, day, is_intercalation = lunar_date
+	if not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"lunar_date is:{lunar_date}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	return _abs_days_to_solar(_lunar_abs_days(year, month, day, is_intercalation))
+
+
+def _day_pillar(abs_days: int) -> Pillar:
+	"""Get the gapja indexes of the given absolute day.
+
+	Args:
+		abs_days (int): Absolute day (1: lunar 1000/01/01)
+
+	Returns:
+		Pillar: Day gapja indexes
+	"""
+	return Pillar((abs_days + 4) % 10, (abs_days + 2) % 12)
+
+
+def _get_gap_ja(year:int, month:int, day:int, is_intercalation:bool) -> GapJa:
+	"""Get the gapja indexes of the given (valid) lunar date.
+
+	Args:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+		is_intercalation (bool): Whether the day is in the regular or intercalation month
+
+	Returns:
+		GapJa: Gapja indexes (lunar intercalation months are ignored when determining the gapja for the month)
+	"""
+	abs_days:int = _lunar_abs_days(year, month, day, is_intercalation)
+	month_count:int = month + 12 * (year - _BASE_YEAR)
+	return GapJa(
+		Pillar(((year + 6) - _BASE_YEAR) % 10, (year - _BASE_YEAR) % 12),
+		Pillar((month_count + 3) % 10, (month_count + 1) % 12),
+		_day_pillar(abs_days),
+	)
+
+
+def _gap_ja_str(gap_ja_inx: GapJa, is_intercalation: bool, gapja_type: str) -> str:
+	"""Get the names associated with the given gapja indexes in the chosen language.
+
+	Args:
+		gap_ja_inx (GapJa): Gapja indexes
+		is_intercalation (bool): Whether the date is in an intercalation month
+		gapja_type (str): ISO 3166 of Korea ('KR') or China ('CN'), or any language registered with `register_gap_ja_locale`
+
+	Raises:
+		ValueError: If **gapja_type** is not valid
+
+	Returns:
+		str: `CGU CGU CGU` or `CGU CGU CGU (IU)` where:
+			* `C`: Cheongan character
+			* `G`: Ganji character
+			* `U`: Unit character
+			* `I`: Intercalation/Leap character
+	"""
+	locale: GapJaLocale = get_gap_ja_locale(gapja_type)
+	year, month, day = gap_ja_inx
+	gapja_str: str = " ".join((
+		locale.years[(6 * year.cheongan - 5 * year.ganji) % 60],
+		locale.months[(6 * month.cheongan - 5 * month.ganji) % 60],
+		locale.days[(6 * day.cheongan - 5 * day.ganji) % 60],
+	))
+	return gapja_str + locale.intercalation if is_intercalation else gapja_str
+
+
+def register_gap_ja_locale(gapja_type: str, locale: GapJaLocale) -> None:
+	"""Register the gapja names of a language, to be chosen as **gapja_type** (e.g. by `gap_ja_string`).
+
+	The names are interned once here, so that rendering a gapja string only indexes the tables.
+
+	Args:
+		gapja_type (str): Language code, e.g. ISO 3166 'JP' (an already registered language is replaced)
+		locale (GapJaLocale): Gapja names
+
+	Raises:
+		ValueError: If the year, month or day names are not 60 strings
+
+	Examples:
+		```python
+		register_gap_ja_locale("KR-Latn", GapJaLocale.from_characters(
+			("gap", "eul", "byeong", "jeong", "mu", "gi", "gyeong", "sin", "im", "gye"),
+			("ja", "chuk", "in", "myo", "jin", "sa", "o", "mi", "sin", "yu", "sul", "hae"),
+			("-nyeon", "-wol", "-il"), " (yun-wol)",
+		))
+		gap_ja_string(LunarDate(2025, 1, 1), "KR-Latn") # => 'eulsa-nyeon muin-wol musul-il'
+		```
+	"""
+	names: list[tuple[str, ...]] = []
+	for unit_names in locale[:3]:
+		if len(unit_names) != 60 or not all(isinstance(name, str) for name in unit_names):
+			raise ValueError(f"locale names are:{unit_names}\nShould be: 60 strings")
+		names.append(tuple(sys.intern(name) for name in unit_names))
+	years, months, days = names
+	_GAP_JA_LOCALES[gapja_type] = GapJaLocale(years, months, days, sys.intern(locale.intercalation))
+
+
+def get_gap_ja_locale(gapja_type: str) -> GapJaLocale:
+	"""Get the gapja names of a language.
+
+	Args:
+		gapja_type (str): ISO 3166 of Korea ('KR') or China ('CN'), or any language registered with `register_gap_ja_locale`
+
+	Raises:
+		ValueError: If **gapja_type** is not registered
+
+	Returns:
+		GapJaLocale: Gapja names
+	"""
+	locale: GapJaLocale | None = _GAP_JA_LOCALES.get(gapja_type)
+	if locale is None:
+		raise ValueError(f"gapja_type is:{gapja_type}\nShould be one of: {tuple(_GAP_JA_LOCALES)}")
+	return locale
+
+
+# Gapja names of each language, by `gapja_type`
+_GAP_JA_LOCALES: dict[str, GapJaLocale] = {}
+register_gap_ja_locale("KR", GapJaLocale.from_characters(
+	[chr(c) for c in KoreanLunarCalendar.KOREAN_CHEONGAN], [chr(c) for c in KoreanLunarCalendar.KOREAN_GANJI], [chr(c) for c in KoreanLunarCalendar.KOREAN_GAPJA_UNIT],
+	f" ({chr(KoreanLunarCalendar.INTERCALATION_STR[0])}{chr(KoreanLunarCalendar.KOREAN_GAPJA_UNIT[1])})",
+))
+register_gap_ja_locale("CN", GapJaLocale.from_characters(
+	[chr(c) for c in KoreanLunarCalendar.CHINESE_CHEONGAN], [chr(c) for c in KoreanLunarCalendar.CHINESE_GANJI], [chr(c) for c in KoreanLunarCalendar.CHINESE_GAPJA_UNIT],
+	f" ({chr(KoreanLunarCalendar.INTERCALATION_STR[1])}{chr(KoreanLunarCalendar.CHINESE_GAPJA_UNIT[1])})",
+))
+
+
+def lunar_to_ordinal(lunar_date: LunarDate) -> int:
+	"""Get the ordinal of a lunar date, aligned with `datetime.date.toordinal` (proleptic Gregorian ordinal, where 0001/01/01 has ordinal 1).
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Raises:
+		ValueError: If **lunar_date** is not valid
+
+	Returns:
+		int: Ordinal of the day
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("lunar_to_ordinal", lunar_to_ordinal, lunar_date)
+	year, month, day, is_intercalation = lunar_date
+	if not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"lunar_date is:{lunar_date}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	return _lunar_abs_days(year, month, day, is_intercalation) + _ORDINAL_ABS_DAY_DIFF
+
+
+def ordinal_to_lunar(ordinal: int) -> LunarDate:
+	"""Get the lunar date of an ordinal aligned with `datetime.date.toordinal`.
+
+	Args:
+		ordinal (int): Ordinal of the day
+
+	Raises:
+		ValueError: If **ordinal** is out of the supported range
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("ordinal_to_lunar", ordinal_to_lunar, ordinal)
+	if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+		raise ValueError(f"ordinal is:{ordinal}\nShould be between: {_MIN_ORDINAL} and {_MAX_ORDINAL}")
+	return _abs_days_to_lunar(ordinal - _ORDINAL_ABS_DAY_DIFF)
+
+
+def solar_to_ordinal(solar_date: SolarDate) -> int:
+	"""Get the ordinal of a solar date, i.e. `datetime.date(*solar_date).toordinal()`.
+
+	Args:
+		solar_date (SolarDate): Solar date
+
+	Raises:
+		ValueError: If **solar_date** is not valid
+
+	Returns:
+		int: Ordinal of the day
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("solar_to_ordinal", solar_to_ordinal, solar_date)
+	year, month, day = solar_date
+	if not _check_valid_date(False, False, year, month, day):
+		raise ValueError(f"solar_date is:{solar_date}\nShould be a valid solar date between: {KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE}")
+	return date(year, month, day).toordinal()
+
+
+def ordinal_to_solar(ordinal: int) -> SolarDate:
+	"""Get the solar date of an ordinal aligned with `datetime.date.toordinal`.
+
+	Args:
+		ordinal (int): Ordinal of the day
+
+	Raises:
+		ValueError: If **ordinal** is out of the supported range
+
+	Returns:
+		SolarDate: Solar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("ordinal_to_solar", ordinal_to_solar, ordinal)
+	if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+		raise ValueError(f"ordinal is:{ordinal}\nShould be between: {_MIN_ORDINAL} and {_MAX_ORDINAL}")
+	return _abs_days_to_solar(ordinal - _ORDINAL_ABS_DAY_DIFF)
+
+
+def from_date(solar_date: date) -> LunarDate:
+	"""Convert a `datetime.date` to a lunar date.
+
+	As a `datetime.date` is always a valid date, only its range is checked before looking up its ordinal.
+
+	Args:
+		solar_date (date): Solar date
+
+	Raises:
+		ValueError: If **solar_date** is out of the supported range
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("from_date", from_date, solar_date)
+	ordinal: int = solar_date.toordinal()
+	if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+		raise ValueError(f"solar_date is:{solar_date}\nShould be between: {KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE}")
+	return _abs_days_to_lunar(ordinal - _ORDINAL_ABS_DAY_DIFF)
+
+
+def to_date(lunar_date: LunarDate) -> date:
+	"""Convert a lunar date to a `datetime.date`.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Raises:
+		ValueError: If **lunar_date** is not valid
+
+	Returns:
+		date: Solar date
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("to_date", to_date, lunar_date)
+	return date.fromordinal(lunar_to_ordinal(lunar_date))
+
+
+def gap_ja(lunar_date: LunarDate) -> GapJa:
+	"""Get the gapja indexes of a lunar date.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Raises:
+		ValueError: If **lunar_date** is not valid
+
+	Returns:
+		GapJa: Gapja indexes (lunar intercalation months are ignored when determining the gapja for the month)
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("gap_ja", gap_ja, lunar_date)
+	year, month, day, is_intercalation = lunar_date
+	if not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"lunar_date is:{lunar_date}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	return _get_gap_ja(year, month, day, is_intercalation)
+
+
+def gap_ja_string(lunar_date: LunarDate, gapja_type: str = "KR") -> str:
+	"""Get the gapja string of a lunar date.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+		gapja_type (str, optional): ISO 3166 of Korea ('KR') or China ('CN'), or any language registered with `register_gap_ja_locale`. Defaults to "KR".
+
+	Raises:
+		ValueError: If **lunar_date** or **gapja_type** is not valid
+
+	Returns:
+		str: `CGU CGU CGU` or `CGU CGU CGU (IU)` where:
+			* `C`: Cheongan character
+			* `G`: Ganji character
+			* `U`: Unit character
+			* `I`: Intercalation/Leap character
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("gap_ja_string", gap_ja_string, lunar_date, gapja_type)
+	return _gap_ja_str(gap_ja(lunar_date), lunar_date[3], gapja_type)
+
+
+def iter_days(start: SolarDate, end: SolarDate) -> Iterator[tuple[SolarDate, LunarDate]]:
+	"""Iterate over every solar day from **start** to **end** (included), along with its lunar date.
+
+	Only **start** is converted: each following day is derived from the previous one, by walking the solar months (solar leap years being read from `KOREAN_LUNAR_DATA`) and the lunar months (`LUNAR_MONTH_STARTS`), so that each step costs O(1).
+
+	Args:
+		start (SolarDate): First solar date
+		end (SolarDate): Last solar date (no day is yielded if it is before **start**)
+
+	Raises:
+		ValueError: If **start** or **end** is not valid
+
+	Returns:
+		Iterator[tuple[SolarDate, LunarDate]]: Solar & lunar dates of each day
+
+	Examples:
+		```python
+		for solar_date, lunar_date in iter_days(SolarDate(2025, 1, 1), SolarDate(2025, 12, 31)):
+			...
+		```
+	"""
+	start_ordinal: int = solar_to_ordinal(start)
+	day_count: int = solar_to_ordinal(end) - start_ordinal + 1
+	return _iter_days(SolarDate(*start), start_ordinal - _ORDINAL_ABS_DAY_DIFF, day_count)
+
+
+def _iter_days(start: SolarDate, start_abs_days: int, day_count: int) -> Iterator[tuple[SolarDate, LunarDate]]:
+	"""Iterate over **day_count** days from **start** (see `iter_days`, once its arguments are checked).
+
+	Args:
+		start (SolarDate): First (valid) solar date
+		start_abs_days (int): Duration in days between base solar date (1000/02/13) and **start** (included)
+		day_count (int): Number of days
+
+	Yields:
+		tuple[SolarDate, LunarDate]: Solar & lunar dates of each day
+	"""
+	if day_count <= 0:
+		return
+	year, month, day = start
+	# `|0X..|....|....|....|....|....|....|....|`
+	solar_days_before_month: tuple[int, ...] = _SOLAR_DAYS_BEFORE_MONTH[(_LUNAR_DATA[year - _BASE_YEAR] >> 30) & 0x01]
+	solar_month_days: int = solar_days_before_month[month] - solar_days_before_month[month - 1]
+
+	month_inx: int = bisect_right(_LUNAR_MONTH_START_DAYS, start_abs_days) - 1
+	# `|YYYY|YYYY|YYYY|MMMM|I|`
+	month_key: int = _LUNAR_MONTH_START_KEYS[month_inx]
+	lunar_year, lunar_month, is_intercalation = month_key >> 5, (month_key >> 1) & 0x0F, (month_key & 0x01) > 0
+	lunar_day: int = start_abs_days - _LUNAR_MONTH_START_DAYS[month_inx] + 1
+	lunar_month_days: int = _LUNAR_MONTH_START_DAYS[month_inx + 1] - _LUNAR_MONTH_START_DAYS[month_inx]
+
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructors, the main cost of each step
+	new = tuple.__new__
+	yield new(SolarDate, (year, month, day)), new(LunarDate, (lunar_year, lunar_month, lunar_day, is_intercalation))
+	for _ in range(day_count - 1):
+		if day < solar_month_days:
+			day += 1
+		else:
+			day = 1
+			if month < 12:
+				month += 1
+			else:
+				month = 1
+				year += 1
+				solar_days_before_month = _SOLAR_DAYS_BEFORE_MONTH[(_LUNAR_DATA[year - _BASE_YEAR] >> 30) & 0x01]
+			solar_month_days = solar_days_before_month[month] - solar_days_before_month[month - 1]
+
+		if lunar_day < lunar_month_days:
+			lunar_day += 1
+		else:
+			month_inx += 1
+			month_key = _LUNAR_MONTH_START_KEYS[month_inx]
+			lunar_year, lunar_month, is_intercalation = month_key >> 5, (month_key >> 1) & 0x0F, (month_key & 0x01) > 0
+			lunar_day = 1
+			lunar_month_days = _LUNAR_MONTH_START_DAYS[month_inx + 1] - _LUNAR_MONTH_START_DAYS[month_inx]
+		yield new(SolarDate, (year, month, day)), new(LunarDate, (lunar_year, lunar_month, lunar_day, is_intercalation))
+
+
+def iter_lunar_months(start: LunarDate, end: LunarDate) -> Iterator[tuple[LunarDate, SolarDate]]:
+	"""Iterate over the first day of every lunar month from **start** to **end** (included), along with its solar date.
+
+	Only **start** is converted: the following months are read in order from `LUNAR_MONTH_START_DAYS` & `LUNAR_MONTH_START_KEYS`, so that each step costs O(1).
+
+	Args:
+		start (LunarDate): First lunar date (its month is skipped if it is not its first day)
+		end (LunarDate): Last lunar date (no month is yielded if it is before **start**)
+
+	Raises:
+		ValueError: If **start** or **end** is not valid
+
+	Returns:
+		Iterator[tuple[LunarDate, SolarDate]]: Lunar & solar dates of the first day of each lunar month
+
+	Examples:
+		```python
+		for lunar_date, solar_date in iter_lunar_months(LunarDate(2025, 1, 1), LunarDate(2025, 12, 29)):
+			...
+		```
+	"""
+	start_abs_days: int = lunar_to_ordinal(start) - _ORDINAL_ABS_DAY_DIFF
+	end_abs_days: int = lunar_to_ordinal(end) - _ORDINAL_ABS_DAY_DIFF
+	# First lunar month starting on or after `start`
+	return _iter_lunar_months(bisect_left(_LUNAR_MONTH_START_DAYS, start_abs_days), end_abs_days)
+
+
+def _iter_lunar_months(month_inx: int, end_abs_days: int) -> Iterator[tuple[LunarDate, SolarDate]]:
+	"""Iterate over the lunar months from index **month_inx** in `LUNAR_MONTH_START_DAYS` (see `iter_lunar_months`, once its arguments are checked).
+
+	Args:
+		month_inx (int): Index of the first lunar month in `LUNAR_MONTH_START_DAYS`
+		end_abs_days (int): Duration in days between base lunar date (1000/01/01) and the last date (included)
+
+	Yields:
+		tuple[LunarDate, SolarDate]: Lunar & solar dates of the first day of each lunar month
+	"""
+	for abs_days, month_key in islice(zip(_LUNAR_MONTH_START_DAYS, _LUNAR_MONTH_START_KEYS), month_inx, None):
+		if abs_days > end_abs_days:
+			return
+		# `|YYYY|YYYY|YYYY|MMMM|I|`
+		yield LunarDate(month_key >> 5, (month_key >> 1) & 0x0F, 1, (month_key & 0x01) > 0), _abs_days_to_solar(abs_days)
+
+
+_INTERCALATION_POLICIES: Final[tuple[str, ...]] = ("regular", "raise")
+_DAY_OVERFLOW_POLICIES: Final[tuple[str, ...]] = ("clip", "next", "raise")
+
+
+def _check_policies(intercalation: str, overflow: str) -> None:
+	"""Check the policies of the lunar date arithmetic (see `LunarDate.add_lunar_months`).
+
+	Args:
+		intercalation (str): Policy for an intercalation month missing from the target year
+		overflow (str): Policy for a day missing from the target month
+
+	Raises:
+		ValueError: If a policy is not valid
+	"""
+	if intercalation not in _INTERCALATION_POLICIES:
+		raise ValueError(f"intercalation is:{intercalation!r}\nShould be one of: {_INTERCALATION_POLICIES}")
+	if overflow not in _DAY_OVERFLOW_POLICIES:
+		raise ValueError(f"overflow is:{overflow!r}\nShould be one of: {_DAY_OVERFLOW_POLICIES}")
+
+
+def _resolve_lunar_date(year:int, month:int, day:int, is_intercalation:bool, *, intercalation:str, overflow:str) -> LunarDate: # noqa: PLR0913
+	"""Get the lunar date landed on by month or year arithmetic, applying the policies for a missing intercalation month or day.
+
+	The month is read from the bit fields of the target year only (as `__get_lunar_intercalation_month` & `__get_lunar_days_`), without any conversion.
+
+	Args:
+		year (int): Year
+		month (int): Month
+		day (int): Day, possibly missing from the month
+		is_intercalation (bool): Intercalation month, possibly missing from the year
+		intercalation (str): Policy for an intercalation month missing from the year
+		overflow (str): Policy for a day missing from the month
+
+	Raises:
+		ValueError: If a `"raise"` policy applies, or if the lunar date is out of the supported range
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	if not 0 <= year - _BASE_YEAR < len(_LUNAR_DATA):
+		raise ValueError(f"year is:{year}\nShould be between: {_BASE_YEAR} and {_BASE_YEAR + len(_LUNAR_DATA) - 1}")
+	lunar_data: int = _LUNAR_DATA[year - _BASE_YEAR]
+	# `|0000|0000|0000|0000|XXXX|....|....|....|`
+	if is_intercalation and (lunar_data >> 12) & 0x000F != month:
+		if intercalation == "raise":
+			raise ValueError(f"lunar_date is:{LunarDate(year, month, day, is_intercalation)}\nShould be in: an existing intercalation month (intercalation='raise')")
+		is_intercalation = False
+	# `|0000|0000|0000|000X|....|....|....|....|` or `|0000|0000|0000|0000|0000|YYYY|YYYY|YYYY|`: one of the Ys
+	big_month: int = (lunar_data >> 16) if is_intercalation else (lunar_data >> (12 - month))
+	month_days: int = KoreanLunarCalendar.LUNAR_BIG_MONTH_DAY if big_month & 0x01 else KoreanLunarCalendar.LUNAR_SMALL_MONTH_DAY
+	if day > month_days:
+		if overflow == "raise":
+			raise ValueError(f"day is:{day}\nShould be at most: {month_days} in {LunarDate(year, month, 1, is_intercalation)} (overflow='raise')")
+		if overflow == "clip":
+			day = month_days
+		else:
+			# Roll over to the following month: its first day(s), from the first day of this one
+			abs_days: int = _lunar_abs_days(year, month, 1, is_intercalation) + day - 1
+			if abs_days + _ORDINAL_ABS_DAY_DIFF > _MAX_ORDINAL:
+				raise ValueError(f"lunar_date is:{LunarDate(year, month, day, is_intercalation)}\nShould be between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+			return _abs_days_to_lunar(abs_days)
+	if not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"lunar_date is:{LunarDate(year, month, day, is_intercalation)}\nShould be between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	return tuple.__new__(LunarDate, (year, month, day, is_intercalation))
+
+
+# Trailing argument of the iso format of a lunar date in an intercalation month (see `LunarDate.iso_format`)
+_INTERCALATION_ISO_SUFFIX: Final[str] = " Intercalation"
+
+
+def _parse_iso_fields(text: str) -> tuple[int, int, int] | None:
+	"""Parse the year, month & day of a date in iso format `'YYYY-MM-DD'` (4-digit year, 2-digit month & day), without checking the date.
+
+	Args:
+		text (str): Date in iso format
+
+	Returns:
+		tuple[int, int, int] | None: Year, month & day (`None` if **text** is not in iso format)
+	"""
+	if len(text) != 10 or text[4] != "-" or text[7] != "-":
+		return None
+	digits: str = text[:4] + text[5:7] + text[8:]
+	# `str.isdigit` alone accepts non-ASCII digits (e.g. '٢'), which `int` would parse
+	if not (digits.isascii() and digits.isdigit()):
+		return None
+	value: int = int(digits)
+	return value // 10000, value // 100 % 100, value % 100
+
+
+def parse_solar_iso(text: str) -> SolarDate:
+	"""Parse a solar date in iso format `'YYYY-MM-DD'` (as `SolarDate.iso_format`).
+
+	The date is parsed by `datetime.date.fromisoformat`, only its format (the extended formats accepted since Python 3.11, e.g. `'YYYYMMDD'`, being rejected) & its range being checked here.
+
+	Args:
+		text (str): Solar date in iso format `'YYYY-MM-DD'`
+
+	Raises:
+		ValueError: If **text** is not a valid solar date in iso format
+
+	Returns:
+		SolarDate: Solar date
+
+	Examples:
+		```python
+		parse_solar_iso("2025-07-25") # => SolarDate(year=2025, month=7, day=25)
+		```
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("parse_solar_iso", parse_solar_iso, text)
+	if len(text) == 10 and text[4] == "-" and text[7] == "-":
+		try:
+			solar_date: date = date.fromisoformat(text)
+		except ValueError:
+			pass
+		else:
+			if _MIN_ORDINAL <= solar_date.toordinal() <= _MAX_ORDINAL:
+				# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+				return tuple.__new__(SolarDate, (solar_date.year, solar_date.month, solar_date.day))
+	raise ValueError(f"text is:{text!r}\nShould be: a valid solar date in iso format 'YYYY-MM-DD' between: {KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE}")
+
+
+def parse_lunar_iso(text: str) -> LunarDate:
+	"""Parse a lunar date in iso format `'YYYY-MM-DD'` or `'YYYY-MM-DD Intercalation'` (as `LunarDate.iso_format`).
+
+	Args:
+		text (str): Lunar date in iso format `'YYYY-MM-DD'`, with trailing argument `' Intercalation'` if in the intercalation month
+
+	Raises:
+		ValueError: If **text** is not a valid lunar date in iso format
+
+	Returns:
+		LunarDate: Lunar date
+
+	Examples:
+		```python
+		parse_lunar_iso("2025-06-01 Intercalation") # => LunarDate(year=2025, month=6, day=1, is_intercalation=True)
+		```
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("parse_lunar_iso", parse_lunar_iso, text)
+	is_intercalation: bool = text.endswith(_INTERCALATION_ISO_SUFFIX)
+	fields: tuple[int, int, int] | None = _parse_iso_fields(text[:-len(_INTERCALATION_ISO_SUFFIX)] if is_intercalation else text)
+	if fields is not None:
+		year, month, day = fields
+		if _check_valid_date(True, is_intercalation, year, month, day):
+			# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+			return tuple.__new__(LunarDate, (year, month, day, is_intercalation))
+	raise ValueError(f"text is:{text!r}\nShould be: a valid lunar date in iso format 'YYYY-MM-DD' or 'YYYY-MM-DD Intercalation' between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+
+
+def parse_solar_iso_many(texts: Iterable[str]) -> list[SolarDate]:
+	"""Parse many solar dates in iso format (see `parse_solar_iso`), e.g. a list or a NumPy array of strings.
+
+	(See `korean_lunar_calendar.batch.parse_solar_iso` to parse NumPy arrays without any Python loop, flagging invalid dates instead of raising.)
+
+	Args:
+		texts (Iterable[str]): Solar dates in iso format `'YYYY-MM-DD'`
+
+	Raises:
+		ValueError: If a text is not a valid solar date in iso format
+
+	Returns:
+		list[SolarDate]: Solar dates
+	"""
+	return list(map(parse_solar_iso, texts))
+
+
+def parse_lunar_iso_many(texts: Iterable[str]) -> list[LunarDate]:
+	"""Parse many lunar dates in iso format (see `parse_lunar_iso`), e.g. a list or a NumPy array of strings.
+
+	(See `korean_lunar_calendar.batch.parse_lunar_iso` to parse NumPy arrays without any Python loop, flagging invalid dates instead of raising.)
+
+	Args:
+		texts (Iterable[str]): Lunar dates in iso format `'YYYY-MM-DD'` or `'YYYY-MM-DD Intercalation'`
+
+	Raises:
+		ValueError: If a text is not a valid lunar date in iso format
+
+	Returns:
+		list[LunarDate]: Lunar dates
+	"""
+	return list(map(parse_lunar_iso, texts))
+
+
+def _date_check(is_lunar:bool, is_intercalation:bool, year:int, month:int, day:int) -> DateCheck:
+	"""Check the given date, as `_check_valid_date`, telling why it is not valid.
+
+	Args:
+		is_lunar (bool): Lunar or solar date
+		is_intercalation (bool): Intercalation (has to exist if lunar date) or regular month
+		year (int): Year
+		month (int): Month
+		day (int): Day
+
+	Returns:
+		DateCheck: Outcome of the check
+	"""
+	if _check_valid_date(is_lunar, is_intercalation, year, month, day):
+		return DateCheck.VALID
+	# Only invalid dates get here: the first failing check of `_check_valid_date` is looked for
+	date_value:int = year*10000 + month*100 + day
+	min_value:int = KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE if is_lunar else KoreanLunarCalendar.KOREAN_SOLAR_MIN_VALUE
+	max_value:int = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE if is_lunar else KoreanLunarCalendar.KOREAN_SOLAR_MAX_VALUE
+	if not min_value <= date_value <= max_value:
+		return DateCheck.OUT_OF_RANGE
+	if not 0 < month < 13:
+		return DateCheck.INVALID_MONTH
+	# `|0000|0000|0000|0000|XXXX|....|....|....|`
+	if is_lunar and is_intercalation and ((_LUNAR_DATA[year - _BASE_YEAR] >> 12) & 0x000F) != month:
+		return DateCheck.INVALID_INTERCALATION
+	return DateCheck.INVALID_DAY
+
+
+def check_lunar_date(lunar_date: LunarDate) -> DateCheck:
+	"""Check a lunar date without converting it, telling why it is not valid.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Returns:
+		DateCheck: Outcome of the check (`DateCheck.VALID` if valid)
+
+	Examples:
+		```python
+		check_lunar_date(LunarDate(2025, 5, 1, True)) # => <DateCheck.INVALID_INTERCALATION: 3>
+		```
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("check_lunar_date", check_lunar_date, lunar_date)
+	year, month, day, is_intercalation = lunar_date
+	return _date_check(True, is_intercalation, year, month, day)
+
+
+def check_solar_date(solar_date: SolarDate) -> DateCheck:
+	"""Check a solar date without converting it, telling why it is not valid.
+
+	Args:
+		solar_date (SolarDate): Solar date
+
+	Returns:
+		DateCheck: Outcome of the check (`DateCheck.VALID` if valid)
+	"""
+	if _instrumentation is not None and not _instrumentation.active:
+		return _instrumentation.call("check_solar_date", check_solar_date, solar_date)
+	year, month, day = solar_date
+	return _date_check(False, False, year, month, day)
+
+
+def validate_lunar_many(lunar_dates: Iterable[LunarDate]) -> int:
+	"""Check many lunar dates without converting them.
+
+	(See `check_lunar_date` for why a lunar date is rejected, and `korean_lunar_calendar.batch.validate_lunar` for NumPy arrays.)
+
+	Args:
+		lunar_dates (Iterable[LunarDate]): Lunar dates
+
+	Returns:
+		int: Validity bitmask, whose bit `i` is set if the `i`-th lunar date is valid
+
+	Examples:
+		```python
+		mask = validate_lunar_many(lunar_dates)
+		valid_dates = [lunar_date for i, lunar_date in enumerate(lunar_dates) if mask >> i & 1]
+		```
+	"""
+	# Bits are gathered as a string, as growing the bitmask bit by bit would be quadratic
+	bits: str = "".join(
+		"1" if _check_valid_date(True, is_intercalation, year, month, day) else "0" for year, month, day, is_intercalation in lunar_dates
+	)
+	return int(bits[::-1] or "0", 2)
+
+
+def validate_solar_many(solar_dates: Iterable[SolarDate]) -> int:
+	"""Check many solar dates without converting them.
+
+	(See `check_solar_date` for why a solar date is rejected, and `korean_lunar_calendar.batch.validate_solar` for NumPy arrays.)
+
+	Args:
+		solar_dates (Iterable[SolarDate]): Solar dates
+
+	Returns:
+		int: Validity bitmask, whose bit `i` is set if the `i`-th solar date is valid
+	"""
+	# Bits are gathered as a string, as growing the bitmask bit by bit would be quadratic
+	bits: str = "".join(
+		"1" if _check_valid_date(False, False, year, month, day) else "0" for year, month, day in solar_dates
+	)
+	return int(bits[::-1] or "0", 2)
@@ -0,0 +1,132 @@
+"""Compact binary encoding of lunar dates.
+
+Each lunar date is packed in a single 32-bit unsigned integer as:
+
+`|0000|0000|00YY|YYYY|YYYY|YYMM|MMIL|LLLL|`
+
+|Bits|Desc.|
+|:---|:---|
+|`Y`|Year|
+|`M`|Month|
+|`I`|Intercalation month (or not if `0`)|
+|`L`|Day|
+
+As the intercalation month follows its regular month, packed lunar dates sort in chronological order: they can be used as is as index keys.
+
+Bulk variants encode sequences of lunar dates as little-endian unsigned 32-bit integers (4 bytes per date), e.g. to be stored in Redis or in a Parquet binary column.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable
+
+from .korean_lunar_calendar import KoreanLunarCalendar, LunarDate, _check_valid_date
+
+
+def _pack(year: int, month: int, day: int, is_intercalation: bool) -> int:
+	"""Pack a (valid) lunar date in 32 bits: `|0000|0000|00YY|YYYY|YYYY|YYMM|MMIL|LLLL|`.
+
+	Args:
+		year (int): Year
+		month (int): Month
+		day (int): Day
+		is_intercalation (bool): Intercalation month
+
+	Returns:
+		int: Packed lunar date
+	"""
+	return (year << 10) | (month << 6) | (is_intercalation << 5) | day
+
+
+def _unpack(packed: int) -> LunarDate:
+	"""Unpack a lunar date packed by `_pack`.
+
+	Args:
+		packed (int): Packed lunar date
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	return tuple.__new__(LunarDate, (packed >> 10, (packed >> 6) & 0x0F, packed & 0x1F, (packed & 0x20) > 0))
+
+
+def pack(lunar_date: LunarDate) -> int:
+	"""Pack a lunar date in a 32-bit unsigned integer, sorting in chronological order.
+
+	Args:
+		lunar_date (LunarDate): Lunar date
+
+	Raises:
+		ValueError: If **lunar_date** is not valid
+
+	Returns:
+		int: Packed lunar date
+
+	Examples:
+		```python
+		pack(LunarDate(2025, 6, 1, True)) # => 2074017
+		```
+	"""
+	year, month, day, is_intercalation = lunar_date
+	if not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"lunar_date is:{lunar_date}\nShould be a valid lunar date between: {KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE} and {KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE}")
+	return _pack(year, month, day, is_intercalation)
+
+
+def unpack(packed: int) -> LunarDate:
+	"""Unpack a lunar date packed by `pack`.
+
+	Args:
+		packed (int): Packed lunar date
+
+	Raises:
+		ValueError: If **packed** is not a valid packed lunar date
+
+	Returns:
+		LunarDate: Lunar date
+	"""
+	year, month, day, is_intercalation = lunar_date = _unpack(packed)
+	if packed >> 32 or not _check_valid_date(True, is_intercalation, year, month, day):
+		raise ValueError(f"packed is:{packed}\nShould be: a lunar date packed by `pack`")
+	return lunar_date
+
+
+def pack_many(lunar_dates: Iterable[LunarDate]) -> bytes:
+	"""Pack lunar dates (see `pack`) as little-endian unsigned 32-bit integers.
+
+	Args:
+		lunar_dates (Iterable[LunarDate]): Lunar dates
+
+	Raises:
+		ValueError: If a lunar date is not valid
+
+	Returns:
+		bytes: Packed lunar dates, 4 bytes per date
+	"""
+	packed: array[int] = array("I", map(pack, lunar_dates))
+	if sys.byteorder != "little":
+		packed.byteswap()
+	return packed.tobytes()
+
+
+def unpack_many(data: bytes | bytearray | memoryview) -> list[LunarDate]:
+	"""Unpack lunar dates packed by `pack_many`.
+
+	Args:
+		data (bytes | bytearray | memoryview): Packed lunar dates
+
+	Raises:
+		ValueError: If **data** is not a multiple of 4 bytes, or holds an invalid packed lunar date
+
+	Returns:
+		list[LunarDate]: Lunar dates
+	"""
+	with memoryview(data) as view, view.cast("B") as raw:
+		if len(raw) % 4:
+			raise ValueError(f"data length is:{len(raw)}\nShould be: a multiple of 4 bytes")
+		packed: array[int] = array("I")
+		packed.frombytes(raw)
+	if sys.byteorder != "little":
+		packed.byteswap()
+	return list(map(unpack, packed))
@@ -0,0 +1,177 @@
+"""Multiprocess bulk conversion.
+
+The conversions are CPU-bound pure Python, so they only scale over several cores with processes: `convert_many` splits its input in chunks, converts them in a `ProcessPoolExecutor` and yields the results in the input order.
+
+Only a bounded number of chunks are in flight at once, so arbitrarily long (or infinite) iterables are streamed in constant memory.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from datetime import date
+from itertools import islice
+from typing import TypeVar
+
+from .korean_lunar_calendar import LunarDate, SolarDate, from_date, to_lunar, to_solar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Number of chunks submitted per worker ahead of the one being yielded
+_CHUNKS_IN_FLIGHT_PER_WORKER: int = 2
+
+
+def _chunks(iterable: Iterable[_T], chunksize: int) -> Iterator[list[_T]]:
+	"""Split an iterable in lists of **chunksize** items.
+
+	Args:
+		iterable (Iterable[_T]): Items
+		chunksize (int): Number of items per chunk
+
+	Yields:
+		list[_T]: Chunk of items
+	"""
+	iterator = iter(iterable)
+	while chunk := list(islice(iterator, chunksize)):
+		yield chunk
+
+
+def _check_workers(workers: int | None) -> int:
+	"""Check the number of worker processes.
+
+	Args:
+		workers (int | None): Number of worker processes (`None`: one per CPU)
+
+	Raises:
+		ValueError: If **workers** is not positive
+
+	Returns:
+		int: Number of worker processes
+	"""
+	if workers is None:
+		return os.cpu_count() or 1
+	if workers < 1:
+		raise ValueError(f"workers is:{workers}\nShould be: a positive integer or None")
+	return workers
+
+
+def _pool(workers: int) -> AbstractContextManager[ProcessPoolExecutor | None]:
+	"""Start a pool of worker processes.
+
+	The lookup tables of a worker are built once, when it imports `korean_lunar_calendar.korean_lunar_calendar` to run its first chunk (or inherited as is by forked workers), never per chunk or per date.
+
+	Args:
+		workers (int): Number of worker processes (`1`: none, the chunks being converted in the current process)
+
+	Returns:
+		AbstractContextManager[ProcessPoolExecutor | None]: Pool (or `None`), shut down on exit
+	"""
+	if workers == 1:
+		return nullcontext()
+	return ProcessPoolExecutor(max_workers=workers)
+
+
+def _map_chunks(func: Callable[[list[_T]], _R], chunks: Iterable[list[_T]], executor: Executor | None, max_in_flight: int) -> Iterator[tuple[list[_T], _R]]:
+	"""Apply **func** to each chunk in **executor**, in order.
+
+	Args:
+		func (Callable[[list[_T]], _R]): Picklable function converting a chunk
+		chunks (Iterable[list[_T]]): Chunks
+		executor (Executor | None): Executor (`None`: in the current process)
+		max_in_flight (int): Maximum number of chunks submitted to **executor** at once
+
+	Yields:
+		tuple[list[_T], _R]: Each chunk & its result, in the order of **chunks**
+	"""
+	if executor is None:
+		for chunk in chunks:
+			yield chunk, func(chunk)
+		return
+
+	pending: deque[tuple[list[_T], Future[_R]]] = deque()
+	try:
+		for chunk in chunks:
+			pending.append((chunk, executor.submit(func, chunk)))
+			if len(pending) >= max_in_flight:
+				done_chunk, future = pending.popleft()
+				yield done_chunk, future.result()
+		while pending:
+			done_chunk, future = pending.popleft()
+			yield done_chunk, future.result()
+	finally:
+		for _, future in pending:
+			future.cancel()
+
+
+def _convert_chunk(dates: list[SolarDate | LunarDate | date]) -> list[LunarDate | SolarDate]:
+	"""Convert a chunk of dates (see `convert_many`).
+
+	Args:
+		dates (list[SolarDate | LunarDate | date]): Dates
+
+	Raises:
+		ValueError: If a date is not valid
+		TypeError: If a date is neither a `SolarDate`, a `LunarDate` nor a `datetime.date`
+
+	Returns:
+		list[LunarDate | SolarDate]: Converted dates
+	"""
+	converted: list[LunarDate | SolarDate] = []
+	append = converted.append
+	for date_ in dates:
+		if isinstance(date_, SolarDate):
+			append(to_lunar(date_))
+		elif isinstance(date_, LunarDate):
+			append(to_solar(date_))
+		elif isinstance(date_, date):
+			append(from_date(date_))
+		else:
+			raise TypeError(f"date is:{date_!r}\nShould be: a SolarDate, a LunarDate or a datetime.date")
+	return converted
+
+
+def convert_many(dates: Iterable[SolarDate | LunarDate | date], workers: int | None = None, chunksize: int = 4096) -> Iterator[LunarDate | SolarDate]:
+	"""Convert many dates in worker processes, yielding the results in the input order.
+
+	Solar dates (`SolarDate` or `datetime.date`) are converted to `LunarDate`, and lunar dates (`LunarDate`) to `SolarDate`.
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date]): Dates, consumed lazily
+		workers (int | None, optional): Number of worker processes (`None`: one per CPU, `1`: in the current process, without any pool). Defaults to None.
+		chunksize (int, optional): Number of dates sent at once to a worker. Defaults to 4096.
+
+	Raises:
+		ValueError: If **workers** or **chunksize** is not positive, or if a date is not valid
+		TypeError: If a date is neither a `SolarDate`, a `LunarDate` nor a `datetime.date`
+
+	Returns:
+		Iterator[LunarDate | SolarDate]: Converted dates
+
+	Examples:
+		```python
+		solar_dates = (SolarDate(year, 1, 1) for year in range(1001, 2051))
+		list(convert_many(solar_dates, workers=4, chunksize=256))
+		```
+	"""
+	workers = _check_workers(workers)
+	if chunksize < 1:
+		raise ValueError(f"chunksize is:{chunksize}\nShould be: a positive integer")
+	return _convert_many(dates, workers, chunksize)
+
+
+def _convert_many(dates: Iterable[SolarDate | LunarDate | date], workers: int, chunksize: int) -> Iterator[LunarDate | SolarDate]:
+	"""Convert many dates in worker processes (see `convert_many`, once its arguments are checked).
+
+	Args:
+		dates (Iterable[SolarDate | LunarDate | date]): Dates
+		workers (int): Number of worker processes
+		chunksize (int): Number of dates sent at once to a worker
+
+	Yields:
+		LunarDate | SolarDate: Converted dates
+	"""
+	with _pool(workers) as executor:
+		for _, converted in _map_chunks(_convert_chunk, _chunks(dates, chunksize), executor, workers * _CHUNKS_IN_FLIGHT_PER_WORKER):
+			yield from converted
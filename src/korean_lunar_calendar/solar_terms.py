@@ -0,0 +1,1453 @@
+"""Solar terms (jeolgi) and month pillars split at the solar terms, as used for the four pillars (saju).
+
+`gap_ja` counts lunar months (intercalation months being ignored), whereas a saju month starts at one of the 12 "jeol" solar terms:
+Ipchun (입춘, apparent solar longitude 315°) starts the month of the tiger (寅), Gyeongchip (경칩, 345°) the month of the rabbit (卯), ..., Sohan (소한, 285°) the month of the ox (丑).
+The 12 other solar terms (junggi, mid-month) do not split months, and are not stored.
+
+The moment (day & minute, in Korea Standard Time) of each of the 12 jeol of the solar years 1000 ~ 2050 is precomputed (`SOLAR_TERM_DATA`),
+and a month pillar is a binary search in the moments of the jeol, as a date conversion: the month changes at the minute of the term, not at midnight.
+
+The table was generated by `_build_solar_term_data` from the VSOP87 series of the Earth truncated as in Jean Meeus, *Astronomical Algorithms* (appendix III),
+the ΔT polynomials of Espenak & Meeus, and Korea Standard Time (UTC+9) throughout, rounded to the nearest minute.
+The result is within a minute of the published times in recent years; before ~1600, the uncertainty of ΔT may shift the terms by a few minutes.
+
+`four_pillars` builds on it the year (from Ipchun), month, day & hour pillars of a moment in one call.
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Final, NamedTuple
+
+from .korean_lunar_calendar import (
+	_MAX_ORDINAL,
+	_MIN_ORDINAL,
+	_ORDINAL_ABS_DAY_DIFF,
+	Pillar,
+	_day_pillar,
+)
+
+# ruff: noqa: PLR2004
+
+
+# Names of the 12 jeol (month starting solar terms), from the one in January to the one in December
+SOLAR_TERM_NAMES: Final[tuple[str, ...]] = (
+	"Sohan", "Ipchun", "Gyeongchip", "Cheongmyeong", "Ipha", "Mangjong", "Soseo", "Ipchu", "Baengno", "Hallo", "Ipdong", "Daeseol",
+)
+SOLAR_TERM_BASE_YEAR: Final[int] = 1000
+# Time zone of the solar term table, and of naive datetimes
+KST: Final[timezone] = timezone(timedelta(hours=9), "KST")
+
+# 4 figure hexadecimal -> 16bits: `|.DDD|DMMM|MMMM|MMMM|` day of the month (`D`) & minute of the day in KST (`M`) of a jeol;
+# one row of 12 jeol (Sohan ~ Daeseol) per year; len: 12612; packed in a read-only `memoryview` of 2 byte items
+SOLAR_TERM_DATA: Final[memoryview] = memoryview(array("H", (
+	0x2b5a, 0x2108, 0x30eb, 0x2bbb, 0x33cd, 0x3847, 0x42f6, 0x449b, 0x43ea, 0x4841, 0x3d0d, 0x3a54,
+	0x2cb1, 0x2260, 0x3244, 0x2d15, 0x3526, 0x39a0, 0x444f, 0x4855, 0x4544, 0x499b, 0x40c9, 0x3bb4,
+	0x3073, 0x23c3, 0x33a6, 0x30d3, 0x38e0, 0x3af7, 0x4805, 0x49ac, 0x48fd, 0x4af6, 0x4226, 0x3d13,
+	0x31d5, 0x2526, 0x3508, 0x3233, 0x3a3d, 0x3c51, 0x495d, 0x4b05, 0x4a56, 0x4c4f, 0x437d, 0x40c6,
+	0x3325, 0x28d6, 0x30ba, 0x2b88, 0x3396, 0x380d, 0x42bc, 0x4465, 0x43b8, 0x4811, 0x3cdf, 0x3a27,
+	0x2c85, 0x2236, 0x321b, 0x2cec, 0x34fc, 0x3971, 0x441c, 0x4820, 0x450f, 0x4967, 0x4097, 0x3b83,
+	0x3044, 0x2396, 0x337a, 0x30aa, 0x38b7, 0x3acb, 0x4575, 0x4979, 0x48c8, 0x4ac2, 0x41f3, 0x3cde,
+	0x319e, 0x24ed, 0x34cd, 0x31fa, 0x3a08, 0x3c20, 0x4930, 0x4ada, 0x4a2d, 0x4c27, 0x4357, 0x40a2,
+	0x3301, 0x28b0, 0x3091, 0x2b5d, 0x336c, 0x3585, 0x4295, 0x443c, 0x438c, 0x4583, 0x3cb0, 0x39fa,
+	0x2c5a, 0x220b, 0x31ee, 0x2cbc, 0x34ca, 0x3941, 0x43f0, 0x4599, 0x44ea, 0x4942, 0x4070, 0x3b59,
+	0x3019, 0x236a, 0x334c, 0x3078, 0x3884, 0x3a99, 0x4548, 0x4953, 0x48a8, 0x4aa4, 0x41d6, 0x3cc0,
+	0x3180, 0x24ce, 0x34af, 0x31da, 0x39e5, 0x3bf8, 0x4906, 0x4ab0, 0x4a06, 0x4c03, 0x4333, 0x407c,
+	0x32d8, 0x2884, 0x3063, 0x2b2f, 0x333c, 0x3554, 0x4265, 0x4410, 0x4367, 0x4565, 0x3c97, 0x39e1,
+	0x2c3e, 0x21ea, 0x31c9, 0x2c94, 0x34a2, 0x3918, 0x43c6, 0x456e, 0x44c1, 0x491e, 0x4052, 0x3b40,
+	0x3002, 0x2351, 0x3330, 0x3058, 0x3861, 0x3a73, 0x451f, 0x4927, 0x487b, 0x4a78, 0x41ac, 0x3c9a,
+	0x315b, 0x24a9, 0x3486, 0x31ad, 0x39b4, 0x3bc8, 0x48d8, 0x4a85, 0x49de, 0x4bde, 0x4311, 0x405d,
+	0x32bd, 0x286b, 0x304a, 0x2b13, 0x331c, 0x352f, 0x423d, 0x43e6, 0x433a, 0x4538, 0x3c6a, 0x39b5,
+	0x2c14, 0x21c4, 0x31a5, 0x2c70, 0x347a, 0x38ec, 0x4398, 0x453f, 0x4493, 0x48f1, 0x4024, 0x3b11,
+	0x2d71, 0x2320, 0x32ff, 0x3028, 0x3831, 0x3a43, 0x44ef, 0x48f7, 0x484d, 0x4a4d, 0x4183, 0x3c73,
+	0x3134, 0x2481, 0x345e, 0x3185, 0x398d, 0x3ba0, 0x48ac, 0x4a54, 0x49a9, 0x4ba6, 0x42d9, 0x4025,
+	0x3285, 0x2832, 0x300f, 0x2ad7, 0x32e1, 0x34f6, 0x4206, 0x43b2, 0x4307, 0x4504, 0x3c36, 0x3981,
+	0x2be0, 0x218e, 0x316c, 0x2c36, 0x3440, 0x38b5, 0x4363, 0x450d, 0x4462, 0x48bf, 0x3d91, 0x3ade,
+	0x2d3e, 0x22ed, 0x32cc, 0x2d94, 0x359b, 0x3a0c, 0x44b9, 0x48c3, 0x481a, 0x4a1a, 0x414d, 0x3c39,
+	0x30f5, 0x243f, 0x341a, 0x3140, 0x3948, 0x3b5c, 0x486d, 0x4a1d, 0x497a, 0x4b7e, 0x42b4, 0x3d9f,
+	0x325a, 0x2802, 0x2d7b, 0x2aa0, 0x32a9, 0x34bf, 0x41d0, 0x437d, 0x42d6, 0x44d7, 0x3c0e, 0x395b,
+	0x2bb8, 0x2161, 0x313b, 0x2c00, 0x3407, 0x387a, 0x4329, 0x44d5, 0x442e, 0x4890, 0x3d68, 0x3ab8,
+	0x2d19, 0x22c4, 0x329c, 0x2d5d, 0x355f, 0x39d0, 0x447f, 0x488d, 0x458a, 0x49ef, 0x4129, 0x3c1b,
+	0x30de, 0x242a, 0x3403, 0x3123, 0x3924, 0x3b32, 0x483f, 0x49ed, 0x4949, 0x4b4d, 0x4285, 0x3d73,
+	0x3234, 0x2580, 0x2d5b, 0x2a7f, 0x3282, 0x3492, 0x419f, 0x434d, 0x42a9, 0x44ad, 0x3be5, 0x3934,
+	0x2b93, 0x213f, 0x311c, 0x2be2, 0x33e8, 0x3857, 0x4302, 0x44ac, 0x4406, 0x486a, 0x3d44, 0x3a95,
+	0x2cf8, 0x22a5, 0x3281, 0x2d46, 0x354a, 0x39b8, 0x4462, 0x486a, 0x4562, 0x49c6, 0x4100, 0x3bf1,
+	0x30b2, 0x23fd, 0x33d5, 0x30f7, 0x38fb, 0x3b0d, 0x481c, 0x49ca, 0x4926, 0x4b2a, 0x4263, 0x3d53,
+	0x3213, 0x255d, 0x2d36, 0x2a59, 0x325f, 0x3473, 0x4183, 0x4330, 0x4289, 0x448a, 0x3bc0, 0x390e,
+	0x2b6f, 0x211c, 0x30f7, 0x2bbb, 0x33c0, 0x3831, 0x42df, 0x448b, 0x43e5, 0x4847, 0x3d1d, 0x3a6b,
+	0x2ccb, 0x2276, 0x3250, 0x2d11, 0x3514, 0x3983, 0x4432, 0x4841, 0x4540, 0x49a7, 0x40e1, 0x3bd0,
+	0x308e, 0x23d7, 0x33af, 0x30d0, 0x38d3, 0x3ae2, 0x4591, 0x49a0, 0x48fe, 0x4b05, 0x423e, 0x3d2c,
+	0x31e8, 0x252e, 0x2d04, 0x2a25, 0x3229, 0x343b, 0x414a, 0x42fa, 0x4258, 0x445f, 0x3b9a, 0x38e9,
+	0x2b46, 0x20ed, 0x30c2, 0x2b82, 0x3386, 0x3596, 0x42a5, 0x4453, 0x43b0, 0x4817, 0x3cf3, 0x3a46,
+	0x2ca8, 0x2253, 0x3229, 0x2ce6, 0x34e5, 0x3952, 0x43ff, 0x480c, 0x4509, 0x4971, 0x40ad, 0x3b9f,
+	0x305f, 0x23a7, 0x337b, 0x3097, 0x3894, 0x3aa1, 0x4551, 0x4963, 0x48c5, 0x4ad0, 0x420b, 0x3cfc,
+	0x31ba, 0x2502, 0x2cd8, 0x29f6, 0x31f7, 0x3406, 0x4114, 0x42c4, 0x4223, 0x442b, 0x3b67, 0x38b8,
+	0x2b17, 0x20c0, 0x3098, 0x2b58, 0x3358, 0x3565, 0x4270, 0x441c, 0x437a, 0x4582, 0x3cbf, 0x3a12,
+	0x2c72, 0x221b, 0x31ef, 0x2cac, 0x34a9, 0x3915, 0x43c2, 0x4570, 0x44d1, 0x493d, 0x407d, 0x3b72,
+	0x3033, 0x237c, 0x334f, 0x306b, 0x386a, 0x3a77, 0x4525, 0x4934, 0x4893, 0x4a9c, 0x41d9, 0x3ccb,
+	0x318b, 0x24d3, 0x2ca8, 0x29c5, 0x31c5, 0x33d3, 0x40e2, 0x4292, 0x41f1, 0x43f9, 0x3b34, 0x3885,
+	0x2ae5, 0x208e, 0x3065, 0x2b23, 0x3323, 0x3531, 0x423f, 0x43ef, 0x434f, 0x4558, 0x3c95, 0x39e7,
+	0x2c48, 0x21f2, 0x31c9, 0x2c87, 0x3485, 0x38f1, 0x439e, 0x454d, 0x44ae, 0x4919, 0x4057, 0x3b48,
+	0x3005, 0x234b, 0x331d, 0x3039, 0x3837, 0x3a45, 0x44f4, 0x4908, 0x486d, 0x4a7c, 0x41bb, 0x3cac,
+	0x3168, 0x24ac, 0x2c7d, 0x2998, 0x3199, 0x33aa, 0x40bb, 0x426d, 0x41cf, 0x43dc, 0x3b1b, 0x386e,
+	0x2acd, 0x2073, 0x3045, 0x2b00, 0x32ff, 0x350d, 0x421b, 0x43cb, 0x432c, 0x4537, 0x3c77, 0x39cc,
+	0x2c2e, 0x21d5, 0x31a5, 0x2c5c, 0x3454, 0x38be, 0x436d, 0x4520, 0x4486, 0x48f5, 0x4038, 0x3b2e,
+	0x2d90, 0x2337, 0x3308, 0x3020, 0x3819, 0x3a23, 0x44d1, 0x48e5, 0x484a, 0x4a58, 0x4197, 0x3c8a,
+	0x314a, 0x2491, 0x2c63, 0x297d, 0x3179, 0x3383, 0x408f, 0x4241, 0x41a4, 0x43b2, 0x3af2, 0x3845,
+	0x2aa4, 0x204b, 0x301e, 0x2ad9, 0x32d6, 0x34e0, 0x41eb, 0x439a, 0x42fd, 0x450b, 0x3c4e, 0x39a4,
+	0x2c06, 0x21ad, 0x3180, 0x2c39, 0x3435, 0x389f, 0x434a, 0x44f8, 0x4459, 0x48c7, 0x4009, 0x3aff,
+	0x2d5f, 0x2303, 0x32d2, 0x2d89, 0x3584, 0x39ef, 0x449e, 0x48b1, 0x4816, 0x4a24, 0x4165, 0x3c59,
+	0x3118, 0x245d, 0x2c2c, 0x2943, 0x313f, 0x334d, 0x405e, 0x4212, 0x4175, 0x4381, 0x3ac0, 0x3813,
+	0x2a72, 0x2019, 0x2d8b, 0x2aa4, 0x32a0, 0x34ab, 0x41b9, 0x436b, 0x42cf, 0x44dc, 0x3c1b, 0x396f,
+	0x2bce, 0x2173, 0x3143, 0x2bf8, 0x33ef, 0x3857, 0x4305, 0x44ba, 0x4423, 0x4896, 0x3d7a, 0x3acf,
+	0x2d2d, 0x22cf, 0x329d, 0x2d52, 0x354b, 0x39b5, 0x4464, 0x487a, 0x4583, 0x49f6, 0x413a, 0x3c2d,
+	0x30ea, 0x242c, 0x2bf8, 0x290d, 0x3107, 0x3312, 0x4021, 0x41d5, 0x413c, 0x434e, 0x3a93, 0x3589,
+	0x2a48, 0x1d8a, 0x2d57, 0x2a6b, 0x3261, 0x346a, 0x4178, 0x432b, 0x4292, 0x44a5, 0x3bec, 0x3946,
+	0x2ba9, 0x214f, 0x311d, 0x2bd0, 0x33c5, 0x382c, 0x42d8, 0x448c, 0x43f3, 0x4866, 0x3d4c, 0x3aa4,
+	0x2d05, 0x22aa, 0x3276, 0x2d28, 0x351d, 0x3983, 0x4430, 0x4846, 0x4550, 0x49c5, 0x410a, 0x3c01,
+	0x30c0, 0x2404, 0x2bd2, 0x28e7, 0x30df, 0x32e8, 0x3d96, 0x41aa, 0x4112, 0x4325, 0x3a6a, 0x3560,
+	0x2a21, 0x1d66, 0x2d37, 0x2a4e, 0x3247, 0x344f, 0x415b, 0x430c, 0x4271, 0x4483, 0x3bc9, 0x3921,
+	0x2b83, 0x2127, 0x30f4, 0x2ba6, 0x339b, 0x3802, 0x42ad, 0x4461, 0x43c9, 0x483e, 0x3d27, 0x3a81,
+	0x2ce2, 0x2286, 0x3251, 0x2d03, 0x34fa, 0x3963, 0x4413, 0x4829, 0x4532, 0x49a4, 0x40e9, 0x3bdf,
+	0x309f, 0x23e3, 0x2bb0, 0x28c4, 0x30bb, 0x32c5, 0x3d75, 0x418a, 0x40f2, 0x4303, 0x3a46, 0x353b,
+	0x29fb, 0x1d3f, 0x2d0d, 0x2a20, 0x3216, 0x341d, 0x412b, 0x42e1, 0x424a, 0x445e, 0x3ba4, 0x38fb,
+	0x2b5b, 0x20ff, 0x30cc, 0x2b80, 0x3376, 0x357d, 0x428b, 0x4441, 0x43ad, 0x4823, 0x3d09, 0x3a5f,
+	0x2cbc, 0x225b, 0x3223, 0x2cd4, 0x34c9, 0x3931, 0x43e0, 0x4598, 0x4506, 0x497e, 0x40c6, 0x3bbc,
+	0x3079, 0x23b6, 0x2b7d, 0x288d, 0x3083, 0x328d, 0x3d3e, 0x4156, 0x40c2, 0x42d9, 0x3a21, 0x351a,
+	0x29da, 0x1d1b, 0x2ce3, 0x29f3, 0x31e7, 0x33ef, 0x40fe, 0x42b4, 0x421e, 0x4434, 0x3b7d, 0x38d7,
+	0x2b39, 0x20db, 0x30a2, 0x2b4c, 0x333a, 0x353c, 0x4249, 0x4401, 0x4370, 0x458a, 0x3cd5, 0x3a31,
+	0x2c92, 0x2235, 0x31fc, 0x2ca8, 0x3498, 0x38fb, 0x43a9, 0x4562, 0x44d2, 0x494b, 0x4095, 0x3b8d,
+	0x304c, 0x238e, 0x2b57, 0x2867, 0x3059, 0x325e, 0x3d0a, 0x411f, 0x408c, 0x42a4, 0x39ee, 0x34e7,
+	0x29a6, 0x1ce8, 0x2cb2, 0x29c1, 0x31b2, 0x33b5, 0x40be, 0x4272, 0x41dd, 0x43f7, 0x3b43, 0x38a0,
+	0x2b03, 0x20a6, 0x306f, 0x2b1e, 0x330f, 0x3513, 0x421e, 0x43d3, 0x433f, 0x4558, 0x3ca3, 0x39ff,
+	0x2c5f, 0x2200, 0x31c6, 0x2c73, 0x3464, 0x38ca, 0x4377, 0x452f, 0x449c, 0x4914, 0x405e, 0x3b57,
+	0x3017, 0x2358, 0x2b1f, 0x282c, 0x301e, 0x3226, 0x3cd6, 0x40ee, 0x405b, 0x4272, 0x39ba, 0x34b2,
+	0x2973, 0x1cb5, 0x2c80, 0x2990, 0x3183, 0x3389, 0x4098, 0x4250, 0x41bd, 0x43d4, 0x3b1d, 0x3876,
+	0x2ad6, 0x2076, 0x303d, 0x2ae9, 0x32d7, 0x34da, 0x41e7, 0x43a1, 0x4313, 0x4530, 0x3c7d, 0x39d7,
+	0x2c35, 0x21d3, 0x3197, 0x2c42, 0x3432, 0x3898, 0x4348, 0x4504, 0x4477, 0x48f5, 0x4041, 0x3b3a,
+	0x2d97, 0x2334, 0x2af8, 0x2803, 0x2d95, 0x31fd, 0x3cad, 0x40c7, 0x4036, 0x4253, 0x39a0, 0x349b,
+	0x295b, 0x1c99, 0x2c5d, 0x2966, 0x3153, 0x3355, 0x4062, 0x421c, 0x418c, 0x43a9, 0x3af8, 0x3857,
+	0x2aba, 0x205b, 0x3020, 0x2ac8, 0x32b4, 0x34b5, 0x41c3, 0x437e, 0x42f0, 0x450f, 0x3c5d, 0x39b9,
+	0x2c1a, 0x21b9, 0x317d, 0x2c25, 0x3411, 0x3873, 0x4320, 0x44db, 0x444e, 0x48ce, 0x401c, 0x3b17,
+	0x2d76, 0x2315, 0x2ad9, 0x2583, 0x2d70, 0x31d2, 0x3c7f, 0x4098, 0x4009, 0x4227, 0x3976, 0x3472,
+	0x2933, 0x1c73, 0x2c39, 0x2945, 0x3134, 0x3337, 0x4043, 0x41fb, 0x416a, 0x4387, 0x3ad6, 0x3834,
+	0x2a97, 0x2036, 0x2d98, 0x2a9f, 0x328a, 0x348a, 0x4194, 0x434d, 0x42be, 0x44de, 0x3c2f, 0x398e,
+	0x2bf0, 0x218e, 0x3150, 0x2bf6, 0x33e1, 0x3844, 0x42f3, 0x44af, 0x4421, 0x489f, 0x3d8c, 0x3ae8,
+	0x2d48, 0x22e7, 0x2aab, 0x2555, 0x2d42, 0x31a7, 0x3c56, 0x4071, 0x3d81, 0x41fe, 0x394a, 0x3445,
+	0x2904, 0x1c44, 0x2c08, 0x2911, 0x30fb, 0x32fb, 0x4006, 0x41c0, 0x4132, 0x4351, 0x3aa0, 0x359d,
+	0x2a5e, 0x1d9d, 0x2d60, 0x2a68, 0x3253, 0x3454, 0x4161, 0x431d, 0x4292, 0x44b4, 0x3c05, 0x3960,
+	0x2bbd, 0x2158, 0x3118, 0x2bbe, 0x33aa, 0x380d, 0x42bb, 0x4477, 0x43ed, 0x4870, 0x3d61, 0x3abe,
+	0x2d1b, 0x22b5, 0x2a73, 0x2518, 0x2d03, 0x3166, 0x3c15, 0x4030, 0x3d44, 0x41c4, 0x3916, 0x3415,
+	0x28d6, 0x1c14, 0x2bd4, 0x28da, 0x30c5, 0x32c7, 0x3d75, 0x4191, 0x4105, 0x4325, 0x3a77, 0x3577,
+	0x2a3a, 0x1d78, 0x2d37, 0x2a38, 0x321d, 0x341a, 0x4126, 0x42e3, 0x425a, 0x447e, 0x3bd1, 0x3931,
+	0x2b93, 0x2131, 0x30f0, 0x2b92, 0x3378, 0x3576, 0x4284, 0x4442, 0x43bb, 0x483f, 0x3d31, 0x3a8e,
+	0x2ced, 0x228a, 0x324c, 0x2cf3, 0x34dd, 0x393e, 0x43ec, 0x4808, 0x451d, 0x499f, 0x40f2, 0x3bf0,
+	0x30b0, 0x23ed, 0x33ae, 0x30b3, 0x389b, 0x3a98, 0x4542, 0x495b, 0x48cf, 0x4af2, 0x4247, 0x3d49,
+	0x320c, 0x2549, 0x3509, 0x320d, 0x39f5, 0x3bf5, 0x4902, 0x4abe, 0x4a34, 0x4c58, 0x43ac, 0x410c,
+	0x336c, 0x2908, 0x38c5, 0x3368, 0x3b50, 0x3d52, 0x4a62, 0x4c20, 0x4b97, 0x501a, 0x450c, 0x426a,
+	0x34c9, 0x2a65, 0x3223, 0x2cc5, 0x34ad, 0x390e, 0x43bd, 0x457b, 0x44f1, 0x4974, 0x40c5, 0x3bc3,
+	0x3084, 0x23c1, 0x3382, 0x3087, 0x3871, 0x3a71, 0x4520, 0x493f, 0x48b7, 0x4ada, 0x422d, 0x3d2c,
+	0x31eb, 0x2526, 0x34e3, 0x31e4, 0x39c9, 0x3bc6, 0x48d3, 0x4a91, 0x4a0d, 0x4c35, 0x438c, 0x40ec,
+	0x334a, 0x28e3, 0x389d, 0x333d, 0x3b22, 0x3d20, 0x4a2f, 0x4bf0, 0x4b6c, 0x4d94, 0x44eb, 0x424a,
+	0x34a8, 0x2a40, 0x31fb, 0x2c9c, 0x3484, 0x38e5, 0x4395, 0x4554, 0x44cd, 0x4954, 0x40aa, 0x3bac,
+	0x306d, 0x23a7, 0x3362, 0x3060, 0x3843, 0x3a3e, 0x44e8, 0x4905, 0x487e, 0x4aa5, 0x41fd, 0x3d01,
+	0x31c5, 0x2503, 0x34bf, 0x31bc, 0x399d, 0x3b97, 0x48a3, 0x4a62, 0x49de, 0x4c07, 0x435f, 0x40c0,
+	0x3320, 0x28bb, 0x3877, 0x3316, 0x3af9, 0x3cf5, 0x4a02, 0x4bc1, 0x4b3d, 0x4d66, 0x44bd, 0x421e,
+	0x347d, 0x2a17, 0x31d3, 0x2c72, 0x3456, 0x38b2, 0x435d, 0x4519, 0x4491, 0x4918, 0x4070, 0x3b72,
+	0x3033, 0x236f, 0x332c, 0x302e, 0x3814, 0x3a11, 0x44bd, 0x48d9, 0x4852, 0x4a79, 0x41d1, 0x3cd4,
+	0x3196, 0x24d0, 0x348a, 0x3187, 0x3969, 0x3b65, 0x4870, 0x4a2e, 0x49a8, 0x4bd1, 0x432a, 0x408e,
+	0x32f0, 0x2889, 0x3843, 0x32de, 0x3abf, 0x3cbb, 0x49ca, 0x4b8b, 0x4b06, 0x4d2e, 0x4484, 0x41e4,
+	0x3444, 0x29de, 0x3199, 0x2c38, 0x341e, 0x387d, 0x432d, 0x44ef, 0x446b, 0x48f2, 0x4047, 0x3b46,
+	0x3005, 0x2340, 0x32fb, 0x2d9a, 0x357b, 0x39d6, 0x4481, 0x48a0, 0x481c, 0x4a46, 0x419f, 0x3ca0,
+	0x3160, 0x249a, 0x3453, 0x3150, 0x3930, 0x3b2b, 0x4838, 0x49fa, 0x497a, 0x4ba8, 0x4303, 0x4063,
+	0x32c0, 0x2855, 0x380b, 0x32a7, 0x3a8a, 0x3c89, 0x4999, 0x4b5c, 0x4adc, 0x4d0a, 0x4466, 0x41c9,
+	0x3427, 0x29bc, 0x3170, 0x2c09, 0x33ea, 0x3847, 0x42f4, 0x44b5, 0x4432, 0x48be, 0x401a, 0x3b1f,
+	0x2d81, 0x231a, 0x32d1, 0x2d6b, 0x354b, 0x39a6, 0x4454, 0x4877, 0x4595, 0x4a22, 0x417e, 0x3c84,
+	0x3147, 0x2481, 0x3438, 0x312f, 0x390a, 0x3b02, 0x480e, 0x49d0, 0x4951, 0x4b81, 0x42df, 0x4044,
+	0x32a7, 0x283f, 0x3596, 0x328e, 0x3a69, 0x3c60, 0x496c, 0x4b2e, 0x4aaf, 0x4cde, 0x443a, 0x419e,
+	0x33fe, 0x2997, 0x3150, 0x2bec, 0x33cd, 0x3828, 0x42d5, 0x4496, 0x4415, 0x48a2, 0x3d9f, 0x3b04,
+	0x2d65, 0x22fe, 0x32b7, 0x2d51, 0x3530, 0x3987, 0x442f, 0x484c, 0x4568, 0x49f5, 0x4154, 0x3c5c,
+	0x3120, 0x245a, 0x3411, 0x310a, 0x38e7, 0x3adf, 0x458a, 0x49aa, 0x4928, 0x4b56, 0x42b3, 0x4018,
+	0x327a, 0x2811, 0x3567, 0x3260, 0x3a40, 0x3c3c, 0x494c, 0x4b10, 0x4a8f, 0x4cbb, 0x4416, 0x4179,
+	0x33d9, 0x2971, 0x3127, 0x2bc0, 0x339f, 0x359a, 0x42a6, 0x4467, 0x43e5, 0x4871, 0x3d6a, 0x3acd,
+	0x2d2e, 0x22c7, 0x327f, 0x2d1a, 0x34f9, 0x3953, 0x4401, 0x4824, 0x4545, 0x49d3, 0x412f, 0x3c32,
+	0x30f1, 0x2427, 0x33db, 0x30d2, 0x38af, 0x3aa8, 0x4555, 0x497a, 0x48fe, 0x4b30, 0x4290, 0x3d94,
+	0x3252, 0x2585, 0x3536, 0x322a, 0x3a06, 0x3bff, 0x490d, 0x4ad2, 0x4a55, 0x4c87, 0x43e5, 0x414a,
+	0x33a9, 0x293c, 0x30ee, 0x2b83, 0x3361, 0x355d, 0x426e, 0x4433, 0x43b6, 0x4847, 0x3d46, 0x3aac,
+	0x2d0d, 0x22a3, 0x3255, 0x2ce9, 0x34c1, 0x3917, 0x43c2, 0x4585, 0x4507, 0x4998, 0x40f9, 0x3c02,
+	0x30c6, 0x23fe, 0x33b1, 0x30a3, 0x3879, 0x3a6c, 0x4517, 0x493c, 0x48c2, 0x4af6, 0x4257, 0x3d5d,
+	0x321d, 0x2552, 0x3505, 0x31f9, 0x39d3, 0x3bcb, 0x48d8, 0x4a9e, 0x4a24, 0x4c59, 0x43ba, 0x4120,
+	0x337f, 0x2913, 0x30c6, 0x2b5a, 0x3335, 0x352c, 0x4236, 0x43f6, 0x4378, 0x480a, 0x3d0b, 0x3a74,
+	0x2cd6, 0x226d, 0x3221, 0x2cb6, 0x3491, 0x38e8, 0x4393, 0x4555, 0x44d8, 0x496b, 0x40cd, 0x3bd6,
+	0x3099, 0x23ce, 0x337f, 0x3071, 0x384a, 0x3a41, 0x44ee, 0x4912, 0x4897, 0x4acb, 0x422e, 0x3d38,
+	0x31fa, 0x252f, 0x34df, 0x31d0, 0x39a8, 0x3b9e, 0x48ab, 0x4a71, 0x49f6, 0x4c28, 0x4387, 0x40ee,
+	0x334e, 0x28e4, 0x3097, 0x2b2b, 0x3306, 0x34ff, 0x420f, 0x43d6, 0x435c, 0x458f, 0x3cef, 0x3a54,
+	0x2cb4, 0x224a, 0x31fe, 0x2c92, 0x346a, 0x38bf, 0x436a, 0x452e, 0x44b3, 0x4949, 0x40ac, 0x3bb4,
+	0x3075, 0x23aa, 0x335b, 0x304d, 0x3823, 0x3a17, 0x44c2, 0x48e8, 0x4870, 0x4aa8, 0x420d, 0x3d14,
+	0x31d2, 0x2503, 0x34b1, 0x31a2, 0x397c, 0x3b75, 0x4885, 0x4a4e, 0x49d6, 0x4c0e, 0x4372, 0x40db,
+	0x333b, 0x28cc, 0x3079, 0x2b09, 0x32e1, 0x34d8, 0x41e4, 0x43a9, 0x432d, 0x4562, 0x3cc6, 0x3a30,
+	0x2c94, 0x222a, 0x31da, 0x2c69, 0x343e, 0x3892, 0x433f, 0x4505, 0x448c, 0x4922, 0x4086, 0x3b91,
+	0x3054, 0x2389, 0x3337, 0x3025, 0x3598, 0x39eb, 0x4498, 0x48c0, 0x484a, 0x4a84, 0x41ea, 0x3cf4,
+	0x31b5, 0x24e8, 0x3497, 0x3185, 0x3958, 0x3b4a, 0x4854, 0x4a1b, 0x49a3, 0x4bdb, 0x433f, 0x40a8,
+	0x3307, 0x289a, 0x304a, 0x2adb, 0x32b2, 0x34a8, 0x41b4, 0x437b, 0x4303, 0x453a, 0x3c9f, 0x3a09,
+	0x2c6a, 0x21fd, 0x31ac, 0x2c3c, 0x3411, 0x3864, 0x430e, 0x44d1, 0x4457, 0x48ef, 0x4056, 0x3b63,
+	0x3026, 0x235a, 0x3307, 0x2d94, 0x3566, 0x39b7, 0x4461, 0x4887, 0x480f, 0x4a47, 0x41ad, 0x3cb7,
+	0x3178, 0x24aa, 0x3456, 0x3143, 0x3918, 0x3b0f, 0x481f, 0x49e9, 0x4973, 0x4bac, 0x4310, 0x4078,
+	0x32d8, 0x286a, 0x3018, 0x2aa6, 0x327b, 0x346f, 0x417b, 0x4342, 0x42ca, 0x4501, 0x3c64, 0x39cd,
+	0x2c2e, 0x21c2, 0x3170, 0x2bff, 0x33d3, 0x3825, 0x42d1, 0x4499, 0x4423, 0x48be, 0x4025, 0x3b2e,
+	0x2d8e, 0x231e, 0x32c8, 0x2d54, 0x3527, 0x397b, 0x4429, 0x4853, 0x4582, 0x4a20, 0x418a, 0x3c96,
+	0x3155, 0x2483, 0x342b, 0x3114, 0x38e6, 0x3ad9, 0x4586, 0x49af, 0x493b, 0x4b77, 0x42e0, 0x404c,
+	0x32ac, 0x283c, 0x2d86, 0x2a70, 0x3242, 0x3436, 0x4146, 0x4310, 0x429c, 0x44d8, 0x3c41, 0x39ae,
+	0x2c11, 0x21a4, 0x314f, 0x2bd8, 0x33a7, 0x3596, 0x42a1, 0x446a, 0x43f6, 0x4893, 0x3d9e, 0x3b0d,
+	0x2d72, 0x2307, 0x32b2, 0x2d3a, 0x3507, 0x3953, 0x43fc, 0x4824, 0x4552, 0x49f1, 0x415b, 0x3c67,
+	0x3128, 0x245a, 0x3405, 0x30f0, 0x38c1, 0x3ab3, 0x4560, 0x498a, 0x4919, 0x4b57, 0x42c2, 0x402d,
+	0x328e, 0x281f, 0x2d6a, 0x2a57, 0x322a, 0x341b, 0x4125, 0x42eb, 0x4274, 0x44af, 0x3c19, 0x3987,
+	0x2bea, 0x217d, 0x312a, 0x2bb5, 0x3387, 0x3577, 0x4281, 0x4447, 0x43d1, 0x486d, 0x3d77, 0x3ae6,
+	0x2d49, 0x22da, 0x3283, 0x2d0b, 0x34dc, 0x392e, 0x43dc, 0x4807, 0x4535, 0x49d3, 0x413e, 0x3c4b,
+	0x310d, 0x243d, 0x33e5, 0x30cd, 0x389c, 0x3a8e, 0x453c, 0x4967, 0x48f4, 0x4b2f, 0x4296, 0x4000,
+	0x3260, 0x2591, 0x2d3b, 0x2a26, 0x31f7, 0x33e9, 0x40f8, 0x42c5, 0x4254, 0x4491, 0x3bf9, 0x3963,
+	0x2bc2, 0x2151, 0x30fb, 0x2b84, 0x3353, 0x3543, 0x424f, 0x441b, 0x43ab, 0x484b, 0x3d57, 0x3ac4,
+	0x2d24, 0x22b3, 0x3259, 0x2cdf, 0x34ac, 0x38fa, 0x43a4, 0x456f, 0x4501, 0x49a4, 0x4111, 0x3c1e,
+	0x30dc, 0x2407, 0x33ab, 0x308f, 0x385d, 0x3a50, 0x44ff, 0x492d, 0x48c0, 0x4b03, 0x4271, 0x3d7f,
+	0x323f, 0x256b, 0x2d0f, 0x29f3, 0x31c0, 0x33b0, 0x40bd, 0x4288, 0x4216, 0x4456, 0x3bc3, 0x3934,
+	0x2b99, 0x212a, 0x30d1, 0x2b54, 0x331e, 0x3509, 0x4213, 0x43dd, 0x436e, 0x480f, 0x3d1d, 0x3a8e,
+	0x2cf1, 0x2281, 0x3226, 0x2ca8, 0x3471, 0x38be, 0x4369, 0x4537, 0x44cc, 0x4971, 0x40e1, 0x3bf1,
+	0x30b2, 0x23e1, 0x3387, 0x306a, 0x3834, 0x3a21, 0x44cb, 0x48f6, 0x4886, 0x4ac9, 0x4237, 0x3d46,
+	0x3207, 0x2536, 0x2cdd, 0x29c3, 0x318f, 0x337d, 0x4088, 0x4252, 0x41e2, 0x4425, 0x3b93, 0x3904,
+	0x2b66, 0x20f6, 0x309c, 0x2b21, 0x32ec, 0x34d9, 0x41e3, 0x43ad, 0x433d, 0x4580, 0x3cf0, 0x3a63,
+	0x2cc8, 0x2259, 0x31fe, 0x2c80, 0x3449, 0x3895, 0x433e, 0x4508, 0x4499, 0x493c, 0x40aa, 0x3bba,
+	0x307c, 0x23aa, 0x334f, 0x3032, 0x359d, 0x39ed, 0x449c, 0x48cb, 0x485e, 0x4aa1, 0x420f, 0x3d1c,
+	0x31dd, 0x250b, 0x2cb1, 0x2997, 0x3163, 0x3352, 0x405f, 0x422c, 0x41bd, 0x43ff, 0x3b6c, 0x38da,
+	0x2b3c, 0x20cc, 0x3072, 0x2af8, 0x32c3, 0x34af, 0x41b9, 0x4385, 0x4318, 0x455d, 0x3ccd, 0x3a3c,
+	0x2c9c, 0x2227, 0x31c9, 0x2c4a, 0x3414, 0x3863, 0x4311, 0x44e1, 0x4479, 0x4923, 0x4096, 0x3ba6,
+	0x3066, 0x2390, 0x3330, 0x300f, 0x3579, 0x39c8, 0x4476, 0x48a5, 0x4839, 0x4a7f, 0x41f0, 0x3d01,
+	0x31c2, 0x24ee, 0x2c8f, 0x296e, 0x3137, 0x3325, 0x4033, 0x4202, 0x4197, 0x43dc, 0x3b4d, 0x38bf,
+	0x2b22, 0x20b0, 0x3053, 0x2ad1, 0x3297, 0x3481, 0x418c, 0x435b, 0x42f2, 0x453b, 0x3cae, 0x3a22,
+	0x2c86, 0x2215, 0x31b7, 0x2c35, 0x33f9, 0x3840, 0x42e8, 0x44b5, 0x444c, 0x48f6, 0x4069, 0x3b7a,
+	0x303a, 0x2366, 0x3307, 0x2d87, 0x354d, 0x3998, 0x4444, 0x4873, 0x480a, 0x4a54, 0x41c8, 0x3cd9,
+	0x319a, 0x24c6, 0x2c68, 0x2949, 0x3112, 0x32fd, 0x4007, 0x41d2, 0x4165, 0x43ab, 0x3b1f, 0x3893,
+	0x2af8, 0x2086, 0x3028, 0x2aa8, 0x326f, 0x3458, 0x415f, 0x432a, 0x42bc, 0x4503, 0x3c76, 0x39eb,
+	0x2c4f, 0x21db, 0x317b, 0x2bf7, 0x33bc, 0x3807, 0x42b4, 0x4484, 0x441b, 0x48c5, 0x4039, 0x3b4b,
+	0x300e, 0x233a, 0x32da, 0x2d57, 0x351c, 0x3968, 0x4415, 0x4845, 0x457b, 0x4a21, 0x4192, 0x3ca2,
+	0x3163, 0x248f, 0x2c31, 0x2910, 0x30d7, 0x32c2, 0x3d6e, 0x419d, 0x4135, 0x437c, 0x3aee, 0x385e,
+	0x2abe, 0x204a, 0x2d8b, 0x2a69, 0x322e, 0x3417, 0x4122, 0x42f2, 0x428c, 0x44d8, 0x3c4e, 0x39c2,
+	0x2c23, 0x21ad, 0x314b, 0x2bc7, 0x338b, 0x3573, 0x427d, 0x444c, 0x43e6, 0x4893, 0x400a, 0x3b1c,
+	0x2d7c, 0x2303, 0x329f, 0x2d19, 0x34dd, 0x3928, 0x43d7, 0x4809, 0x4543, 0x49f0, 0x4166, 0x3c7b,
+	0x313c, 0x2465, 0x2c02, 0x28dc, 0x30a0, 0x328b, 0x3d38, 0x4168, 0x4100, 0x434b, 0x3ac1, 0x3837,
+	0x2a9c, 0x2029, 0x2d69, 0x2a43, 0x3205, 0x33ea, 0x40f3, 0x42c1, 0x425a, 0x44a6, 0x3c1d, 0x3993,
+	0x2bf6, 0x2182, 0x311f, 0x2b98, 0x3358, 0x353e, 0x424a, 0x441c, 0x43ba, 0x486a, 0x3d83, 0x3af8,
+	0x2d59, 0x22e3, 0x3280, 0x2cfb, 0x34be, 0x3906, 0x43b2, 0x4583, 0x451d, 0x49c9, 0x4140, 0x3c55,
+	0x3116, 0x2440, 0x2bdf, 0x28bb, 0x307f, 0x3268, 0x3d12, 0x4141, 0x40da, 0x4325, 0x3a9d, 0x3812,
+	0x2a75, 0x2000, 0x2d3d, 0x2a16, 0x31d8, 0x33c0, 0x40ca, 0x429b, 0x4235, 0x4483, 0x3bfd, 0x3974,
+	0x2bd9, 0x2164, 0x3100, 0x2b78, 0x3339, 0x3520, 0x422b, 0x43fc, 0x4396, 0x4844, 0x3d5b, 0x3ad0,
+	0x2d31, 0x22bb, 0x3256, 0x2cce, 0x348f, 0x38d8, 0x4385, 0x4559, 0x44f6, 0x49a4, 0x411b, 0x3c2e,
+	0x30ee, 0x2417, 0x2bb3, 0x288d, 0x3050, 0x3239, 0x3ce5, 0x4118, 0x40b4, 0x4302, 0x3a79, 0x358e,
+	0x2a50, 0x1d7a, 0x2d17, 0x29f1, 0x31b2, 0x3398, 0x40a1, 0x4271, 0x420d, 0x445d, 0x3bd8, 0x394d,
+	0x2bae, 0x2134, 0x30cc, 0x2b41, 0x32ff, 0x34e6, 0x41f2, 0x43c7, 0x4367, 0x481c, 0x3d39, 0x3ab0,
+	0x2d11, 0x2296, 0x322d, 0x2ca1, 0x3460, 0x38a8, 0x4357, 0x452b, 0x44c8, 0x4978, 0x40f3, 0x3c0b,
+	0x30ce, 0x23f6, 0x2b8f, 0x2863, 0x3021, 0x3207, 0x3cb1, 0x40e4, 0x4081, 0x42d0, 0x3a4a, 0x3562,
+	0x2a27, 0x1d52, 0x2cec, 0x29bf, 0x3179, 0x335b, 0x4064, 0x4237, 0x41d7, 0x442a, 0x3ba8, 0x3921,
+	0x2b86, 0x2110, 0x30ab, 0x2b1f, 0x32da, 0x34bc, 0x41c3, 0x4395, 0x4334, 0x4588, 0x3d04, 0x3a7b,
+	0x2cdc, 0x2264, 0x31fd, 0x2c73, 0x3430, 0x3874, 0x431e, 0x44f0, 0x448e, 0x4941, 0x40bd, 0x3bd4,
+	0x3096, 0x23be, 0x2b57, 0x282e, 0x2d8d, 0x31d3, 0x3c7d, 0x40ad, 0x404a, 0x429a, 0x3a17, 0x3530,
+	0x29f5, 0x1d1f, 0x2cba, 0x2990, 0x314e, 0x3332, 0x403b, 0x420a, 0x41a5, 0x43f6, 0x3b72, 0x38eb,
+	0x2b4f, 0x20d7, 0x306e, 0x2ae0, 0x329b, 0x3480, 0x418c, 0x4361, 0x4302, 0x4556, 0x3cd2, 0x3a4a,
+	0x2cac, 0x2233, 0x31ca, 0x2c3d, 0x33fb, 0x3842, 0x42f0, 0x44c7, 0x4468, 0x4919, 0x4093, 0x3ba8,
+	0x3069, 0x2390, 0x2b29, 0x259e, 0x2d5c, 0x31a2, 0x3c4e, 0x4082, 0x4023, 0x4276, 0x39f1, 0x3506,
+	0x29c7, 0x1ced, 0x2c85, 0x2957, 0x3112, 0x32f5, 0x4000, 0x41d6, 0x417a, 0x43d2, 0x3b53, 0x38cd,
+	0x2b2e, 0x20b3, 0x3047, 0x2ab8, 0x3272, 0x3456, 0x4161, 0x4337, 0x42db, 0x4533, 0x3cb4, 0x3a2d,
+	0x2c8e, 0x2211, 0x31a3, 0x2c12, 0x33cc, 0x3811, 0x42bd, 0x4494, 0x4437, 0x48ee, 0x406f, 0x3b89,
+	0x304d, 0x2372, 0x2b06, 0x2575, 0x2d2e, 0x3172, 0x3c1d, 0x4053, 0x3d96, 0x424c, 0x39cc, 0x34e8,
+	0x29ae, 0x1cd8, 0x2c6f, 0x293f, 0x30f7, 0x32d6, 0x3d7e, 0x41b2, 0x4154, 0x43ab, 0x3b2c, 0x38a7,
+	0x2b0c, 0x2092, 0x3027, 0x2a96, 0x324c, 0x342b, 0x4134, 0x430a, 0x42af, 0x450a, 0x3c8d, 0x3a08,
+	0x2c6a, 0x21ef, 0x3184, 0x2bf4, 0x33ad, 0x3590, 0x429b, 0x4470, 0x4413, 0x48ca, 0x404b, 0x3b65,
+	0x3028, 0x234e, 0x2ae5, 0x2556, 0x2d11, 0x3154, 0x3bfc, 0x402f, 0x3d6f, 0x4224, 0x39a4, 0x34bf,
+	0x2984, 0x1cac, 0x2c40, 0x290f, 0x30c5, 0x32a5, 0x3d4e, 0x4182, 0x4124, 0x437c, 0x3aff, 0x387c,
+	0x2ae1, 0x2069, 0x2d9d, 0x2a6b, 0x3222, 0x3403, 0x410d, 0x42e4, 0x4288, 0x44df, 0x3c5e, 0x39d7,
+	0x2c3a, 0x21bf, 0x3153, 0x2bc2, 0x337a, 0x355c, 0x4267, 0x443f, 0x43e3, 0x489a, 0x4019, 0x3b30,
+	0x2d91, 0x2316, 0x2aaa, 0x251a, 0x2cd3, 0x3115, 0x3bc0, 0x3d96, 0x3d3c, 0x41f4, 0x3975, 0x348e,
+	0x2950, 0x1c75, 0x2c09, 0x28d9, 0x3092, 0x3273, 0x3d1c, 0x4152, 0x40f7, 0x4351, 0x3ad5, 0x3850,
+	0x2ab0, 0x2031, 0x2d60, 0x2a2a, 0x31df, 0x33c0, 0x40cc, 0x42a5, 0x424d, 0x44ab, 0x3c31, 0x39ad,
+	0x2c0e, 0x218e, 0x311c, 0x2b84, 0x333a, 0x351d, 0x422c, 0x4406, 0x43ae, 0x4869, 0x3d8c, 0x3b09,
+	0x2d6c, 0x22f0, 0x2a80, 0x24eb, 0x2c9f, 0x30e0, 0x3b8b, 0x3d63, 0x3d0a, 0x41c4, 0x3947, 0x3464,
+	0x2929, 0x1c4f, 0x2be0, 0x28a7, 0x3057, 0x3232, 0x3cda, 0x4112, 0x40bc, 0x431b, 0x3aa2, 0x3821,
+	0x2a86, 0x200b, 0x2d3b, 0x2a05, 0x31b6, 0x3393, 0x409b, 0x4274, 0x421e, 0x447e, 0x3c04, 0x3981,
+	0x2be4, 0x2167, 0x30f7, 0x2b62, 0x3316, 0x34f4, 0x41fd, 0x43d3, 0x437b, 0x4838, 0x3d5f, 0x3adc,
+	0x2d40, 0x22c3, 0x2a53, 0x24be, 0x2c72, 0x30b1, 0x3b59, 0x3d2f, 0x3cd5, 0x4192, 0x3918, 0x3438,
+	0x28ff, 0x1c25, 0x2bb7, 0x2882, 0x3037, 0x3215, 0x3cbe, 0x40f4, 0x4099, 0x42f5, 0x3a7b, 0x359b,
+	0x2a60, 0x1d84, 0x2d12, 0x29da, 0x318b, 0x3369, 0x4074, 0x424d, 0x41f7, 0x4455, 0x3bdb, 0x3958,
+	0x2bbb, 0x213e, 0x30ce, 0x2b36, 0x32e9, 0x34c9, 0x41d7, 0x43b3, 0x435d, 0x481a, 0x3d3d, 0x3ab8,
+	0x2d1a, 0x229e, 0x2a30, 0x249b, 0x2c50, 0x3090, 0x3b3b, 0x3d14, 0x3cbd, 0x417a, 0x38ff, 0x341c,
+	0x28de, 0x1c00, 0x2b8e, 0x2856, 0x3006, 0x31e2, 0x3c8a, 0x40c3, 0x406f, 0x42d2, 0x3a5c, 0x357c,
+	0x2a3f, 0x1d5f, 0x2ceb, 0x29b1, 0x3162, 0x3340, 0x404a, 0x4226, 0x41d2, 0x4434, 0x3bbe, 0x393d,
+	0x2ba0, 0x211f, 0x30aa, 0x2b0f, 0x32c0, 0x349f, 0x41aa, 0x4384, 0x432f, 0x458f, 0x3d17, 0x3a97,
+	0x2cfb, 0x227d, 0x2a09, 0x246f, 0x2c1d, 0x3058, 0x3b01, 0x3cda, 0x3c85, 0x4145, 0x38ce, 0x33ef,
+	0x28b5, 0x1bdb, 0x2b6a, 0x2831, 0x2d7f, 0x31b9, 0x3c61, 0x409a, 0x4045, 0x42a6, 0x3a30, 0x3550,
+	0x2a14, 0x1d35, 0x2cc2, 0x2986, 0x3134, 0x330d, 0x4015, 0x41ef, 0x419c, 0x4400, 0x3b8a, 0x390a,
+	0x2b6d, 0x20ed, 0x3078, 0x2add, 0x328d, 0x346a, 0x4175, 0x434f, 0x42fa, 0x455c, 0x3ce5, 0x3a65,
+	0x2cc8, 0x2249, 0x29d6, 0x243d, 0x2bee, 0x302c, 0x3ad6, 0x3caf, 0x3c58, 0x4117, 0x38a0, 0x33c1,
+	0x2886, 0x1ba8, 0x2b33, 0x2595, 0x2d41, 0x317b, 0x3c23, 0x405c, 0x4008, 0x426b, 0x39f7, 0x351a,
+	0x29df, 0x1d01, 0x2c8c, 0x294d, 0x30f9, 0x32d4, 0x3d7f, 0x41bc, 0x416b, 0x43cf, 0x3b58, 0x38d6,
+	0x2b39, 0x20b9, 0x3044, 0x2aa8, 0x3256, 0x3433, 0x413e, 0x431b, 0x42c9, 0x452c, 0x3cb5, 0x3a33,
+	0x2c94, 0x2214, 0x29a0, 0x2405, 0x2bb2, 0x2d8c, 0x3a94, 0x3c6f, 0x3c1e, 0x40e3, 0x386e, 0x338f,
+	0x2852, 0x1b73, 0x2afe, 0x2562, 0x2d10, 0x314b, 0x3bf4, 0x4030, 0x3d7f, 0x4246, 0x39d4, 0x34f7,
+	0x29b9, 0x1cd6, 0x2c5c, 0x291b, 0x30c7, 0x32a2, 0x3d4d, 0x418a, 0x413b, 0x43a3, 0x3b32, 0x38b5,
+	0x2b19, 0x2096, 0x301c, 0x2a7a, 0x3224, 0x3400, 0x410d, 0x42eb, 0x429b, 0x4501, 0x3c8e, 0x3a11,
+	0x2c76, 0x21f7, 0x2981, 0x23e3, 0x2b8e, 0x2d69, 0x3a73, 0x3c50, 0x3c00, 0x40c5, 0x3851, 0x3374,
+	0x283b, 0x1b5d, 0x2ae7, 0x2545, 0x2cec, 0x3120, 0x3bc6, 0x4001, 0x3d53, 0x421d, 0x39ad, 0x34d2,
+	0x2997, 0x1cb8, 0x2c41, 0x2901, 0x30a9, 0x3280, 0x3d28, 0x4165, 0x4118, 0x4381, 0x3b10, 0x3893,
+	0x2af6, 0x2075, 0x2d9d, 0x2a5f, 0x320b, 0x33e6, 0x40ef, 0x42ca, 0x4279, 0x44df, 0x3c6e, 0x39f1,
+	0x2c55, 0x21d5, 0x295d, 0x23be, 0x2b69, 0x2d41, 0x3a47, 0x3c21, 0x3bce, 0x4094, 0x3823, 0x3348,
+	0x280f, 0x1b31, 0x2aba, 0x251b, 0x2cc5, 0x30ff, 0x3ba7, 0x3d83, 0x3d32, 0x41f8, 0x3987, 0x34aa,
+	0x296f, 0x1c8e, 0x2c15, 0x28d2, 0x307b, 0x3254, 0x3cff, 0x413e, 0x40f0, 0x4357, 0x3ae5, 0x3866,
+	0x2ac8, 0x2046, 0x2d6c, 0x2a2a, 0x31d3, 0x33ad, 0x40b9, 0x4299, 0x424c, 0x44b3, 0x3c3f, 0x39bf,
+	0x2c21, 0x219f, 0x2927, 0x2388, 0x2b34, 0x2d0e, 0x3a1a, 0x3bf9, 0x3bac, 0x4075, 0x3803, 0x3325,
+	0x2587, 0x1b03, 0x2a87, 0x24e2, 0x2c88, 0x30be, 0x3b65, 0x3d43, 0x3cf9, 0x41c6, 0x395a, 0x347f,
+	0x2942, 0x1c5d, 0x2bde, 0x2897, 0x303c, 0x3213, 0x3cbd, 0x40fe, 0x40b5, 0x4323, 0x3ab6, 0x383c,
+	0x2a9f, 0x201a, 0x2d3c, 0x29f5, 0x319b, 0x3373, 0x407f, 0x4260, 0x4214, 0x447f, 0x3c11, 0x3997,
+	0x2bfc, 0x217a, 0x28fe, 0x2358, 0x2afa, 0x2ccd, 0x39d3, 0x3bb0, 0x3b64, 0x4030, 0x3563, 0x32ea,
+	0x2552, 0x1ad3, 0x2a5a, 0x24b5, 0x2c59, 0x308b, 0x3b31, 0x3d0f, 0x3cc5, 0x4193, 0x3927, 0x344e,
+	0x2913, 0x1c30, 0x2bb4, 0x286f, 0x3012, 0x31e6, 0x3c8e, 0x40cc, 0x4081, 0x42f0, 0x3a85, 0x380b,
+	0x2a6f, 0x1d8c, 0x2d0f, 0x29c9, 0x316f, 0x3344, 0x404c, 0x422a, 0x41dd, 0x4449, 0x3bdd, 0x3963,
+	0x2bc9, 0x2147, 0x28cc, 0x2329, 0x2ad2, 0x2caa, 0x39b3, 0x3b90, 0x3b43, 0x400d, 0x3540, 0x32c7,
+	0x252e, 0x1aad, 0x2a31, 0x248a, 0x2c2d, 0x3060, 0x3b07, 0x3ce5, 0x3c99, 0x4166, 0x38fb, 0x3423,
+	0x28e9, 0x1c08, 0x2b8b, 0x2843, 0x2d85, 0x31ba, 0x3c64, 0x40a6, 0x405d, 0x42cb, 0x3a5d, 0x3582,
+	0x2a45, 0x1d61, 0x2ce5, 0x29a0, 0x3147, 0x331e, 0x402a, 0x420d, 0x41c4, 0x4431, 0x3bc3, 0x3946,
+	0x2ba9, 0x2124, 0x28a8, 0x2303, 0x2aa7, 0x2c7b, 0x3982, 0x3b61, 0x3b17, 0x3d86, 0x351b, 0x32a2,
+	0x2506, 0x1a82, 0x2a05, 0x245e, 0x2c02, 0x3037, 0x3ae0, 0x3cc0, 0x3c79, 0x414b, 0x38e2, 0x340a,
+	0x28cd, 0x1be5, 0x2b63, 0x2818, 0x2d5b, 0x3191, 0x3c3d, 0x407f, 0x4039, 0x42aa, 0x3a42, 0x356a,
+	0x2a2e, 0x1d48, 0x2cc5, 0x2979, 0x3119, 0x32ee, 0x3d99, 0x41db, 0x4194, 0x4403, 0x3b98, 0x3920,
+	0x2b86, 0x2103, 0x2884, 0x22da, 0x2a7c, 0x2c50, 0x395a, 0x3b3c, 0x3af6, 0x3d65, 0x34fb, 0x3283,
+	0x24e9, 0x1a66, 0x29e7, 0x243b, 0x2bd8, 0x3007, 0x3aac, 0x3c8c, 0x3c47, 0x411b, 0x38b5, 0x33de,
+	0x28a4, 0x1bbf, 0x2b3f, 0x2593, 0x2d30, 0x315f, 0x3c06, 0x4047, 0x4002, 0x4276, 0x3a0f, 0x3537,
+	0x29fb, 0x1d14, 0x2c94, 0x294a, 0x30ec, 0x32c1, 0x3d6a, 0x41ab, 0x4163, 0x43d5, 0x3b6d, 0x38f6,
+	0x2b5b, 0x20d6, 0x2855, 0x22ab, 0x2a4b, 0x2c1c, 0x3920, 0x3afe, 0x3ab4, 0x3d24, 0x34bc, 0x3248,
+	0x24b0, 0x1a2d, 0x29ae, 0x2402, 0x2ba1, 0x2d72, 0x3a79, 0x3c59, 0x3c12, 0x40e5, 0x387d, 0x33a6,
+	0x286c, 0x1b86, 0x2b05, 0x2558, 0x2cf7, 0x312a, 0x3bd5, 0x4018, 0x3d74, 0x4246, 0x39de, 0x3505,
+	0x29c9, 0x1ce2, 0x2c60, 0x2914, 0x30b3, 0x3285, 0x3d2e, 0x4171, 0x412c, 0x439e, 0x3b34, 0x38bb,
+	0x2b1e, 0x2098, 0x2818, 0x226e, 0x2a10, 0x2be3, 0x38ed, 0x3ad0, 0x3a8d, 0x3d01, 0x349a, 0x3223,
+	0x2486, 0x19ff, 0x297b, 0x23cd, 0x2b6a, 0x2d3a, 0x3a41, 0x3c24, 0x3be1, 0x40b9, 0x3856, 0x3383,
+	0x2848, 0x1b5f, 0x2ad8, 0x2527, 0x2cc2, 0x30f1, 0x3b9b, 0x3d80, 0x3d3e, 0x4215, 0x39b1, 0x34dd,
+	0x29a2, 0x1cb9, 0x2c34, 0x28e4, 0x3082, 0x3255, 0x3d00, 0x4147, 0x4105, 0x437a, 0x3b15, 0x38a0,
+	0x2b06, 0x2081, 0x259e, 0x224e, 0x29e9, 0x2bb6, 0x38bb, 0x3a9d, 0x3a59, 0x3ccf, 0x346b, 0x31f8,
+	0x2460, 0x19dc, 0x295b, 0x23ac, 0x2b46, 0x2d13, 0x3a18, 0x3bfa, 0x3bb9, 0x4092, 0x3830, 0x335c,
+	0x2821, 0x1b39, 0x2ab5, 0x2506, 0x2ca2, 0x30d2, 0x3b7b, 0x3d5f, 0x3d1e, 0x41f7, 0x3994, 0x34c0,
+	0x2985, 0x1c9c, 0x2c16, 0x28c7, 0x3063, 0x3233, 0x3cda, 0x411c, 0x40d8, 0x434d, 0x3ae9, 0x3875,
+	0x2adb, 0x2055, 0x2572, 0x2223, 0x29c1, 0x2b93, 0x389c, 0x3a7f, 0x3a3c, 0x3cb2, 0x344d, 0x31da,
+	0x2441, 0x19bb, 0x2936, 0x2384, 0x2b1d, 0x2ceb, 0x39f3, 0x3bd7, 0x3b95, 0x406d, 0x380a, 0x3337,
+	0x259e, 0x1b17, 0x2a91, 0x24dd, 0x2c75, 0x30a2, 0x3b4a, 0x3d31, 0x3cf1, 0x41c9, 0x3965, 0x348f,
+	0x2953, 0x1c6a, 0x2be5, 0x2895, 0x3031, 0x3202, 0x3cac, 0x40f4, 0x40b6, 0x432e, 0x3aca, 0x3854,
+	0x2ab7, 0x202d, 0x2548, 0x21f8, 0x2992, 0x2b5f, 0x3864, 0x3a47, 0x3a06, 0x3c80, 0x341f, 0x31ad,
+	0x2412, 0x1989, 0x2902, 0x234f, 0x2ae7, 0x2cb4, 0x39ba, 0x3b9e, 0x3b5f, 0x403c, 0x357e, 0x330d,
+	0x2571, 0x1ae5, 0x2a5a, 0x24a4, 0x2c3c, 0x306c, 0x3b16, 0x3cfe, 0x3cc1, 0x419d, 0x393e, 0x346d,
+	0x2933, 0x1c49, 0x2bbe, 0x2867, 0x2d9d, 0x31ca, 0x3c71, 0x40b7, 0x4077, 0x42f0, 0x3a8f, 0x381d,
+	0x2a85, 0x1d9f, 0x2d18, 0x29c4, 0x315b, 0x3327, 0x402e, 0x4213, 0x41d5, 0x4450, 0x3bf0, 0x397e,
+	0x2be6, 0x215f, 0x30d8, 0x2b23, 0x32b7, 0x3480, 0x4185, 0x4369, 0x432c, 0x480a, 0x3d4d, 0x3ade,
+	0x2d44, 0x22bb, 0x3233, 0x2c7d, 0x3412, 0x383a, 0x42df, 0x44c3, 0x4486, 0x4962, 0x4104, 0x3c33,
+	0x30f8, 0x240e, 0x3386, 0x3032, 0x356b, 0x399a, 0x4443, 0x4889, 0x484a, 0x4ac5, 0x4266, 0x3d94,
+	0x325b, 0x2572, 0x2cea, 0x2997, 0x312e, 0x32fa, 0x3d9f, 0x41e1, 0x41a0, 0x441a, 0x3bbb, 0x394c,
+	0x2bb5, 0x212f, 0x30a7, 0x2af1, 0x3286, 0x3451, 0x4157, 0x433c, 0x42fe, 0x457b, 0x3d1c, 0x3aaa,
+	0x2d10, 0x2285, 0x31fb, 0x2c45, 0x33dc, 0x380a, 0x42b6, 0x44a1, 0x4466, 0x4944, 0x40e4, 0x3c10,
+	0x30d4, 0x23e9, 0x335f, 0x3009, 0x353f, 0x396d, 0x4415, 0x485d, 0x4821, 0x4a9e, 0x423e, 0x3d6a,
+	0x322e, 0x2543, 0x2cba, 0x2965, 0x30fb, 0x32c9, 0x3d71, 0x41ba, 0x4180, 0x4400, 0x3ba3, 0x3932,
+	0x2b96, 0x2109, 0x307c, 0x2ac2, 0x3256, 0x3421, 0x412a, 0x4313, 0x42da, 0x455d, 0x3d05, 0x3a98,
+	0x2cfe, 0x2271, 0x31e1, 0x2c24, 0x33b5, 0x357e, 0x4285, 0x446f, 0x4436, 0x4917, 0x40bc, 0x3bee,
+	0x30b4, 0x23c9, 0x333b, 0x2d80, 0x3512, 0x393d, 0x43e7, 0x4832, 0x459a, 0x4a7b, 0x421f, 0x3d50,
+	0x3217, 0x252e, 0x2ca4, 0x294a, 0x30db, 0x32a1, 0x3d45, 0x418b, 0x4150, 0x43d1, 0x3b77, 0x390a,
+	0x2b73, 0x20eb, 0x3061, 0x2aa8, 0x3237, 0x33fb, 0x40fd, 0x42e3, 0x42a9, 0x452c, 0x3cd4, 0x3a66,
+	0x2ccc, 0x2240, 0x31b3, 0x2bf9, 0x338c, 0x3556, 0x425d, 0x4446, 0x440e, 0x48f1, 0x4098, 0x3bca,
+	0x3090, 0x23a3, 0x3315, 0x2d5b, 0x34ee, 0x3918, 0x43be, 0x4803, 0x4566, 0x4a45, 0x41ea, 0x3d1c,
+	0x31e4, 0x24fa, 0x2c6e, 0x2915, 0x30a8, 0x3271, 0x3d18, 0x415e, 0x4122, 0x43a2, 0x3b47, 0x38d9,
+	0x2b42, 0x20b7, 0x302a, 0x2a6e, 0x31fd, 0x33c6, 0x40cd, 0x42b7, 0x427e, 0x4500, 0x3ca7, 0x3a39,
+	0x2ca1, 0x2215, 0x3187, 0x2bca, 0x3358, 0x351f, 0x4226, 0x4410, 0x43d8, 0x48ba, 0x405e, 0x3b8d,
+	0x3051, 0x2364, 0x32d7, 0x2d1c, 0x34ae, 0x38d9, 0x4382, 0x456e, 0x4538, 0x4a1c, 0x41c1, 0x3cf0,
+	0x31b4, 0x24c6, 0x2c38, 0x28de, 0x306f, 0x3237, 0x3cdd, 0x4125, 0x40ed, 0x4372, 0x3b1b, 0x38ae,
+	0x2b14, 0x2087, 0x2d96, 0x2a38, 0x31c6, 0x338d, 0x4091, 0x427a, 0x4244, 0x44ca, 0x3c75, 0x3a09,
+	0x2c6f, 0x21df, 0x314b, 0x2b8b, 0x3319, 0x34e3, 0x41ee, 0x43dc, 0x43a9, 0x488f, 0x4039, 0x3b6d,
+	0x3034, 0x2346, 0x32b3, 0x2cf2, 0x347f, 0x38a7, 0x434f, 0x4539, 0x4503, 0x49e7, 0x418f, 0x3cc3,
+	0x318b, 0x24a0, 0x2c11, 0x28b3, 0x303f, 0x3204, 0x3ca9, 0x40f3, 0x40bf, 0x4345, 0x3af0, 0x3884,
+	0x2aec, 0x2060, 0x2d70, 0x2a10, 0x319b, 0x335e, 0x4063, 0x424e, 0x421c, 0x44a6, 0x3c54, 0x39ea,
+	0x2c52, 0x21c4, 0x3132, 0x2b71, 0x32fc, 0x34c0, 0x41c4, 0x43ad, 0x4378, 0x4860, 0x400c, 0x3b41,
+	0x3008, 0x231a, 0x3289, 0x2cca, 0x3458, 0x387f, 0x4326, 0x4511, 0x44db, 0x49c2, 0x416d, 0x3ca2,
+	0x316a, 0x247e, 0x2bee, 0x288f, 0x301c, 0x31e2, 0x3c87, 0x40cf, 0x4097, 0x431d, 0x3ac8, 0x3860,
+	0x2aca, 0x2040, 0x2d50, 0x29f0, 0x317a, 0x333d, 0x4041, 0x422a, 0x41f4, 0x447b, 0x3c26, 0x39ba,
+	0x2c21, 0x2194, 0x3102, 0x2b41, 0x32cd, 0x3494, 0x419d, 0x438c, 0x435b, 0x4844, 0x3d8e, 0x3b20,
+	0x2d85, 0x22f5, 0x3264, 0x2ca4, 0x3432, 0x3859, 0x4300, 0x44eb, 0x44b7, 0x499e, 0x4148, 0x3c7b,
+	0x3141, 0x2452, 0x2bc0, 0x2861, 0x2d8e, 0x31b3, 0x3c58, 0x40a3, 0x4070, 0x42f9, 0x3aa6, 0x383c,
+	0x2aa2, 0x2011, 0x2d1b, 0x29b7, 0x3141, 0x3306, 0x400d, 0x41fb, 0x41cb, 0x4458, 0x3c08, 0x39a1,
+	0x2c08, 0x2177, 0x30e0, 0x2b19, 0x32a0, 0x3463, 0x416a, 0x4357, 0x4326, 0x4810, 0x3d5d, 0x3af4,
+	0x2d5c, 0x22cd, 0x3237, 0x2c72, 0x33fa, 0x381d, 0x42c5, 0x44b3, 0x4483, 0x496d, 0x411a, 0x3c50,
+	0x3117, 0x242a, 0x2b98, 0x2835, 0x2d5c, 0x317d, 0x3c20, 0x406b, 0x403a, 0x42c5, 0x3a74, 0x380d,
+	0x2a76, 0x1d89, 0x2cf7, 0x2993, 0x3119, 0x32d8, 0x3d79, 0x41c2, 0x4190, 0x441d, 0x3bcd, 0x3965,
+	0x2bcb, 0x213a, 0x30a4, 0x2adf, 0x3268, 0x342b, 0x4132, 0x4320, 0x42f1, 0x457e, 0x3d2e, 0x3ac5,
+	0x2d2b, 0x229a, 0x3204, 0x2c40, 0x33ca, 0x358f, 0x4296, 0x4481, 0x444d, 0x4937, 0x40e5, 0x3c1c,
+	0x30e5, 0x23f7, 0x2b62, 0x259e, 0x2d26, 0x3148, 0x3bed, 0x4039, 0x4006, 0x4290, 0x3a3e, 0x3576,
+	0x2a3f, 0x1d50, 0x2cb9, 0x2951, 0x30d7, 0x3299, 0x3d41, 0x4191, 0x4164, 0x43f2, 0x3ba3, 0x393b,
+	0x2ba2, 0x2112, 0x307b, 0x2ab4, 0x3239, 0x33fa, 0x4101, 0x42f0, 0x42c3, 0x4551, 0x3cff, 0x3a94,
+	0x2cf9, 0x2268, 0x31d1, 0x2c0c, 0x3393, 0x3555, 0x425d, 0x444d, 0x4420, 0x4910, 0x40c0, 0x3bf6,
+	0x30bb, 0x23c9, 0x2b32, 0x256d, 0x2cf4, 0x3115, 0x3bba, 0x4008, 0x3d7b, 0x426c, 0x3a20, 0x355b,
+	0x2a24, 0x1d33, 0x2c9a, 0x2930, 0x30b4, 0x3274, 0x3d17, 0x4163, 0x4136, 0x43c7, 0x3b7c, 0x3917,
+	0x2b7f, 0x20ed, 0x3051, 0x2a86, 0x3208, 0x33ca, 0x40d3, 0x42c5, 0x429a, 0x452b, 0x3cdf, 0x3a79,
+	0x2ce2, 0x2251, 0x31b8, 0x2bee, 0x3372, 0x3533, 0x423a, 0x4429, 0x43fb, 0x48e9, 0x409b, 0x3bd5,
+	0x309f, 0x23b2, 0x2b1c, 0x2554, 0x2cd7, 0x30f5, 0x3b97, 0x3d83, 0x3d55, 0x4245, 0x39f8, 0x3533,
+	0x29fc, 0x1d0d, 0x2c75, 0x290a, 0x308c, 0x324a, 0x3ced, 0x413c, 0x4112, 0x43a6, 0x3b5d, 0x38f9,
+	0x2b61, 0x20cf, 0x3036, 0x2a6c, 0x31ee, 0x33ad, 0x40b2, 0x42a0, 0x4272, 0x4503, 0x3cb6, 0x3a50,
+	0x2cb8, 0x2226, 0x318d, 0x2bc4, 0x3348, 0x3509, 0x420e, 0x43fc, 0x43ce, 0x48bd, 0x4070, 0x3baa,
+	0x3073, 0x2383, 0x2aeb, 0x2521, 0x2ca4, 0x30c3, 0x3b68, 0x3d56, 0x3d29, 0x4219, 0x39cd, 0x3508,
+	0x29d3, 0x1ce4, 0x2c4b, 0x28e0, 0x3061, 0x321e, 0x3cc2, 0x410f, 0x40e3, 0x4374, 0x3b27, 0x38c0,
+	0x2b27, 0x2094, 0x2d99, 0x2a2e, 0x31af, 0x336f, 0x4077, 0x426a, 0x4242, 0x44d5, 0x3c89, 0x3a20,
+	0x2c85, 0x21f0, 0x3154, 0x2b8a, 0x330e, 0x34cf, 0x41d6, 0x43c7, 0x439d, 0x4890, 0x4044, 0x3b7d,
+	0x3042, 0x234f, 0x2ab3, 0x24e8, 0x2c6b, 0x3089, 0x3b2d, 0x3d1c, 0x3cf1, 0x41e6, 0x399d, 0x34da,
+	0x29a1, 0x1cac, 0x2c0c, 0x289b, 0x3019, 0x31d6, 0x3c7d, 0x40d0, 0x40a9, 0x4342, 0x3afd, 0x389c,
+	0x2b04, 0x206f, 0x2d6f, 0x29fd, 0x3179, 0x3336, 0x403d, 0x4230, 0x4209, 0x449e, 0x3c56, 0x39f3,
+	0x2c5c, 0x21c9, 0x312c, 0x2b5c, 0x32d9, 0x3495, 0x4199, 0x438b, 0x4363, 0x4859, 0x4010, 0x3b4d,
+	0x3016, 0x2325, 0x2a8b, 0x24bc, 0x2c39, 0x3052, 0x3af4, 0x3ce4, 0x3cbc, 0x41b4, 0x396f, 0x34ae,
+	0x2979, 0x1c89, 0x2bee, 0x2880, 0x2d9c, 0x31b5, 0x3c55, 0x40a2, 0x4079, 0x4311, 0x3acc, 0x386b,
+	0x2ad4, 0x2040, 0x2d42, 0x29d3, 0x3151, 0x330d, 0x4011, 0x4202, 0x41da, 0x4471, 0x3c2b, 0x39ca,
+	0x2c32, 0x219f, 0x3101, 0x2b33, 0x32b4, 0x3473, 0x4178, 0x4368, 0x433d, 0x4831, 0x3d89, 0x3b27,
+	0x2d92, 0x2302, 0x2a67, 0x2499, 0x2c18, 0x3035, 0x3ad8, 0x3cc6, 0x3c9b, 0x418f, 0x3946, 0x3484,
+	0x294f, 0x1c5d, 0x2bbf, 0x284e, 0x2d6a, 0x3185, 0x3c2b, 0x407f, 0x405a, 0x42f2, 0x3aac, 0x3849,
+	0x2ab1, 0x201d, 0x2d1f, 0x29ae, 0x312c, 0x32e8, 0x3d90, 0x41e5, 0x41c0, 0x4457, 0x3c0e, 0x39a9,
+	0x2c0e, 0x2179, 0x30da, 0x2b0c, 0x328a, 0x3447, 0x414d, 0x4340, 0x431b, 0x4813, 0x3d6c, 0x3b08,
+	0x2d6d, 0x22d7, 0x2a38, 0x2467, 0x2be4, 0x2d9f, 0x3aa4, 0x3c96, 0x3c72, 0x416d, 0x392b, 0x346b,
+	0x2934, 0x1c3e, 0x2b9d, 0x2829, 0x2d44, 0x315e, 0x3c02, 0x4054, 0x402f, 0x42ca, 0x3a88, 0x3828,
+	0x2a90, 0x1d99, 0x2cf5, 0x297e, 0x30f7, 0x32b1, 0x3d57, 0x41ad, 0x418b, 0x4426, 0x3be2, 0x3981,
+	0x2bea, 0x2154, 0x30b3, 0x2ade, 0x3258, 0x3412, 0x4117, 0x430c, 0x42e8, 0x4582, 0x3d3e, 0x3add,
+	0x2d47, 0x22b4, 0x2a16, 0x2444, 0x2bbd, 0x2d74, 0x3a74, 0x3c64, 0x3c3f, 0x413a, 0x38f7, 0x3438,
+	0x2901, 0x1c0c, 0x2b6a, 0x2594, 0x2d0a, 0x3120, 0x3bc2, 0x4016, 0x3d94, 0x4293, 0x3a53, 0x3596,
+	0x2a5f, 0x1d68, 0x2cc5, 0x2950, 0x30c9, 0x3282, 0x3d26, 0x4179, 0x4156, 0x43f1, 0x3bae, 0x394f,
+	0x2bb8, 0x2122, 0x3080, 0x2aac, 0x3226, 0x33df, 0x40e3, 0x42d5, 0x42af, 0x4549, 0x3d05, 0x3aa5,
+	0x2d10, 0x227c, 0x29db, 0x2406, 0x2b7d, 0x2d34, 0x3a37, 0x3c2a, 0x3c06, 0x4102, 0x38c0, 0x3403,
+	0x28ce, 0x1bdb, 0x2b3a, 0x2565, 0x2cdb, 0x30f2, 0x3b95, 0x3d89, 0x3d66, 0x4263, 0x3a20, 0x3560,
+	0x2a28, 0x1d31, 0x2c8e, 0x2918, 0x3090, 0x3248, 0x3ced, 0x4143, 0x4124, 0x43c2, 0x3b7f, 0x391e,
+	0x2b84, 0x20ec, 0x3049, 0x2a74, 0x31ee, 0x33a8, 0x40ad, 0x42a2, 0x4282, 0x4520, 0x3cdf, 0x3a7f,
+	0x2ce7, 0x2251, 0x29ae, 0x23d9, 0x2b52, 0x2d0b, 0x3a0e, 0x3c00, 0x3bde, 0x40dc, 0x389e, 0x33e1,
+	0x28ab, 0x1bb2, 0x2b0b, 0x2530, 0x2ca4, 0x30ba, 0x3b5f, 0x3d56, 0x3d37, 0x4239, 0x39fd, 0x3542,
+	0x2a0d, 0x1d15, 0x2c6e, 0x28f2, 0x3066, 0x321e, 0x3cc4, 0x411d, 0x40ff, 0x439e, 0x3b5e, 0x3900,
+	0x2b6b, 0x20d5, 0x3031, 0x2a59, 0x31ce, 0x3384, 0x4087, 0x427c, 0x425c, 0x44fc, 0x3cbb, 0x3a5d,
+	0x2cc7, 0x2233, 0x2990, 0x23b8, 0x2b2b, 0x2cde, 0x39de, 0x3bd2, 0x3bb3, 0x40b6, 0x387a, 0x33bf,
+	0x288a, 0x1b94, 0x2af1, 0x2519, 0x2c8d, 0x30a1, 0x3b42, 0x3d36, 0x3d16, 0x4218, 0x39db, 0x351f,
+	0x29e8, 0x1cf0, 0x2c49, 0x28d0, 0x3045, 0x31fb, 0x3c9e, 0x40f3, 0x40d4, 0x4374, 0x3b37, 0x38da,
+	0x2b44, 0x20ab, 0x3004, 0x2a2b, 0x31a1, 0x3359, 0x405d, 0x4252, 0x4231, 0x44d0, 0x3c91, 0x3a35,
+	0x2ca0, 0x220b, 0x2967, 0x238e, 0x2b03, 0x2cb9, 0x39bc, 0x3bb0, 0x3b8e, 0x408d, 0x384f, 0x3393,
+	0x285e, 0x1b67, 0x2ac0, 0x24e3, 0x2c53, 0x3066, 0x3b09, 0x3d01, 0x3ce5, 0x41e9, 0x39ac, 0x34ef,
+	0x29b8, 0x1cbf, 0x2c17, 0x289b, 0x300d, 0x31c3, 0x3c68, 0x40c2, 0x40a7, 0x434a, 0x3b0c, 0x38ad,
+	0x2b14, 0x207a, 0x2d73, 0x29f9, 0x316e, 0x3324, 0x4027, 0x421e, 0x4201, 0x44a4, 0x3c67, 0x3a0a,
+	0x2c72, 0x21d8, 0x292f, 0x2352, 0x2ac3, 0x2c75, 0x3977, 0x3b6c, 0x3b50, 0x4056, 0x381f, 0x3367,
+	0x2832, 0x1b38, 0x2a8e, 0x24af, 0x2c1e, 0x3032, 0x3ad5, 0x3ccc, 0x3cb0, 0x41b6, 0x397d, 0x34c4,
+	0x298f, 0x1c95, 0x2bea, 0x2869, 0x2d77, 0x318a, 0x3c2e, 0x4086, 0x406c, 0x4311, 0x3ad5, 0x387b,
+	0x2ae6, 0x204e, 0x2d45, 0x29c7, 0x3136, 0x32e8, 0x3d8a, 0x41e1, 0x41c6, 0x446b, 0x3c30, 0x39d6,
+	0x2c42, 0x21ac, 0x2906, 0x232b, 0x2a9b, 0x2c4d, 0x394d, 0x3b41, 0x3b24, 0x4029, 0x3590, 0x3338,
+	0x2803, 0x1b0a, 0x2a60, 0x2481, 0x2bef, 0x2d9e, 0x3a9e, 0x3c95, 0x3c7b, 0x4183, 0x394c, 0x3494,
+	0x295f, 0x1c65, 0x2bba, 0x283b, 0x2d4a, 0x315e, 0x3c02, 0x405b, 0x4040, 0x42e5, 0x3aab, 0x3852,
+	0x2abd, 0x2023, 0x2d1b, 0x299d, 0x310f, 0x32c4, 0x3d68, 0x41bf, 0x41a1, 0x4445, 0x3c09, 0x39af,
+	0x2c1b, 0x2183, 0x30da, 0x2afb, 0x3268, 0x3419, 0x411b, 0x4312, 0x42f7, 0x459d, 0x3d65, 0x3b0c,
+	0x2d78, 0x22e1, 0x3238, 0x2c58, 0x33c6, 0x3578, 0x427c, 0x4476, 0x445e, 0x4966, 0x412d, 0x3c71,
+	0x3139, 0x243d, 0x3392, 0x3012, 0x3521, 0x3934, 0x43d9, 0x4834, 0x481d, 0x4ac6, 0x428c, 0x4030,
+	0x3297, 0x259a, 0x34ed, 0x316d, 0x38dd, 0x3a90, 0x4534, 0x498e, 0x4976, 0x4c20, 0x43ea, 0x4191,
+	0x33fa, 0x295e, 0x30b2, 0x2ad2, 0x3240, 0x33f3, 0x40f6, 0x42ef, 0x42d6, 0x4580, 0x3d4b, 0x3af6,
+	0x2d61, 0x22c3, 0x3213, 0x2c2c, 0x3395, 0x3544, 0x4246, 0x4441, 0x442c, 0x4938, 0x4105, 0x3c50,
+	0x311d, 0x2421, 0x3371, 0x2d8a, 0x34f2, 0x3902, 0x43a6, 0x4803, 0x458e, 0x4a99, 0x4263, 0x400c,
+	0x3277, 0x257e, 0x34d2, 0x314f, 0x38ba, 0x3a69, 0x450b, 0x4964, 0x494c, 0x4bf6, 0x43c0, 0x4169,
+	0x33d5, 0x293c, 0x3091, 0x2aae, 0x3216, 0x33c0, 0x40bc, 0x42b3, 0x429b, 0x4548, 0x3d16, 0x3ac2,
+	0x2d2f, 0x2296, 0x31e9, 0x2c06, 0x336f, 0x351c, 0x421b, 0x4413, 0x43fd, 0x4909, 0x40d6, 0x3c21,
+	0x30ec, 0x23f0, 0x3341, 0x2d5d, 0x34c9, 0x38d9, 0x437a, 0x4572, 0x455a, 0x4a64, 0x422f, 0x3d79,
+	0x3244, 0x2548, 0x349b, 0x3117, 0x3882, 0x3a31, 0x44d3, 0x492a, 0x4911, 0x4bba, 0x4384, 0x412e,
+	0x339b, 0x2903, 0x3057, 0x2a75, 0x31e0, 0x3390, 0x4092, 0x428b, 0x4272, 0x451c, 0x3ce6, 0x3a90,
+	0x2cfb, 0x2260, 0x31b2, 0x2bcb, 0x3333, 0x34e0, 0x41e1, 0x43dd, 0x43ca, 0x48d7, 0x40a3, 0x3bec,
+	0x30b5, 0x23b7, 0x3308, 0x2d21, 0x348a, 0x3899, 0x433e, 0x453c, 0x4529, 0x4a37, 0x4203, 0x3d4a,
+	0x3211, 0x2513, 0x3464, 0x30e0, 0x384c, 0x39fd, 0x44a1, 0x48fd, 0x48e9, 0x4b96, 0x4364, 0x410d,
+	0x3377, 0x28d8, 0x3027, 0x2a3f, 0x31a6, 0x3352, 0x4052, 0x424c, 0x4238, 0x44e9, 0x3cbb, 0x3a69,
+	0x2cd6, 0x2238, 0x3185, 0x2b9b, 0x3300, 0x34ad, 0x41af, 0x43ad, 0x439c, 0x48ac, 0x407d, 0x3bc9,
+	0x3095, 0x2398, 0x32e5, 0x2cfb, 0x3460, 0x386e, 0x4311, 0x450f, 0x44fe, 0x4a0e, 0x41dc, 0x3d28,
+	0x31f3, 0x24f7, 0x3446, 0x30be, 0x3823, 0x39cd, 0x446c, 0x48c7, 0x48b5, 0x4b65, 0x4335, 0x40e1,
+	0x334e, 0x28b3, 0x3005, 0x2a1f, 0x3185, 0x3331, 0x4030, 0x422a, 0x4217, 0x44c8, 0x3c9a, 0x3a48,
+	0x2cb5, 0x2218, 0x3165, 0x2b7b, 0x32e0, 0x348a, 0x4189, 0x4383, 0x4372, 0x4884, 0x4057, 0x3ba6,
+	0x3072, 0x2374, 0x32c0, 0x2cd6, 0x343a, 0x3846, 0x42e9, 0x44e5, 0x44d3, 0x49e3, 0x41b3, 0x3d00,
+	0x31cc, 0x24d0, 0x341f, 0x3097, 0x359f, 0x39ad, 0x4451, 0x48ac, 0x4898, 0x4b46, 0x4314, 0x40c1,
+	0x332e, 0x2893, 0x2d83, 0x29f9, 0x315b, 0x3304, 0x4002, 0x41fd, 0x41ea, 0x449b, 0x3c6c, 0x3a1a,
+	0x2c87, 0x21ec, 0x313a, 0x2b50, 0x32b2, 0x345c, 0x415e, 0x435c, 0x434d, 0x485f, 0x4030, 0x3b7a,
+	0x3044, 0x2345, 0x3292, 0x2ca9, 0x340e, 0x381b, 0x42be, 0x44bc, 0x44ad, 0x49c0, 0x4190, 0x3cdb,
+	0x31a3, 0x24a2, 0x33ee, 0x3064, 0x3569, 0x3974, 0x4414, 0x4870, 0x485f, 0x4b12, 0x42e4, 0x4092,
+	0x32fe, 0x285f, 0x2d4a, 0x29bf, 0x3124, 0x32d0, 0x3d71, 0x41ce, 0x41bd, 0x4471, 0x3c46, 0x39f6,
+	0x2c63, 0x21c2, 0x310a, 0x2b1a, 0x327a, 0x3423, 0x4125, 0x4324, 0x4316, 0x482b, 0x4000, 0x3b50,
+	0x301d, 0x231d, 0x3266, 0x2c75, 0x33d3, 0x357c, 0x427e, 0x447e, 0x4471, 0x4986, 0x4158, 0x3ca6,
+	0x3172, 0x2474, 0x33c1, 0x3035, 0x3537, 0x3941, 0x43e2, 0x4840, 0x4832, 0x4ae7, 0x42ba, 0x4068,
+	0x32d4, 0x2836, 0x2d23, 0x2995, 0x30f4, 0x3299, 0x3d35, 0x418f, 0x4180, 0x4437, 0x3c0e, 0x39c0,
+	0x2c2e, 0x218f, 0x30da, 0x2aeb, 0x324a, 0x33f1, 0x40f0, 0x42ed, 0x42e0, 0x4597, 0x3d6e, 0x3b1e,
+	0x2d8a, 0x22e9, 0x3232, 0x2c44, 0x33a6, 0x3550, 0x4253, 0x4451, 0x4443, 0x4958, 0x412c, 0x3c7c,
+	0x3148, 0x2448, 0x3392, 0x3003, 0x3504, 0x390c, 0x43ac, 0x4808, 0x4598, 0x4aac, 0x4280, 0x4031,
+	0x329f, 0x2803, 0x2cef, 0x2960, 0x30c0, 0x3269, 0x3d0a, 0x4169, 0x415b, 0x4411, 0x3be6, 0x3996,
+	0x2c03, 0x2163, 0x30ac, 0x2abb, 0x3219, 0x33c1, 0x40c2, 0x42c4, 0x42b9, 0x4573, 0x3d49, 0x3af8,
+	0x2d63, 0x22c1, 0x3209, 0x2c18, 0x3376, 0x351e, 0x4220, 0x4421, 0x4417, 0x4930, 0x4107, 0x3c55,
+	0x311f, 0x241d, 0x3365, 0x2d76, 0x34d8, 0x38e2, 0x4385, 0x4586, 0x457c, 0x4a95, 0x426d, 0x401e,
+	0x328a, 0x2589, 0x2ccf, 0x293c, 0x3098, 0x323e, 0x3cdc, 0x413a, 0x412e, 0x43e9, 0x3bc5, 0x397a,
+	0x2bea, 0x214a, 0x308f, 0x2a99, 0x31f2, 0x3396, 0x4096, 0x4297, 0x428e, 0x454a, 0x3d24, 0x3ad7,
+	0x2d45, 0x22a5, 0x31eb, 0x2bf8, 0x3354, 0x34fa, 0x41fb, 0x43fe, 0x43f4, 0x490e, 0x40e6, 0x3c38,
+	0x3105, 0x2406, 0x334e, 0x2d5d, 0x34b9, 0x38bb, 0x4357, 0x4554, 0x4548, 0x4a61, 0x423a, 0x3d8d,
+	0x325c, 0x255e, 0x2ca8, 0x2918, 0x3074, 0x3218, 0x3cb5, 0x4112, 0x4107, 0x43c2, 0x3b9d, 0x3951,
+	0x2bbe, 0x211d, 0x3063, 0x2a70, 0x31cc, 0x3371, 0x4070, 0x426f, 0x4264, 0x4520, 0x3cfb, 0x3aaf,
+	0x2d1c, 0x227a, 0x31be, 0x2bca, 0x3325, 0x34ca, 0x41cb, 0x43ca, 0x43be, 0x48d7, 0x40af, 0x3c01,
+	0x30ce, 0x23ce, 0x3315, 0x2d23, 0x3480, 0x3889, 0x432b, 0x452c, 0x4521, 0x4a3a, 0x4211, 0x3d62,
+	0x3230, 0x2530, 0x2c77, 0x28e3, 0x303c, 0x31df, 0x3c7e, 0x40dd, 0x40d3, 0x438f, 0x3b69, 0x391c,
+	0x2b89, 0x20e8, 0x302d, 0x2a37, 0x318f, 0x3332, 0x4031, 0x4234, 0x422e, 0x44ec, 0x3cc6, 0x3a77,
+	0x2ce0, 0x223c, 0x317f, 0x2b8b, 0x32e7, 0x348e, 0x4191, 0x4396, 0x4391, 0x48af, 0x408a, 0x3bdb,
+	0x30a5, 0x23a0, 0x32e2, 0x2cec, 0x3447, 0x384b, 0x42e9, 0x44e8, 0x44e0, 0x49fe, 0x41db, 0x3d31,
+	0x31fe, 0x24fb, 0x2c3e, 0x28a6, 0x2d9e, 0x31a2, 0x3c42, 0x40a3, 0x409c, 0x435c, 0x3b3b, 0x38f3,
+	0x2b61, 0x20be, 0x2d9e, 0x2a03, 0x3158, 0x32fb, 0x3d9c, 0x4201, 0x41fc, 0x44bd, 0x3c9c, 0x3a53,
+	0x2cc2, 0x221f, 0x3161, 0x2b66, 0x32ba, 0x345a, 0x4159, 0x435c, 0x4357, 0x4877, 0x4053, 0x3ba8,
+	0x3076, 0x2376, 0x32bb, 0x2cc5, 0x341d, 0x381f, 0x42be, 0x44c1, 0x44bb, 0x49dc, 0x41b9, 0x3d0f,
+	0x31dd, 0x24dc, 0x2c21, 0x288a, 0x2d80, 0x317f, 0x3c19, 0x4078, 0x4071, 0x4333, 0x3b15, 0x38ce,
+	0x2b3d, 0x209c, 0x2d7e, 0x29e5, 0x313a, 0x32d9, 0x3d75, 0x41d6, 0x41d0, 0x4492, 0x3c72, 0x3a28,
+	0x2c97, 0x21f3, 0x3135, 0x2b3d, 0x3296, 0x343b, 0x413c, 0x433f, 0x433a, 0x4859, 0x4036, 0x3b8c,
+	0x305a, 0x2358, 0x329b, 0x2ca3, 0x33fb, 0x359d, 0x429b, 0x449a, 0x4491, 0x49af, 0x418c, 0x3ce2,
+	0x31b2, 0x24b2, 0x2bf7, 0x285f, 0x2d55, 0x3156, 0x3bf5, 0x4057, 0x4051, 0x4311, 0x3aef, 0x38a5,
+	0x2b12, 0x206e, 0x2d50, 0x29b6, 0x310c, 0x32ae, 0x3d50, 0x41b6, 0x41b4, 0x4477, 0x3c56, 0x3a0b,
+	0x2c76, 0x21cf, 0x310f, 0x2b14, 0x326a, 0x340c, 0x410c, 0x4310, 0x430d, 0x482f, 0x400e, 0x3b62,
+	0x302d, 0x2327, 0x3266, 0x2c6d, 0x33c4, 0x3568, 0x426a, 0x446f, 0x446c, 0x4990, 0x4171, 0x3cc7,
+	0x3194, 0x248e, 0x2bcc, 0x282e, 0x2d21, 0x3120, 0x3bbf, 0x4022, 0x401f, 0x42e4, 0x3ac9, 0x3883,
+	0x2af4, 0x204f, 0x2d2b, 0x298a, 0x30d9, 0x3275, 0x3d13, 0x4179, 0x4179, 0x443e, 0x3c20, 0x39d9,
+	0x2c47, 0x21a2, 0x30e0, 0x2ae1, 0x3232, 0x33d1, 0x40d2, 0x42d9, 0x42da, 0x4800, 0x3d82, 0x3b39,
+	0x3006, 0x2302, 0x3242, 0x2c45, 0x3397, 0x3533, 0x422e, 0x442e, 0x442b, 0x4950, 0x4134, 0x3c8d,
+	0x315d, 0x245b, 0x2b9c, 0x259f, 0x2cf0, 0x30eb, 0x3b85, 0x3d86, 0x3d83, 0x42aa, 0x3a8f, 0x384b,
+	0x2aba, 0x2014, 0x2cf1, 0x2952, 0x30a3, 0x3242, 0x3ce0, 0x4145, 0x4144, 0x440b, 0x3bf0, 0x39ab,
+	0x2c1a, 0x2175, 0x30b1, 0x2ab2, 0x3203, 0x33a2, 0x40a0, 0x42a2, 0x429f, 0x4562, 0x3d44, 0x3afd,
+	0x2d6d, 0x22ca, 0x3209, 0x2c0c, 0x335e, 0x34fe, 0x41fd, 0x4402, 0x4400, 0x4924, 0x4106, 0x3c5f,
+	0x312e, 0x242b, 0x2b6b, 0x256c, 0x2cbc, 0x30b8, 0x3b56, 0x3d5b, 0x3d5b, 0x4281, 0x3a66, 0x3820,
+	0x2a8f, 0x1d8b, 0x2cc9, 0x2929, 0x3077, 0x3212, 0x3caf, 0x4114, 0x4117, 0x43df, 0x3bc3, 0x397b,
+	0x2be7, 0x213f, 0x307b, 0x2a7d, 0x31cf, 0x336f, 0x4070, 0x4279, 0x427d, 0x4546, 0x3d2b, 0x3ae4,
+	0x2d4f, 0x22a7, 0x31e3, 0x2be4, 0x3336, 0x34d4, 0x41d1, 0x43d4, 0x43d4, 0x48fc, 0x40e3, 0x3c40,
+	0x3110, 0x240b, 0x2b46, 0x2544, 0x2c92, 0x308d, 0x3b2b, 0x3d2f, 0x3d30, 0x4259, 0x3a42, 0x359f,
+	0x2a70, 0x1d69, 0x2ca2, 0x28fe, 0x304a, 0x31e7, 0x3c87, 0x40f1, 0x40f6, 0x43c1, 0x3ba9, 0x3965,
+	0x2bd5, 0x212f, 0x306a, 0x2a66, 0x31b2, 0x334d, 0x404b, 0x4251, 0x4253, 0x451b, 0x3d01, 0x3abb,
+	0x2d2a, 0x2286, 0x31c3, 0x2bc3, 0x3311, 0x34ad, 0x41aa, 0x43af, 0x43b1, 0x48db, 0x40c3, 0x3c1e,
+	0x30ed, 0x23e8, 0x2b24, 0x2523, 0x2c70, 0x306a, 0x3b05, 0x3d09, 0x3d0b, 0x4237, 0x3a21, 0x3580,
+	0x2a51, 0x1d4a, 0x2c83, 0x28df, 0x302a, 0x31c3, 0x3c5e, 0x40c3, 0x40c5, 0x438f, 0x3b77, 0x3933,
+	0x2ba2, 0x20fb, 0x3034, 0x2a30, 0x317e, 0x331c, 0x401c, 0x4224, 0x4228, 0x44f2, 0x3cd8, 0x3a94,
+	0x2d03, 0x225c, 0x3197, 0x2b94, 0x32e1, 0x347c, 0x4179, 0x437e, 0x437e, 0x48a7, 0x408e, 0x3bea,
+	0x30bb, 0x23b6, 0x2af2, 0x24ee, 0x2c38, 0x3030, 0x3acc, 0x3cd2, 0x3cd5, 0x4200, 0x39e9, 0x3544,
+	0x2a13, 0x1d0a, 0x2c43, 0x289e, 0x2d89, 0x3183, 0x3c23, 0x408e, 0x4096, 0x4365, 0x3b4f, 0x390a,
+	0x2b76, 0x20cc, 0x3003, 0x29fd, 0x3148, 0x32e4, 0x3d82, 0x41e9, 0x41ee, 0x44bb, 0x3ca5, 0x3a60,
+	0x2cce, 0x2224, 0x315b, 0x2b56, 0x32a2, 0x343d, 0x413b, 0x4343, 0x4348, 0x4876, 0x4061, 0x3bc0,
+	0x3090, 0x2387, 0x2abd, 0x24b4, 0x2bfc, 0x2d94, 0x3a91, 0x3c9a, 0x3ca1, 0x41d0, 0x39bf, 0x3521,
+	0x29f3, 0x1cec, 0x2c21, 0x2877, 0x2d5b, 0x3150, 0x3bec, 0x4054, 0x405b, 0x432b, 0x3b16, 0x38d5,
+	0x2b45, 0x209e, 0x2d75, 0x29cd, 0x3115, 0x32ac, 0x3d4a, 0x41b4, 0x41bd, 0x448e, 0x3c79, 0x3a37,
+	0x2ca6, 0x21ff, 0x3138, 0x2b33, 0x327d, 0x3413, 0x410d, 0x4312, 0x4317, 0x4846, 0x4033, 0x3b94,
+	0x3066, 0x2360, 0x2a99, 0x2493, 0x2bdb, 0x2d70, 0x3a68, 0x3c6c, 0x3c71, 0x41a0, 0x398f, 0x34f1,
+	0x29c1, 0x1cb8, 0x2bee, 0x2845, 0x2d2d, 0x3126, 0x3bc5, 0x402e, 0x4037, 0x4308, 0x3af6, 0x38b6,
+	0x2b26, 0x207d, 0x2d52, 0x29aa, 0x30f2, 0x328d, 0x3d2b, 0x4193, 0x4198, 0x4465, 0x3c4f, 0x3a0e,
+	0x2c7f, 0x21d8, 0x3110, 0x2b09, 0x3251, 0x33ea, 0x40e8, 0x42f1, 0x42f7, 0x4825, 0x4010, 0x3b6e,
+	0x303f, 0x2337, 0x2a6e, 0x2465, 0x2bab, 0x2d42, 0x3a40, 0x3c4b, 0x3c55, 0x4187, 0x3975, 0x34d4,
+	0x29a4, 0x1c9b, 0x2bd0, 0x2826, 0x2d0b, 0x3100, 0x3b9c, 0x4007, 0x4012, 0x42e5, 0x3ad2, 0x3890,
+	0x2afc, 0x2050, 0x2d23, 0x2979, 0x30c0, 0x3259, 0x3cf8, 0x4164, 0x4170, 0x4445, 0x3c34, 0x39f3,
+	0x2c60, 0x21b3, 0x30e5, 0x2adb, 0x3222, 0x33b9, 0x40b6, 0x42bf, 0x42c8, 0x459b, 0x3d8c, 0x3b50,
+	0x3022, 0x2319, 0x324c, 0x2c3e, 0x3380, 0x3514, 0x420e, 0x4416, 0x441f, 0x4952, 0x4144, 0x3ca8,
+	0x317b, 0x2470, 0x33a1, 0x2d91, 0x34d1, 0x38c5, 0x4363, 0x4571, 0x457f, 0x4ab6, 0x42a7, 0x4069,
+	0x32da, 0x2831, 0x3504, 0x3156, 0x3898, 0x3a2c, 0x44c8, 0x4931, 0x493b, 0x4c0f, 0x43ff, 0x41c0,
+	0x3431, 0x2989, 0x38be, 0x32b4, 0x39f7, 0x3b89, 0x4882, 0x4a89, 0x4a93, 0x4d67, 0x4558, 0x431b,
+	0x358d, 0x2ae4, 0x3217, 0x2c0b, 0x334d, 0x34df, 0x41d8, 0x43e0, 0x43eb, 0x4922, 0x4117, 0x3c7c,
+	0x314f, 0x2446, 0x3377, 0x2d69, 0x34aa, 0x389d, 0x4336, 0x453e, 0x4548, 0x4a7c, 0x426d, 0x4030,
+	0x32a1, 0x2597, 0x34c9, 0x311c, 0x385e, 0x39f4, 0x4491, 0x48fc, 0x4906, 0x4bda, 0x43ca, 0x418b,
+	0x33fc, 0x2953, 0x3886, 0x327b, 0x39be, 0x3b53, 0x484f, 0x4a58, 0x4a62, 0x4d35, 0x4525, 0x42e8,
+	0x355b, 0x2ab3, 0x31e7, 0x2bdb, 0x331c, 0x34ae, 0x41a8, 0x43b1, 0x43bc, 0x48f1, 0x40e3, 0x3c44,
+	0x3113, 0x2407, 0x3338, 0x2d29, 0x346a, 0x385e, 0x42fd, 0x450c, 0x451d, 0x4a56, 0x424a, 0x400b,
+	0x3278, 0x256a, 0x3499, 0x30ea, 0x382d, 0x39c4, 0x4463, 0x48cf, 0x48dd, 0x4bb4, 0x43a8, 0x416a,
+	0x33d9, 0x292c, 0x385b, 0x324b, 0x398d, 0x3b22, 0x481e, 0x4a2a, 0x4a37, 0x4d0e, 0x4503, 0x42c8,
+	0x353a, 0x2a8f, 0x31bc, 0x2ba8, 0x32e5, 0x3477, 0x4174, 0x4382, 0x4393, 0x48ce, 0x40c6, 0x3c2e,
+	0x3102, 0x23f7, 0x3324, 0x2d10, 0x344b, 0x383a, 0x42d5, 0x44e3, 0x44f3, 0x4a2e, 0x4222, 0x3d87,
+	0x3258, 0x254d, 0x347c, 0x30ca, 0x3808, 0x3998, 0x4433, 0x48a0, 0x48b1, 0x4b8c, 0x4382, 0x4146,
+	0x33b7, 0x290c, 0x383d, 0x322d, 0x396c, 0x3afc, 0x4595, 0x49ff, 0x4a0d, 0x4ce7, 0x44df, 0x42a7,
+	0x351a, 0x2a70, 0x31a1, 0x2b90, 0x32ce, 0x345c, 0x4153, 0x435a, 0x4367, 0x48a1, 0x4099, 0x3c01,
+	0x30d4, 0x23c7, 0x32f4, 0x2ce1, 0x341e, 0x380f, 0x42ab, 0x44b8, 0x44c8, 0x4a03, 0x41fb, 0x3d61,
+	0x3233, 0x2527, 0x3454, 0x30a1, 0x3580, 0x3973, 0x4410, 0x487d, 0x488a, 0x4b62, 0x4356, 0x411b,
+	0x338d, 0x28e3, 0x3813, 0x3202, 0x3940, 0x3ad1, 0x456b, 0x49d7, 0x49e4, 0x4cbc, 0x44b0, 0x4275,
+	0x34e7, 0x2a3d, 0x316b, 0x2b57, 0x3292, 0x3420, 0x411b, 0x4329, 0x433d, 0x487a, 0x4072, 0x3bd8,
+	0x30a9, 0x239c, 0x32c9, 0x2cb4, 0x33f0, 0x357f, 0x427a, 0x4488, 0x449b, 0x49d8, 0x41cf, 0x3d33,
+	0x3202, 0x24f2, 0x341d, 0x3069, 0x3546, 0x3936, 0x43d2, 0x4840, 0x4853, 0x4b31, 0x432a, 0x40f0,
+	0x335f, 0x28b0, 0x357a, 0x31c5, 0x3901, 0x3a92, 0x452c, 0x4999, 0x49aa, 0x4c88, 0x4483, 0x424d,
+	0x34c1, 0x2a15, 0x3140, 0x2b29, 0x3261, 0x33ee, 0x40e7, 0x42f3, 0x4304, 0x4841, 0x403c, 0x3ba6,
+	0x3079, 0x236c, 0x3295, 0x2c7c, 0x33b2, 0x353f, 0x423a, 0x444b, 0x4461, 0x49a1, 0x419c, 0x3d03,
+	0x31d5, 0x24c8, 0x33f3, 0x303c, 0x3516, 0x3904, 0x439f, 0x480e, 0x4821, 0x4aff, 0x42f9, 0x40c0,
+	0x3332, 0x2886, 0x3554, 0x319f, 0x38da, 0x3a67, 0x44fe, 0x4969, 0x497b, 0x4c59, 0x4454, 0x421d,
+	0x3490, 0x29e3, 0x310d, 0x2af5, 0x322c, 0x33b8, 0x40b1, 0x42be, 0x42d3, 0x4815, 0x4013, 0x3b7f,
+	0x3052, 0x2344, 0x326d, 0x2c55, 0x338d, 0x351a, 0x4215, 0x4423, 0x4437, 0x4976, 0x4171, 0x3cda,
+	0x31ad, 0x249f, 0x33c9, 0x3010, 0x34e9, 0x38d7, 0x4372, 0x4581, 0x4595, 0x4ad3, 0x42cd, 0x4095,
+	0x3307, 0x285a, 0x3526, 0x316e, 0x38a7, 0x3a34, 0x44ce, 0x493d, 0x4951, 0x4c30, 0x442c, 0x41f6,
+	0x346a, 0x29be, 0x30eb, 0x2ad4, 0x320b, 0x3396, 0x408e, 0x429c, 0x42b1, 0x4592, 0x3d8e, 0x3b57,
+	0x3028, 0x2318, 0x3240, 0x2c26, 0x335d, 0x34e9, 0x41e4, 0x43f6, 0x440f, 0x4953, 0x4151, 0x3cba,
+	0x3189, 0x2478, 0x339e, 0x2d85, 0x34be, 0x38ad, 0x434a, 0x455a, 0x4571, 0x4ab3, 0x42b1, 0x407b,
+	0x32ed, 0x283d, 0x3505, 0x314b, 0x3883, 0x3a10, 0x44aa, 0x4917, 0x492c, 0x4c0d, 0x440c, 0x41d8,
+	0x344d, 0x299e, 0x30c4, 0x2aa6, 0x31d7, 0x3360, 0x4059, 0x426a, 0x4283, 0x4568, 0x3d6a, 0x3b38,
+	0x300d, 0x22ff, 0x3226, 0x2c08, 0x333a, 0x34c2, 0x41bb, 0x43cd, 0x43e6, 0x492a, 0x4128, 0x3c93,
+	0x3166, 0x2458, 0x3380, 0x2d65, 0x3499, 0x3882, 0x4319, 0x4528, 0x453f, 0x4a83, 0x4282, 0x404c,
+	0x32bf, 0x2810, 0x34da, 0x3120, 0x3854, 0x39dd, 0x4473, 0x48df, 0x48f5, 0x4bda, 0x43db, 0x41a9,
+	0x341e, 0x2971, 0x309a, 0x2a7f, 0x31b4, 0x333c, 0x4032, 0x423e, 0x4252, 0x4536, 0x3d37, 0x3b04,
+	0x2d78, 0x22c7, 0x31ed, 0x2bcf, 0x3302, 0x348c, 0x4186, 0x4396, 0x43ad, 0x48f1, 0x40f1, 0x3c5d,
+	0x3130, 0x2420, 0x3345, 0x2d28, 0x345d, 0x384b, 0x42e7, 0x44f8, 0x450f, 0x4a50, 0x424d, 0x4018,
+	0x328b, 0x257d, 0x34a5, 0x30ea, 0x381f, 0x39aa, 0x4444, 0x48b3, 0x48ca, 0x4bac, 0x43a9, 0x4174,
+	0x33e6, 0x2937, 0x305d, 0x2a3e, 0x316f, 0x32f6, 0x3d8f, 0x4202, 0x421e, 0x4507, 0x3d09, 0x3ad5,
+	0x2d47, 0x2294, 0x31b7, 0x2b98, 0x32ca, 0x3453, 0x414e, 0x4362, 0x4380, 0x48c9, 0x40ca, 0x3c35,
+	0x3105, 0x23f1, 0x3313, 0x2cf3, 0x3426, 0x3811, 0x42ab, 0x44bd, 0x44d8, 0x4a21, 0x4225, 0x3d92,
+	0x3264, 0x2551, 0x3473, 0x30b2, 0x3582, 0x396a, 0x4402, 0x4874, 0x488e, 0x4b78, 0x437e, 0x4150,
+	0x33c6, 0x2917, 0x303a, 0x2a18, 0x3146, 0x32cb, 0x3d63, 0x41d5, 0x41f0, 0x44d9, 0x3cde, 0x3aaf,
+	0x2d24, 0x2274, 0x3197, 0x2b73, 0x32a0, 0x3424, 0x411c, 0x4330, 0x434e, 0x4899, 0x409e, 0x3c0c,
+	0x30e0, 0x23d0, 0x32f4, 0x2cd3, 0x3402, 0x358a, 0x4282, 0x4494, 0x44b0, 0x49f9, 0x41fd, 0x3d6c,
+	0x3241, 0x2532, 0x3458, 0x309a, 0x356c, 0x3953, 0x43e9, 0x4857, 0x486f, 0x4b58, 0x435d, 0x412d,
+	0x33a3, 0x28f3, 0x3016, 0x29f4, 0x3121, 0x32a5, 0x3d3b, 0x41ab, 0x41c6, 0x44b2, 0x3cb9, 0x3a8c,
+	0x2d02, 0x2251, 0x3173, 0x2b50, 0x327e, 0x3405, 0x40ff, 0x4312, 0x432e, 0x4877, 0x407b, 0x3bea,
+	0x30be, 0x23ae, 0x32d0, 0x2caf, 0x33df, 0x3567, 0x4260, 0x4472, 0x448d, 0x49d4, 0x41d7, 0x3d44,
+	0x3218, 0x2508, 0x342c, 0x306b, 0x3539, 0x391e, 0x43b5, 0x4827, 0x4843, 0x4b2c, 0x4331, 0x4100,
+	0x3375, 0x28c6, 0x2d8a, 0x29c9, 0x30f7, 0x327c, 0x3d13, 0x4186, 0x41a4, 0x448f, 0x3c95, 0x3a63,
+	0x2cd5, 0x2220, 0x3140, 0x2b1c, 0x324a, 0x33d0, 0x40c8, 0x42dd, 0x42fd, 0x484b, 0x4052, 0x3bc0,
+	0x3091, 0x237b, 0x3299, 0x2c74, 0x33a2, 0x352b, 0x4225, 0x4439, 0x4458, 0x49a5, 0x41ac, 0x3d1c,
+	0x31f0, 0x24dc, 0x33fc, 0x3038, 0x3505, 0x38ec, 0x4385, 0x4598, 0x4815, 0x4b00, 0x4308, 0x40da,
+	0x3351, 0x289e, 0x2d5b, 0x2991, 0x30b8, 0x3238, 0x3ccf, 0x4144, 0x4165, 0x4455, 0x3c5f, 0x3a33,
+	0x2ca9, 0x21f7, 0x3115, 0x2aec, 0x3213, 0x3395, 0x408d, 0x42a3, 0x42c7, 0x4816, 0x401f, 0x3b90,
+	0x3064, 0x2351, 0x3271, 0x2c4c, 0x3376, 0x34f8, 0x41ee, 0x4401, 0x4421, 0x4970, 0x4179, 0x3cea,
+	0x31be, 0x24ac, 0x33cc, 0x3007, 0x34d0, 0x38b0, 0x4343, 0x4553, 0x4572, 0x4ac1, 0x42ce, 0x40a3,
+	0x331b, 0x286a, 0x2d2a, 0x2964, 0x308e, 0x320f, 0x3ca4, 0x4116, 0x4134, 0x4423, 0x3c2f, 0x3a04,
+	0x2c7a, 0x21c7, 0x30e4, 0x2abc, 0x31e5, 0x3368, 0x405f, 0x4272, 0x4292, 0x4581, 0x3d8b, 0x3b5e,
+	0x3033, 0x2321, 0x323f, 0x2c17, 0x3341, 0x34c6, 0x41bf, 0x43d3, 0x43f2, 0x4940, 0x4148, 0x3cba,
+	0x318f, 0x247f, 0x33a1, 0x2d7c, 0x34a7, 0x388b, 0x4323, 0x4537, 0x4556, 0x4aa4, 0x42ac, 0x407e,
+	0x32f3, 0x2841, 0x2cff, 0x2937, 0x305e, 0x31de, 0x3c74, 0x40e9, 0x410d, 0x43ff, 0x3c0c, 0x39df,
+	0x2c53, 0x219e, 0x30ba, 0x2a91, 0x31b9, 0x333b, 0x4034, 0x424c, 0x4272, 0x4565, 0x3d71, 0x3b43,
+	0x3015, 0x22fe, 0x321a, 0x2bf2, 0x331c, 0x34a1, 0x419a, 0x43b0, 0x43d2, 0x4923, 0x4130, 0x3ca4,
+	0x3178, 0x2463, 0x337e, 0x2d54, 0x3479, 0x3859, 0x42ef, 0x4503, 0x4525, 0x4a77, 0x4286, 0x405e,
+	0x32d7, 0x2825, 0x2ce1, 0x2915, 0x3039, 0x31b8, 0x3c4f, 0x40c5, 0x40e9, 0x43dd, 0x3bea, 0x39c0,
+	0x2c36, 0x2183, 0x309e, 0x2a72, 0x3196, 0x3315, 0x400b, 0x4221, 0x4247, 0x453b, 0x3d48, 0x3b1c,
+	0x2d91, 0x22dc, 0x31f9, 0x2bce, 0x32f4, 0x3473, 0x4169, 0x437e, 0x43a1, 0x48f4, 0x4102, 0x3c76,
+	0x314c, 0x2438, 0x3356, 0x2d2e, 0x3456, 0x3837, 0x42cc, 0x44df, 0x4501, 0x4a53, 0x4261, 0x4037,
+	0x32ae, 0x2599, 0x2cb3, 0x28e6, 0x300a, 0x3188, 0x3c1b, 0x408f, 0x40b3, 0x43a8, 0x3bb8, 0x3990,
+	0x2c07, 0x2152, 0x306b, 0x2a3c, 0x315f, 0x32de, 0x3d76, 0x41ee, 0x4213, 0x4507, 0x3d14, 0x3ae9,
+	0x2d5e, 0x22a9, 0x31c4, 0x2b98, 0x32bd, 0x343e, 0x4137, 0x434e, 0x4372, 0x48c4, 0x40d1, 0x3c45,
+	0x311a, 0x2406, 0x3321, 0x2cf5, 0x3417, 0x3593, 0x4287, 0x449c, 0x44c1, 0x4a16, 0x4225, 0x3d9c,
+	0x3272, 0x255e, 0x2c79, 0x28ac, 0x2d6e, 0x314c, 0x3be1, 0x4059, 0x4081, 0x4379, 0x3b89, 0x395f,
+	0x2bd2, 0x211a, 0x3031, 0x2a03, 0x3126, 0x32a5, 0x3d3d, 0x41b4, 0x41dd, 0x44d6, 0x3ce8, 0x3abe,
+	0x2d31, 0x2278, 0x318e, 0x2b5e, 0x3280, 0x3400, 0x40f7, 0x430e, 0x4334, 0x488b, 0x409d, 0x3c16,
+	0x30ed, 0x23d7, 0x32ef, 0x2cc0, 0x33e3, 0x3561, 0x4259, 0x4470, 0x4496, 0x49ed, 0x41ff, 0x3d79,
+	0x3253, 0x253e, 0x2c55, 0x2881, 0x2d3e, 0x3118, 0x3bab, 0x4023, 0x404c, 0x4346, 0x3b5a, 0x3935,
+	0x2bad, 0x20f9, 0x3011, 0x29de, 0x30fb, 0x3275, 0x3d0a, 0x4184, 0x41ae, 0x44a8, 0x3cbb, 0x3a92,
+	0x2d08, 0x2253, 0x316d, 0x2b3f, 0x3262, 0x33df, 0x40d4, 0x42eb, 0x4312, 0x486b, 0x407d, 0x3bf6,
+	0x30cc, 0x23b7, 0x32d1, 0x2ca2, 0x33c2, 0x353c, 0x422d, 0x4440, 0x4465, 0x49be, 0x41d3, 0x3d4f,
+	0x3228, 0x2514, 0x2c2d, 0x285c, 0x2d1c, 0x30f8, 0x3b8c, 0x4002, 0x402a, 0x4323, 0x3b38, 0x3912,
+	0x2b89, 0x20d3, 0x2d89, 0x29b8, 0x30d8, 0x3257, 0x3cee, 0x4166, 0x418e, 0x4487, 0x3c99, 0x3a71,
+	0x2ce7, 0x2231, 0x3147, 0x2b16, 0x3236, 0x33b3, 0x40aa, 0x42c2, 0x42e9, 0x4840, 0x4051, 0x3bc8,
+	0x309f, 0x238a, 0x32a4, 0x2c75, 0x3396, 0x3513, 0x420a, 0x4424, 0x444d, 0x49a6, 0x41b8, 0x3d30,
+	0x3206, 0x24ee, 0x2c04, 0x2830, 0x2ced, 0x30c7, 0x3b5c, 0x3d75, 0x4001, 0x42ff, 0x3b15, 0x38ee,
+	0x2b63, 0x20a9, 0x2d5c, 0x2986, 0x30a3, 0x321e, 0x3cb4, 0x412f, 0x415d, 0x445b, 0x3c72, 0x3a4b,
+	0x2cbf, 0x2204, 0x3117, 0x2ae3, 0x3202, 0x3380, 0x4078, 0x4292, 0x42bd, 0x481a, 0x4030, 0x3bac,
+	0x3083, 0x236a, 0x327d, 0x2c46, 0x3360, 0x34d7, 0x41ca, 0x43e0, 0x440a, 0x4967, 0x4180, 0x3cfe,
+	0x31da, 0x24c5, 0x2bd9, 0x2801, 0x2cb9, 0x308f, 0x3b22, 0x3d3b, 0x3d69, 0x42c8, 0x3ae0, 0x38bc,
+	0x2b34, 0x207d, 0x2d31, 0x295b, 0x3075, 0x31ed, 0x3c81, 0x40fb, 0x4128, 0x4427, 0x3c3f, 0x3a1a,
+	0x2c91, 0x21d9, 0x30ed, 0x2ab8, 0x31d4, 0x334b, 0x403c, 0x4253, 0x427c, 0x4579, 0x3d91, 0x3b6e,
+	0x3046, 0x2330, 0x3246, 0x2c13, 0x3331, 0x34aa, 0x419c, 0x43b3, 0x43dd, 0x493a, 0x4152, 0x3cd0,
+	0x31aa, 0x2493, 0x2ba6, 0x256e, 0x2c88, 0x305f, 0x3af2, 0x3d09, 0x3d35, 0x4293, 0x3aad, 0x388b,
+	0x2b05, 0x204d, 0x2cff, 0x2927, 0x303f, 0x31b7, 0x3c4c, 0x40c7, 0x40f3, 0x43f1, 0x3c07, 0x39e3,
+	0x2c5a, 0x21a3, 0x30b7, 0x2a82, 0x319f, 0x331a, 0x4011, 0x422d, 0x425a, 0x4556, 0x3d6c, 0x3b46,
+	0x301d, 0x2306, 0x321b, 0x2be6, 0x32ff, 0x3475, 0x4167, 0x4380, 0x43ac, 0x490b, 0x4124, 0x3ca0,
+	0x3179, 0x2461, 0x2b75, 0x253e, 0x2c57, 0x302d, 0x3ac1, 0x3cdc, 0x3d0d, 0x4270, 0x3a8a, 0x3865,
+	0x2ada, 0x201e, 0x2cce, 0x28f6, 0x3011, 0x318c, 0x3c23, 0x40a0, 0x40d1, 0x43d4, 0x3bef, 0x39cc,
+	0x2c41, 0x2185, 0x3093, 0x2a59, 0x3172, 0x32eb, 0x3d81, 0x41fb, 0x4229, 0x4529, 0x3d45, 0x3b24,
+	0x2d9d, 0x22e4, 0x31f4, 0x2bba, 0x32d1, 0x3449, 0x413f, 0x435b, 0x438b, 0x48ed, 0x4109, 0x3c89,
+	0x3163, 0x244a, 0x2b59, 0x251c, 0x2c30, 0x3003, 0x3a97, 0x3cb3, 0x3ce6, 0x424b, 0x3a69, 0x3849,
+	0x2ac3, 0x200a, 0x2cb9, 0x28dc, 0x2d8e, 0x3160, 0x3bf3, 0x406f, 0x40a1, 0x43a6, 0x3bc3, 0x39a1,
+	0x2c18, 0x215f, 0x3070, 0x2a37, 0x314f, 0x32c5, 0x3d58, 0x41d4, 0x4204, 0x4508, 0x3d25, 0x3b04,
+	0x2d7d, 0x22c4, 0x31d5, 0x2b9c, 0x32b1, 0x3424, 0x4112, 0x4328, 0x4356, 0x48b9, 0x40d8, 0x3c5b,
+	0x3137, 0x241f, 0x2b2f, 0x24f3, 0x2c07, 0x2d79, 0x3a6a, 0x3c83, 0x3cb3, 0x4217, 0x3a35, 0x3816,
+	0x2a8f, 0x1d75, 0x2c84, 0x28a8, 0x2d5e, 0x3135, 0x3bcb, 0x4048, 0x4078, 0x437b, 0x3b97, 0x3975,
+	0x2bee, 0x2135, 0x3044, 0x2a08, 0x311d, 0x3292, 0x3d25, 0x419f, 0x41cd, 0x44ce, 0x3ce9, 0x3ac7,
+	0x2d40, 0x2289, 0x319a, 0x2b60, 0x3276, 0x33ea, 0x40de, 0x42fa, 0x432c, 0x4890, 0x40ac, 0x3c2b,
+	0x3103, 0x23e8, 0x2af5, 0x24b8, 0x2bcc, 0x2d3f, 0x3a33, 0x3c50, 0x3c84, 0x41ec, 0x3a0d, 0x358d,
+	0x2a64, 0x1d46, 0x2c51, 0x2872, 0x2d24, 0x30f7, 0x3b8a, 0x4008, 0x403c, 0x4343, 0x3b63, 0x3943,
+	0x2bba, 0x20fd, 0x3008, 0x29ca, 0x30df, 0x3255, 0x3ceb, 0x4169, 0x419d, 0x44a4, 0x3cc4, 0x3aa6,
+	0x2d20, 0x2265, 0x3171, 0x2b31, 0x3241, 0x33b2, 0x40a3, 0x42be, 0x42f0, 0x4857, 0x4078, 0x3bfd,
+	0x30da, 0x23c2, 0x2acf, 0x248e, 0x2b9b, 0x2d09, 0x39f9, 0x3c16, 0x3c4b, 0x41b5, 0x39d7, 0x3559,
+	0x2a32, 0x1d18, 0x2c25, 0x2845, 0x2cf7, 0x30c9, 0x3b5d, 0x3d7b, 0x4012, 0x431c, 0x3b3d, 0x391e,
+	0x2b96, 0x20db, 0x2d87, 0x29a9, 0x30bc, 0x322e, 0x3cbe, 0x4137, 0x4169, 0x4470, 0x3c91, 0x3a74,
+	0x2cee, 0x2235, 0x3143, 0x2b05, 0x3218, 0x338a, 0x407b, 0x4296, 0x42c9, 0x4831, 0x4054, 0x3bd8,
+	0x30b4, 0x2398, 0x2aa3, 0x2461, 0x2b71, 0x2ce3, 0x39d6, 0x3bf4, 0x3c29, 0x4192, 0x39b6, 0x353b,
+	0x2a15, 0x1cfa, 0x2c03, 0x2820, 0x2ccf, 0x309f, 0x3b33, 0x3d51, 0x3d86, 0x42ee, 0x3b0e, 0x38f0,
+	0x2b6a, 0x20af, 0x2d5b, 0x297b, 0x308d, 0x3200, 0x3c95, 0x4115, 0x414c, 0x4454, 0x3c75, 0x3a56,
+	0x2ccf, 0x2214, 0x3121, 0x2ae1, 0x31f0, 0x335f, 0x4050, 0x426c, 0x42a2, 0x480c, 0x4030, 0x3bb4,
+	0x308e, 0x2373, 0x2a7e, 0x243c, 0x2b49, 0x2cb7, 0x39a7, 0x3bc4, 0x3bfc, 0x416a, 0x398f, 0x3512,
+	0x29e9, 0x1cca, 0x2bd2, 0x258f, 0x2ca0, 0x3072, 0x3b07, 0x3d28, 0x3d61, 0x42ce, 0x3af4, 0x38d8,
+	0x2b51, 0x2092, 0x2d39, 0x2954, 0x3063, 0x31d4, 0x3c66, 0x40e3, 0x4117, 0x4421, 0x3c46, 0x3a2c,
+	0x2ca8, 0x21ee, 0x30f7, 0x2ab3, 0x31bf, 0x332d, 0x401e, 0x423c, 0x4273, 0x457e, 0x4004, 0x3b8a,
+	0x3067, 0x234c, 0x2a54, 0x240e, 0x2b18, 0x2c84, 0x3975, 0x3b96, 0x3bd0, 0x413f, 0x3966, 0x34ec,
+	0x29c7, 0x1cab, 0x2bb3, 0x256d, 0x2c77, 0x3043, 0x3ad2, 0x3cf0, 0x3d28, 0x4295, 0x3abb, 0x389f,
+	0x2b18, 0x205c, 0x2d05, 0x2923, 0x3031, 0x31a0, 0x3c31, 0x40af, 0x40e7, 0x43f4, 0x3c1a, 0x3a00,
+	0x2c7a, 0x21be, 0x30c7, 0x2a83, 0x3190, 0x32fc, 0x3d8b, 0x4206, 0x423b, 0x4548, 0x3d70, 0x3b59,
+	0x3037, 0x231c, 0x2a23, 0x23dd, 0x2ae7, 0x2c52, 0x3941, 0x3b5d, 0x3b95, 0x4102, 0x3929, 0x34af,
+	0x298a, 0x1c6d, 0x2b73, 0x252d, 0x2c39, 0x300a, 0x3a9e, 0x3cc0, 0x3cfa, 0x4268, 0x3a8d, 0x3871,
+	0x2aeb, 0x202e, 0x2cd5, 0x28f0, 0x2d9d, 0x316c, 0x3bfe, 0x407c, 0x40b3, 0x43bf, 0x3be4, 0x39c8,
+	0x2c42, 0x2186, 0x3090, 0x2a4b, 0x3156, 0x32c2, 0x3d53, 0x41d3, 0x420e, 0x451d, 0x3d44, 0x3b2a,
+	0x3003, 0x22e3, 0x29e8, 0x23a0, 0x2aaa, 0x2c17, 0x390a, 0x3b2e, 0x3b6c, 0x40e1, 0x390c, 0x3493,
+	0x296c, 0x1c4b, 0x2b4d, 0x2502, 0x2c0a, 0x2d77, 0x3a69, 0x3c8b, 0x3cc7, 0x4239, 0x3a63, 0x384b,
+	0x2ac5, 0x2004, 0x2ca7, 0x28bd, 0x2d66, 0x3134, 0x3bc8, 0x404a, 0x4087, 0x4399, 0x3bc4, 0x39ad,
+	0x2c2a, 0x216d, 0x3071, 0x2a27, 0x312c, 0x3295, 0x3d25, 0x41a5, 0x41e1, 0x44f4, 0x3d20, 0x3b0d,
+	0x2d8c, 0x22d1, 0x29d7, 0x238b, 0x2a8e, 0x2bf3, 0x38e0, 0x3aff, 0x3b3d, 0x40b1, 0x38dd, 0x3466,
+	0x2942, 0x1c25, 0x2b2a, 0x24e1, 0x2be8, 0x2d52, 0x3a43, 0x3c64, 0x3ca3, 0x4217, 0x3a43, 0x382c,
+	0x2aa7, 0x1d89, 0x2c8f, 0x28a7, 0x2d50, 0x311b, 0x3ba9, 0x4025, 0x405d, 0x436e, 0x3b9a, 0x3985,
+	0x2c02, 0x2146, 0x304d, 0x2a05, 0x310d, 0x3276, 0x3d03, 0x4180, 0x41b9, 0x44ca, 0x3cf6, 0x3ae2,
+	0x2d5f, 0x22a2, 0x29a5, 0x235a, 0x2a60, 0x2bcb, 0x38bc, 0x3ade, 0x3b1b, 0x408e, 0x38bb, 0x3445,
+	0x2922, 0x1c04, 0x2b07, 0x24bb, 0x2bc0, 0x2d2b, 0x3a1c, 0x3c3d, 0x3c78, 0x41e9, 0x3a12, 0x3599,
+	0x2a74, 0x1d56, 0x2c5b, 0x2872, 0x2d19, 0x30e4, 0x3b76, 0x3d99, 0x4036, 0x4348, 0x3b72, 0x3959,
+	0x2bd3, 0x2114, 0x3019, 0x29cf, 0x30d5, 0x323e, 0x3cce, 0x414f, 0x418d, 0x44a2, 0x3cd0, 0x3ab9,
+	0x2d35, 0x2275, 0x2977, 0x232b, 0x2a2e, 0x2b96, 0x3883, 0x3aa4, 0x3ae3, 0x405b, 0x3889, 0x3412,
+	0x28eb, 0x1bc8, 0x2ac7, 0x2479, 0x2b7e, 0x2cea, 0x39dd, 0x3c01, 0x3c43, 0x41bb, 0x39ea, 0x3575,
+	0x2a4f, 0x1d2c, 0x2c2b, 0x283c, 0x2ce1, 0x30ab, 0x3b3c, 0x3d5d, 0x3d9a, 0x430f, 0x3b3e, 0x392b,
+	0x2ba9, 0x20eb, 0x2d8c, 0x299d, 0x309e, 0x3203, 0x3c91, 0x4112, 0x4152, 0x4468, 0x3c97, 0x3a85,
+	0x2d03, 0x2245, 0x2944, 0x22f3, 0x29f2, 0x2b57, 0x3846, 0x3a6b, 0x3aaf, 0x402a, 0x385c, 0x33e8,
+	0x28c5, 0x1ba5, 0x2aa5, 0x2455, 0x2b55, 0x2cbb, 0x39a9, 0x3bca, 0x3c0b, 0x4183, 0x39b3, 0x353f,
+	0x2a1b, 0x1cfb, 0x2bfd, 0x2810, 0x2cb3, 0x3079, 0x3b07, 0x3d28, 0x3d67, 0x42df, 0x3b10, 0x38fe,
+	0x2b7b, 0x20bc, 0x2d5d, 0x296f, 0x3070, 0x31d6, 0x3c63, 0x40e3, 0x4123, 0x443b, 0x3c6e, 0x3a5e,
+	0x2cde, 0x2221, 0x2921, 0x22d0, 0x29d0, 0x2b35, 0x3821, 0x3a41, 0x3a81, 0x3d99, 0x3829, 0x33b6,
+	0x2894, 0x1b74, 0x2a74, 0x2424, 0x2b25, 0x2c8d, 0x397f, 0x3ba3, 0x3be6, 0x415e, 0x398e, 0x3519,
+	0x29f5, 0x1cd6, 0x2bd7, 0x2589, 0x2c8b, 0x3053, 0x3ae3, 0x3d06, 0x3d46, 0x42bc, 0x3aeb, 0x38d7,
+	0x2b54, 0x2096, 0x2d38, 0x294b, 0x304c, 0x31b1, 0x3c3d, 0x40bf, 0x4100, 0x441a, 0x3c4b, 0x3a38,
+	0x2cb4, 0x21f1, 0x28ef, 0x229d, 0x299d, 0x2b03, 0x3594, 0x3a1a, 0x3a60, 0x3d7f, 0x3814, 0x33a2,
+	0x287c, 0x1b58, 0x2a54, 0x2400, 0x2b00, 0x2c67, 0x3958, 0x3b7d, 0x3bc0, 0x413a, 0x396e, 0x34fc,
+	0x29d8, 0x1cb6, 0x2bb2, 0x255f, 0x2c5e, 0x3024, 0x3ab4, 0x3cd8, 0x3d1b, 0x4296, 0x3ac9, 0x38b8,
+	0x2b37, 0x2077, 0x2d14, 0x291f, 0x301b, 0x317d, 0x3c0b, 0x4090, 0x40d5, 0x43f2, 0x3c27, 0x3a18,
+	0x2c98, 0x21da, 0x28d8, 0x2283, 0x297d, 0x2add, 0x3568, 0x39ea, 0x3a2f, 0x3d4d, 0x3582, 0x3370,
+	0x284c, 0x1b2b, 0x2a28, 0x23d4, 0x2ad1, 0x2c34, 0x3922, 0x3b46, 0x3b8c, 0x410a, 0x3940, 0x34cf,
+	0x29aa, 0x1c88, 0x2b85, 0x2533, 0x2c32, 0x2d97, 0x3a84, 0x3ca5, 0x3ce7, 0x4262, 0x3a97, 0x3889,
+	0x2b08, 0x2048, 0x2ce5, 0x28f2, 0x2d8f, 0x3151, 0x3bdb, 0x405b, 0x409d, 0x43b8, 0x3bed, 0x39df,
+	0x2c5e, 0x219d, 0x2897, 0x223f, 0x293a, 0x2a9d, 0x352c, 0x39b2, 0x39f9, 0x3d18, 0x354f, 0x3340,
+	0x281e, 0x1afc, 0x29f7, 0x23a0, 0x2a9b, 0x2bfe, 0x38ee, 0x3b14, 0x3b59, 0x40d5, 0x3908, 0x3496,
+	0x2973, 0x1c52, 0x2b4f, 0x24fa, 0x2bf6, 0x2d59, 0x3a47, 0x3c6c, 0x3cb2, 0x422f, 0x3a63, 0x3852,
+	0x2ace, 0x200d, 0x2ca9, 0x28b4, 0x2d4e, 0x310f, 0x3b9c, 0x4022, 0x406a, 0x438c, 0x3bc4, 0x39b6,
+	0x2c34, 0x2171, 0x286b, 0x2214, 0x290d, 0x2a6e, 0x34f9, 0x397e, 0x39c6, 0x3ce8, 0x3522, 0x3313,
+	0x258e, 0x1ac9, 0x29c0, 0x2368, 0x2a62, 0x2bc4, 0x38b4, 0x3adb, 0x3b24, 0x40a6, 0x38e0, 0x3473,
+	0x2951, 0x1c2c, 0x2b24, 0x24cc, 0x2bc6, 0x2d28, 0x3a17, 0x3c3c, 0x3c83, 0x4202, 0x3a3b, 0x3830,
+	0x2ab2, 0x1d93, 0x2c8e, 0x2895, 0x2d2c, 0x30ea, 0x3b74, 0x3d98, 0x403e, 0x435f, 0x3b98, 0x398d,
+	0x2c0d, 0x214d, 0x2846, 0x21ec, 0x28e1, 0x2a3f, 0x34cb, 0x3952, 0x399d, 0x3cc3, 0x34fe, 0x32f2,
+	0x2571, 0x1aae, 0x29a8, 0x2350, 0x2a48, 0x2ba8, 0x3895, 0x3aba, 0x3b02, 0x4083, 0x38bd, 0x3450,
+	0x292e, 0x1c0b, 0x2b06, 0x24b0, 0x2baa, 0x2d0b, 0x39f6, 0x3c18, 0x3c5e, 0x41df, 0x3a18, 0x380c,
+	0x2a8c, 0x1d6b, 0x2c64, 0x286b, 0x2d03, 0x30c2, 0x3b4e, 0x3d72, 0x401a, 0x433c, 0x3b78, 0x396e,
+	0x2bef, 0x212e, 0x2827, 0x21cd, 0x28c4, 0x2a22, 0x34af, 0x3933, 0x397b, 0x3c9c, 0x34d5, 0x32c8,
+	0x2546, 0x1a83, 0x297c, 0x2321, 0x2a19, 0x2b79, 0x3868, 0x3a90, 0x3ada, 0x405c, 0x3894, 0x3425,
+	0x2902, 0x1bde, 0x2ad7, 0x247e, 0x2b77, 0x2cd7, 0x39c6, 0x3bed, 0x3c36, 0x41b8, 0x39f1, 0x3583,
+	0x2a61, 0x1d3e, 0x2c38, 0x283f, 0x2cd6, 0x3094, 0x3b1f, 0x3d44, 0x3d8e, 0x4312, 0x3b4e, 0x3942,
+	0x2bbe, 0x20f8, 0x258c, 0x218e, 0x2882, 0x29e0, 0x346d, 0x38f6, 0x3945, 0x3c6e, 0x34ae, 0x32a3,
+	0x251f, 0x1a57, 0x294a, 0x22eb, 0x29df, 0x2b3f, 0x382f, 0x3a58, 0x3aa3, 0x4029, 0x3866, 0x33fc,
+	0x28dc, 0x1bb7, 0x2aab, 0x244d, 0x2b40, 0x2c9e, 0x398a, 0x3bb1, 0x3bfb, 0x4180, 0x39bd, 0x3553,
+	0x2a35, 0x1d13, 0x2c09, 0x2809, 0x2c98, 0x3051, 0x3adb, 0x3d02, 0x3d50, 0x42d9, 0x3b19, 0x3911,
+	0x2b93, 0x20d2, 0x2569, 0x216a, 0x285a, 0x29b3, 0x343b, 0x38c1, 0x390e, 0x3c37, 0x3476, 0x326c,
+	0x24eb, 0x1a27, 0x291d, 0x22bf, 0x29b2, 0x2b0d, 0x3597, 0x3a1d, 0x3a69, 0x3d91, 0x3830, 0x33c7,
+	0x28a6, 0x1b81, 0x2a77, 0x241b, 0x2b10, 0x2c6d, 0x3957, 0x3b7c, 0x3bc6, 0x414c, 0x398b, 0x3524,
+	0x2a06, 0x1ce4, 0x2bdb, 0x257e, 0x2c72, 0x302e, 0x3ab7, 0x3cda, 0x3d23, 0x42a8, 0x3ae7, 0x38e0,
+	0x2b62, 0x209e, 0x2532, 0x2131, 0x2822, 0x297d, 0x340a, 0x3892, 0x38e0, 0x3c09, 0x3448, 0x3240,
+	0x24c0, 0x19fb, 0x28ef, 0x228f, 0x2982, 0x2ae0, 0x356f, 0x39f9, 0x3a47, 0x3d6d, 0x380a, 0x339f,
+	0x287e, 0x1b5a, 0x2a50, 0x23f3, 0x2ae6, 0x2c43, 0x392f, 0x3b57, 0x3ba5, 0x412c, 0x3969, 0x34fe,
+	0x29dc, 0x1cb8, 0x2bad, 0x254d, 0x2c3d, 0x2d97, 0x3a82, 0x3cab, 0x3cfc, 0x4288, 0x3acb, 0x38c4,
+	0x2b43, 0x207c, 0x2d0e, 0x290d, 0x2d9e, 0x3159, 0x3be5, 0x406e, 0x40bf, 0x43eb, 0x3c2e, 0x3a26,
+	0x2ca4, 0x21db, 0x30cb, 0x2a67, 0x3158, 0x32b4, 0x3d41, 0x41cb, 0x421b, 0x4547, 0x3d89, 0x3b82,
+	0x3062, 0x233b, 0x322c, 0x2bc8, 0x32b7, 0x3412, 0x40fe, 0x4328, 0x4378, 0x4902, 0x4145, 0x3ce0,
+	0x31c3, 0x24a0, 0x3394, 0x2d31, 0x341e, 0x3575, 0x425e, 0x4485, 0x44d4, 0x4a60, 0x42a3, 0x409e,
+	0x331f, 0x285a, 0x2ceb, 0x28e6, 0x2d71, 0x3126, 0x3baf, 0x4039, 0x408c, 0x43bb, 0x3c01, 0x39fc,
+	0x2c7c, 0x21b5, 0x30a6, 0x2a43, 0x3130, 0x3289, 0x3d14, 0x419d, 0x41ee, 0x451a, 0x3d5e, 0x3b58,
+	0x3038, 0x2313, 0x3205, 0x2ba4, 0x3293, 0x33ec, 0x40d5, 0x42fa, 0x4347, 0x48d2, 0x4115, 0x3cb0,
+	0x3193, 0x246f, 0x3360, 0x2cfc, 0x33e7, 0x353c, 0x4224, 0x444b, 0x449b, 0x4a28, 0x426e, 0x406b,
+	0x32ef, 0x282b, 0x2cbc, 0x28b7, 0x2d43, 0x30f9, 0x3b83, 0x400c, 0x405d, 0x438a, 0x3bcd, 0x39c6,
+	0x2c47, 0x2181, 0x3072, 0x2a0e, 0x30fb, 0x3253, 0x3cde, 0x4168, 0x41b9, 0x44e5, 0x3d27, 0x3b1f,
+	0x2d9e, 0x22d8, 0x31ca, 0x2b67, 0x3254, 0x33ac, 0x4096, 0x42bf, 0x4311, 0x489e, 0x40e2, 0x3c7c,
+	0x315c, 0x2437, 0x3329, 0x2cc6, 0x33b4, 0x350b, 0x41f4, 0x441c, 0x446d, 0x49fd, 0x4243, 0x403e,
+	0x32bd, 0x2594, 0x2c80, 0x2879, 0x2d03, 0x30ba, 0x3b44, 0x3d70, 0x4025, 0x4357, 0x3ba0, 0x399d,
+	0x2c1c, 0x2152, 0x303d, 0x29d4, 0x30bf, 0x3218, 0x3ca6, 0x4133, 0x4187, 0x44b6, 0x3cfd, 0x3afa,
+	0x2d7c, 0x22b5, 0x31a3, 0x2b3b, 0x3226, 0x337d, 0x4068, 0x4292, 0x42e5, 0x4873, 0x40b9, 0x3c57,
+	0x313a, 0x2416, 0x3305, 0x2c9b, 0x3381, 0x34d2, 0x41b9, 0x43e3, 0x4439, 0x49cc, 0x4216, 0x4015,
+	0x3299, 0x2574, 0x2c63, 0x285b, 0x2ce2, 0x3094, 0x3b1c, 0x3d48, 0x3d9e, 0x4331, 0x3b7a, 0x3977,
+	0x2bf8, 0x2130, 0x301f, 0x29b8, 0x30a2, 0x31f7, 0x3c80, 0x4109, 0x415d, 0x448f, 0x3cd7, 0x3ad4,
+	0x2d56, 0x228e, 0x317c, 0x2b15, 0x31ff, 0x3354, 0x403c, 0x4264, 0x42b6, 0x4847, 0x4090, 0x3c30,
+	0x3114, 0x23ef, 0x32de, 0x2c77, 0x3361, 0x34b6, 0x419f, 0x43c7, 0x4419, 0x49aa, 0x41f3, 0x3d92,
+	0x3276, 0x254f, 0x2c3b, 0x2830, 0x2cb6, 0x306a, 0x3af4, 0x3d20, 0x3d75, 0x4308, 0x3b51, 0x394e,
+	0x2bd0, 0x2108, 0x2d94, 0x298a, 0x3071, 0x31c7, 0x3c54, 0x40e2, 0x4138, 0x446a, 0x3cb1, 0x3aac,
+	0x2d2d, 0x2265, 0x3154, 0x2aed, 0x31d7, 0x332c, 0x4017, 0x4242, 0x4297, 0x4829, 0x4071, 0x3c0e,
+	0x30ee, 0x23c6, 0x32b2, 0x2c47, 0x332d, 0x347d, 0x4164, 0x438f, 0x43e7, 0x497e, 0x41cc, 0x3d6c,
+	0x324d, 0x2523, 0x2c0d, 0x2800, 0x2c86, 0x3039, 0x3ac2, 0x3cef, 0x3d48, 0x42e0, 0x3b2d, 0x392c,
+	0x2bad, 0x20e2, 0x2d6a, 0x295d, 0x3042, 0x3197, 0x3c21, 0x40ad, 0x4104, 0x4439, 0x3c85, 0x3a85,
+	0x2d08, 0x223f, 0x3129, 0x2abb, 0x319e, 0x32ef, 0x3d76, 0x4201, 0x4258, 0x458d, 0x4039, 0x3bdb,
+	0x30c1, 0x239c, 0x3289, 0x2c1d, 0x3300, 0x344f, 0x4135, 0x4360, 0x43b7, 0x494d, 0x419a, 0x3d3c,
+	0x321f, 0x24f7, 0x2be2, 0x2574, 0x2c56, 0x3004, 0x3a8a, 0x3cb5, 0x3d0e, 0x42a7, 0x3af5, 0x38f6,
+	0x2b78, 0x20ae, 0x2d38, 0x292b, 0x300f, 0x3161, 0x3be9, 0x4075, 0x40cc, 0x4403, 0x3c50, 0x3a50,
+	0x2cd3, 0x220a, 0x30f6, 0x2a8b, 0x3172, 0x32c5, 0x3d4e, 0x41d7, 0x422c, 0x4560, 0x400d, 0x3baf,
+	0x3093, 0x236b, 0x3255, 0x2be6, 0x32c8, 0x3416, 0x40fc, 0x4327, 0x437e, 0x4915, 0x4164, 0x3d07,
+	0x31ed, 0x24c5, 0x2baf, 0x253f, 0x2c20, 0x2d71, 0x3a5a, 0x3c89, 0x3ce3, 0x427b, 0x3ac8, 0x38c7,
+	0x2b49, 0x2080, 0x2d09, 0x28fb, 0x2d7f, 0x3131, 0x3bbb, 0x404a, 0x40a4, 0x43db, 0x3c27, 0x3a25,
+	0x2ca6, 0x21dc, 0x30c6, 0x2a59, 0x313b, 0x328b, 0x3d12, 0x419f, 0x41f9, 0x4532, 0x3d81, 0x3b82,
+	0x3065, 0x233c, 0x3225, 0x2bb7, 0x329a, 0x33ea, 0x40d2, 0x42ff, 0x435b, 0x48f6, 0x4148, 0x3cea,
+	0x31cc, 0x249f, 0x2b83, 0x2511, 0x2bf1, 0x2d41, 0x3a2a, 0x3c58, 0x3cb5, 0x4252, 0x3aa5, 0x38aa,
+	0x2b2d, 0x2060, 0x2ce4, 0x28d0, 0x2d4f, 0x30ff, 0x3b8a, 0x4019, 0x4075, 0x43b0, 0x3c01, 0x3a06,
+	0x2c8a, 0x21c1, 0x30a9, 0x2a38, 0x3118, 0x3267, 0x3cf0, 0x417e, 0x41d9, 0x4513, 0x3d63, 0x3b68,
+	0x304e, 0x2327, 0x320f, 0x2b9c, 0x3277, 0x33bf, 0x40a3, 0x42cf, 0x432c, 0x48c9, 0x411d, 0x3cc3,
+	0x31aa, 0x2482, 0x2b69, 0x24f7, 0x2bd3, 0x2d1d, 0x3a02, 0x3c30, 0x3c8e, 0x422c, 0x3a80, 0x3884,
+	0x2b07, 0x203c, 0x2cc4, 0x28b3, 0x2d34, 0x30e2, 0x3b69, 0x3d94, 0x404f, 0x438a, 0x3bdc, 0x39e1,
+	0x2c65, 0x219b, 0x3082, 0x2a11, 0x30f1, 0x323d, 0x3cc0, 0x4149, 0x41a2, 0x44db, 0x3d2e, 0x3b35,
+	0x301d, 0x22f5, 0x31dd, 0x2b6c, 0x324b, 0x3398, 0x407e, 0x42aa, 0x4304, 0x489e, 0x40f0, 0x3c96,
+	0x317c, 0x2452, 0x2b37, 0x24c3, 0x2ba0, 0x2cee, 0x39d5, 0x3c04, 0x3c60, 0x41fc, 0x3a4d, 0x3850,
+	0x2ad4, 0x2009, 0x2c8f, 0x287b, 0x2cf8, 0x30a6, 0x3b2f, 0x3d5f, 0x401c, 0x4357, 0x3ba7, 0x39a8,
+	0x2c2a, 0x2160, 0x3047, 0x29d7, 0x30b7, 0x3206, 0x3c8f, 0x411e, 0x417c, 0x44b8, 0x3d0a, 0x3b0d,
+	0x2d8f, 0x22c3, 0x31a7, 0x2b32, 0x320e, 0x3358, 0x403d, 0x426b, 0x42ca, 0x486b, 0x40c2, 0x3c68,
+	0x314c, 0x241e, 0x2aff, 0x2487, 0x2b62, 0x2cad, 0x3995, 0x3bc6, 0x3c28, 0x41c9, 0x3a20, 0x3826,
+	0x2aa9, 0x1d7b, 0x2c5c, 0x2844, 0x2cc0, 0x306d, 0x3af7, 0x3d29, 0x3d89, 0x4328, 0x3b7e, 0x3985,
+	0x2c0a, 0x213e, 0x3020, 0x29a8, 0x3080, 0x31c8, 0x3c4c, 0x40da, 0x4139, 0x4479, 0x3ccf, 0x3ad8,
+	0x2d60, 0x2297, 0x317d, 0x2b06, 0x31de, 0x3325, 0x4009, 0x4237, 0x4299, 0x483c, 0x4094, 0x3c3d,
+	0x3122, 0x23f7, 0x2ada, 0x2462, 0x2b3a, 0x2c82, 0x3967, 0x3b96, 0x3bf7, 0x419a, 0x39f4, 0x359c,
+	0x2a80, 0x1d54, 0x2c36, 0x281e, 0x2c98, 0x3041, 0x3ac6, 0x3cf4, 0x3d53, 0x42f4, 0x3b4b, 0x3954,
+	0x2bda, 0x210f, 0x2d93, 0x297e, 0x305b, 0x31a7, 0x3c2d, 0x40bb, 0x4119, 0x4459, 0x3caf, 0x3ab9,
+	0x2d41, 0x2277, 0x315a, 0x2ae1, 0x31b8, 0x3300, 0x3d83, 0x4211, 0x4270, 0x4811, 0x406a, 0x3c14,
+	0x30fc, 0x23d2, 0x2ab5, 0x243b, 0x2b11, 0x2c59, 0x393f, 0x3b71, 0x3bd3, 0x4176, 0x39cc, 0x3573,
+	0x2a57, 0x1d2b, 0x2c0e, 0x2597, 0x2c72, 0x301d, 0x3aa6, 0x3cd8, 0x3d3a, 0x42db, 0x3b31, 0x3937,
+	0x2bba, 0x20ee, 0x2d71, 0x295a, 0x3033, 0x317a, 0x3bfd, 0x408b, 0x40ec, 0x442f, 0x3c87, 0x3a90,
+	0x2d15, 0x224a, 0x312c, 0x2ab3, 0x318b, 0x32d4, 0x3d58, 0x41e8, 0x424b, 0x4591, 0x404d, 0x3bf7,
+	0x30db, 0x23ab, 0x2a88, 0x240c, 0x2ae3, 0x2c2d, 0x3914, 0x3b46, 0x3baa, 0x414f, 0x39ab, 0x3556,
+	0x2a3b, 0x1d0c, 0x2be9, 0x256b, 0x2c40, 0x2d88, 0x3a6f, 0x3ca0, 0x3d02, 0x42a5, 0x3aff, 0x390a,
+	0x2b91, 0x20c6, 0x2d46, 0x292b, 0x3001, 0x3149, 0x3bcf, 0x4061, 0x40c4, 0x4408, 0x3c61, 0x3a6c,
+	0x2cf3, 0x2229, 0x310a, 0x2a8d, 0x315e, 0x32a1, 0x3d22, 0x41b1, 0x4215, 0x455d, 0x401a, 0x3bc6,
+	0x30ad, 0x2381, 0x2a61, 0x23e4, 0x2ab6, 0x2bf9, 0x38db, 0x3b0b, 0x3b71, 0x4119, 0x3976, 0x3520,
+	0x2a04, 0x1cd6, 0x2bb5, 0x253a, 0x2c10, 0x2d58, 0x3a3e, 0x3c6f, 0x3cd2, 0x4278, 0x3ad4, 0x38df,
+	0x2b65, 0x2097, 0x2d16, 0x28fa, 0x2d6f, 0x3113, 0x3b95, 0x4021, 0x4082, 0x43c7, 0x3c23, 0x3a31,
+	0x2cba, 0x21f0, 0x30d0, 0x2a52, 0x3125, 0x3269, 0x3cec, 0x417c, 0x41e0, 0x4526, 0x3d83, 0x3b90,
+	0x3077, 0x2349, 0x2a27, 0x23a8, 0x2a7b, 0x2bc1, 0x38a7, 0x3adb, 0x3b41, 0x40e8, 0x3944, 0x34ef,
+	0x29d5, 0x1ca7, 0x2b85, 0x2507, 0x2bd9, 0x2d1e, 0x3a03, 0x3c35, 0x3c9a, 0x4240, 0x3a9c, 0x38a6,
+	0x2b2b, 0x205e, 0x2cdd, 0x28c2, 0x2d37, 0x30de, 0x3b63, 0x3d95, 0x405c, 0x43a5, 0x3c02, 0x3a0e,
+	0x2c93, 0x21c5, 0x30a2, 0x2a22, 0x30f4, 0x3237, 0x3cba, 0x414b, 0x41b2, 0x44fe, 0x3d60, 0x3b6f,
+	0x3056, 0x2327, 0x2a01, 0x237e, 0x2a4e, 0x2b90, 0x3874, 0x3aa8, 0x3b10, 0x40bb, 0x391d, 0x34cb,
+	0x29b2, 0x1c83, 0x2b5d, 0x24dc, 0x2bad, 0x2cf3, 0x39db, 0x3c10, 0x3c78, 0x4221, 0x3a80, 0x388f,
+	0x2b18, 0x204b, 0x2cc8, 0x28a7, 0x2d16, 0x30b6, 0x3b37, 0x3d67, 0x402d, 0x4376, 0x3bd6, 0x39e6,
+	0x2c71, 0x21a7, 0x3086, 0x2a06, 0x30d4, 0x3213, 0x3c93, 0x4123, 0x418b, 0x44d8, 0x3d3a, 0x3b49,
+	0x3031, 0x2303, 0x29df, 0x235f, 0x2a2f, 0x2b72, 0x3855, 0x3a88, 0x3af0, 0x409c, 0x38ff, 0x34ae,
+	0x2994, 0x1c65, 0x2b40, 0x24c0, 0x2b90, 0x2cd3, 0x39b5, 0x3be5, 0x3c4a, 0x41f3, 0x3a53, 0x3861,
+	0x2aea, 0x201d, 0x2c9a, 0x287a, 0x2ced, 0x3091, 0x3b15, 0x3d46, 0x400c, 0x4355, 0x3bb5, 0x39c4,
+	0x2c4d, 0x2181, 0x305c, 0x29da, 0x30a8, 0x31e9, 0x3c6c, 0x40fe, 0x4165, 0x44b0, 0x3d11, 0x3b21,
+	0x300a, 0x22dc, 0x29b7, 0x2333, 0x29ff, 0x2b3f, 0x3822, 0x3a56, 0x3ac0, 0x406c, 0x38cb, 0x3477,
+	0x295d, 0x1c2d, 0x2b08, 0x2486, 0x2b57, 0x2c9b, 0x3981, 0x3bb8, 0x3c23, 0x41d0, 0x3a2f, 0x383b,
+	0x2ac0, 0x1d8f, 0x2c6a, 0x2848, 0x2cb7, 0x3057, 0x3ad8, 0x3d09, 0x3d72, 0x4320, 0x3b83, 0x3992,
+	0x2c19, 0x2149, 0x3022, 0x299e, 0x306a, 0x31a9, 0x3c2a, 0x40bd, 0x4128, 0x4479, 0x3ce0, 0x3af2,
+	0x2d78, 0x22a5, 0x297a, 0x22f2, 0x29be, 0x2b00, 0x3586, 0x3a1c, 0x3a89, 0x403a, 0x38a0, 0x3453,
+	0x293b, 0x1c09, 0x2ade, 0x2455, 0x2b1f, 0x2c5e, 0x3941, 0x3b75, 0x3bdf, 0x418d, 0x39f1, 0x3803,
+	0x2a8d, 0x1d60, 0x2c39, 0x2814, 0x2c7e, 0x301c, 0x3a9e, 0x3cd1, 0x3d3d, 0x42ed, 0x3b52, 0x3964,
+	0x2bef, 0x2122, 0x2d9b, 0x2974, 0x303c, 0x3177, 0x3bf6, 0x4089, 0x40f6, 0x4448, 0x3cb1, 0x3ac5,
+	0x2d4f, 0x2280, 0x2958, 0x22d1, 0x2999, 0x2ad4, 0x3552, 0x39e5, 0x3a51, 0x4002, 0x3869, 0x341c,
+	0x2904, 0x1bd4, 0x2aac, 0x2427, 0x2af4, 0x2c34, 0x3917, 0x3b4b, 0x3bb6, 0x4166, 0x39cc, 0x357f,
+	0x2a69, 0x1d3a, 0x2c13, 0x258e, 0x2c59, 0x2d97, 0x3a76, 0x3ca6, 0x3d0e, 0x42bc, 0x3b23, 0x3937,
+	0x2bc4, 0x20f7, 0x2d71, 0x294a, 0x3013, 0x314f, 0x3bcf, 0x4062, 0x40cc, 0x441c, 0x3c83, 0x3a96,
+	0x2d1f, 0x2250, 0x2927, 0x229f, 0x2969, 0x2aa9, 0x352f, 0x39c7, 0x3a36, 0x3d87, 0x384c, 0x33fd,
+	0x28e4, 0x1bb3, 0x2a8b, 0x2404, 0x2ace, 0x2c0d, 0x38f0, 0x3b25, 0x3b91, 0x4141, 0x39a6, 0x3556,
+	0x2a3d, 0x1d0d, 0x2be5, 0x2560, 0x2c2b, 0x2d6a, 0x3a4c, 0x3c82, 0x3cf0, 0x42a3, 0x3b0b, 0x391d,
+	0x2ba4, 0x20d2, 0x2d47, 0x291d, 0x2d85, 0x3122, 0x3ba5, 0x403b, 0x40ab, 0x4401, 0x3c6c, 0x3a82,
+	0x2d0b, 0x2238, 0x290a, 0x227d, 0x2942, 0x2a7e, 0x34ff, 0x3996, 0x3a06, 0x3d5a, 0x3824, 0x33d9,
+	0x28c2, 0x1b90, 0x2a62, 0x23d6, 0x2a9c, 0x2bd9, 0x38be, 0x3af6, 0x3b67, 0x411b, 0x3984, 0x3539,
+	0x2a23, 0x1cf3, 0x2bc9, 0x253e, 0x2c02, 0x2d3b, 0x3a19, 0x3c4d, 0x3cbb, 0x4270, 0x3adb, 0x38f1,
+	0x2b7e, 0x20b0, 0x2d27, 0x28fc, 0x2d5f, 0x30f4, 0x3b70, 0x4002, 0x4071, 0x43c8, 0x3c35, 0x3a4b,
+	0x2cd5, 0x2203, 0x30d7, 0x2a4b, 0x3111, 0x324c, 0x3ccc, 0x4162, 0x41d3, 0x452a, 0x3d97, 0x3bad,
+	0x3097, 0x2365, 0x3238, 0x2bad, 0x3273, 0x33af, 0x408e, 0x42c0, 0x432c, 0x48df, 0x4149, 0x3cff,
+	0x31eb, 0x24bb, 0x3391, 0x2d06, 0x33cc, 0x3507, 0x41e7, 0x441a, 0x4487, 0x4a3a, 0x42a4, 0x40bb,
+	0x3348, 0x2878, 0x34ec, 0x30bf, 0x3522, 0x38bc, 0x433c, 0x4572, 0x4843, 0x4b99, 0x4405, 0x421c,
+	0x34a8, 0x29d7, 0x30ab, 0x2a1d, 0x30df, 0x3217, 0x3c96, 0x412d, 0x419e, 0x44f3, 0x3d5d, 0x3b70,
+	0x3059, 0x2327, 0x31fb, 0x2b70, 0x3235, 0x3370, 0x4053, 0x428b, 0x42fe, 0x48b5, 0x4120, 0x3cd4,
+	0x31bb, 0x2489, 0x335d, 0x2cd2, 0x3397, 0x34d0, 0x41af, 0x43e4, 0x4455, 0x4a0d, 0x427b, 0x4092,
+	0x331d, 0x284b, 0x34bd, 0x308f, 0x34f1, 0x3889, 0x4307, 0x453b, 0x480d, 0x4b67, 0x43d7, 0x41f0,
+	0x3479, 0x29a4, 0x3073, 0x29e2, 0x30a4, 0x31df, 0x3c63, 0x40fd, 0x4172, 0x44cd, 0x3d3c, 0x3b55,
+	0x3040, 0x230d, 0x31dc, 0x2b4b, 0x320d, 0x3346, 0x4028, 0x425f, 0x42d0, 0x4887, 0x40f4, 0x3cac,
+	0x3199, 0x2469, 0x333d, 0x2cae, 0x336f, 0x34a5, 0x4183, 0x43ba, 0x442d, 0x49e6, 0x4254, 0x406d,
+	0x32f9, 0x2829, 0x349b, 0x306b, 0x34ca, 0x3860, 0x42de, 0x4516, 0x458c, 0x4b49, 0x43bb, 0x41d5,
+	0x3461, 0x298e, 0x305e, 0x29cd, 0x308d, 0x31c2, 0x3c40, 0x40d5, 0x4149, 0x44a4, 0x3d14, 0x3b2c,
+	0x3017, 0x22e3, 0x31b4, 0x2b24, 0x31e6, 0x331f, 0x3d9f, 0x4237, 0x42aa, 0x4864, 0x40d4, 0x3c8e,
+	0x3179, 0x2447, 0x3318, 0x2c88, 0x3349, 0x3480, 0x415e, 0x4393, 0x4404, 0x49bd, 0x422d, 0x4049,
+	0x32d7, 0x2807, 0x3479, 0x3047, 0x34a5, 0x3839, 0x42b5, 0x44ea, 0x455d, 0x4b17, 0x4388, 0x41a1,
+	0x342d, 0x295a, 0x302a, 0x2997, 0x3056, 0x318d, 0x3c0f, 0x40aa, 0x4121, 0x447d, 0x3ced, 0x3b05,
+	0x2d8e, 0x22ba, 0x318a, 0x2af9, 0x31b9, 0x32f0, 0x3d70, 0x4208, 0x427c, 0x4837, 0x40a6, 0x3c5e,
+	0x3148, 0x2414, 0x32e5, 0x2c54, 0x3314, 0x344a, 0x4128, 0x435e, 0x43d3, 0x4990, 0x4202, 0x401d,
+	0x32a7, 0x2572, 0x343e, 0x3009, 0x3466, 0x359b, 0x427a, 0x44b4, 0x452c, 0x4aed, 0x4363, 0x4181,
+	0x340d, 0x2938, 0x3002, 0x296b, 0x3025, 0x3159, 0x3bd8, 0x4070, 0x40e7, 0x4445, 0x3cb8, 0x3ad4,
+	0x2d61, 0x228d, 0x315a, 0x2ac3, 0x317e, 0x32b2, 0x3d31, 0x41cb, 0x4243, 0x4801, 0x4074, 0x3c2f,
+	0x311d, 0x23eb, 0x32bb, 0x2c26, 0x32e1, 0x3412, 0x40ed, 0x4324, 0x439a, 0x4959, 0x41ce, 0x3d8c,
+	0x327b, 0x254b, 0x341b, 0x2d87, 0x3440, 0x356f, 0x4247, 0x447b, 0x44f1, 0x4ab2, 0x4328, 0x4145,
+	0x33d1, 0x28fd, 0x2d6a, 0x2935, 0x2d90, 0x3124, 0x3ba2, 0x403b, 0x40b3, 0x4414, 0x3c8a, 0x3aa7,
+	0x2d33, 0x225e, 0x312b, 0x2a97, 0x3154, 0x328a, 0x3d08, 0x419e, 0x4212, 0x456f, 0x4042, 0x3bff,
+	0x30ed, 0x23bc, 0x328a, 0x2bf7, 0x32b3, 0x33e7, 0x40c3, 0x42f9, 0x436e, 0x492b, 0x419e, 0x3d5c,
+	0x324a, 0x2517, 0x33e4, 0x2d4c, 0x3406, 0x3539, 0x4218, 0x4453, 0x44cd, 0x4a8e, 0x4304, 0x4121,
+	0x33ae, 0x28da, 0x2d47, 0x290f, 0x2d68, 0x30fb, 0x3b7a, 0x4015, 0x408f, 0x43f0, 0x3c63, 0x3a7e,
+	0x2d08, 0x2232, 0x30fe, 0x2a68, 0x3123, 0x3256, 0x3cd6, 0x4171, 0x41ec, 0x454e, 0x4024, 0x3bdf,
+	0x30c9, 0x2392, 0x325e, 0x2bc8, 0x3282, 0x33b4, 0x4091, 0x42cb, 0x4346, 0x490a, 0x4183, 0x3d43,
+	0x3231, 0x24fc, 0x33c6, 0x2d2c, 0x33e4, 0x3514, 0x41ef, 0x4426, 0x449f, 0x4a64, 0x42df, 0x4100,
+	0x338d, 0x28b6, 0x2d1d, 0x28e0, 0x2d36, 0x30c7, 0x3b47, 0x3d84, 0x4061, 0x43c5, 0x3c3f, 0x3a60,
+	0x2cee, 0x2219, 0x30e2, 0x2a48, 0x30fe, 0x322f, 0x3cad, 0x4148, 0x41c1, 0x4523, 0x3d9a, 0x3bba,
+	0x30aa, 0x2379, 0x3246, 0x2bad, 0x3263, 0x3390, 0x406a, 0x42a0, 0x431a, 0x48dc, 0x4155, 0x3d16,
+	0x3205, 0x24d2, 0x339d, 0x2d02, 0x33b7, 0x34e4, 0x41be, 0x43f7, 0x4474, 0x4a3c, 0x42b8, 0x40da,
+	0x3368, 0x2893, 0x2cfc, 0x28c2, 0x2d18, 0x30a6, 0x3b22, 0x3d5a, 0x4034, 0x4397, 0x3c11, 0x3a31,
+	0x2cbf, 0x21e9, 0x30b3, 0x2a19, 0x30d1, 0x3201, 0x3c7d, 0x4115, 0x418e, 0x44f1, 0x3d69, 0x3b89,
+	0x3078, 0x2344, 0x320f, 0x2b75, 0x322b, 0x335a, 0x4035, 0x426d, 0x42e7, 0x48aa, 0x4124, 0x3ce6,
+	0x31d7, 0x24a4, 0x336f, 0x2cd4, 0x3388, 0x34b5, 0x4190, 0x43c7, 0x4441, 0x4a05, 0x427e, 0x409e,
+	0x332b, 0x2855, 0x2cbe, 0x2882, 0x2cd6, 0x3065, 0x3ae4, 0x3d21, 0x3d9f, 0x4365, 0x3bdf, 0x39fd,
+	0x2c88, 0x21b0, 0x3079, 0x29df, 0x3096, 0x31c7, 0x3c45, 0x40e0, 0x415d, 0x44c3, 0x3d3c, 0x3b5a,
+	0x3046, 0x2310, 0x31d9, 0x2b3e, 0x31f5, 0x3324, 0x3d9f, 0x4237, 0x42b3, 0x487a, 0x40f6, 0x3cb8,
+	0x31a5, 0x246d, 0x3331, 0x2c91, 0x3343, 0x3471, 0x414e, 0x438c, 0x440c, 0x49d8, 0x4258, 0x407d,
+	0x330b, 0x2832, 0x2c95, 0x2854, 0x2ca4, 0x3032, 0x3ab0, 0x3cee, 0x3d6e, 0x4336, 0x3bb3, 0x39d6,
+	0x2c65, 0x218f, 0x3054, 0x29b4, 0x3064, 0x3190, 0x3c0c, 0x40a9, 0x4129, 0x4492, 0x3d0f, 0x3b32,
+	0x3021, 0x22ed, 0x31b5, 0x2b16, 0x31c5, 0x32ee, 0x3d67, 0x4201, 0x4282, 0x484d, 0x40ce, 0x3c93,
+	0x3184, 0x2451, 0x3319, 0x2c7a, 0x3329, 0x3452, 0x4129, 0x4361, 0x43df, 0x49aa, 0x422c, 0x4051,
+	0x32e0, 0x2809, 0x2c6e, 0x282f, 0x2c7f, 0x300a, 0x3a85, 0x3cc0, 0x3d3f, 0x430a, 0x3b8b, 0x39b0,
+	0x2c3f, 0x2168, 0x302e, 0x298f, 0x3042, 0x3170, 0x3bec, 0x4086, 0x4102, 0x446a, 0x3ce8, 0x3b0d,
+	0x2d9e, 0x22cb, 0x3193, 0x2af5, 0x31a7, 0x32d3, 0x3d4d, 0x41e4, 0x4260, 0x4827, 0x40a4, 0x3c69,
+	0x315b, 0x2426, 0x32ec, 0x2c4b, 0x32f9, 0x3422, 0x40fe, 0x433b, 0x43bc, 0x4988, 0x4207, 0x402c,
+	0x32bb, 0x2585, 0x2c4a, 0x280a, 0x2c59, 0x2d84, 0x3a61, 0x3ca0, 0x3d21, 0x42eb, 0x3b68, 0x398a,
+	0x2c17, 0x213f, 0x3005, 0x2966, 0x3017, 0x3143, 0x3bbe, 0x405a, 0x40db, 0x4446, 0x3cc5, 0x3ae7,
+	0x2d74, 0x229b, 0x3160, 0x2ac0, 0x316f, 0x3299, 0x3d12, 0x41ae, 0x4230, 0x459e, 0x4081, 0x3c48,
+	0x3138, 0x2400, 0x32c3, 0x2c20, 0x32cd, 0x33f6, 0x40d0, 0x430b, 0x438b, 0x4959, 0x41dd, 0x4004,
+	0x3294, 0x255a, 0x2c1b, 0x2575, 0x2c20, 0x2d49, 0x3a25, 0x3c63, 0x3ce7, 0x42b4, 0x3b36, 0x395d,
+	0x2bed, 0x2116, 0x2d78, 0x2933, 0x2d80, 0x3109, 0x3b84, 0x4021, 0x40a3, 0x4410, 0x3c91, 0x3ab7,
+	0x2d49, 0x2274, 0x313b, 0x2a99, 0x3145, 0x326c, 0x3ce3, 0x417c, 0x41fc, 0x4569, 0x404c, 0x3c13,
+	0x3104, 0x23cd, 0x3290, 0x2beb, 0x3294, 0x33b9, 0x4091, 0x42cd, 0x4351, 0x4922, 0x41a9, 0x3d72,
+	0x3262, 0x2529, 0x2bea, 0x2545, 0x2bf1, 0x2d1a, 0x39f4, 0x3c31, 0x3cb4, 0x4282, 0x3b06, 0x392d,
+	0x2bbd, 0x20e5, 0x2d47, 0x2903, 0x2d50, 0x30d9, 0x3b52, 0x3d8d, 0x406e, 0x43db, 0x3c5d, 0x3a84,
+	0x2d15, 0x223f, 0x3102, 0x2a5c, 0x3106, 0x322d, 0x3ca5, 0x4141, 0x41c4, 0x4533, 0x4018, 0x3be1,
+	0x30d5, 0x23a0, 0x3263, 0x2bbd, 0x3267, 0x338d, 0x4066, 0x42a2, 0x4326, 0x48f5, 0x417a, 0x3d41,
+	0x3230, 0x24f8, 0x2bb9, 0x2513, 0x2bbd, 0x2ce4, 0x39be, 0x3bfd, 0x3c84, 0x4255, 0x3ad8, 0x38fe,
+	0x2b8d, 0x20b3, 0x2d14, 0x28d0, 0x2d1c, 0x30a5, 0x3b1f, 0x3d5e, 0x4043, 0x43b4, 0x3c39, 0x3a61,
+	0x2cf1, 0x2218, 0x30da, 0x2a36, 0x30e2, 0x3209, 0x3c82, 0x411d, 0x41a0, 0x4512, 0x3d99, 0x3bc4,
+	0x30b5, 0x237b, 0x3238, 0x2b8e, 0x3235, 0x3359, 0x4033, 0x4272, 0x42f9, 0x48ce, 0x4158, 0x3d25,
+	0x3217, 0x24de, 0x2b9b, 0x24f0, 0x2b96, 0x2cbc, 0x3998, 0x3bd9, 0x3c60, 0x4233, 0x3ab9, 0x38e3,
+	0x2b76, 0x209e, 0x2cff, 0x28b6, 0x2cfe, 0x3082, 0x3afb, 0x3d38, 0x401e, 0x4390, 0x3c15, 0x3a3f,
+	0x2cd1, 0x21fb, 0x30bd, 0x2a16, 0x30bb, 0x31db, 0x3c50, 0x40ec, 0x4173, 0x44e8, 0x3d72, 0x3b9e,
+	0x3091, 0x235a, 0x321c, 0x2b75, 0x321c, 0x333e, 0x4013, 0x424f, 0x42d4, 0x48a9, 0x4133, 0x3cfe,
+	0x31ef, 0x24b5, 0x2b73, 0x24ca, 0x2b72, 0x2c97, 0x396e, 0x3bab, 0x3c31, 0x4204, 0x3a8c, 0x38b7,
+	0x2b48, 0x206f, 0x2ccd, 0x2884, 0x2ccd, 0x3053, 0x3acc, 0x3d09, 0x3d8d, 0x435f, 0x3be6, 0x3a11,
+	0x2ca4, 0x21cd, 0x308e, 0x29e6, 0x308e, 0x31b3, 0x3c2b, 0x40c7, 0x414b, 0x44bb, 0x3d42, 0x3b6e,
+	0x3060, 0x2328, 0x31e6, 0x2b3a, 0x31dd, 0x32ff, 0x3d77, 0x4217, 0x42a0, 0x4876, 0x40ff, 0x3cca,
+	0x31ba, 0x2480, 0x2b3c, 0x2491, 0x2b35, 0x2c59, 0x3934, 0x3b76, 0x3c01, 0x41d7, 0x3a5f, 0x3887,
+	0x2b15, 0x203a, 0x2c97, 0x284d, 0x2c94, 0x3019, 0x3a92, 0x3cd1, 0x3d5a, 0x4330, 0x3bba, 0x39e4,
+	0x2c73, 0x2198, 0x3054, 0x29a8, 0x304a, 0x316b, 0x3be1, 0x407f, 0x4108, 0x4481, 0x3d10, 0x3b40,
+	0x3033, 0x22f8, 0x31b2, 0x2b03, 0x31a5, 0x32c6, 0x3d3e, 0x41dd, 0x4268, 0x4841, 0x40cf, 0x3c9f,
+	0x3192, 0x2457, 0x2b10, 0x2460, 0x2b00, 0x2c21, 0x38f9, 0x3b3a, 0x3bc4, 0x419c, 0x3a29, 0x3857,
+	0x2aeb, 0x2012, 0x2c6e, 0x281f, 0x2c60, 0x2d7f, 0x3a56, 0x3c95, 0x3d1f, 0x42f7, 0x3b84, 0x39b2,
+	0x2c47, 0x2170, 0x3030, 0x2985, 0x3028, 0x3146, 0x3bbb, 0x4057, 0x40df, 0x4458, 0x3ce6, 0x3b15,
+	0x300a, 0x22d1, 0x318d, 0x2ade, 0x317e, 0x329b, 0x3d0f, 0x41ac, 0x4237, 0x4812, 0x40a3, 0x3c74,
+	0x3168, 0x242d, 0x2ae8, 0x2439, 0x2adb, 0x2bfc, 0x38d3, 0x3b13, 0x3b9d, 0x4176, 0x3a03, 0x3832,
+	0x2ac6, 0x1d8d, 0x2c49, 0x259d, 0x2c41, 0x2d63, 0x3a3b, 0x3c79, 0x3d00, 0x42d6, 0x3b62, 0x3990,
+	0x2c25, 0x214d, 0x300a, 0x295c, 0x2d9c, 0x311a, 0x3b8f, 0x402c, 0x40b5, 0x442e, 0x3cbc, 0x3aec,
+	0x2d82, 0x22aa, 0x3167, 0x2ab9, 0x3159, 0x3278, 0x3cef, 0x4190, 0x421c, 0x4596, 0x4083, 0x3c50,
+	0x3142, 0x2407, 0x2ac2, 0x2413, 0x2ab5, 0x2bd5, 0x38ad, 0x3aef, 0x3b7c, 0x4156, 0x39e3, 0x380f,
+	0x2a9f, 0x1d62, 0x2c1c, 0x256e, 0x2c10, 0x2d31, 0x3a08, 0x3c48, 0x3cd4, 0x42af, 0x3b3e, 0x396d,
+	0x2bff, 0x2123, 0x2d7d, 0x292e, 0x2d71, 0x30f1, 0x3b69, 0x4008, 0x4093, 0x440f, 0x3ca0, 0x3ad2,
+	0x2d65, 0x2288, 0x313d, 0x2a88, 0x3124, 0x3241, 0x3cb7, 0x4159, 0x41e8, 0x4566, 0x4059, 0x3c2c,
+	0x3120, 0x23e4, 0x2a99, 0x23e3, 0x2a7e, 0x2b9b, 0x3873, 0x3ab8, 0x3b48, 0x4125, 0x39b5, 0x3586,
+	0x2a7b, 0x1d40, 0x2bf9, 0x2547, 0x2be3, 0x2d00, 0x39d6, 0x3c17, 0x3ca4, 0x4281, 0x3b11, 0x3942,
+	0x2bd6, 0x20fd, 0x2d57, 0x2904, 0x2d3e, 0x30b5, 0x3b25, 0x3d63, 0x4050, 0x43d0, 0x3c64, 0x3a99,
+	0x2d2f, 0x2256, 0x310f, 0x2a5c, 0x30f7, 0x3211, 0x3c84, 0x4122, 0x41b0, 0x4530, 0x4025, 0x3bf8,
+	0x30ec, 0x23b0, 0x2a67, 0x23b4, 0x2a51, 0x2b6e, 0x3843, 0x3a82, 0x3b0e, 0x40eb, 0x397d, 0x3550,
+	0x2a45, 0x1d09, 0x2bc1, 0x250e, 0x2bab, 0x2cc8, 0x399c, 0x3bda, 0x3c65, 0x4241, 0x3ad2, 0x3905,
+	0x2b9c, 0x20c4, 0x2d1e, 0x28cc, 0x2d0a, 0x3086, 0x3afc, 0x3d3b, 0x4028, 0x43a3, 0x3c35, 0x3a68,
+	0x2cfd, 0x2223, 0x30da, 0x2a25, 0x30bf, 0x31d9, 0x3c4e, 0x40f0, 0x4180, 0x4500, 0x3d93, 0x3bc5,
+	0x30b8, 0x237c, 0x3232, 0x2b7d, 0x3217, 0x3333, 0x400a, 0x424f, 0x42e1, 0x48c1, 0x4154, 0x3d24,
+	0x3215, 0x24d8, 0x338f, 0x2cdd, 0x337b, 0x3499, 0x4170, 0x43b2, 0x4442, 0x4a23, 0x42b7, 0x40e9,
+	0x337c, 0x289e, 0x34f4, 0x309e, 0x34d7, 0x3850, 0x42c2, 0x4502, 0x4593, 0x4b75, 0x440e, 0x4245,
+	0x34dc, 0x29ff, 0x38b3, 0x31fa, 0x3892, 0x39ab, 0x4421, 0x48c4, 0x4956, 0x4cda, 0x4571, 0x43a7,
+	0x389d, 0x2b60, 0x3214, 0x2b5b, 0x31f3, 0x330d, 0x3d84, 0x4228, 0x42ba, 0x489c, 0x4131, 0x3d05,
+	0x31fb, 0x24c0, 0x3376, 0x2cbf, 0x3356, 0x346e, 0x4140, 0x4381, 0x4412, 0x49f4, 0x428a, 0x40bf,
+	0x3356, 0x287c, 0x34d4, 0x307f, 0x34b9, 0x3831, 0x42a3, 0x44e4, 0x4574, 0x4b57, 0x43ef, 0x4225,
+	0x34bc, 0x29df, 0x3893, 0x31db, 0x3872, 0x3989, 0x43fb, 0x489c, 0x492e, 0x4cb3, 0x454c, 0x4383,
+	0x3879, 0x2b3b, 0x31ee, 0x2b34, 0x31cb, 0x32e3, 0x3d58, 0x41fb, 0x428c, 0x486f, 0x4106, 0x3cdc,
+	0x31d1, 0x2495, 0x3349, 0x2c92, 0x332b, 0x3446, 0x411c, 0x435f, 0x43ef, 0x49cf, 0x4265, 0x409b,
+	0x3332, 0x2858, 0x34ad, 0x3053, 0x3488, 0x359d, 0x426d, 0x44ad, 0x453e, 0x4b21, 0x43ba, 0x41f1,
+	0x3489, 0x29ae, 0x3863, 0x31a9, 0x383d, 0x3952, 0x43c5, 0x4868, 0x48fd, 0x4c83, 0x451b, 0x4350,
+	0x3844, 0x2b06, 0x31b9, 0x2b00, 0x3197, 0x32b0, 0x3d25, 0x41c9, 0x425e, 0x4843, 0x40db, 0x3caf,
+	0x31a2, 0x2463, 0x3315, 0x2c5c, 0x32f3, 0x340a, 0x40db, 0x431c, 0x43ae, 0x4994, 0x422e, 0x4065,
+	0x32fb, 0x281d, 0x3470, 0x3016, 0x344c, 0x3564, 0x4237, 0x4479, 0x450d, 0x4af3, 0x438f, 0x41c9,
+	0x3460, 0x2982, 0x3830, 0x3171, 0x3803, 0x3918, 0x438c, 0x4830, 0x48c5, 0x4c4d, 0x44ea, 0x4324,
+	0x381c, 0x2ade, 0x318e, 0x2ace, 0x315e, 0x3272, 0x3ce6, 0x418b, 0x4221, 0x4808, 0x40a2, 0x3c7a,
+	0x3172, 0x2436, 0x32e9, 0x2c2e, 0x32c2, 0x33d7, 0x40aa, 0x42ee, 0x4383, 0x496a, 0x4205, 0x403d,
+	0x32d4, 0x2599, 0x344d, 0x2d91, 0x3422, 0x3533, 0x4200, 0x443f, 0x44d3, 0x4abc, 0x435b, 0x4196,
+	0x3430, 0x2953, 0x3806, 0x3149, 0x357a, 0x38ed, 0x435d, 0x459e, 0x4894, 0x4c1d, 0x44bc, 0x42f6,
+	0x358d, 0x2aaf, 0x315f, 0x2aa3, 0x3138, 0x324f, 0x3cc3, 0x4166, 0x41fb, 0x4581, 0x407d, 0x3c56,
+	0x314e, 0x2410, 0x32c1, 0x2c05, 0x3298, 0x33ae, 0x407f, 0x42c0, 0x4352, 0x4937, 0x41d2, 0x400b,
+	0x32a5, 0x256b, 0x341e, 0x2d62, 0x33f5, 0x350a, 0x41de, 0x4421, 0x44b6, 0x4a9d, 0x4339, 0x4173,
+	0x340a, 0x292d, 0x357d, 0x311e, 0x354e, 0x38c2, 0x4336, 0x457d, 0x4875, 0x4bff, 0x449c, 0x42d5,
+	0x356a, 0x2a8a, 0x3139, 0x2a79, 0x310a, 0x321e, 0x3c91, 0x4138, 0x41d2, 0x455c, 0x4059, 0x3c31,
+	0x3125, 0x23e5, 0x3294, 0x2bd7, 0x326a, 0x3381, 0x4055, 0x429b, 0x4334, 0x4920, 0x41be, 0x3d98,
+	0x328e, 0x254e, 0x33fc, 0x2d3a, 0x33c9, 0x34da, 0x41aa, 0x43ec, 0x4484, 0x4a71, 0x4314, 0x4153,
+	0x33ed, 0x290e, 0x355a, 0x30f6, 0x3521, 0x3891, 0x4302, 0x4547, 0x4841, 0x4bcf, 0x4471, 0x42ae,
+	0x3547, 0x2a69, 0x3115, 0x2a53, 0x30e0, 0x31f1, 0x3c64, 0x410c, 0x41a6, 0x4532, 0x4032, 0x3c0d,
+	0x3106, 0x23c9, 0x3278, 0x2bb7, 0x3245, 0x3353, 0x4020, 0x4261, 0x42f8, 0x48e3, 0x4184, 0x3d60,
+	0x325b, 0x251f, 0x33d1, 0x2d12, 0x339f, 0x34ae, 0x417c, 0x43bd, 0x4454, 0x4a42, 0x42e4, 0x4123,
+	0x33bc, 0x28dd, 0x352a, 0x30c9, 0x34f6, 0x3866, 0x42d6, 0x4519, 0x4811, 0x4b9f, 0x4442, 0x4280,
+	0x3519, 0x2a3a, 0x30e6, 0x2a22, 0x30af, 0x31c0, 0x3c30, 0x40d4, 0x416b, 0x44f6, 0x3d96, 0x3bd2,
+	0x30cb, 0x238d, 0x323c, 0x2b7b, 0x320a, 0x331e, 0x3d91, 0x4236, 0x42ce, 0x48b8, 0x4157, 0x3d33,
+	0x322d, 0x24f0, 0x339e, 0x2cdc, 0x3367, 0x3476, 0x4145, 0x4388, 0x4420, 0x4a0d, 0x42af, 0x40ed,
+	0x3386, 0x28a9, 0x34f6, 0x3092, 0x34bc, 0x382a, 0x429a, 0x44e0, 0x457c, 0x4b6c, 0x440e, 0x4249,
+	0x34df, 0x29fd, 0x30a9, 0x29e7, 0x3075, 0x3187, 0x3bfa, 0x40a3, 0x4141, 0x44d1, 0x3d73, 0x3bae,
+	0x30a4, 0x2362, 0x320d, 0x2b4a, 0x31d7, 0x32e7, 0x3d56, 0x41f9, 0x4293, 0x4883, 0x4127, 0x3d06,
+	0x31ff, 0x24bf, 0x336a, 0x2ca5, 0x332f, 0x343f, 0x410f, 0x4355, 0x43f0, 0x49e1, 0x4288, 0x40ca,
+	0x3364, 0x2883, 0x34ca, 0x3061, 0x3489, 0x3598, 0x426a, 0x44b3, 0x4552, 0x4b45, 0x43ec, 0x422d,
+	0x34c8, 0x29e8, 0x3090, 0x29c7, 0x304c, 0x3158, 0x3bc8, 0x4070, 0x410d, 0x449e, 0x3d43, 0x3b82,
+	0x307c, 0x233e, 0x31ea, 0x2b25, 0x31ae, 0x32bb, 0x3d2b, 0x41d2, 0x4270, 0x4862, 0x4108, 0x3ce8,
+	0x31e2, 0x24a5, 0x3351, 0x2c8c, 0x3313, 0x341d, 0x40e8, 0x432a, 0x43c6, 0x49ba, 0x4263, 0x40a7,
+	0x3343, 0x2864, 0x34af, 0x3047, 0x346e, 0x3577, 0x4243, 0x4486, 0x4523, 0x4b16, 0x43bf, 0x4201,
+	0x349b, 0x29bb, 0x3065, 0x299e, 0x3028, 0x3137, 0x3ba8, 0x404f, 0x40ec, 0x447d, 0x3d23, 0x3b64,
+	0x305f, 0x2320, 0x31ca, 0x2b04, 0x318d, 0x329a, 0x3d07, 0x41a9, 0x4242, 0x4831, 0x40d6, 0x3cb8,
+	0x31b4, 0x2478, 0x3325, 0x2c5f, 0x32e6, 0x33f1, 0x40bf, 0x4304, 0x439f, 0x4991, 0x4237, 0x4078,
+	0x3312, 0x2832, 0x347c, 0x3014, 0x343b, 0x3547, 0x4218, 0x4461, 0x4501, 0x4af5, 0x439c, 0x41dc,
+	0x3474, 0x2992, 0x303a, 0x2972, 0x2d98, 0x3104, 0x3b74, 0x401a, 0x40b9, 0x444c, 0x3cf3, 0x3b32,
+	0x3029, 0x22e7, 0x318f, 0x2ac8, 0x3151, 0x325f, 0x3cd0, 0x4177, 0x4216, 0x480b, 0x40b4, 0x3c95,
+	0x318f, 0x244d, 0x32f3, 0x2c29, 0x32ad, 0x33b7, 0x4085, 0x42cb, 0x436a, 0x4960, 0x420c, 0x4052,
+	0x32ee, 0x280e, 0x3453, 0x2d85, 0x3405, 0x350d, 0x41da, 0x4421, 0x44c2, 0x4ab8, 0x4363, 0x41a6,
+	0x3442, 0x2961, 0x3007, 0x293b, 0x2d5e, 0x30c8, 0x3b39, 0x3d83, 0x4086, 0x441c, 0x3cc6, 0x3b08,
+	0x3002, 0x22c2, 0x316b, 0x2aa1, 0x3124, 0x322c, 0x3c97, 0x413b, 0x41d9, 0x456e, 0x4079, 0x3c5d,
+	0x3159, 0x241b, 0x32c5, 0x2bfb, 0x327e, 0x3385, 0x404f, 0x4293, 0x4332, 0x4929, 0x41d7, 0x401c,
+	0x32b8, 0x2576, 0x341b, 0x2d4f, 0x33d2, 0x34db, 0x41aa, 0x43f2, 0x4494, 0x4a8c, 0x4339, 0x417f,
+	0x341a, 0x2938, 0x2d7d, 0x290f, 0x2d32, 0x309c, 0x3b0a, 0x3d50, 0x404f, 0x43e4, 0x3c8e, 0x3ad2,
+	0x2d6f, 0x228f, 0x3136, 0x2a6b, 0x30ee, 0x31f9, 0x3c68, 0x4110, 0x41b0, 0x4546, 0x4050, 0x3c34,
+	0x3130, 0x23f1, 0x3299, 0x2bcc, 0x324d, 0x3354, 0x4021, 0x4269, 0x430b, 0x4903, 0x41b0, 0x3d96,
+	0x3292, 0x2552, 0x33f9, 0x2d2b, 0x33ab, 0x34b0, 0x417c, 0x43c4, 0x4468, 0x4a62, 0x430e, 0x4151,
+	0x33eb, 0x2907, 0x2d4c, 0x28e0, 0x2d03, 0x306d, 0x3add, 0x3d28, 0x402d, 0x43c9, 0x3c76, 0x3aba,
+	0x2d53, 0x226e, 0x3113, 0x2a46, 0x30c9, 0x31d2, 0x3c3f, 0x40e4, 0x4185, 0x451f, 0x402e, 0x3c16,
+	0x3113, 0x23d1, 0x3276, 0x2ba6, 0x3226, 0x332b, 0x3d97, 0x423e, 0x42df, 0x48da, 0x418b, 0x3d75,
+	0x3273, 0x2530, 0x33d1, 0x2cff, 0x337c, 0x3482, 0x4152, 0x439d, 0x4444, 0x4a40, 0x42f0, 0x4139,
+	0x33d6, 0x28f5, 0x2d38, 0x28c6, 0x2ce3, 0x3048, 0x3ab4, 0x3cfc, 0x3d9f, 0x4399, 0x3c47, 0x3a8d,
+	0x2d2a, 0x224a, 0x30f1, 0x2a23, 0x30a2, 0x31a6, 0x3c11, 0x40b9, 0x415c, 0x44f7, 0x4006, 0x3bed,
+	0x30ea, 0x23aa, 0x324f, 0x2b81, 0x31ff, 0x3302, 0x3d6b, 0x4211, 0x42b4, 0x48b1, 0x4163, 0x3d4e,
+	0x324c, 0x250b, 0x33ae, 0x2cdd, 0x335a, 0x345c, 0x4125, 0x436b, 0x440e, 0x4a09, 0x42b9, 0x4102,
+	0x339e, 0x28bc, 0x2cfe, 0x288d, 0x2cac, 0x3013, 0x3a82, 0x3ccb, 0x3d6f, 0x436a, 0x3c19, 0x3a60,
+	0x2cfd, 0x221b, 0x30bf, 0x29ef, 0x306e, 0x3174, 0x3be0, 0x4086, 0x4127, 0x44c1, 0x3d6f, 0x3bb7,
+	0x30b6, 0x2376, 0x321b, 0x2b4a, 0x31c6, 0x32c8, 0x3d32, 0x41da, 0x427e, 0x487a, 0x412a, 0x3d11,
+	0x320d, 0x24ca, 0x336b, 0x2c98, 0x3314, 0x3419, 0x40e7, 0x4334, 0x43de, 0x49df, 0x4291, 0x40d8,
+	0x3372, 0x288c, 0x2ccc, 0x2859, 0x2c75, 0x2d7a, 0x3a47, 0x3c91, 0x3d37, 0x4336, 0x3be7, 0x3a2f,
+	0x2cc9, 0x21e4, 0x3085, 0x29b2, 0x302f, 0x3133, 0x3b9f, 0x4049, 0x40ef, 0x448f, 0x3d43, 0x3b8e,
+	0x308c, 0x2348, 0x31e7, 0x2b11, 0x318a, 0x328c, 0x3cf7, 0x41a1, 0x4249, 0x484b, 0x4102, 0x3cf1,
+	0x31f2, 0x24af, 0x334e, 0x2c76, 0x32eb, 0x33ea, 0x40b3, 0x42fd, 0x43a5, 0x49a6, 0x425b, 0x40a6,
+	0x3345, 0x2864, 0x2ca4, 0x282f, 0x2c47, 0x2d47, 0x3a13, 0x3c5e, 0x3d08, 0x430a, 0x3bbf, 0x3a09,
+	0x2ca7, 0x21c5, 0x3068, 0x2996, 0x3010, 0x3110, 0x3b78, 0x401e, 0x40c4, 0x4464, 0x3d1a, 0x3b67,
+	0x3067, 0x2327, 0x31ca, 0x2af7, 0x3171, 0x326f, 0x3cd5, 0x417a, 0x421e, 0x481f, 0x40d6, 0x3cc4,
+	0x31c4, 0x2480, 0x3320, 0x2c4a, 0x32c3, 0x33c5, 0x4091, 0x42db, 0x4384, 0x4986, 0x423d, 0x408a,
+	0x3329, 0x2846, 0x2c85, 0x280f, 0x2c29, 0x2d2c, 0x39f8, 0x3c41, 0x3ce5, 0x42e3, 0x3b96, 0x39e1,
+	0x2c81, 0x219f, 0x3041, 0x296d, 0x2d87, 0x30e9, 0x3b54, 0x3d9d, 0x40a3, 0x4441, 0x3cf4, 0x3b3f,
+	0x303f, 0x22fd, 0x319f, 0x2ac9, 0x3140, 0x3240, 0x3cab, 0x4156, 0x4200, 0x4802, 0x40b8, 0x3ca4,
+	0x31a3, 0x2460, 0x32ff, 0x2c28, 0x329f, 0x339e, 0x4067, 0x42b2, 0x435c, 0x495f, 0x4214, 0x405e,
+	0x32f9, 0x2813, 0x2c51, 0x257a, 0x2bf3, 0x2cf5, 0x39c1, 0x3c0e, 0x3cba, 0x42be, 0x3b75, 0x39c0,
+	0x2c5b, 0x2174, 0x3010, 0x293a, 0x2d53, 0x30b4, 0x3b1f, 0x3d68, 0x4071, 0x4414, 0x3ccd, 0x3b1c,
+	0x301c, 0x22d8, 0x3174, 0x2a9a, 0x310f, 0x320c, 0x3c75, 0x411e, 0x41c7, 0x456b, 0x4085, 0x3c75,
+	0x3175, 0x2430, 0x32ca, 0x2bec, 0x325e, 0x335b, 0x4027, 0x4275, 0x4324, 0x492c, 0x41e6, 0x4034,
+	0x32d4, 0x258f, 0x2c2b, 0x254f, 0x2bc2, 0x2cbf, 0x3989, 0x3bd4, 0x3c7f, 0x4284, 0x3b3d, 0x398a,
+	0x2c2a, 0x2147, 0x2d86, 0x290e, 0x2d22, 0x307d, 0x3ae3, 0x3d2c, 0x4036, 0x43db, 0x3c96, 0x3ae5,
+	0x2d85, 0x22a2, 0x313f, 0x2a65, 0x30d8, 0x31d2, 0x3c38, 0x40e1, 0x418d, 0x4536, 0x4054, 0x3c46,
+	0x3148, 0x2404, 0x32a0, 0x2bc5, 0x3237, 0x3332, 0x3d99, 0x4241, 0x42eb, 0x48f1, 0x41ac, 0x3d9c,
+	0x329d, 0x2558, 0x2bf4, 0x2519, 0x2b8d, 0x2c8a, 0x3954, 0x3b9f, 0x3c4a, 0x424f, 0x3b09, 0x3958,
+	0x2bf8, 0x2115, 0x2d53, 0x28d9, 0x2cee, 0x304b, 0x3ab4, 0x3cfe, 0x4008, 0x43ac, 0x3c65, 0x3ab6,
+	0x2d58, 0x2277, 0x3116, 0x2a3c, 0x30ae, 0x31a9, 0x3c0f, 0x40b8, 0x4163, 0x4509, 0x4023, 0x3c13,
+	0x3112, 0x23cd, 0x3268, 0x2b8c, 0x31fe, 0x32fa, 0x3d65, 0x4214, 0x42c5, 0x48cf, 0x418c, 0x3d7a,
+	0x3277, 0x2530, 0x2bca, 0x24ee, 0x2b62, 0x2c61, 0x392c, 0x3b79, 0x3c26, 0x422f, 0x3aeb, 0x393a,
+	0x2bd8, 0x20f2, 0x2d2c, 0x28b0, 0x2cc4, 0x3021, 0x3a89, 0x3cd4, 0x3d81, 0x4389, 0x3c46, 0x3a99,
+	0x2d3a, 0x2255, 0x30ed, 0x2a0d, 0x307b, 0x3176, 0x3bde, 0x408c, 0x413c, 0x44e8, 0x4008, 0x3bfe,
+	0x3101, 0x23bd, 0x3256, 0x2b75, 0x31e1, 0x32d9, 0x3d41, 0x41ee, 0x429e, 0x48a8, 0x4166, 0x3d58,
+	0x3259, 0x2514, 0x2baf, 0x24d0, 0x2b3e, 0x2c37, 0x38fe, 0x3b4b, 0x3bfb, 0x4206, 0x3ac4, 0x3915,
+	0x2bb5, 0x20d1, 0x2d0d, 0x2891, 0x2ca1, 0x2d9a, 0x3a5f, 0x3ca8, 0x3d56, 0x4361, 0x3c21, 0x3a75,
+	0x2d18, 0x2234, 0x30d0, 0x29f2, 0x3061, 0x3159, 0x3bbc, 0x4063, 0x410f, 0x44b9, 0x3d7a, 0x3bce,
+	0x30d0, 0x238a, 0x3221, 0x2b41, 0x31af, 0x32a8, 0x3d10, 0x41bc, 0x426c, 0x4879, 0x4139, 0x3d2d,
+	0x322f, 0x24e8, 0x2b80, 0x249f, 0x2b0f, 0x2c0a, 0x38d3, 0x3b20, 0x3bcd, 0x41d5, 0x3a93, 0x38e5,
+	0x2b87, 0x20a3, 0x2cdd, 0x285e, 0x2c6d, 0x2d66, 0x3a2d, 0x3c77, 0x3d25, 0x432d, 0x3bea, 0x3a3d,
+	0x2cdf, 0x21fb, 0x3095, 0x29b4, 0x301f, 0x3115, 0x3b7b, 0x4029, 0x40db, 0x4489, 0x3d4b, 0x3b9f,
+	0x30a0, 0x235a, 0x31f2, 0x2b11, 0x317c, 0x3273, 0x3cda, 0x4187, 0x4239, 0x4848, 0x4108, 0x3cfa,
+	0x31f9, 0x24b0, 0x2b47, 0x2466, 0x2ad4, 0x2bcc, 0x3893, 0x3ae0, 0x3b92, 0x41a1, 0x3a63, 0x38b6,
+	0x2b56, 0x206e, 0x2ca4, 0x2822, 0x2c2f, 0x2d27, 0x39ee, 0x3c39, 0x3cea, 0x42f8, 0x3bbc, 0x3a14,
+	0x2cb9, 0x21d4, 0x306a, 0x2987, 0x2d90, 0x30e5, 0x3b4a, 0x3d95, 0x40a5, 0x4453, 0x3d17, 0x3b6e,
+	0x3073, 0x232d, 0x31c2, 0x2adc, 0x3143, 0x3237, 0x3c9e, 0x414d, 0x4202, 0x4813, 0x40d7, 0x3ccd,
+	0x31d0, 0x248a, 0x2b21, 0x243e, 0x2aa8, 0x2b9e, 0x3865, 0x3ab3, 0x3b65, 0x4174, 0x3a36, 0x388b,
+	0x2b2e, 0x2049, 0x2c83, 0x2803, 0x2c0e, 0x2d03, 0x39c7, 0x3c10, 0x3cc0, 0x42ce, 0x3b92, 0x39e9,
+	0x2c8c, 0x21a7, 0x303e, 0x295b, 0x2d63, 0x30b7, 0x3b1b, 0x3d67, 0x4079, 0x442c, 0x3cf3, 0x3b4c,
+	0x3051, 0x230b, 0x31a0, 0x2abb, 0x3125, 0x321a, 0x3c80, 0x412d, 0x41e0, 0x458f, 0x40b3, 0x3ca9,
+	0x31ac, 0x2466, 0x2afc, 0x2418, 0x2a82, 0x2b79, 0x383f, 0x3a8d, 0x3b3f, 0x414d, 0x3a10, 0x3865,
+	0x2b08, 0x2022, 0x2c59, 0x2575, 0x2bdf, 0x2cd5, 0x399b, 0x3be8, 0x3c9b, 0x42aa, 0x3b6e, 0x39c5,
+	0x2c69, 0x2185, 0x301c, 0x2939, 0x2d41, 0x3095, 0x3afa, 0x3d47, 0x405a, 0x440b, 0x3cd0, 0x3b26,
+	0x3027, 0x22de, 0x3172, 0x2a8b, 0x30f3, 0x31e6, 0x3c4d, 0x40fd, 0x41b5, 0x456a, 0x4090, 0x3c86,
+	0x3186, 0x243b, 0x2acd, 0x23e6, 0x2a50, 0x2b46, 0x380e, 0x3a5e, 0x3b14, 0x4127, 0x39ee, 0x3845,
+	0x2ae7, 0x1d9f, 0x2c32, 0x254b, 0x2bb3, 0x2ca8, 0x396d, 0x3bba, 0x3c6d, 0x427f, 0x3b47, 0x39a1,
+	0x2c46, 0x215f, 0x2d90, 0x2904, 0x2d06, 0x3056, 0x3aba, 0x3d09, 0x4020, 0x43d6, 0x3ca1, 0x3afe,
+	0x3005, 0x22bf, 0x3150, 0x2a65, 0x30c7, 0x31b6, 0x3c1b, 0x40cb, 0x4183, 0x4538, 0x4060, 0x3c59,
+	0x315d, 0x2417, 0x2aab, 0x23c2, 0x2a26, 0x2b16, 0x3578, 0x3a25, 0x3adb, 0x40f0, 0x39b8, 0x3811,
+	0x2ab5, 0x1d6e, 0x2c03, 0x251d, 0x2b81, 0x2c71, 0x3931, 0x3b7b, 0x3c30, 0x4245, 0x3b10, 0x396c,
+	0x2c13, 0x212e, 0x2d63, 0x28dc, 0x2ce1, 0x3030, 0x3a91, 0x3cdb, 0x3d8d, 0x43a1, 0x3c6c, 0x3ac8,
+	0x2d6e, 0x2286, 0x3117, 0x2a2d, 0x3091, 0x3182, 0x3be5, 0x4093, 0x4148, 0x44fd, 0x4026, 0x3c21,
+	0x3127, 0x23df, 0x2a71, 0x2387, 0x29ec, 0x2ae0, 0x3546, 0x39f5, 0x3aaa, 0x40bc, 0x3983, 0x357d,
+	0x2a82, 0x1d3d, 0x2bd1, 0x24ea, 0x2b50, 0x2c42, 0x3906, 0x3b54, 0x3c08, 0x421a, 0x3ae1, 0x393a,
+	0x2bde, 0x20f8, 0x2d2b, 0x28a1, 0x2ca2, 0x2d90, 0x3a53, 0x3ca3, 0x3d5d, 0x4375, 0x3c40, 0x3a9b,
+	0x2d3f, 0x2256, 0x30e7, 0x29fc, 0x305f, 0x3150, 0x3bb5, 0x4067, 0x4122, 0x44db, 0x4005, 0x3bff,
+	0x3100, 0x23b5, 0x2a44, 0x2359, 0x29be, 0x2ab0, 0x3515, 0x39c5, 0x3a7e, 0x4096, 0x3962, 0x355d,
+	0x2a60, 0x1d15, 0x2ba4, 0x24b8, 0x2b1a, 0x2c09, 0x38cd, 0x3b1c, 0x3bd4, 0x41ee, 0x3abd, 0x391d,
+	0x2bc4, 0x20dd, 0x2d0c, 0x287e, 0x2c7d, 0x2d6a, 0x3a2d, 0x3c7d, 0x3d36, 0x434f, 0x3c1d, 0x3a7d,
+	0x2d24, 0x223c, 0x30ca, 0x29da, 0x3037, 0x3123, 0x3b85, 0x4036, 0x40f2, 0x44ad, 0x3d7c, 0x3bd9,
+	0x30df, 0x2398, 0x2a28, 0x233a, 0x2999, 0x2a87, 0x34e9, 0x3999, 0x3a53, 0x406d, 0x393a, 0x3538,
+	0x2a3e, 0x1cf7, 0x2b8a, 0x24a0, 0x2b01, 0x2bef, 0x38af, 0x3afb, 0x3bb1, 0x41ca, 0x3a98, 0x38f7,
+	0x2b9f, 0x20b7, 0x2ce7, 0x2859, 0x2c57, 0x2d41, 0x3a00, 0x3c4d, 0x3d06, 0x4321, 0x3bf3, 0x3a54,
+	0x2cfc, 0x2215, 0x30a3, 0x29b4, 0x3012, 0x30ff, 0x3b62, 0x4012, 0x40cc, 0x4485, 0x3d53, 0x3bb1,
+	0x30b7, 0x2370, 0x29ff, 0x2311, 0x2971, 0x2a60, 0x34c3, 0x3972, 0x3a2a, 0x4041, 0x390d, 0x350a,
+	0x2a10, 0x1cc9, 0x2b5a, 0x246c, 0x2aca, 0x2bb6, 0x3876, 0x3ac4, 0x3b7d, 0x4197, 0x3a65, 0x38c4,
+	0x2b6b, 0x2085, 0x2cb6, 0x2828, 0x2c27, 0x2d12, 0x39d3, 0x3c23, 0x3cdd, 0x42f8, 0x3bc7, 0x3a25,
+	0x2cc9, 0x21df, 0x306c, 0x297c, 0x2d7a, 0x30c6, 0x3b28, 0x3d79, 0x4096, 0x4453, 0x3d24, 0x3b81,
+	0x3084, 0x2338, 0x29c3, 0x22d3, 0x2931, 0x2a20, 0x3484, 0x3934, 0x39f0, 0x400d, 0x38de, 0x34dd,
+	0x29e2, 0x1c98, 0x2b25, 0x2435, 0x2a93, 0x2b81, 0x3844, 0x3a93, 0x3b4d, 0x4168, 0x3a39, 0x389b,
+	0x2b44, 0x205b, 0x2c86, 0x2591, 0x2be8, 0x2cd0, 0x3990, 0x3be1, 0x3c9f, 0x42be, 0x3b92, 0x39f5,
+	0x2c9e, 0x21b6, 0x3041, 0x294d, 0x2d44, 0x308d, 0x3aee, 0x3d42, 0x4062, 0x4421, 0x3cf3, 0x3b53,
+	0x3059, 0x2310, 0x299e, 0x22ad, 0x2908, 0x29f2, 0x3453, 0x3903, 0x39c0, 0x3d7e, 0x38b1, 0x34b0,
+	0x29b6, 0x1c6d, 0x2afb, 0x240a, 0x2a64, 0x2b4b, 0x3809, 0x3a56, 0x3b11, 0x4131, 0x3a06, 0x386a,
+	0x2b14, 0x202c, 0x2c59, 0x2567, 0x2bc2, 0x2caa, 0x3969, 0x3bb8, 0x3c75, 0x4294, 0x3b69, 0x39cd
+)).tobytes()).cast("H")
+
+_MINUTES_PER_DAY: Final[int] = 1440
+
+
+def _build_solar_term_minutes(solar_term_data: memoryview, base_year: int) -> tuple[int, ...]:
+	"""Build the moments of the jeol, in minutes (KST) since the day before the ordinal 1 (`datetime.date.toordinal`), in chronological order.
+
+	Args:
+		solar_term_data (memoryview): Packed moments of the jeol, 12 per year
+		base_year (int): Year of the first row of **solar_term_data**
+
+	Returns:
+		tuple[int, ...]: `ordinal * 1440 + minute` of each jeol; len: `len(solar_term_data)`
+	"""
+	return tuple(
+		date(base_year + term_inx // 12, term_inx % 12 + 1, packed >> 11).toordinal() * _MINUTES_PER_DAY + (packed & 0x07FF)
+		for term_inx, packed in enumerate(solar_term_data)
+	)
+
+
+_SOLAR_TERM_MINUTES: Final[tuple[int, ...]] = _build_solar_term_minutes(SOLAR_TERM_DATA, SOLAR_TERM_BASE_YEAR)
+# Cycle index in the sexagenary cycle (see `batch`) of the month starting at the first jeol (Sohan 1000: 정축/丁丑)
+_MONTH_CYCLE_OFFSET: Final[int] = 13
+
+
+def _moment_minutes(moment: datetime) -> tuple[int, int]:
+	"""Get the ordinal of the day & the minutes since the day before the ordinal 1 of a moment, in KST.
+
+	Args:
+		moment (datetime): Moment (naive: in KST)
+
+	Raises:
+		ValueError: If **moment** is out of the supported range
+
+	Returns:
+		tuple[int, int]: Ordinal of the day (`datetime.date.toordinal`), and `ordinal * 1440 + minute of the day`
+	"""
+	if moment.tzinfo is not None:
+		moment = moment.astimezone(KST)
+	ordinal: int = moment.toordinal()
+	if not _MIN_ORDINAL <= ordinal <= _MAX_ORDINAL:
+		raise ValueError(f"moment is:{moment}\nShould be between: {date.fromordinal(_MIN_ORDINAL)} and {date.fromordinal(_MAX_ORDINAL)} (KST)")
+	return ordinal, ordinal * _MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def _solar_term_index(minutes: int) -> int:
+	"""Get the index in `_SOLAR_TERM_MINUTES` of the last jeol on or before the given (supported) moment.
+
+	Args:
+		minutes (int): Moment, as `ordinal * 1440 + minute of the day` (KST)
+
+	Returns:
+		int: Index of the jeol (`12 * (year - 1000) + month - 1` for the jeol of **month** in **year**)
+	"""
+	return bisect_right(_SOLAR_TERM_MINUTES, minutes) - 1
+
+
+def _month_cycle(term_inx: int) -> int:
+	"""Get the index in the sexagenary cycle of the month starting at the given jeol.
+
+	Args:
+		term_inx (int): Index of the jeol in `_SOLAR_TERM_MINUTES`
+
+	Returns:
+		int: Cycle index `n` (0: 갑자/甲子, ..., 59: 계해/癸亥), where `n % 10` is the cheongan & `n % 12` the ganji
+	"""
+	return (term_inx + _MONTH_CYCLE_OFFSET) % 60
+
+
+def solar_terms(year: int) -> tuple[datetime, ...]:
+	"""Get the moments of the 12 jeol (month starting solar terms) of a solar year (see `SOLAR_TERM_NAMES`).
+
+	Args:
+		year (int): Solar year (1000 ~ 2050)
+
+	Raises:
+		ValueError: If **year** is out of the table
+
+	Returns:
+		tuple[datetime, ...]: Moment (KST, to the minute) of each jeol, from Sohan (January) to Daeseol (December)
+
+	Examples:
+		```python
+		solar_terms(2025)[1] # => datetime.datetime(2025, 2, 3, 23, 10, tzinfo=datetime.timezone(datetime.timedelta(seconds=32400), 'KST')) (Ipchun)
+		```
+	"""
+	year_count: int = len(SOLAR_TERM_DATA) // 12
+	if not 0 <= year - SOLAR_TERM_BASE_YEAR < year_count:
+		raise ValueError(f"year is:{year}\nShould be between: {SOLAR_TERM_BASE_YEAR} and {SOLAR_TERM_BASE_YEAR + year_count - 1}")
+	term_inx: int = 12 * (year - SOLAR_TERM_BASE_YEAR)
+	return tuple(
+		datetime(year, month, packed >> 11, *divmod(packed & 0x07FF, 60), tzinfo=KST)
+		for month, packed in enumerate(SOLAR_TERM_DATA[term_inx:term_inx + 12], 1)
+	)
+
+
+def month_pillar(moment: datetime) -> Pillar:
+	"""Get the month pillar of a moment, the months being split at the jeol (month starting solar terms).
+
+	Naive datetimes are in Korea Standard Time, aware ones are converted to it.
+
+	Args:
+		moment (datetime): Moment (solar 1000/02/13 ~ 2050/12/31 in KST)
+
+	Raises:
+		ValueError: If **moment** is out of the supported range
+
+	Returns:
+		Pillar: Cheongan & ganji indexes of the month
+
+	Examples:
+		```python
+		month_pillar(datetime(2025, 2, 3, 23, 10)) # => Pillar(cheongan=4, ganji=2) (무인/戊寅, from Ipchun)
+		month_pillar(datetime(2025, 2, 3, 23, 9)) # => Pillar(cheongan=3, ganji=1) (정축/丁丑)
+		```
+	"""
+	month_cycle: int = _month_cycle(_solar_term_index(_moment_minutes(moment)[1]))
+	# `tuple.__new__` skips the keyword handling of the `NamedTuple` constructor
+	return tuple.__new__(Pillar, (month_cycle % 10, month_cycle % 12))
+
+
+class FourPillars(NamedTuple):
+	"""Four pillars (saju) indexes of a moment.
+
+	Attributes:
+		year (Pillar): Year gapja indexes (the year starting at Ipchun)
+		month (Pillar): Month gapja indexes (the months starting at the jeol)
+		day (Pillar): Day gapja indexes
+		hour (Pillar): Hour gapja indexes (12 double hours, from 23:00)
+	"""
+
+	year: Pillar
+	month: Pillar
+	day: Pillar
+	hour: Pillar
+
+
+def _year_cycle(term_inx: int) -> int:
+	"""Get the index in the sexagenary cycle of the year containing the given jeol, the year starting at Ipchun.
+
+	Args:
+		term_inx (int): Index of the jeol in `_SOLAR_TERM_MINUTES`
+
+	Returns:
+		int: Cycle index (as `_month_cycle`)
+	"""
+	# Ipchun of 1000 (경자/庚子 year, cycle index 36) is the jeol of index 1
+	return ((term_inx - 1) // 12 + 36) % 60
+
+
+def _hour_pillar(day: Pillar, hour: int) -> Pillar:
+	"""Get the gapja indexes of an hour, from the ones of its day.
+
+	The 23:00 ~ 24:00 hour (야자시) is the ja (子) hour of the next day: the day pillar does not change before midnight.
+
+	Args:
+		day (Pillar): Day gapja indexes
+		hour (int): Hour [0-23]
+
+	Returns:
+		Pillar: Hour gapja indexes
+	"""
+	# Index of the double hour from the ja (子) hour starting the day (12: the one starting the next day)
+	hour_inx: int = (hour + 1) // 2
+	return Pillar((day.cheongan % 5 * 2 + hour_inx) % 10, hour_inx % 12)
+
+
+def four_pillars(moment: datetime) -> FourPillars:
+	"""Get the four pillars (year, month, day & hour gapja indexes) of a moment.
+
+	The year starts at Ipchun and the months at the jeol (see `month_pillar`), at the minute of the term. Naive datetimes are in Korea Standard Time, aware ones are converted to it.
+
+	Args:
+		moment (datetime): Moment (solar 1000/02/13 ~ 2050/12/31 in KST)
+
+	Raises:
+		ValueError: If **moment** is out of the supported range
+
+	Returns:
+		FourPillars: Year, month, day & hour gapja indexes
+
+	Examples:
+		```python
+		four_pillars(datetime(2025, 2, 3, 23, 30))
+		# => FourPillars(year=Pillar(cheongan=1, ganji=5), month=Pillar(cheongan=4, ganji=2), day=Pillar(cheongan=9, ganji=3), hour=Pillar(cheongan=0, ganji=0)) (을사년 무인월 계묘일 갑자시)
+		```
+	"""
+	ordinal, minutes = _moment_minutes(moment)
+	term_inx: int = _solar_term_index(minutes)
+	year_cycle: int = _year_cycle(term_inx)
+	month_cycle: int = _month_cycle(term_inx)
+	day: Pillar = _day_pillar(ordinal - _ORDINAL_ABS_DAY_DIFF)
+	hour: int = (minutes - ordinal * _MINUTES_PER_DAY) // 60
+	return FourPillars(Pillar(year_cycle % 10, year_cycle % 12), Pillar(month_cycle % 10, month_cycle % 12), day, _hour_pillar(day, hour))
+
+
+# Julian day of the proleptic Gregorian ordinal 0 at midnight (`datetime.date.toordinal`)
+_ORDINAL_JULIAN_DAY: Final[float] = 1721424.5
+# Julian day of the J2000.0 epoch, & days per Julian millennium
+_J2000: Final[float] = 2451545.0
+_JULIAN_MILLENNIUM: Final[float] = 365250.0
+_TROPICAL_YEAR: Final[float] = 365.2422
+# Korea Standard Time: UTC+9
+_KST_OFFSET: Final[float] = 9 / 24
+
+# VSOP87 series of the heliocentric longitude (L0 ~ L5) & radius vector (R0 ~ R1) of the Earth, truncated (Meeus, appendix III):
+# `(A, B, C)` terms of `A * cos(B + C * tau)`, `tau` in Julian millennia since J2000.0; units of 1e-8 radian, resp. astronomical unit
+_EARTH_LONGITUDE_SERIES: Final[tuple[tuple[tuple[float, float, float], ...], ...]] = (
+	(
+		(175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517), (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231),
+		(3136, 3.6277, 77713.7715), (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698), (1273, 2.0371, 529.691),
+		(1199, 1.1096, 1577.3435), (990, 5.233, 5884.927), (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+		(753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523), (357, 2.92, 0.067), (317, 5.849, 11790.629),
+		(284, 1.899, 796.298), (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314), (205, 1.869, 5573.143),
+		(202, 2.458, 6069.777), (156, 0.833, 213.299), (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+		(103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114), (99, 6.21, 2146.17), (98, 0.68, 155.42),
+		(86, 5.98, 161000.69), (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15), (79, 3.04, 12036.46),
+		(75, 1.76, 5088.63), (74, 3.5, 3154.69), (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+		(61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5), (56, 3.47, 6279.55), (52, 0.19, 12139.55),
+		(52, 1.33, 1748.02), (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24), (41, 2.4, 19651.05),
+		(39, 6.17, 10447.39), (37, 6.04, 10213.29), (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+		(33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87), (25, 3.16, 4690.48),
+	),
+	(
+		(628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517), (425, 1.59, 3.523), (119, 5.796, 26.298),
+		(109, 2.966, 1577.344), (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15), (67, 4.41, 5507.55),
+		(59, 2.89, 5223.69), (56, 2.17, 155.42), (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+		(21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3), (17, 2.99, 6275.96), (16, 0.03, 2544.31),
+		(16, 1.43, 2146.17), (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63), (12, 5.27, 1194.45),
+		(12, 2.08, 4694), (11, 0.77, 553.57), (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+		(9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76), (6, 4.67, 4690.48),
+	),
+	(
+		(52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152), (27, 0.05, 3.52), (16, 5.19, 26.3),
+		(16, 3.68, 155.42), (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52), (5, 4.66, 1577.34),
+		(4, 1.03, 7.11), (4, 3.44, 5573.14), (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+		(3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57), (2, 4.38, 5223.69), (2, 3.75, 0.98),
+	),
+	((289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15), (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23), (1, 5.97, 242.73)),
+	((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15)),
+	((1, 3.14, 0),),
+)
+_EARTH_RADIUS_SERIES: Final[tuple[tuple[tuple[float, float, float], ...], ...]] = (
+	((100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517), (3084, 5.1985, 77713.7715), (1628, 1.1739, 5753.3849)),
+	((103019, 1.10749, 6283.07585), (1721, 1.0644, 12566.1517), (702, 3.142, 0)),
+)
+
+
+def _delta_t(year: float) -> float: # noqa: PLR0911
+	"""Get ΔT = TT - UT in seconds (polynomial expressions of Espenak & Meeus, 1000 ~ 2050).
+
+	Args:
+		year (float): Decimal year
+
+	Returns:
+		float: ΔT in seconds
+	"""
+	if year < 1600:
+		u: float = (year - 1000) / 100
+		return 1574.2 - 556.01 * u + 71.23472 * u**2 + 0.319781 * u**3 - 0.8503463 * u**4 - 0.005050998 * u**5 + 0.0083572073 * u**6
+	if year < 1700:
+		t: float = year - 1600
+		return 120 - 0.9808 * t - 0.01532 * t**2 + t**3 / 7129
+	if year < 1800:
+		t = year - 1700
+		return 8.83 + 0.1603 * t - 0.0059285 * t**2 + 0.00013336 * t**3 - t**4 / 1174000
+	if year < 1860:
+		t = year - 1800
+		return 13.72 - 0.332447 * t + 0.0068612 * t**2 + 0.0041116 * t**3 - 0.00037436 * t**4 + 0.0000121272 * t**5 - 0.0000001699 * t**6 + 0.000000000875 * t**7
+	if year < 1900:
+		t = year - 1860
+		return 7.62 + 0.5737 * t - 0.251754 * t**2 + 0.01680668 * t**3 - 0.0004473624 * t**4 + t**5 / 233174
+	if year < 1920:
+		t = year - 1900
+		return -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+	if year < 1941:
+		t = year - 1920
+		return 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3
+	if year < 1961:
+		t = year - 1950
+		return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+	if year < 1986:
+		t = year - 1975
+		return 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+	if year < 2005:
+		t = year - 2000
+		return 63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5
+	t = year - 2000
+	return 62.92 + 0.32217 * t + 0.005589 * t**2
+
+
+def _vsop87(series: tuple[tuple[tuple[float, float, float], ...], ...], tau: float) -> float:
+	"""Sum a truncated VSOP87 series: `sum(S_i * tau**i)`, `S_i` being the sum of the `A * cos(B + C * tau)` terms of the `i`-th part.
+
+	Args:
+		series (tuple[tuple[tuple[float, float, float], ...], ...]): Parts of the series
+		tau (float): Julian millennia since J2000.0
+
+	Returns:
+		float: Value of the series (in units of 1e-8)
+	"""
+	return sum(sum(a * math.cos(b + c * tau) for a, b, c in part) * tau**power for power, part in enumerate(series))
+
+
+def _apparent_solar_longitude(julian_ephemeris_day: float) -> float:
+	"""Get the apparent longitude of the Sun, referred to the mean equinox of the date.
+
+	Args:
+		julian_ephemeris_day (float): Julian ephemeris day (TT)
+
+	Returns:
+		float: Apparent solar longitude in degrees [0, 360)
+	"""
+	tau: float = (julian_ephemeris_day - _J2000) / _JULIAN_MILLENNIUM
+	t: float = 10 * tau
+	# Geocentric longitude, converted to the FK5 system
+	longitude: float = math.degrees(_vsop87(_EARTH_LONGITUDE_SERIES, tau) / 1e8) + 180 - 0.09033 / 3600
+	# Nutation in longitude (main terms, in arcseconds)
+	omega: float = math.radians(125.04452 - 1934.136261 * t)
+	sun_mean_longitude: float = math.radians(280.4665 + 36000.7698 * t)
+	moon_mean_longitude: float = math.radians(218.3165 + 481267.8813 * t)
+	nutation: float = -17.20 * math.sin(omega) - 1.32 * math.sin(2 * sun_mean_longitude) - 0.23 * math.sin(2 * moon_mean_longitude) + 0.21 * math.sin(2 * omega)
+	# Aberration (in arcseconds), depending on the distance to the Sun
+	aberration: float = -20.4898 / (_vsop87(_EARTH_RADIUS_SERIES, tau) / 1e8)
+	return (longitude + (nutation + aberration) / 3600) % 360
+
+
+def _solar_term_moment(year: int, month: int) -> tuple[int, int]:
+	"""Compute the moment (in KST) of the jeol of the given month, i.e. when the apparent solar longitude reaches `285° + 30° * (month - 1)`.
+
+	Args:
+		year (int): Solar year
+		month (int): Month of the jeol (1: Sohan, ..., 12: Daeseol)
+
+	Returns:
+		tuple[int, int]: Day of the month, and minute of the day (rounded to the nearest minute)
+	"""
+	longitude: float = (285 + 30 * (month - 1)) % 360
+	# Newton's method from the 6th of the month, the Sun moving ~1° per day
+	julian_ephemeris_day: float = _ORDINAL_JULIAN_DAY + date(year, month, 6).toordinal()
+	for _ in range(6):
+		julian_ephemeris_day += ((longitude - _apparent_solar_longitude(julian_ephemeris_day) + 180) % 360 - 180) * _TROPICAL_YEAR / 360
+	kst_days: float = julian_ephemeris_day - _delta_t(year + (month - 0.5) / 12) / 86400 + _KST_OFFSET - _ORDINAL_JULIAN_DAY
+	ordinal, minute = divmod(round(kst_days * _MINUTES_PER_DAY), _MINUTES_PER_DAY)
+	return date.fromordinal(ordinal).day, minute
+
+
+def _build_solar_term_data(years: range) -> "array[int]":
+	"""Compute the packed moments of the jeol of the given years (see `SOLAR_TERM_DATA`).
+
+	Args:
+		years (range): Solar years
+
+	Returns:
+		array[int]: Packed moments of the jeol, 12 per year
+	"""
+	return array("H", (day << 11 | minute for year in years for day, minute in (_solar_term_moment(year, month) for month in range(1, 13))))
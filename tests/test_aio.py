@@ -0,0 +1,112 @@
+"""Test `korean_lunar_calendar.aio`."""
+
+import asyncio
+import datetime
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from korean_lunar_calendar.aio import aconvert_iter, aconvert_many
+from korean_lunar_calendar.korean_lunar_calendar import (
+	LunarDate,
+	SolarDate,
+	from_date,
+	ordinal_to_solar,
+	to_solar,
+)
+
+START: datetime.date = datetime.date(1000, 2, 13)
+DATES: list[datetime.date] = [START + datetime.timedelta(days=offset) for offset in range(0, 383827, 997)]
+
+
+async def _aiter(dates: Iterable[SolarDate | LunarDate | datetime.date]) -> AsyncIterator[SolarDate | LunarDate | datetime.date]:
+	for date in dates:
+		await asyncio.sleep(0)
+		yield date
+
+
+async def _collect(converted: AsyncIterator[LunarDate | SolarDate]) -> list[LunarDate | SolarDate]:
+	return [date async for date in converted]
+
+
+class TestAConvertMany:
+
+	@pytest.mark.parametrize("executor_factory", [None, partial(ThreadPoolExecutor, 2), partial(ProcessPoolExecutor, 2)])
+	@pytest.mark.parametrize("chunksize, max_in_flight", [(7, 1), (7, 3), (1000, 2)])
+	def test_order(self, executor_factory:Callable[[], Executor] | None, chunksize:int, max_in_flight:int) -> None:
+		expected = [from_date(date) for date in DATES]
+		if executor_factory is None:
+			assert asyncio.run(aconvert_many(DATES, chunksize, None, max_in_flight)) == expected
+			assert asyncio.run(_collect(aconvert_iter(_aiter(DATES), chunksize, None, max_in_flight))) == expected
+			return
+		with executor_factory() as executor:
+			assert asyncio.run(aconvert_many(DATES, chunksize, executor, max_in_flight)) == expected
+			assert asyncio.run(_collect(aconvert_iter(_aiter(DATES), chunksize, executor, max_in_flight))) == expected
+
+	def test_mixed(self) -> None:
+		dates:list[SolarDate|LunarDate|datetime.date] = [SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True), datetime.date(2025, 7, 25)]
+		assert asyncio.run(aconvert_many(dates, chunksize=2)) == [LunarDate(2025, 6, 1, True), SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True)]
+		assert asyncio.run(aconvert_many([])) == []
+
+	def test_yields_between_chunks(self) -> None:
+		ticks: list[int] = []
+
+		async def ticker() -> None:
+			for tick in itertools.count():
+				ticks.append(tick)
+				await asyncio.sleep(0)
+
+		async def convert() -> list[int]:
+			task = asyncio.create_task(ticker())
+			await asyncio.sleep(0)
+			ticks_per_chunk: list[int] = []
+			async for _ in aconvert_iter(DATES, chunksize=len(DATES) // 4):
+				ticks_per_chunk.append(len(ticks))
+			task.cancel()
+			return ticks_per_chunk
+
+		ticks_per_chunk = asyncio.run(convert())
+		# The other task runs between the chunks
+		assert ticks_per_chunk[-1] > ticks_per_chunk[0]
+
+	@pytest.mark.parametrize("with_executor", [False, True])
+	def test_backpressure(self, with_executor:bool) -> None:
+		consumed: list[LunarDate] = []
+
+		def lunar_dates() -> Iterable[LunarDate]:
+			for lunar_date in itertools.cycle([LunarDate(2025, 1, 1), LunarDate(2025, 6, 1, True)]):
+				consumed.append(lunar_date)
+				yield lunar_date
+
+		async def first(executor:Executor | None) -> list[LunarDate | SolarDate]:
+			converted = aconvert_iter(lunar_dates(), chunksize=3, executor=executor, max_in_flight=2)
+			res = [await anext(converted) for _ in range(5)]
+			await converted.aclose()
+			return res
+
+		if with_executor:
+			with ThreadPoolExecutor(1) as executor:
+				res = asyncio.run(first(executor))
+		else:
+			res = asyncio.run(first(None))
+		assert res == [to_solar(LunarDate(2025, 1, 1)), SolarDate(2025, 7, 25)] * 2 + [to_solar(LunarDate(2025, 1, 1))]
+		# Infinite input: only the consumed chunks (and the ones in flight) are read
+		assert len(consumed) <= 3 * 3
+
+	def test_invalid_date(self) -> None:
+		dates = [ordinal_to_solar(ordinal) for ordinal in range(700000, 700010)] + [SolarDate(2025, 2, 29)]
+		with pytest.raises(ValueError, match="solar_date"):
+			asyncio.run(aconvert_many(dates, chunksize=4))
+		with ThreadPoolExecutor(2) as executor, pytest.raises(TypeError, match="date is"):
+			asyncio.run(aconvert_many([(2025, 1, 1)], executor=executor)) # type: ignore[list-item]
+
+	@pytest.mark.parametrize("chunksize, max_in_flight, match", [(0, 1, "chunksize"), (1, 0, "max_in_flight")])
+	def test_invalid_args(self, chunksize:int, max_in_flight:int, match:str) -> None:
+		# Raised on call, not on iteration
+		with pytest.raises(ValueError, match=match):
+			aconvert_iter([], chunksize=chunksize, max_in_flight=max_in_flight)
+		with pytest.raises(ValueError, match=match):
+			asyncio.run(aconvert_many([], chunksize=chunksize, max_in_flight=max_in_flight))
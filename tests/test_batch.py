@@ -0,0 +1,189 @@
+"""Test `korean_lunar_calendar.batch`."""
+
+import datetime
+
+import pytest
+
+from korean_lunar_calendar import korean_lunar_calendar
+from korean_lunar_calendar.korean_lunar_calendar import (
+	DateCheck,
+	KoreanLunarCalendar,
+	LunarDate,
+	SolarDate,
+	check_lunar_date,
+	check_solar_date,
+	from_date,
+	gap_ja,
+	gap_ja_string,
+)
+from korean_lunar_calendar.solar_terms import four_pillars, month_pillar, solar_terms
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("korean_lunar_calendar.batch")
+
+
+def _solar_sample() -> list[datetime.date]:
+	start = datetime.date(1000, 2, 13)
+	end = datetime.date(2050, 12, 31)
+	return [start + datetime.timedelta(days=offset) for offset in range(0, (end - start).days + 1, 37)] + [end]
+
+
+class TestBatch:
+
+	klc:KoreanLunarCalendar
+
+	def setup_method(self):
+		self.klc = KoreanLunarCalendar()
+
+	def test_solar_to_lunar_matches_scalar(self) -> None:
+		dates = _solar_sample()
+		lunar_dates, valid = batch.solar_to_lunar([d.year for d in dates], [d.month for d in dates], [d.day for d in dates])
+		assert valid.all()
+		for solar_date, lunar_date in zip(dates, lunar_dates):
+			self.klc.set_solar_date(solar_date.year, solar_date.month, solar_date.day)
+			assert tuple(lunar_date.tolist()) == (self.klc.lunar_year, self.klc.lunar_month, self.klc.lunar_day, self.klc.is_intercalation)
+
+	def test_lunar_to_solar_matches_scalar(self) -> None:
+		month_starts = KoreanLunarCalendar.LUNAR_MONTH_STARTS[::7]
+		lunar_dates = [(month_start.year, month_start.month, 1 + i % 29, month_start.is_intercalation) for i, month_start in enumerate(month_starts)]
+		lunar_dates = [lunar_date for lunar_date in lunar_dates if lunar_date[0] * 10000 + lunar_date[1] * 100 + lunar_date[2] <= KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE]
+		solar_dates, valid = batch.lunar_to_solar(*zip(*lunar_dates))
+		assert valid.all()
+		for lunar_date, solar_date in zip(lunar_dates, solar_dates):
+			self.klc.set_lunar_date(*lunar_date)
+			assert tuple(solar_date.tolist()) == (self.klc.solar_year, self.klc.solar_month, self.klc.solar_day)
+
+	@pytest.mark.parametrize("year, month, day, res", [
+		(1000, 2, 13, (True, (1000, 1, 1, False))),
+		(1000, 2, 12, (False, (0, 0, 0, False))),
+		(2025, 2, 29, (False, (0, 0, 0, False))),
+		(2024, 2, 29, (True, (2024, 1, 20, False))),
+		(2025, 13, 1, (False, (0, 0, 0, False))),
+		(2025, 7, 25, (True, (2025, 6, 1, True))),
+		(2050, 12, 31, (True, (2050, 11, 18, False))),
+		(2051, 1, 1, (False, (0, 0, 0, False))),
+	])
+	def test_solar_to_lunar_validity(self, year:int, month:int, day:int, res:tuple[bool, tuple[int, int, int, bool]]) -> None:
+		lunar_dates, valid = batch.solar_to_lunar([year], [month], [day])
+		assert (bool(valid[0]), tuple(lunar_dates[0].tolist())) == res
+
+	@pytest.mark.parametrize("year, month, day, is_intercalation, res", [
+		(1000, 1, 1, False, (True, (1000, 2, 13))),
+		(999, 12, 29, False, (False, (0, 0, 0))),
+		(2025, 6, 1, True, (True, (2025, 7, 25))),
+		(2025, 6, 30, True, (False, (0, 0, 0))),
+		(2025, 6, 30, False, (True, (2025, 7, 24))),
+		(2025, 5, 1, True, (False, (0, 0, 0))),
+		(2025, 1, 31, False, (False, (0, 0, 0))),
+		(2050, 11, 18, False, (True, (2050, 12, 31))),
+		(2050, 11, 19, False, (False, (0, 0, 0))),
+	])
+	def test_lunar_to_solar_validity(self, year:int, month:int, day:int, is_intercalation:bool, res:tuple[bool, tuple[int, int, int]]) -> None:
+		solar_dates, valid = batch.lunar_to_solar([year], [month], [day], [is_intercalation])
+		assert (bool(valid[0]), tuple(solar_dates[0].tolist())) == res
+
+	def test_broadcast(self) -> None:
+		lunar_dates, valid = batch.solar_to_lunar(2025, [1, 7], [29, 25])
+		assert lunar_dates.dtype == batch.LUNAR_DTYPE
+		assert valid.tolist() == [True, True]
+		assert [tuple(lunar_date.tolist()) for lunar_date in lunar_dates] == [(2025, 1, 1, False), (2025, 6, 1, True)]
+
+	def test_gap_ja_matches_scalar(self) -> None:
+		dates = _solar_sample()
+		gap_ja_inx, valid = batch.gap_ja([d.toordinal() for d in dates])
+		assert valid.all()
+		assert gap_ja_inx.dtype == batch.GAP_JA_DTYPE
+		for solar_date, inx in zip(dates, gap_ja_inx):
+			assert tuple(inx.tolist()) == tuple(value for pillar in gap_ja(from_date(solar_date)) for value in pillar)
+
+	@pytest.mark.parametrize("gapja_type", ["KR", "CN"])
+	def test_gap_ja_strings_matches_scalar(self, gapja_type:str) -> None:
+		dates = _solar_sample()
+		gap_ja_str, valid = batch.gap_ja_strings(np.array([d.toordinal() for d in dates]), gapja_type)
+		assert valid.all()
+		assert gap_ja_str.tolist() == [gap_ja_string(from_date(solar_date), gapja_type) for solar_date in dates]
+
+	def test_gap_ja_validity(self) -> None:
+		ordinals = [datetime.date(1000, 2, 12).toordinal(), datetime.date(2025, 7, 25).toordinal(), datetime.date(2051, 1, 1).toordinal()]
+		gap_ja_inx, valid = batch.gap_ja(ordinals)
+		assert valid.tolist() == [False, True, False]
+		assert [tuple(inx.tolist()) for inx in gap_ja_inx] == [(0,) * 6, (1, 5, 9, 7, 1, 7), (0,) * 6]
+		gap_ja_str, valid = batch.gap_ja_strings(ordinals)
+		assert valid.tolist() == [False, True, False]
+		assert gap_ja_str.tolist() == ["", "을사년 계미월 을미일 (윤월)", ""]
+		with pytest.raises(ValueError, match="gapja_type"):
+			batch.gap_ja_strings(ordinals, "JP")
+
+	def test_month_pillars_matches_scalar(self) -> None:
+		moments = [datetime.datetime.combine(d, datetime.time(hour)) for d in _solar_sample() for hour in (0, 12, 23)]
+		pillars, valid = batch.month_pillars(np.array(moments, dtype="datetime64[m]"))
+		assert valid.all()
+		assert pillars.dtype == batch.PILLAR_DTYPE
+		assert [tuple(pillar.tolist()) for pillar in pillars] == [month_pillar(moment) for moment in moments]
+		# Ipchun 2025: 2025/02/03 23:10 KST
+		pillars, valid = batch.month_pillars(np.array(["1000-02-12T23:59", "2025-02-03T23:09", "2025-02-03T23:10", "NaT", "2051-01-01"], dtype="datetime64[m]"))
+		assert valid.tolist() == [False, True, True, False, False]
+		assert [tuple(pillar.tolist()) for pillar in pillars] == [(0, 0), (3, 1), (4, 2), (0, 0), (0, 0)]
+
+	def test_four_pillars_matches_scalar(self) -> None:
+		moments = [datetime.datetime.combine(d, datetime.time(hour, 59)) for d in _solar_sample() for hour in (0, 1, 12, 22, 23)]
+		moments += [term.replace(tzinfo=None) + datetime.timedelta(minutes=offset) for year in (1001, 1582, 2024, 2050) for term in solar_terms(year)[1:] for offset in (-1, 0)]
+		pillars, valid = batch.four_pillars(np.array(moments, dtype="datetime64[s]"))
+		assert valid.all()
+		assert pillars.dtype == batch.FOUR_PILLARS_DTYPE
+		assert [tuple(inx.tolist()) for inx in pillars] == [tuple(value for pillar in four_pillars(moment) for value in pillar) for moment in moments]
+		pillars, valid = batch.four_pillars(np.array(["1000-02-12T23:59", "2025-02-03T23:30", "NaT", "2051-01-01"], dtype="datetime64[m]"))
+		assert valid.tolist() == [False, True, False, False]
+		assert [tuple(inx.tolist()) for inx in pillars] == [(0,) * 8, (1, 5, 4, 2, 9, 3, 0, 0), (0,) * 8, (0,) * 8]
+
+	def test_gap_ja_strings_locale(self, monkeypatch:pytest.MonkeyPatch) -> None:
+		monkeypatch.setattr(korean_lunar_calendar, "_GAP_JA_LOCALES", dict(korean_lunar_calendar._GAP_JA_LOCALES))
+		korean_lunar_calendar.register_gap_ja_locale("XX", korean_lunar_calendar.GapJaLocale.from_characters("abcdefghij", "ABCDEFGHIJKL", "YMD", "*"))
+		gap_ja_str, _ = batch.gap_ja_strings([datetime.date(2025, 7, 25).toordinal()], "XX")
+		assert gap_ja_str.tolist() == ["bFY jHM bHD*"]
+
+	def test_parse_iso_matches_scalar(self) -> None:
+		dates = _solar_sample()
+		solar_dates, valid = batch.parse_solar_iso([d.isoformat() for d in dates])
+		assert valid.all()
+		assert [tuple(solar_date.tolist()) for solar_date in solar_dates] == [(d.year, d.month, d.day) for d in dates]
+		lunar_texts = [from_date(d).iso_format() for d in dates]
+		lunar_dates, valid = batch.parse_lunar_iso(np.array(lunar_texts))
+		assert valid.all()
+		assert [tuple(lunar_date.tolist()) for lunar_date in lunar_dates] == [tuple(from_date(d)) for d in dates]
+
+	def test_parse_iso_validity(self) -> None:
+		texts = ["2025-06-01 Intercalation", "2025-07-25", "2025-05-01 Intercalation", "2025-02-29", "2025-02-30", "20250725", "2025-7-25", "2051-01-01", "2025-06-01 Intercalation!", "", "x" * 40]
+		lunar_dates, valid = batch.parse_lunar_iso(texts)
+		assert valid.tolist() == [True, True, False, True, False, False, False, False, False, False, False]
+		assert tuple(lunar_dates[0].tolist()) == (2025, 6, 1, True)
+		assert tuple(lunar_dates[2].tolist()) == (0, 0, 0, False)
+		solar_dates, valid = batch.parse_solar_iso(texts)
+		assert valid.tolist() == [False, True, False, False, False, False, False, False, False, False, False]
+		assert tuple(solar_dates[1].tolist()) == (2025, 7, 25)
+		solar_dates, valid = batch.parse_solar_iso([["2025-07-25"], ["2025-02-29"]])
+		assert valid.shape == solar_dates.shape == (2, 1)
+		assert valid.tolist() == [[True], [False]]
+		solar_date, valid = batch.parse_solar_iso("2025-07-25")
+		assert bool(valid) and tuple(solar_date.tolist()) == (2025, 7, 25)
+
+	def test_check_lunar_matches_scalar(self) -> None:
+		lunar_dates = [
+			LunarDate(year, month, day, is_intercalation)
+			for year in (999, 1000, 2025, 2050, 2051) for month in (0, 1, 2, 5, 6, 11, 12, 13) for day in (0, 1, 18, 19, 29, 30, 31) for is_intercalation in (False, True)
+		]
+		checks = batch.check_lunar(*zip(*lunar_dates))
+		assert checks.tolist() == [check_lunar_date(lunar_date) for lunar_date in lunar_dates]
+		assert batch.validate_lunar(*zip(*lunar_dates)).tolist() == [check is DateCheck.VALID for check in map(check_lunar_date, lunar_dates)]
+
+	def test_check_solar_matches_scalar(self) -> None:
+		solar_dates = [
+			SolarDate(year, month, day) for year in (999, 1000, 2024, 2025, 2050, 2051) for month in (0, 1, 2, 4, 12, 13) for day in (0, 1, 12, 13, 28, 29, 30, 31, 32)
+		]
+		checks = batch.check_solar(*zip(*solar_dates))
+		assert checks.tolist() == [check_solar_date(solar_date) for solar_date in solar_dates]
+		assert batch.validate_solar(*zip(*solar_dates)).tolist() == [check is DateCheck.VALID for check in map(check_solar_date, solar_dates)]
+
+	def test_check_broadcast(self) -> None:
+		assert batch.check_lunar(2025, [5, 6], 1, True).tolist() == [DateCheck.INVALID_INTERCALATION, DateCheck.VALID]
+		assert batch.validate_solar(2025, 2, np.arange(27, 31)).tolist() == [True, True, False, False]
@@ -0,0 +1,62 @@
+"""Test `korean_lunar_calendar.cache`."""
+
+import datetime
+
+import pytest
+
+from korean_lunar_calendar.cache import CachedConverter, CacheInfo
+from korean_lunar_calendar.korean_lunar_calendar import LunarDate, SolarDate
+
+
+class TestCachedConverter:
+
+	def test_hits_misses(self) -> None:
+		converter = CachedConverter(maxsize=8)
+		assert converter.to_lunar(SolarDate(2025, 7, 25)) == LunarDate(2025, 6, 1, True)
+		assert converter.to_lunar(SolarDate(2025, 7, 25)) == LunarDate(2025, 6, 1, True)
+		assert converter.to_solar(LunarDate(2025, 6, 1, True)) == SolarDate(2025, 7, 25)
+		assert converter.from_date(datetime.date(2025, 7, 25)) == LunarDate(2025, 6, 1, True)
+		assert converter.to_date(LunarDate(2025, 6, 1, True)) == datetime.date(2025, 7, 25)
+		assert converter.cache_info() == CacheInfo(hits=1, misses=4, evictions=0, maxsize=8, currsize=4)
+
+	def test_direction_in_key(self) -> None:
+		converter = CachedConverter()
+		# Same fields, different conversions
+		assert converter.to_lunar(SolarDate(2025, 1, 29)) == LunarDate(2025, 1, 1)
+		assert converter.to_solar(LunarDate(2025, 1, 29)) == SolarDate(2025, 2, 26)
+		assert converter.cache_info().hits == 0
+
+	def test_eviction(self) -> None:
+		converter = CachedConverter(maxsize=2)
+		converter.to_lunar(SolarDate(2025, 1, 1))
+		converter.to_lunar(SolarDate(2025, 1, 2))
+		# Refresh 2025-01-01, so that 2025-01-02 is the least recently used
+		converter.to_lunar(SolarDate(2025, 1, 1))
+		converter.to_lunar(SolarDate(2025, 1, 3))
+		assert converter.cache_info() == CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+		converter.to_lunar(SolarDate(2025, 1, 1))
+		assert converter.cache_info() == CacheInfo(hits=2, misses=3, evictions=1, maxsize=2, currsize=2)
+		converter.to_lunar(SolarDate(2025, 1, 2))
+		assert converter.cache_info() == CacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2)
+
+	@pytest.mark.parametrize("maxsize, res", [(0, 0), (None, 50)])
+	def test_maxsize(self, maxsize:int|None, res:int) -> None:
+		converter = CachedConverter(maxsize=maxsize)
+		for day in range(1, 51):
+			converter.to_date(LunarDate(2025, 1 + day // 30, 1 + day % 29))
+		assert converter.cache_info().currsize == res
+
+	def test_invalid(self) -> None:
+		converter = CachedConverter()
+		with pytest.raises(ValueError, match="solar_date"):
+			converter.to_lunar(SolarDate(2025, 2, 29))
+		with pytest.raises(ValueError, match="non-negative integer"):
+			CachedConverter(maxsize=-1)
+		assert converter.cache_info() == CacheInfo(hits=0, misses=1, evictions=0, maxsize=4096, currsize=0)
+
+	def test_cache_clear(self) -> None:
+		converter = CachedConverter()
+		converter.to_lunar(SolarDate(2025, 1, 1))
+		converter.to_lunar(SolarDate(2025, 1, 1))
+		converter.cache_clear()
+		assert converter.cache_info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=4096, currsize=0)
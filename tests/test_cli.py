@@ -0,0 +1,115 @@
+"""Test `korean_lunar_calendar.cli`."""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from korean_lunar_calendar.cli import convert_values, main
+
+
+class TestConvertValues:
+
+	@pytest.mark.parametrize("value, gapja_types, res", [
+		("1000-02-13", (), ("1000-01-01", False)),
+		("2025-07-25", ("KR", "CN"), ("2025-06-01", True, "을사년 계미월 을미일 (윤월)", "乙巳年 癸未月 乙未日 (閏月)")),
+		("2050-12-31", ("CN",), ("2050-11-18", False, "庚午年 戊子月 乙酉日")),
+		("1000-02-12", (), None),
+		("2051-01-01", (), None),
+		("2025-02-29", (), None),
+		("", (), None),
+		(None, (), None),
+		# Extended iso formats accepted by `datetime.date.fromisoformat` since Python 3.11
+		("20250725", (), None),
+		("2025-W30-5", (), None),
+		("2025-07-25T00:00", (), None),
+	])
+	def test_convert_values(self, value:str, gapja_types:tuple[str, ...], res:tuple|None) -> None:
+		assert convert_values([value], gapja_types) == [res]
+
+
+class TestMain:
+
+	@pytest.fixture
+	def csv_path(self, tmp_path:pathlib.Path) -> pathlib.Path:
+		path = tmp_path / "dates.csv"
+		path.write_text('name,day\nfoo,2025-07-25\n"b,ar",2051-01-01\nbaz,1000-02-13\n', encoding="utf-8")
+		return path
+
+	@pytest.mark.parametrize("errors, res", [
+		("skip", "name,day,lunar,leap\nfoo,2025-07-25,2025-06-01,true\nbaz,1000-02-13,1000-01-01,false\n"),
+		("blank", 'name,day,lunar,leap\nfoo,2025-07-25,2025-06-01,true\n"b,ar",2051-01-01,,\nbaz,1000-02-13,1000-01-01,false\n'),
+	])
+	def test_csv(self, tmp_path:pathlib.Path, csv_path:pathlib.Path, errors:str, res:str) -> None:
+		output = tmp_path / "out.csv"
+		# Chunks smaller than the file
+		assert main([str(csv_path), "-o", str(output), "-d", "day", "--lunar-column", "lunar", "--intercalation-column", "leap", "--errors", errors, "--chunk-size", "2"]) == 0
+		assert output.read_text(encoding="utf-8") == res
+
+	@pytest.mark.parametrize("errors", ["strict", "skip", "blank"])
+	def test_csv_empty_lines(self, tmp_path:pathlib.Path, errors:str) -> None:
+		# Empty lines are skipped, as in JSONL files
+		path = tmp_path / "dates.csv"
+		path.write_text("\ndate,name\n2025-07-25,a\n\n2050-12-31,b\n\n", encoding="utf-8")
+		output = tmp_path / "out.csv"
+		assert main([str(path), "-o", str(output), "--errors", errors, "--chunk-size", "1"]) == 0
+		assert output.read_text(encoding="utf-8") == "date,name,lunar_date,is_intercalation\n2025-07-25,a,2025-06-01,true\n2050-12-31,b,2050-11-18,false\n"
+
+	def test_csv_multiple_files(self, tmp_path:pathlib.Path) -> None:
+		for name, day in (("a.csv", "2025-01-29"), ("b.csv", "2025-10-06")):
+			(tmp_path / name).write_text(f"date\n{day}\n", encoding="utf-8")
+		output = tmp_path / "out.csv"
+		assert main([str(tmp_path / "a.csv"), str(tmp_path / "b.csv"), "-o", str(output), "--gapja"]) == 0
+		assert output.read_text(encoding="utf-8") == "date,lunar_date,is_intercalation,gapja\n2025-01-29,2025-01-01,false,을사년 무인월 무술일\n2025-10-06,2025-08-15,false,을사년 을유월 무신일\n"
+
+	def test_jsonl(self, tmp_path:pathlib.Path) -> None:
+		path = tmp_path / "dates.jsonl"
+		path.write_text('{"id": 1, "date": "2025-07-25"}\n\n{"id": 2, "date": 20250725}\n', encoding="utf-8")
+		output = tmp_path / "out.jsonl"
+		assert main([str(path), "-o", str(output), "-f", "jsonl", "--chinese-gapja", "--errors", "blank"]) == 0
+		assert [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()] == [
+			{"id": 1, "date": "2025-07-25", "lunar_date": "2025-06-01", "is_intercalation": True, "chinese_gapja": "乙巳年 癸未月 乙未日 (閏月)"},
+			{"id": 2, "date": 20250725, "lunar_date": None, "is_intercalation": None, "chinese_gapja": None},
+		]
+
+	@pytest.mark.parametrize("args, content, match", [
+		([], "date\n2025-07-25\n2025-02-29\n", "record 2: date is:'2025-02-29'"),
+		([], "date\n2025-07-25\n20250725\n", "record 2: date is:'20250725'"),
+		# Records are numbered without the empty lines
+		([], "date\n2025-07-25\n\n2025-02-29\n", "record 2: date is:'2025-02-29'"),
+		(["-d", "day"], "date\n2025-07-25\n", "date_column is:'day'"),
+		(["-f", "jsonl"], '["2025-07-25"]\n', "Should be: a JSON object"),
+	])
+	def test_invalid(self, tmp_path:pathlib.Path, capsys:pytest.CaptureFixture[str], args:list[str], content:str, match:str) -> None:
+		path = tmp_path / "dates.txt"
+		path.write_text(content, encoding="utf-8")
+		assert main([str(path), "-o", str(tmp_path / "out.txt"), *args]) == 1
+		assert match in capsys.readouterr().err
+
+	@pytest.mark.parametrize("fmt, content", [
+		("csv", "date\n" + "".join(f"{1000 + year}-03-01\n" for year in range(1051))),
+		("jsonl", "".join(f'{{"date": "{1000 + year}-03-01"}}\n' for year in range(1051))),
+	])
+	def test_workers(self, tmp_path:pathlib.Path, fmt:str, content:str) -> None:
+		path = tmp_path / "dates.txt"
+		path.write_text(content, encoding="utf-8")
+		for workers in ("1", "2"):
+			assert main([str(path), "-o", str(tmp_path / f"out_{workers}.txt"), "-f", fmt, "--gapja", "--chunk-size", "100", "--workers", workers]) == 0
+		assert (tmp_path / "out_1.txt").read_text(encoding="utf-8") == (tmp_path / "out_2.txt").read_text(encoding="utf-8")
+
+	def test_workers_invalid(self, tmp_path:pathlib.Path, capsys:pytest.CaptureFixture[str]) -> None:
+		path = tmp_path / "dates.csv"
+		path.write_text("date\n" + "2025-01-01\n" * 250 + "2025-02-29\n" + "2025-01-01\n" * 10, encoding="utf-8")
+		output = tmp_path / "out.csv"
+		assert main([str(path), "-o", str(output), "--chunk-size", "100", "--workers", "2"]) == 1
+		assert "record 251: date is:'2025-02-29'" in capsys.readouterr().err
+		# The header & the records preceding the invalid one are written
+		assert output.read_text(encoding="utf-8").splitlines()[1:] == ["2025-01-01,2024-12-02,false"] * 250
+
+	def test_stdin_stdout(self) -> None:
+		env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(pathlib.Path(__file__).parents[1] / "src"), os.environ.get("PYTHONPATH", "")]))
+		result = subprocess.run([sys.executable, "-m", "korean_lunar_calendar"], input=b"date\n2025-07-25\n", capture_output=True, env=env, check=True)
+		assert result.stdout.decode() == "date,lunar_date,is_intercalation\n2025-07-25,2025-06-01,true\n"
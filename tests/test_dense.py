@@ -0,0 +1,64 @@
+"""Test `korean_lunar_calendar.dense`."""
+
+import datetime
+import pathlib
+
+import pytest
+
+from korean_lunar_calendar.dense import DAY_COUNT, DenseTable
+from korean_lunar_calendar.korean_lunar_calendar import LunarDate, SolarDate, from_date
+
+
+class TestDenseTable:
+
+	table:DenseTable
+
+	@classmethod
+	def setup_class(cls):
+		cls.table = DenseTable.build()
+
+	def test_build(self) -> None:
+		assert len(self.table) == DAY_COUNT
+		start = datetime.date(1000, 2, 13)
+		for offset in range(0, DAY_COUNT, 13):
+			solar_date = start + datetime.timedelta(days=offset)
+			assert self.table.from_date(solar_date) == from_date(solar_date)
+
+	@pytest.mark.parametrize("solar_date, res", [
+		(SolarDate(1000, 2, 13), LunarDate(1000, 1, 1)),
+		(SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True)),
+		(SolarDate(2050, 12, 31), LunarDate(2050, 11, 18)),
+	])
+	def test_to_lunar(self, solar_date:SolarDate, res:LunarDate) -> None:
+		assert self.table.to_lunar(solar_date) == res
+
+	@pytest.mark.parametrize("solar_date", [SolarDate(1000, 2, 12), SolarDate(2051, 1, 1), SolarDate(2025, 2, 29)])
+	def test_to_lunar_invalid(self, solar_date:SolarDate) -> None:
+		with pytest.raises(ValueError):
+			self.table.to_lunar(solar_date)
+
+	@pytest.mark.parametrize("use_mmap", [True, False])
+	def test_save_load(self, tmp_path:pathlib.Path, use_mmap:bool) -> None:
+		path = tmp_path / "lunar.bin"
+		self.table.save(path)
+		assert path.stat().st_size == 8 + 4 * DAY_COUNT
+		with DenseTable.load(path, use_mmap=use_mmap) as table:
+			assert len(table) == DAY_COUNT
+			for ordinal in (datetime.date(1000, 2, 13).toordinal(), datetime.date(2025, 7, 25).toordinal(), datetime.date(2050, 12, 31).toordinal()):
+				assert table.from_ordinal(ordinal) == self.table.from_ordinal(ordinal)
+
+	def test_load_invalid(self, tmp_path:pathlib.Path) -> None:
+		path = tmp_path / "lunar.bin"
+		path.write_bytes(b"not a table")
+		with pytest.raises(ValueError, match="path"):
+			DenseTable.load(path)
+
+	@pytest.mark.parametrize("use_mmap", [True, False])
+	@pytest.mark.parametrize("size", [3, 4 * DAY_COUNT - 4, 4 * DAY_COUNT + 1])
+	def test_load_truncated(self, tmp_path:pathlib.Path, use_mmap:bool, size:int) -> None:
+		path = tmp_path / "lunar.bin"
+		self.table.save(path)
+		with path.open("r+b") as f:
+			f.truncate(8 + size)
+		with pytest.raises(ValueError, match="path"):
+			DenseTable.load(path, use_mmap=use_mmap)
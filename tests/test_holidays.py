@@ -0,0 +1,81 @@
+"""Test `korean_lunar_calendar.holidays`."""
+
+import pytest
+
+from korean_lunar_calendar.holidays import (
+	LUNAR_HOLIDAYS,
+	Holiday,
+	holidays,
+	lunar_anniversaries,
+)
+from korean_lunar_calendar.korean_lunar_calendar import LunarDate, SolarDate, to_solar
+
+
+class TestHolidays:
+
+	def test_holidays(self) -> None:
+		assert holidays(range(2025, 2026)) == [
+			Holiday("Seollal", LunarDate(2025, 1, 1), SolarDate(2025, 1, 29)),
+			Holiday("Buddha's Birthday", LunarDate(2025, 4, 8), SolarDate(2025, 5, 5)),
+			Holiday("Chuseok", LunarDate(2025, 8, 15), SolarDate(2025, 10, 6)),
+		]
+
+	def test_holidays_match_to_solar(self) -> None:
+		years = range(1000, 2051)
+		res = holidays(iter(years))
+		assert len(res) == len(years) * len(LUNAR_HOLIDAYS)
+		assert [holiday.lunar_date for holiday in res] == [LunarDate(year, month, day) for year in years for _, month, day in LUNAR_HOLIDAYS]
+		assert all(holiday.solar_date == to_solar(holiday.lunar_date) for holiday in res)
+
+	def test_custom_holidays(self) -> None:
+		assert holidays([2025], [("Dano", 5, 5)]) == [Holiday("Dano", LunarDate(2025, 5, 5), to_solar(LunarDate(2025, 5, 5)))]
+		assert holidays([], [("Dano", 5, 5)]) == []
+
+	@pytest.mark.parametrize("years, lunar_holidays", [
+		(range(2050, 2052), LUNAR_HOLIDAYS),
+		(range(999, 1001), LUNAR_HOLIDAYS),
+		(range(2025, 2026), [("Month 13", 13, 1)]),
+		(range(2025, 2026), [("Day 30", 1, 30)]),
+	])
+	def test_holidays_invalid(self, years:range, lunar_holidays:list[tuple[str, int, int]]) -> None:
+		with pytest.raises(ValueError):
+			holidays(years, lunar_holidays)
+
+
+class TestLunarAnniversaries:
+
+	@pytest.mark.parametrize("lunar_date", [
+		LunarDate(1950, 3, 10),
+		LunarDate(2025, 6, 29, True),
+		LunarDate(2025, 6, 30),
+		LunarDate(2025, 7, 30),
+		LunarDate(1000, 1, 1),
+	])
+	@pytest.mark.parametrize("overflow", ["clip", "next"])
+	def test_matches_add_lunar_years(self, lunar_date:LunarDate, overflow:str) -> None:
+		years = range(1000, 2050)
+		assert lunar_anniversaries(lunar_date, years, overflow=overflow) == [  # type: ignore[arg-type]
+			to_solar(lunar_date.add_lunar_years(year - lunar_date.year, overflow=overflow)) for year in years  # type: ignore[arg-type]
+		]
+
+	def test_policies(self) -> None:
+		# 2025 has a 6th intercalation month of 29 days, 2026 none, & its 6th month has 30 days
+		assert lunar_anniversaries(LunarDate(2025, 6, 29, True), [2025, 2026]) == [to_solar(LunarDate(2025, 6, 29, True)), to_solar(LunarDate(2026, 6, 29))]
+		assert lunar_anniversaries(LunarDate(2026, 6, 30), [2025]) == [to_solar(LunarDate(2025, 6, 30))]
+		assert lunar_anniversaries(LunarDate(2025, 7, 30), [2026]) == [to_solar(LunarDate(2026, 7, 29))]
+		assert lunar_anniversaries(LunarDate(2025, 7, 30), [2026], overflow="next") == [to_solar(LunarDate(2026, 8, 1))]
+		with pytest.raises(ValueError, match="intercalation='raise'"):
+			lunar_anniversaries(LunarDate(2025, 6, 29, True), [2025, 2026], intercalation="raise")
+		with pytest.raises(ValueError, match="overflow='raise'"):
+			lunar_anniversaries(LunarDate(2025, 7, 30), [2026], overflow="raise")
+
+	@pytest.mark.parametrize("lunar_date, years", [
+		(LunarDate(2025, 2, 30), [2025]),
+		(LunarDate(2025, 5, 1, True), [2025]),
+		(LunarDate(2025, 12, 1), [2050]),
+		(LunarDate(2025, 1, 1), [2051]),
+		(LunarDate(2025, 1, 1), [999]),
+	])
+	def test_invalid(self, lunar_date:LunarDate, years:list[int]) -> None:
+		with pytest.raises(ValueError):
+			lunar_anniversaries(lunar_date, years)
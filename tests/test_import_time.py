@@ -0,0 +1,82 @@
+"""Test the import time of `korean_lunar_calendar` (`python -X importtime`)."""
+
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from korean_lunar_calendar import KoreanLunarCalendar, korean_lunar_calendar
+
+# Budget of the self import time of the `korean_lunar_calendar` modules (their dependencies excluded), relative to the one of
+# reference stdlib modules imported in the same run, so that it holds on slower or loaded machines (~2.3 on an idle one)
+IMPORT_TIME_REFERENCE_MODULES: tuple[str, ...] = ("argparse", "dataclasses", "fractions")
+IMPORT_TIME_BUDGET_RATIO: float = 4.0
+# Absolute budget in microseconds, in place of the relative one (e.g. to tune it on a given CI runner)
+IMPORT_TIME_BUDGET_ENV: str = "KLC_IMPORT_BUDGET_US"
+# Best of several runs, to smooth out the noise of a loaded machine
+IMPORT_TIME_RUNS: int = 5
+
+
+def _run(tmp_path:pathlib.Path, code:str, *options:str) -> subprocess.CompletedProcess[str]:
+	"""Run **code** in a fresh interpreter, with its bytecode cached under **tmp_path** (as an installed package)."""
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(pathlib.Path(__file__).parents[1] / "src"), os.environ.get("PYTHONPATH", "")]))
+	env.pop("PYTHONDONTWRITEBYTECODE", None)
+	return subprocess.run(
+		[sys.executable, "-X", f"pycache_prefix={tmp_path}", *options, "-c", code], capture_output=True, text=True, env=env, check=True,
+	)
+
+
+def _self_import_times(stderr:str) -> dict[str, int]:
+	"""Parse the self import time (in microseconds) of each module from the output of `-X importtime`."""
+	times: dict[str, int] = {}
+	for line in stderr.splitlines():
+		self_us, _, name = line.removeprefix("import time:").split("|")
+		if self_us.strip().isdigit():
+			times[name.strip()] = int(self_us)
+	return times
+
+
+class TestImportTime:
+
+	def test_import_time_budget(self, tmp_path:pathlib.Path) -> None:
+		code = f"import {', '.join(IMPORT_TIME_REFERENCE_MODULES)}, korean_lunar_calendar"
+		# The first run caches the bytecode
+		_run(tmp_path, code)
+		package_times: list[int] = []
+		reference_times: list[int] = []
+		for _ in range(IMPORT_TIME_RUNS):
+			times = _self_import_times(_run(tmp_path, code, "-X", "importtime").stderr)
+			if not set(IMPORT_TIME_REFERENCE_MODULES) <= set(times):
+				pytest.skip(f"reference modules already imported at startup: {IMPORT_TIME_REFERENCE_MODULES}")
+			package_times.append(sum(us for name, us in times.items() if name.startswith("korean_lunar_calendar")))
+			reference_times.append(sum(times[name] for name in IMPORT_TIME_REFERENCE_MODULES))
+		assert min(package_times) > 0
+		budget_us: str | None = os.environ.get(IMPORT_TIME_BUDGET_ENV)
+		if budget_us is not None:
+			assert min(package_times) < int(budget_us)
+		else:
+			assert min(package / reference for package, reference in zip(package_times, reference_times)) < IMPORT_TIME_BUDGET_RATIO
+
+	def test_import_is_lazy(self, tmp_path:pathlib.Path) -> None:
+		code = (
+			"import sys, korean_lunar_calendar\n"
+			"print(type(vars(korean_lunar_calendar.KoreanLunarCalendar)['LUNAR_MONTH_STARTS']).__name__)\n"
+			"print(sorted({'numpy', 'argparse', 'asyncio', 'concurrent.futures', 'korean_lunar_calendar.batch', 'korean_lunar_calendar.instrumentation'} & set(sys.modules)))\n"
+		)
+		assert _run(tmp_path, code).stdout.splitlines() == ["_LazyClassAttribute", "[]"]
+
+	def test_lunar_month_starts(self, monkeypatch:pytest.MonkeyPatch) -> None:
+		lazy_month_starts = korean_lunar_calendar._LazyClassAttribute(korean_lunar_calendar._build_lunar_month_starts)
+		monkeypatch.setattr(KoreanLunarCalendar, "LUNAR_MONTH_STARTS", lazy_month_starts)
+		lazy_month_starts.__set_name__(KoreanLunarCalendar, "LUNAR_MONTH_STARTS")
+		year = 2025
+		month_starts = KoreanLunarCalendar.LUNAR_MONTH_STARTS
+		# Built once, then stored on the class in place of the descriptor
+		assert vars(KoreanLunarCalendar)["LUNAR_MONTH_STARTS"] is month_starts
+		assert KoreanLunarCalendar().LUNAR_MONTH_STARTS is month_starts
+		assert month_starts[0] == korean_lunar_calendar.LunarMonthStart(1, 1000, 1, False)
+		assert korean_lunar_calendar.LunarMonthStart(KoreanLunarCalendar.LUNAR_YEAR_START_DAYS[year - 1000] + 1, year, 1, False) in month_starts
+		assert [month_start.abs_days for month_start in month_starts] == list(KoreanLunarCalendar.LUNAR_MONTH_START_DAYS)
+		assert [(month_start.month, month_start.is_intercalation) for month_start in month_starts if month_start.year == year][5:8] == [(6, False), (6, True), (7, False)]
@@ -0,0 +1,119 @@
+"""Test `korean_lunar_calendar.instrumentation`."""
+
+import datetime
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from korean_lunar_calendar import korean_lunar_calendar
+from korean_lunar_calendar.instrumentation import (
+	enable_counters,
+	get_counters,
+	reset_counters,
+	set_profiler,
+)
+from korean_lunar_calendar.korean_lunar_calendar import (
+	KoreanLunarCalendar,
+	LunarDate,
+	SolarDate,
+	gap_ja_string,
+	parse_lunar_iso_many,
+	to_lunar,
+	to_solar,
+)
+
+
+@pytest.fixture(autouse=True)
+def _disable_instrumentation() -> Iterator[None]:
+	yield
+	set_profiler(None)
+	enable_counters(False)
+	reset_counters()
+
+
+class TestInstrumentation:
+
+	def test_disabled_by_default(self) -> None:
+		assert korean_lunar_calendar._instrumentation is None
+		to_lunar(SolarDate(2025, 7, 25))
+		assert get_counters() == {}
+
+	def test_counters(self) -> None:
+		enable_counters()
+		assert to_lunar(SolarDate(2025, 7, 25)) == LunarDate(2025, 6, 1, True)
+		to_lunar(SolarDate(2025, 7, 26))
+		with pytest.raises(ValueError, match="lunar_date"):
+			to_solar(LunarDate(2025, 5, 1, True))
+		counters = get_counters()
+		assert set(counters) == {"to_lunar", "to_solar"}
+		assert counters["to_lunar"][:2] == (2, 0)
+		assert counters["to_solar"][:2] == (1, 1)
+		assert all(stats.total_ns > 0 for stats in counters.values())
+		# Kept while disabled, until reset
+		enable_counters(False)
+		assert korean_lunar_calendar._instrumentation is None
+		to_lunar(SolarDate(2025, 7, 25))
+		assert get_counters() == counters
+		reset_counters()
+		assert get_counters() == {}
+
+	def test_methods(self) -> None:
+		enable_counters()
+		calendar = KoreanLunarCalendar()
+		assert not calendar.set_solar_date(2025, 2, 29)
+		assert calendar.set_lunar_date(2025, 6, 1, True)
+		assert calendar.set_date(datetime.date(2025, 7, 25))
+		assert calendar.get_gap_ja_string() == gap_ja_string(LunarDate(2025, 6, 1, True))
+		assert {event: stats[:2] for event, stats in get_counters().items()} == {
+			"KoreanLunarCalendar.set_solar_date": (1, 1),
+			"KoreanLunarCalendar.set_lunar_date": (1, 0),
+			"KoreanLunarCalendar.set_date": (1, 0),
+			"KoreanLunarCalendar.get_gap_ja_string": (1, 0),
+			"gap_ja_string": (1, 0),
+		}
+
+	def test_profiler(self) -> None:
+		events: list[tuple[str, int]] = []
+		set_profiler(lambda event, duration_ns: events.append((event, duration_ns)))
+		assert parse_lunar_iso_many(["2025-06-01 Intercalation", "2025-06-02"]) == [LunarDate(2025, 6, 1, True), LunarDate(2025, 6, 2)]
+		assert [event for event, _ in events] == ["parse_lunar_iso", "parse_lunar_iso"]
+		assert all(duration_ns > 0 for _, duration_ns in events)
+		# The profiler alone does not count
+		assert get_counters() == {}
+
+	def test_profiler_calling_entry_points(self) -> None:
+		events: list[str] = []
+
+		def profiler(event:str, _duration_ns:int) -> None:
+			events.append(event)
+			to_lunar(SolarDate(2025, 7, 25))
+
+		set_profiler(profiler)
+		enable_counters()
+		to_solar(LunarDate(2025, 6, 1, True))
+		assert events == ["to_solar"]
+		assert set(get_counters()) == {"to_solar"}
+
+	def test_nested_entry_points(self) -> None:
+		enable_counters()
+		# Not an instrumented entry point: the entry point it uses is reported
+		LunarDate(2025, 6, 1, True).add_days(1)
+		assert set(get_counters()) == {"lunar_to_ordinal"}
+
+	def test_threads(self) -> None:
+		enable_counters()
+		call_count = 1000
+		thread_count = 4
+
+		def convert() -> None:
+			for _ in range(call_count):
+				to_lunar(SolarDate(2025, 7, 25))
+
+		threads = [threading.Thread(target=convert) for _ in range(thread_count)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		assert get_counters()["to_lunar"][:2] == (call_count * thread_count, 0)
+
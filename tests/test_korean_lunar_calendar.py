@@ -3,8 +3,47 @@
 import pytest
 # import msgspec
 import datetime
+import re
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from korean_lunar_calendar import korean_lunar_calendar
+from korean_lunar_calendar.korean_lunar_calendar import (
+	DateCheck,
+	GapJa,
+	GapJaLocale,
+	KoreanLunarCalendar,
+	LunarDate,
+	Pillar,
+	SolarDate,
+	check_lunar_date,
+	check_solar_date,
+	from_date,
+	gap_ja,
+	gap_ja_string,
+	get_gap_ja_locale,
+	iter_days,
+	iter_lunar_months,
+	lunar_to_ordinal,
+	ordinal_to_lunar,
+	ordinal_to_solar,
+	parse_lunar_iso,
+	parse_lunar_iso_many,
+	parse_solar_iso,
+	parse_solar_iso_many,
+	register_gap_ja_locale,
+	solar_to_ordinal,
+	to_date,
+	to_lunar,
+	to_solar,
+	validate_lunar_many,
+	validate_solar_many,
+)
+
+
+# ruff: noqa: PLR2004
 
-from korean_lunar_calendar.korean_lunar_calendar import KoreanLunarCalendar
 
 class TestKoreanLunarCalendar():
 
@@ -108,6 +147,25 @@ class TestKoreanLunarCalendar():
 		assert getattr(self.klc, '_KoreanLunarCalendar__get_lunar_days_before_base_year')(year) == res
 
 
+	@pytest.mark.parametrize("year", [999, 1000, 1001, 1582, 2025, 2050])
+	def test__get_lunar_days_before_base_year_matches_year_sum(self, year:int) -> None:
+		expected = sum(getattr(self.klc, '_KoreanLunarCalendar__get_lunar_days')(base_year) for base_year in range(self.klc.KOREAN_LUNAR_BASE_YEAR, year + 1)) # noqa: B009
+		assert getattr(self.klc, '_KoreanLunarCalendar__get_lunar_days_before_base_year')(year) == expected # noqa: B009
+
+	def test_year_start_days_tables(self) -> None:
+		assert len(self.klc.LUNAR_YEAR_START_DAYS) == len(self.klc.KOREAN_LUNAR_DATA) + 1
+		assert len(self.klc.SOLAR_YEAR_START_DAYS) == len(self.klc.KOREAN_LUNAR_DATA) + 1
+		assert self.klc.LUNAR_YEAR_START_DAYS[0] == 0
+		assert self.klc.SOLAR_YEAR_START_DAYS[0] == 0
+		assert self.klc.SOLAR_YEAR_START_DAYS[-1] == (datetime.date(2051, 1, 1) - datetime.date(1000, 1, 1)).days
+
+	def test_lunar_data_is_read_only(self) -> None:
+		with pytest.raises(TypeError):
+			self.klc.KOREAN_LUNAR_DATA[1022] = 0
+		# The conversions read their own copy
+		assert korean_lunar_calendar._LUNAR_DATA is not self.klc.KOREAN_LUNAR_DATA
+		assert list(korean_lunar_calendar._LUNAR_DATA) == list(self.klc.KOREAN_LUNAR_DATA)
+
 	@pytest.mark.parametrize("year, month, is_intercalation, res", [
 		# Default cases
 		(950, 1, True, 0),
@@ -517,3 +575,369 @@ class TestKoreanLunarCalendar():
 
 
 
+
+
+	def test_lunar_month_starts(self) -> None:
+		month_starts = self.klc.LUNAR_MONTH_STARTS
+		assert isinstance(month_starts, tuple)
+		assert len(month_starts) == len(self.klc.LUNAR_MONTH_START_DAYS)
+		assert list(self.klc.LUNAR_MONTH_START_DAYS) == sorted(self.klc.LUNAR_MONTH_START_DAYS)
+		assert month_starts[0] == (1, 1000, 1, False)
+		for month_start in month_starts[::97]:
+			assert month_start.abs_days == getattr(self.klc, '_KoreanLunarCalendar__get_lunar_abs_days')(month_start.year, month_start.month, 1, month_start.is_intercalation) # noqa: B009
+
+	def test_lunar_month_start_columns_are_read_only(self) -> None:
+		with pytest.raises(TypeError):
+			self.klc.LUNAR_MONTH_START_KEYS[0] = 0
+		with pytest.raises(TypeError):
+			self.klc.LUNAR_MONTH_START_DAYS[0] = 0 # type: ignore[index]
+		# The conversions read their own copy of the keys
+		assert korean_lunar_calendar._LUNAR_MONTH_START_KEYS is not self.klc.LUNAR_MONTH_START_KEYS
+		assert list(korean_lunar_calendar._LUNAR_MONTH_START_KEYS) == list(self.klc.LUNAR_MONTH_START_KEYS)
+		assert [(month_start.year << 5 | month_start.month << 1 | month_start.is_intercalation) for month_start in self.klc.LUNAR_MONTH_STARTS] == list(self.klc.LUNAR_MONTH_START_KEYS)
+
+	@pytest.mark.parametrize("year, res", [
+		(2022, [(m, False) for m in range(1, 13)]),
+		(2025, [(m, False) for m in range(1, 7)] + [(6, True)] + [(m, False) for m in range(7, 13)]),
+	])
+	def test_lunar_month_starts_year(self, year:int, res:list[tuple[int, bool]]) -> None:
+		assert [(month_start.month, month_start.is_intercalation) for month_start in self.klc.LUNAR_MONTH_STARTS if month_start.year == year] == res
+
+
+class TestConversionFunctions:
+
+	@pytest.mark.parametrize("solar_date, lunar_date", [
+		(SolarDate(1000, 2, 13), LunarDate(1000, 1, 1, False)),
+		(SolarDate(2025, 1, 29), LunarDate(2025, 1, 1, False)),
+		(SolarDate(2025, 6, 25), LunarDate(2025, 6, 1, False)),
+		(SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True)),
+		(SolarDate(2025, 8, 23), LunarDate(2025, 7, 1, False)),
+		(SolarDate(2025, 10, 6), LunarDate(2025, 8, 15, False)),
+		(SolarDate(2050, 12, 31), LunarDate(2050, 11, 18, False)),
+	])
+	def test_to_lunar_to_solar(self, solar_date:SolarDate, lunar_date:LunarDate) -> None:
+		assert to_lunar(solar_date) == lunar_date
+		assert to_solar(lunar_date) == solar_date
+
+	@pytest.mark.parametrize("solar_date", [SolarDate(1000, 2, 12), SolarDate(2051, 1, 1), SolarDate(2025, 2, 29), SolarDate(2025, 13, 1)])
+	def test_to_lunar_invalid(self, solar_date:SolarDate) -> None:
+		with pytest.raises(ValueError, match="solar_date"):
+			to_lunar(solar_date)
+
+	@pytest.mark.parametrize("lunar_date", [LunarDate(999, 12, 29), LunarDate(2025, 5, 1, True), LunarDate(2025, 6, 30, True), LunarDate(2050, 11, 19)])
+	def test_to_solar_invalid(self, lunar_date:LunarDate) -> None:
+		with pytest.raises(ValueError, match="lunar_date"):
+			to_solar(lunar_date)
+
+	def test_value_types(self) -> None:
+		lunar_date = LunarDate(2025, 6, 1, True)
+		assert not hasattr(lunar_date, "__dict__")
+		assert not hasattr(SolarDate(2025, 7, 25), "__dict__")
+		assert {lunar_date: 1}[LunarDate(2025, 6, 1, True)] == 1
+		assert LunarDate(2025, 6, 1) == (2025, 6, 1, False)
+		assert lunar_date.iso_format() == "2025-06-01 Intercalation"
+		assert SolarDate(2025, 7, 25).iso_format() == "2025-07-25"
+
+	def test_setters_match_functions(self) -> None:
+		klc = KoreanLunarCalendar()
+		assert klc.set_solar_date(2025, 7, 25)
+		assert klc.get_lunar_date() == to_lunar(SolarDate(2025, 7, 25))
+		assert klc.set_lunar_date(2025, 6, 1, True)
+		assert klc.get_solar_date() == to_solar(LunarDate(2025, 6, 1, True))
+
+	@pytest.mark.parametrize("lunar_date, res", [
+		(LunarDate(1000, 1, 1), GapJa(Pillar(6, 0), Pillar(4, 2), Pillar(5, 3))),
+		(LunarDate(2025, 6, 1, True), GapJa(Pillar(1, 5), Pillar(9, 7), Pillar(1, 7))),
+	])
+	def test_gap_ja(self, lunar_date:LunarDate, res:GapJa) -> None:
+		assert gap_ja(lunar_date) == res
+
+	@pytest.mark.parametrize("lunar_date, gapja_type, res", [
+		(LunarDate(2025, 1, 1), "KR", "을사년 무인월 무술일"),
+		(LunarDate(2025, 6, 1, True), "KR", "을사년 계미월 을미일 (윤월)"),
+		(LunarDate(2025, 6, 1, True), "CN", "乙巳年 癸未月 乙未日 (閏月)"),
+	])
+	def test_gap_ja_string(self, lunar_date:LunarDate, gapja_type:str, res:str) -> None:
+		assert gap_ja_string(lunar_date, gapja_type) == res
+
+	def test_gap_ja_string_invalid(self) -> None:
+		with pytest.raises(ValueError, match="gapja_type"):
+			gap_ja_string(LunarDate(2025, 1, 1), "JP")
+		with pytest.raises(ValueError, match="lunar_date"):
+			gap_ja_string(LunarDate(2025, 5, 1, True))
+
+	def test_gap_ja_locale(self, monkeypatch:pytest.MonkeyPatch) -> None:
+		monkeypatch.setattr(korean_lunar_calendar, "_GAP_JA_LOCALES", dict(korean_lunar_calendar._GAP_JA_LOCALES))
+		locale = get_gap_ja_locale("KR")
+		assert (locale.years[0], locale.months[1], locale.days[59]) == ("갑자년", "을축월", "계해일")
+		assert locale.intercalation == " (윤월)"
+		register_gap_ja_locale("KR-Latn", GapJaLocale.from_characters(
+			("gap", "eul", "byeong", "jeong", "mu", "gi", "gyeong", "sin", "im", "gye"),
+			("ja", "chuk", "in", "myo", "jin", "sa", "o", "mi", "sin", "yu", "sul", "hae"),
+			("-nyeon", "-wol", "-il"), " (yun-wol)",
+		))
+		assert gap_ja_string(LunarDate(2025, 6, 1, True), "KR-Latn") == "eulsa-nyeon gyemi-wol eulmi-il (yun-wol)"
+		# Interned names
+		assert get_gap_ja_locale("KR-Latn").years[1] is sys.intern("eulchuk-nyeon")
+		with pytest.raises(ValueError, match="60 strings"):
+			register_gap_ja_locale("XX", GapJaLocale(("a",) * 59, ("a",) * 60, ("a",) * 60, ""))
+		with pytest.raises(ValueError, match="Should be one of: \\('KR', 'CN', 'KR-Latn'\\)"):
+			get_gap_ja_locale("XX")
+
+	@pytest.mark.parametrize("solar_date, lunar_date", [
+		(SolarDate(1000, 2, 13), LunarDate(1000, 1, 1)),
+		(SolarDate(1582, 10, 15), LunarDate(1582, 9, 19)),
+		(SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True)),
+		(SolarDate(2050, 12, 31), LunarDate(2050, 11, 18)),
+	])
+	def test_ordinals(self, solar_date:SolarDate, lunar_date:LunarDate) -> None:
+		ordinal = datetime.date(*solar_date).toordinal()
+		assert solar_to_ordinal(solar_date) == ordinal
+		assert lunar_to_ordinal(lunar_date) == ordinal
+		assert ordinal_to_solar(ordinal) == solar_date
+		assert ordinal_to_lunar(ordinal) == lunar_date
+
+	def test_ordinal_arithmetic(self) -> None:
+		# 100 days after Seollal 2025
+		assert ordinal_to_lunar(lunar_to_ordinal(LunarDate(2025, 1, 1)) + 100) == to_lunar(SolarDate(2025, 5, 9))
+
+	@pytest.mark.parametrize("ordinal", [datetime.date(1000, 2, 12).toordinal(), datetime.date(2051, 1, 1).toordinal()])
+	def test_ordinal_out_of_range(self, ordinal:int) -> None:
+		with pytest.raises(ValueError, match="ordinal"):
+			ordinal_to_lunar(ordinal)
+		with pytest.raises(ValueError, match="ordinal"):
+			ordinal_to_solar(ordinal)
+
+	@pytest.mark.parametrize("solar_date, lunar_date", [
+		(datetime.date(1000, 2, 13), LunarDate(1000, 1, 1)),
+		(datetime.date(2025, 7, 25), LunarDate(2025, 6, 1, True)),
+		(datetime.date(2050, 12, 31), LunarDate(2050, 11, 18)),
+	])
+	def test_from_date_to_date(self, solar_date:datetime.date, lunar_date:LunarDate) -> None:
+		assert from_date(solar_date) == lunar_date
+		assert to_date(lunar_date) == solar_date
+		klc = KoreanLunarCalendar()
+		assert klc.set_date(solar_date)
+		assert klc.get_lunar_date() == lunar_date
+		assert klc.to_date() == solar_date
+
+	@pytest.mark.parametrize("solar_date", [datetime.date(1000, 2, 12), datetime.date(2051, 1, 1)])
+	def test_from_date_out_of_range(self, solar_date:datetime.date) -> None:
+		with pytest.raises(ValueError, match="solar_date"):
+			from_date(solar_date)
+		klc = KoreanLunarCalendar()
+		assert not klc.set_date(solar_date)
+		assert klc.get_lunar_date() == LunarDate(0, 1, 1)
+
+	def test_thread_safety(self) -> None:
+		start = datetime.date(1000, 2, 13)
+		solar_dates = [SolarDate(d.year, d.month, d.day) for d in (start + datetime.timedelta(days=offset) for offset in range(0, 383827, 97))]
+
+		def convert(solar_dates:list[SolarDate]) -> list[tuple[LunarDate, SolarDate, str]]:
+			results = []
+			for solar_date in solar_dates:
+				lunar_date = to_lunar(solar_date)
+				results.append((lunar_date, to_solar(lunar_date), gap_ja_string(lunar_date, "CN")))
+			return results
+
+		expected = convert(solar_dates)
+		chunks = [solar_dates[i::7] for i in range(7)]
+		switch_interval = sys.getswitchinterval()
+		# Switch threads as often as possible to interleave the conversions
+		sys.setswitchinterval(1e-6)
+		try:
+			with ThreadPoolExecutor(max_workers=16) as executor:
+				results = list(executor.map(convert, chunks * 8))
+		finally:
+			sys.setswitchinterval(switch_interval)
+		for i, result in enumerate(results):
+			assert result == expected[i % 7::7]
+
+	def test_iter_days(self) -> None:
+		# Whole supported range: crosses every solar & lunar month/year boundary
+		days = list(iter_days(SolarDate(1000, 2, 13), SolarDate(2050, 12, 31)))
+		assert len(days) == 383827
+		for ordinal, (solar_date, lunar_date) in enumerate(days, datetime.date(1000, 2, 13).toordinal()):
+			assert solar_date == ordinal_to_solar(ordinal)
+			assert lunar_date == ordinal_to_lunar(ordinal)
+
+	@pytest.mark.parametrize("start, end, res", [
+		(SolarDate(2025, 7, 24), SolarDate(2025, 7, 25), [(SolarDate(2025, 7, 24), LunarDate(2025, 6, 30)), (SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True))]),
+		(SolarDate(2024, 2, 29), SolarDate(2024, 2, 29), [(SolarDate(2024, 2, 29), LunarDate(2024, 1, 20))]),
+		(SolarDate(2025, 7, 25), SolarDate(2025, 7, 24), []),
+	])
+	def test_iter_days_range(self, start:SolarDate, end:SolarDate, res:list[tuple[SolarDate, LunarDate]]) -> None:
+		assert list(iter_days(start, end)) == res
+
+	def test_iter_lunar_months(self) -> None:
+		months = list(iter_lunar_months(LunarDate(1000, 1, 1), LunarDate(2050, 11, 18)))
+		assert len(months) == 12998
+		for lunar_date, solar_date in months:
+			assert lunar_date.day == 1
+			assert to_solar(lunar_date) == solar_date
+		assert [lunar_date for lunar_date, _ in iter_lunar_months(LunarDate(2025, 5, 2), LunarDate(2025, 7, 1))] == [
+			LunarDate(2025, 6, 1), LunarDate(2025, 6, 1, True), LunarDate(2025, 7, 1),
+		]
+		assert list(iter_lunar_months(LunarDate(2025, 5, 2), LunarDate(2025, 5, 29))) == []
+
+	@pytest.mark.parametrize("start, end", [
+		(SolarDate(2025, 2, 29), SolarDate(2025, 3, 1)),
+		(SolarDate(2025, 1, 1), SolarDate(2051, 1, 1)),
+	])
+	def test_iter_days_invalid(self, start:SolarDate, end:SolarDate) -> None:
+		with pytest.raises(ValueError, match="solar_date"):
+			iter_days(start, end)
+
+	@pytest.mark.parametrize("start, end", [
+		(LunarDate(2025, 5, 1, True), LunarDate(2025, 7, 1)),
+		(LunarDate(2025, 1, 1), LunarDate(2050, 12, 1)),
+	])
+	def test_iter_lunar_months_invalid(self, start:LunarDate, end:LunarDate) -> None:
+		with pytest.raises(ValueError, match="lunar_date"):
+			iter_lunar_months(start, end)
+
+	@pytest.mark.parametrize("text, res", [
+		("1000-02-13", SolarDate(1000, 2, 13)),
+		("2024-02-29", SolarDate(2024, 2, 29)),
+		("2050-12-31", SolarDate(2050, 12, 31)),
+	])
+	def test_parse_solar_iso(self, text:str, res:SolarDate) -> None:
+		assert parse_solar_iso(text) == res
+		assert type(parse_solar_iso(text)) is SolarDate
+		assert parse_solar_iso(res.iso_format()) == res
+
+	@pytest.mark.parametrize("text, res", [
+		("1000-01-01", LunarDate(1000, 1, 1)),
+		("2025-06-01 Intercalation", LunarDate(2025, 6, 1, True)),
+		("2025-01-30", LunarDate(2025, 1, 30)),
+		("2050-11-18", LunarDate(2050, 11, 18)),
+	])
+	def test_parse_lunar_iso(self, text:str, res:LunarDate) -> None:
+		assert parse_lunar_iso(text) == res
+		assert type(parse_lunar_iso(text)) is LunarDate
+		assert parse_lunar_iso(res.iso_format()) == res
+
+	@pytest.mark.parametrize("text", [
+		"1000-02-12", "2051-01-01", "2025-02-29", "2025-13-01", "2025-00-10",
+		"2025-7-25", "20250725", "2025-W30-5", "2025-07-25 ", " 2025-07-25", "2025-07-25 Intercalation", "２０２５-07-25", "+025-07-25", "",
+	])
+	def test_parse_solar_iso_invalid(self, text:str) -> None:
+		with pytest.raises(ValueError, match="text"):
+			parse_solar_iso(text)
+
+	@pytest.mark.parametrize("text", [
+		"0999-12-30", "2050-11-19", "2025-05-01 Intercalation", "2025-06-30 Intercalation", "2025-13-01",
+		"2025-6-01", "20250601", "2025-06-01 intercalation", "2025-06-01Intercalation", "2025-06-01 Intercalation ", "2025-06-0١", "",
+	])
+	def test_parse_lunar_iso_invalid(self, text:str) -> None:
+		with pytest.raises(ValueError, match="text"):
+			parse_lunar_iso(text)
+
+	def test_parse_iso_many(self) -> None:
+		assert parse_solar_iso_many(["2025-07-25", "2025-01-29"]) == [SolarDate(2025, 7, 25), SolarDate(2025, 1, 29)]
+		assert parse_lunar_iso_many(iter(["2025-06-01 Intercalation", "2025-01-01"])) == [LunarDate(2025, 6, 1, True), LunarDate(2025, 1, 1)]
+		assert parse_lunar_iso_many([]) == []
+		with pytest.raises(ValueError, match="2025-02-29"):
+			parse_solar_iso_many(["2025-07-25", "2025-02-29"])
+
+	@pytest.mark.parametrize("lunar_date, res", [
+		(LunarDate(1000, 1, 1), DateCheck.VALID),
+		(LunarDate(2025, 6, 29, True), DateCheck.VALID),
+		(LunarDate(999, 12, 30), DateCheck.OUT_OF_RANGE),
+		(LunarDate(2050, 11, 19), DateCheck.OUT_OF_RANGE),
+		(LunarDate(2025, 13, 1), DateCheck.INVALID_MONTH),
+		(LunarDate(2025, 0, 1), DateCheck.INVALID_MONTH),
+		(LunarDate(2025, 5, 1, True), DateCheck.INVALID_INTERCALATION),
+		(LunarDate(2025, 6, 30, True), DateCheck.INVALID_DAY),
+		(LunarDate(2025, 2, 30), DateCheck.INVALID_DAY),
+		(LunarDate(2025, 2, 0), DateCheck.INVALID_DAY),
+	])
+	def test_check_lunar_date(self, lunar_date:LunarDate, res:DateCheck) -> None:
+		assert check_lunar_date(lunar_date) is res
+		assert validate_lunar_many([lunar_date]) == (res is DateCheck.VALID)
+
+	@pytest.mark.parametrize("solar_date, res", [
+		(SolarDate(1000, 2, 13), DateCheck.VALID),
+		(SolarDate(2024, 2, 29), DateCheck.VALID),
+		(SolarDate(1000, 2, 12), DateCheck.OUT_OF_RANGE),
+		(SolarDate(2051, 1, 1), DateCheck.OUT_OF_RANGE),
+		(SolarDate(2025, 13, 1), DateCheck.INVALID_MONTH),
+		(SolarDate(2025, 2, 29), DateCheck.INVALID_DAY),
+		(SolarDate(2025, 4, 31), DateCheck.INVALID_DAY),
+	])
+	def test_check_solar_date(self, solar_date:SolarDate, res:DateCheck) -> None:
+		assert check_solar_date(solar_date) is res
+		assert validate_solar_many([solar_date]) == (res is DateCheck.VALID)
+
+	def test_validate_many(self) -> None:
+		lunar_dates = [LunarDate(2025, 6, 1, True), LunarDate(2025, 5, 1, True), LunarDate(2025, 2, 30), LunarDate(2025, 2, 29)]
+		assert validate_lunar_many(lunar_dates) == 0b1001
+		assert validate_lunar_many(iter(lunar_dates)) == 0b1001
+		assert validate_solar_many([SolarDate(2025, 2, 29), SolarDate(2025, 2, 28), (2051, 1, 1)]) == 0b010  # type: ignore[list-item]
+		assert validate_solar_many([]) == 0
+		solar_dates = [SolarDate(2025, 1, 1 + i % 40) for i in range(10000)]
+		mask = validate_solar_many(solar_dates)
+		assert [bool(mask >> i & 1) for i in range(len(solar_dates))] == [i % 40 < 31 for i in range(10000)]
+
+	@pytest.mark.parametrize(("lunar_date", "days", "expected"), [
+		(LunarDate(2025, 6, 30), 1, LunarDate(2025, 6, 1, True)),
+		(LunarDate(2025, 6, 1, True), -1, LunarDate(2025, 6, 30)),
+		(LunarDate(2025, 1, 1), 100, LunarDate(2025, 4, 12)),
+		(LunarDate(1000, 1, 1), 0, LunarDate(1000, 1, 1)),
+	])
+	def test_add_days(self, lunar_date:LunarDate, days:int, expected:LunarDate) -> None:
+		assert lunar_date.add_days(days) == expected
+		assert lunar_to_ordinal(expected) == lunar_to_ordinal(lunar_date) + days
+
+	def test_add_days_matches_ordinals(self) -> None:
+		lunar_date = LunarDate(1999, 11, 30)
+		for days in range(-3000, 3000, 37):
+			assert lunar_date.add_days(days) == ordinal_to_lunar(lunar_to_ordinal(lunar_date) + days)
+
+	@pytest.mark.parametrize(("lunar_date", "months", "options", "expected"), [
+		(LunarDate(2025, 3, 30), 1, {}, LunarDate(2025, 4, 29)),
+		(LunarDate(2025, 3, 30), 1, {"overflow": "next"}, LunarDate(2025, 5, 1)),
+		(LunarDate(2025, 5, 10), 1, {}, LunarDate(2025, 6, 10)),
+		(LunarDate(2025, 6, 10), 1, {}, LunarDate(2025, 7, 10)),
+		(LunarDate(2025, 6, 10, True), 1, {}, LunarDate(2025, 7, 10)),
+		(LunarDate(2025, 6, 10, True), -12, {}, LunarDate(2024, 6, 10)),
+		(LunarDate(2025, 12, 10), 1, {}, LunarDate(2026, 1, 10)),
+		(LunarDate(2026, 1, 10), -1, {}, LunarDate(2025, 12, 10)),
+		(LunarDate(2025, 6, 10), 1, {"count_intercalation": True}, LunarDate(2025, 6, 10, True)),
+		(LunarDate(2025, 6, 30), 1, {"count_intercalation": True}, LunarDate(2025, 6, 29, True)),
+		(LunarDate(2025, 6, 30), 1, {"count_intercalation": True, "overflow": "next"}, LunarDate(2025, 7, 1)),
+		(LunarDate(2025, 7, 10), -2, {"count_intercalation": True}, LunarDate(2025, 6, 10)),
+		(LunarDate(2025, 1, 1), 13, {"count_intercalation": True}, LunarDate(2026, 1, 1)),
+	])
+	def test_add_lunar_months(self, lunar_date:LunarDate, months:int, options:dict, expected:LunarDate) -> None:
+		assert lunar_date.add_lunar_months(months, **options) == expected
+
+	@pytest.mark.parametrize(("lunar_date", "years", "options", "expected"), [
+		(LunarDate(2024, 6, 15), 1, {}, LunarDate(2025, 6, 15)),
+		(LunarDate(2025, 6, 15, True), 1, {}, LunarDate(2026, 6, 15)),
+		(LunarDate(2025, 6, 15, True), -19, {}, LunarDate(2006, 6, 15)),
+		(LunarDate(2025, 7, 30), 1, {}, LunarDate(2026, 7, 29)),
+		(LunarDate(2025, 7, 30), 1, {"overflow": "next"}, LunarDate(2026, 8, 1)),
+		(LunarDate(2025, 2, 29), 0, {}, LunarDate(2025, 2, 29)),
+	])
+	def test_add_lunar_years(self, lunar_date:LunarDate, years:int, options:dict, expected:LunarDate) -> None:
+		assert lunar_date.add_lunar_years(years, **options) == expected
+		assert lunar_date.add_lunar_months(12 * years, **options) == expected
+
+	@pytest.mark.parametrize(("add", "message"), [
+		(lambda: LunarDate(2050, 11, 18).add_days(1), "days is:1"),
+		(lambda: LunarDate(1000, 1, 1).add_days(-1), "days is:-1"),
+		(lambda: LunarDate(2025, 2, 30).add_days(1), "lunar_date is:"),
+		(lambda: LunarDate(2025, 2, 30).add_lunar_years(1), "lunar_date is:"),
+		(lambda: LunarDate(2025, 6, 15, True).add_lunar_years(1, intercalation="raise"), "intercalation='raise'"),
+		(lambda: LunarDate(2025, 3, 30).add_lunar_months(1, overflow="raise"), "overflow='raise'"),
+		(lambda: LunarDate(2050, 11, 1).add_lunar_months(1), "lunar_date is:"),
+		(lambda: LunarDate(2050, 11, 1).add_lunar_years(1), "year is:2051"),
+		(lambda: LunarDate(1000, 1, 1).add_lunar_months(-1), "year is:999"),
+		(lambda: LunarDate(1000, 1, 1).add_lunar_months(-1, count_intercalation=True), "months is:-1"),
+		(lambda: LunarDate(2025, 1, 1).add_lunar_years(1, intercalation="skip"), "intercalation is:'skip'"),  # type: ignore[arg-type]
+		(lambda: LunarDate(2025, 1, 1).add_lunar_months(1, overflow="wrap"), "overflow is:'wrap'"),  # type: ignore[arg-type]
+	])
+	def test_add_invalid(self, add:Callable[[], LunarDate], message:str) -> None:
+		with pytest.raises(ValueError, match=re.escape(message)):
+			add()
@@ -0,0 +1,51 @@
+"""Test `korean_lunar_calendar.packing`."""
+
+import pytest
+
+from korean_lunar_calendar.korean_lunar_calendar import KoreanLunarCalendar, LunarDate
+from korean_lunar_calendar.packing import pack, pack_many, unpack, unpack_many
+
+
+class TestPacking:
+
+	@pytest.mark.parametrize("lunar_date, res", [
+		(LunarDate(1000, 1, 1), (1000 << 10) | (1 << 6) | 1),
+		(LunarDate(2025, 6, 1, True), 2074017),
+		(LunarDate(2050, 11, 18), (2050 << 10) | (11 << 6) | 18),
+	])
+	def test_pack_unpack(self, lunar_date:LunarDate, res:int) -> None:
+		assert pack(lunar_date) == res
+		assert unpack(res) == lunar_date
+
+	def test_chronological_order(self) -> None:
+		month_starts = KoreanLunarCalendar.LUNAR_MONTH_STARTS[:-2]
+		lunar_dates = [LunarDate(month_start.year, month_start.month, day, month_start.is_intercalation) for month_start in month_starts for day in (1, 29)]
+		packed = [pack(lunar_date) for lunar_date in lunar_dates]
+		assert packed == sorted(packed)
+		assert len(set(packed)) == len(packed)
+
+	@pytest.mark.parametrize("lunar_date", [LunarDate(2025, 5, 1, True), LunarDate(2025, 6, 30, True), LunarDate(999, 12, 1), LunarDate(2050, 11, 19)])
+	def test_pack_invalid(self, lunar_date:LunarDate) -> None:
+		with pytest.raises(ValueError, match="lunar_date"):
+			pack(lunar_date)
+
+	@pytest.mark.parametrize("packed", [0, -1, (2025 << 10) | (5 << 6) | (1 << 5) | 1, 2074017 | (1 << 32)])
+	def test_unpack_invalid(self, packed:int) -> None:
+		with pytest.raises(ValueError, match="packed"):
+			unpack(packed)
+
+	def test_many(self) -> None:
+		lunar_dates = [LunarDate(1000, 1, 1), LunarDate(2025, 6, 1, True), LunarDate(2050, 11, 18)]
+		data = pack_many(lunar_dates)
+		assert data == b"".join(pack(lunar_date).to_bytes(4, "little") for lunar_date in lunar_dates)
+		assert unpack_many(data) == lunar_dates
+		assert unpack_many(memoryview(bytearray(data))[4:]) == lunar_dates[1:]
+		assert pack_many([]) == b""
+
+	def test_many_invalid(self) -> None:
+		with pytest.raises(ValueError, match="lunar_date"):
+			pack_many([LunarDate(2025, 1, 1), LunarDate(2025, 5, 1, True)])
+		with pytest.raises(ValueError, match="multiple of 4"):
+			unpack_many(b"\x00" * 6)
+		with pytest.raises(ValueError, match="packed"):
+			unpack_many(b"\x00" * 4)
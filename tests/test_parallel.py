@@ -0,0 +1,49 @@
+"""Test `korean_lunar_calendar.parallel`."""
+
+import datetime
+import itertools
+
+import pytest
+
+from korean_lunar_calendar.korean_lunar_calendar import (
+	LunarDate,
+	SolarDate,
+	from_date,
+	ordinal_to_solar,
+	to_solar,
+)
+from korean_lunar_calendar.parallel import convert_many
+
+
+class TestConvertMany:
+
+	@pytest.mark.parametrize("workers, chunksize", [(1, 7), (2, 7), (3, 1000)])
+	def test_order(self, workers:int, chunksize:int) -> None:
+		start = datetime.date(1000, 2, 13)
+		dates = [start + datetime.timedelta(days=offset) for offset in range(0, 383827, 997)]
+		assert list(convert_many(dates, workers=workers, chunksize=chunksize)) == [from_date(date) for date in dates]
+
+	def test_mixed(self) -> None:
+		dates:list[SolarDate|LunarDate|datetime.date] = [SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True), datetime.date(2025, 7, 25), datetime.datetime(2025, 7, 25, 12)]
+		assert list(convert_many(dates, workers=2, chunksize=1)) == [LunarDate(2025, 6, 1, True), SolarDate(2025, 7, 25), LunarDate(2025, 6, 1, True), LunarDate(2025, 6, 1, True)]
+
+	def test_lazy(self) -> None:
+		# Infinite input: only the consumed chunks (and the ones in flight) are converted
+		lunar_dates = itertools.cycle([LunarDate(2025, 1, 1), LunarDate(2025, 6, 1, True)])
+		assert list(itertools.islice(convert_many(lunar_dates, workers=2, chunksize=3), 5)) == [to_solar(LunarDate(2025, 1, 1)), SolarDate(2025, 7, 25)] * 2 + [to_solar(LunarDate(2025, 1, 1))]
+
+	@pytest.mark.parametrize("workers", [1, 2])
+	def test_invalid_date(self, workers:int) -> None:
+		dates = [ordinal_to_solar(ordinal) for ordinal in range(700000, 700010)] + [SolarDate(2025, 2, 29)]
+		converted = convert_many(dates, workers=workers, chunksize=4)
+		assert next(converted) == from_date(datetime.date.fromordinal(700000))
+		with pytest.raises(ValueError, match="solar_date"):
+			list(converted)
+		with pytest.raises(TypeError, match="date is"):
+			list(convert_many([(2025, 1, 1)], workers=workers)) # type: ignore[list-item]
+
+	@pytest.mark.parametrize("workers, chunksize, match", [(0, 1, "workers"), (-1, 1, "workers"), (1, 0, "chunksize")])
+	def test_invalid_args(self, workers:int, chunksize:int, match:str) -> None:
+		# Raised on call, not on iteration
+		with pytest.raises(ValueError, match=match):
+			convert_many([], workers=workers, chunksize=chunksize)
@@ -0,0 +1,141 @@
+"""Test `korean_lunar_calendar.solar_terms`."""
+
+import datetime
+import itertools
+
+import pytest
+
+from korean_lunar_calendar.korean_lunar_calendar import (
+	Pillar,
+	gap_ja,
+	ordinal_to_solar,
+	to_lunar,
+)
+from korean_lunar_calendar.solar_terms import (
+	KST,
+	SOLAR_TERM_BASE_YEAR,
+	SOLAR_TERM_DATA,
+	SOLAR_TERM_NAMES,
+	FourPillars,
+	_build_solar_term_data,
+	four_pillars,
+	month_pillar,
+	solar_terms,
+)
+
+MONTHS: int = 12
+YEARS: range = range(SOLAR_TERM_BASE_YEAR, SOLAR_TERM_BASE_YEAR + 1051)
+JEOL_DAYS: range = range(3, 11)
+JEOL_INTERVALS: range = range(29, 33)
+ONE_MINUTE: datetime.timedelta = datetime.timedelta(minutes=1)
+CET: datetime.timezone = datetime.timezone(datetime.timedelta(hours=1), "CET")
+
+
+class TestSolarTerms:
+
+	@pytest.mark.parametrize("year, moments", [
+		# Korea Astronomy and Space Science Institute
+		(2024, ((1, 6, 5, 49), (2, 4, 17, 27), (3, 5, 11, 23), (4, 4, 16, 2), (5, 5, 9, 10), (6, 5, 13, 10), (7, 6, 23, 20), (8, 7, 9, 9), (9, 7, 12, 11), (10, 8, 4, 0), (11, 7, 7, 20), (12, 7, 0, 17))),
+		(2025, ((1, 5, 11, 33), (2, 3, 23, 10), (3, 5, 17, 7), (4, 4, 21, 49), (5, 5, 14, 57), (6, 5, 18, 57), (7, 7, 5, 5), (8, 7, 14, 51), (9, 7, 17, 52), (10, 8, 9, 41), (11, 7, 13, 4), (12, 7, 6, 4))),
+	])
+	def test_solar_terms(self, year:int, moments:tuple[tuple[int, int, int, int], ...]) -> None:
+		assert solar_terms(year) == tuple(datetime.datetime(year, *moment, tzinfo=KST) for moment in moments)
+
+	def test_table(self) -> None:
+		assert len(SOLAR_TERM_NAMES) == MONTHS
+		assert len(SOLAR_TERM_DATA) == MONTHS * len(YEARS)
+		# A sample of the years (the full table takes a few seconds to compute)
+		for year in YEARS[::50]:
+			term_inx = MONTHS * (year - SOLAR_TERM_BASE_YEAR)
+			assert _build_solar_term_data(range(year, year + 1)).tolist() == SOLAR_TERM_DATA[term_inx:term_inx + MONTHS].tolist()
+		# The jeol fall in the first days of their month, ~30.4 days apart
+		moments = [moment for year in YEARS for moment in solar_terms(year)]
+		assert all(moment.day in JEOL_DAYS for moment in moments)
+		assert all((moment - previous).days in JEOL_INTERVALS for previous, moment in itertools.pairwise(moments))
+
+	@pytest.mark.parametrize("year", [999, 2051])
+	def test_solar_terms_invalid(self, year:int) -> None:
+		with pytest.raises(ValueError, match="year"):
+			solar_terms(year)
+
+
+class TestMonthPillar:
+
+	@pytest.mark.parametrize("moment, pillar", [
+		# Ipchun 2025: 2025/02/03 23:10 KST
+		(datetime.datetime(2025, 2, 3, 23, 10), Pillar(4, 2)), # 무인/戊寅 from Ipchun
+		(datetime.datetime(2025, 2, 3, 23, 9), Pillar(3, 1)), # 정축/丁丑
+		(datetime.datetime(2025, 2, 3, 15, 10, tzinfo=CET), Pillar(4, 2)),
+		(datetime.datetime(2025, 7, 25), Pillar(9, 7)), # 계미/癸未
+		(datetime.datetime(2025, 12, 31), Pillar(4, 0)), # 무자/戊子
+		(datetime.datetime(1000, 2, 13), Pillar(4, 2)),
+		(datetime.datetime(2050, 12, 31, 23, 59), Pillar(4, 0)),
+	])
+	def test_month_pillar(self, moment:datetime.datetime, pillar:Pillar) -> None:
+		assert month_pillar(moment) == pillar
+
+	def test_month_changes_at_jeol(self) -> None:
+		for year in YEARS[1:]:
+			# Tiger month from Ipchun, its cheongan following the one of the year (갑/기 -> 병인, 을/경 -> 무인, ...)
+			ipchun = solar_terms(year)[1]
+			year_cheongan = (year - 1000 + 36) % 10
+			assert month_pillar(ipchun) == Pillar((year_cheongan % 5 * 2 + 2) % 10, 2)
+			for month, moment in enumerate(solar_terms(year), 1):
+				assert month_pillar(moment).ganji == month % 12
+				assert month_pillar(moment - ONE_MINUTE).ganji == (month - 1) % 12
+
+	@pytest.mark.parametrize("moment", [datetime.datetime(1000, 2, 12, 23, 59), datetime.datetime(2051, 1, 1)])
+	def test_month_pillar_invalid(self, moment:datetime.datetime) -> None:
+		with pytest.raises(ValueError, match="moment"):
+			month_pillar(moment)
+
+
+class TestFourPillars:
+
+	@pytest.mark.parametrize("moment, pillars", [
+		# 을사년 무인월 계묘일 갑자시: 23:00 ~ 24:00 is the ja (子) hour of the next (갑/甲) day
+		(datetime.datetime(2025, 2, 3, 23, 30), FourPillars(Pillar(1, 5), Pillar(4, 2), Pillar(9, 3), Pillar(0, 0))),
+		# 갑진년 정축월 임인일 경술시: before Ipchun
+		(datetime.datetime(2025, 2, 2, 19, 0), FourPillars(Pillar(0, 4), Pillar(3, 1), Pillar(8, 2), Pillar(6, 10))),
+		# 임인일 경자시 (00:00 ~ 01:00) & 신축시 (01:00 ~ 03:00)
+		(datetime.datetime(2025, 2, 2, 0, 59), FourPillars(Pillar(0, 4), Pillar(3, 1), Pillar(8, 2), Pillar(6, 0))),
+		(datetime.datetime(2025, 2, 2, 1, 0), FourPillars(Pillar(0, 4), Pillar(3, 1), Pillar(8, 2), Pillar(7, 1))),
+		(datetime.datetime(1000, 2, 13), FourPillars(Pillar(6, 0), Pillar(4, 2), Pillar(5, 3), Pillar(0, 0))),
+		(datetime.datetime(2050, 12, 31, 23, 59), FourPillars(Pillar(6, 6), Pillar(4, 0), Pillar(1, 9), Pillar(4, 0))),
+		# Aware datetimes are converted to KST
+		(datetime.datetime(2025, 2, 3, 15, 30, tzinfo=CET), FourPillars(Pillar(1, 5), Pillar(4, 2), Pillar(9, 3), Pillar(0, 0))),
+		# Ipchun 2025 at 23:10 KST: 갑진년 정축월 until 23:09, then 을사년 무인월, within the same day & hour
+		(datetime.datetime(2025, 2, 3, 23, 9), FourPillars(Pillar(0, 4), Pillar(3, 1), Pillar(9, 3), Pillar(0, 0))),
+		(datetime.datetime(2025, 2, 3, 23, 10), FourPillars(Pillar(1, 5), Pillar(4, 2), Pillar(9, 3), Pillar(0, 0))),
+		# Gyeongchip 2025 at 17:07 KST, 계유일 신유시: 무인월 until 17:06, then 기묘월
+		(datetime.datetime(2025, 3, 5, 17, 6), FourPillars(Pillar(1, 5), Pillar(4, 2), Pillar(9, 9), Pillar(7, 9))),
+		(datetime.datetime(2025, 3, 5, 17, 7), FourPillars(Pillar(1, 5), Pillar(5, 3), Pillar(9, 9), Pillar(7, 9))),
+	])
+	def test_four_pillars(self, moment:datetime.datetime, pillars:FourPillars) -> None:
+		assert four_pillars(moment) == pillars
+
+	def test_matches_gap_ja_and_month_pillar(self) -> None:
+		for ordinal in range(datetime.date(1000, 2, 13).toordinal(), datetime.date(2050, 12, 31).toordinal() + 1, 97):
+			solar_date = ordinal_to_solar(ordinal)
+			moment = datetime.datetime(*solar_date, 12)
+			pillars = four_pillars(moment)
+			assert pillars.day == gap_ja(to_lunar(solar_date)).day
+			assert pillars.month == month_pillar(moment)
+			# The stem of the tiger month (Ipchun) follows the one of the year (갑/기 -> 병인, 을/경 -> 무인, ...)
+			assert (pillars.month.cheongan - (pillars.month.ganji - 2) % 12) % 10 == (pillars.year.cheongan % 5 * 2 + 2) % 10
+
+	def test_hours(self) -> None:
+		day = datetime.datetime(2025, 7, 25)
+		hours = [four_pillars(day + datetime.timedelta(hours=hour)).hour for hour in range(24)]
+		# 12 double hours from 23:00, the stems running on from day to day
+		assert [hour.ganji for hour in hours] == [0] + [(hour + 1) // 2 for hour in range(1, 23)] + [0]
+		assert hours[-1] == four_pillars(day + datetime.timedelta(days=1)).hour
+
+	@pytest.mark.parametrize("moment", [
+		datetime.datetime(1000, 2, 12, 23, 59),
+		datetime.datetime(2051, 1, 1),
+		datetime.datetime(2050, 12, 31, 16, tzinfo=CET),
+	])
+	def test_four_pillars_invalid(self, moment:datetime.datetime) -> None:
+		with pytest.raises(ValueError, match="moment"):
+			four_pillars(moment)